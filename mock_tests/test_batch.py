@@ -0,0 +1,932 @@
+import asyncio
+import functools
+import json
+import threading
+import time
+import uuid
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union, cast
+
+import grpc
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC
+from weaviate.classes.batch import Deduplication, PIControl, RetryBudget, RetryClass
+from weaviate.collections.batch import grpc_batch_objects
+from weaviate.collections.batch.controller import _PIController
+from weaviate.collections.batch.journal import read_batch_journal
+from weaviate.collections.classes.batch import (
+    ErrorObject,
+    ErrorReference,
+    Shard,
+    VectorIndexingProgress,
+)
+from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.event_loop import _EventLoopSingleton
+from weaviate.exceptions import WeaviateBatchError
+from weaviate.proto.v1 import base_pb2, batch_pb2, weaviate_pb2_grpc
+
+
+@pytest.fixture(scope="function")
+def batch_requests(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> List[batch_pb2.BatchObjectsRequest]:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+    weaviate_mock.expect_request("/v1/schema").respond_with_json({"classes": []})
+    requests: List[batch_pb2.BatchObjectsRequest] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            requests.append(request)
+            return batch_pb2.BatchObjectsReply()
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    return requests
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["dynamic", "fixed_size"])
+async def test_async_collection_batch(
+    batch_requests: List[batch_pb2.BatchObjectsRequest], mode: str
+) -> None:
+    async with weaviate.use_async_with_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        collection = client.collections.get("BatchCollection")
+        batching = (
+            collection.batch.dynamic()
+            if mode == "dynamic"
+            else collection.batch.fixed_size(batch_size=7, concurrent_requests=3)
+        )
+        uuids = []
+        async with batching as batch:
+            for i in range(100):
+                uuids.append(await batch.add_object(properties={"name": f"obj{i}"}))
+
+    sent = [obj for request in batch_requests for obj in request.objects]
+    assert sorted(obj.uuid for obj in sent) == sorted(str(uid) for uid in uuids)
+    assert all(obj.collection == "BatchCollection" for obj in sent)
+    assert len(collection.batch.failed_objects) == 0
+    assert len(collection.batch.results.objs.uuids) == 100
+    if mode == "fixed_size":
+        assert all(len(request.objects) <= 7 for request in batch_requests)
+
+
+@pytest.mark.asyncio
+async def test_async_client_batch(batch_requests: List[batch_pb2.BatchObjectsRequest]) -> None:
+    async with weaviate.use_async_with_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        async with client.batch.fixed_size(batch_size=10) as batch:
+            for _ in range(25):
+                await batch.add_object(collection="BatchCollection", uuid=uuid.uuid4())
+            await batch.flush()
+            assert sum(len(request.objects) for request in batch_requests) == 25
+    assert len(client.batch.results.objs.uuids) == 25
+
+
+def test_sync_collection_batch(batch_requests: List[batch_pb2.BatchObjectsRequest]) -> None:
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    with collection.batch.fixed_size(batch_size=7, concurrent_requests=3) as batch:
+        uuids = [batch.add_object(properties={"name": f"obj{i}"}) for i in range(50)]
+    client.close()
+
+    sent = [obj for request in batch_requests for obj in request.objects]
+    assert sorted(obj.uuid for obj in sent) == sorted(str(uid) for uid in uuids)
+    assert all(len(request.objects) <= 7 for request in batch_requests)
+    assert len(collection.batch.results.objs.uuids) == 50
+
+
+def test_insert_many_arrays(batch_requests: List[batch_pb2.BatchObjectsRequest]) -> None:
+    vectors = np.random.rand(5, 8)
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    ret = collection.data.insert_many_arrays(
+        properties=[{"name": f"obj{i}"} for i in range(5)], vectors=vectors
+    )
+    client.close()
+
+    assert len(ret.uuids) == 5 and not ret.has_errors
+    sent = batch_requests[0].objects
+    assert [obj.vector_bytes for obj in sent] == [row.astype("<f4").tobytes() for row in vectors]
+    assert [obj.uuid for obj in sent] == [str(ret.uuids[i]) for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_add_objects_named_vectors(
+    batch_requests: List[batch_pb2.BatchObjectsRequest],
+) -> None:
+    vectors = {"first": np.random.rand(20, 4), "second": np.random.rand(20, 2)}
+    async with weaviate.use_async_with_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        collection = client.collections.get("BatchCollection")
+        async with collection.batch.fixed_size(batch_size=7) as batch:
+            uuids = await batch.add_objects(vectors=vectors)
+
+    sent = {obj.uuid: obj for request in batch_requests for obj in request.objects}
+    assert len(sent) == 20
+    for i, uid in enumerate(uuids):
+        named = {vec.name: vec.vector_bytes for vec in sent[str(uid)].vectors}
+        assert named == {
+            name: matrix[i].astype("<f4").tobytes() for name, matrix in vectors.items()
+        }
+
+
+def test_sync_client_batch_add_objects(batch_requests: List[batch_pb2.BatchObjectsRequest]) -> None:
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    with client.batch.fixed_size(batch_size=10) as batch:
+        uuids = batch.add_objects(
+            "BatchCollection", properties=[{"i": i} for i in range(30)], vectors=np.ones((30, 3))
+        )
+    client.close()
+
+    sent = [obj for request in batch_requests for obj in request.objects]
+    assert sorted(obj.uuid for obj in sent) == sorted(str(uid) for uid in uuids)
+    assert all(obj.vector_bytes == np.ones(3, dtype="<f4").tobytes() for obj in sent)
+    assert len(client.batch.results.objs.uuids) == 30
+
+
+def test_sync_collection_batch_add_objects_from_generator(
+    batch_requests: List[batch_pb2.BatchObjectsRequest],
+) -> None:
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    with collection.batch.fixed_size(batch_size=100) as batch:
+        uuids = batch.add_objects(properties=({"i": i} for i in range(2500)))
+    client.close()
+
+    sent = {obj.uuid: obj for request in batch_requests for obj in request.objects}
+    assert len(sent) == 2500
+    for i, uid in enumerate(uuids):
+        assert sent[str(uid)].properties.non_ref_properties["i"] == i
+    assert all(len(request.objects) <= 100 for request in batch_requests)
+    assert len(collection.batch.results.objs.uuids) == 2500
+
+
+def test_insert_arrow_from_parquet(
+    batch_requests: List[batch_pb2.BatchObjectsRequest], weaviate_mock: HTTPServer, tmp_path: Path
+) -> None:
+    weaviate_mock.expect_request("/v1/nodes").respond_with_json({"nodes": [{"name": "node1"}]})
+    uuids = [uuid.uuid4() for _ in range(250)]
+    vectors = np.random.rand(250, 4).astype(np.float32)
+    path = tmp_path / "data.parquet"
+    pq.write_table(
+        pa.table(
+            {
+                "id": [str(uid) for uid in uuids],
+                "name": [f"obj{i}" for i in range(250)],
+                "vec": pa.FixedSizeListArray.from_arrays(pa.array(vectors.ravel()), 4),
+            }
+        ),
+        path,
+    )
+
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    ret = collection.data.insert_arrow(
+        pq.ParquetFile(path).iter_batches(batch_size=100), uuid_column="id", vector_column="vec"
+    )
+    client.close()
+
+    assert len(ret.uuids) == 250 and not ret.has_errors
+    sent = {obj.uuid: obj for request in batch_requests for obj in request.objects}
+    for i, uid in enumerate(uuids):
+        obj = sent[str(uid)]
+        assert obj.vector_bytes == vectors[i].tobytes()
+        assert obj.properties.non_ref_properties["name"] == f"obj{i}"
+
+
+def test_dynamic_batch_exposes_node_stats(
+    batch_requests: List[batch_pb2.BatchObjectsRequest], weaviate_mock: HTTPServer
+) -> None:
+    for _ in range(10):  # one-shot handlers take precedence over the default /nodes response
+        weaviate_mock.expect_oneshot_request("/v1/nodes").respond_with_json(
+            {
+                "nodes": [
+                    {"name": "node1", "batchStats": {"queueLength": 10, "ratePerSecond": 100}},
+                    {"name": "node2", "batchStats": {"queueLength": 20, "ratePerSecond": 300}},
+                ]
+            }
+        )
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    with collection.batch.dynamic() as batch:
+        batch.add_object(properties={"name": "obj"})
+        for _ in range(50):
+            if len(batch.node_batch_stats) > 0:
+                break
+            time.sleep(0.1)
+        assert batch.node_batch_stats == {
+            "node1": {"queueLength": 10, "ratePerSecond": 100},
+            "node2": {"queueLength": 20, "ratePerSecond": 300},
+        }
+    client.close()
+
+
+def _wait_for(condition: Callable[[], bool]) -> None:
+    for _ in range(50):
+        if condition():
+            return
+        time.sleep(0.1)
+
+
+async def _wait_for_async(condition: Callable[[], bool]) -> None:
+    for _ in range(50):
+        if condition():
+            return
+        await asyncio.sleep(0.1)
+
+
+@pytest.fixture(scope="function")
+def pi_controller_gains(
+    batch_requests: List[batch_pb2.BatchObjectsRequest],
+    weaviate_mock: HTTPServer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> List[float]:
+    for _ in range(10):  # one-shot handlers take precedence over the default /nodes response
+        weaviate_mock.expect_oneshot_request("/v1/nodes").respond_with_json(
+            {"nodes": [{"name": "node1", "batchStats": {"queueLength": 10, "ratePerSecond": 100}}]}
+        )
+    gains: List[float] = []
+    update = _PIController.update
+
+    def recording_update(self: _PIController, *args: Any) -> None:
+        gains.append(self.kp)
+        update(self, *args)
+
+    monkeypatch.setattr(_PIController, "update", recording_update)
+    return gains
+
+
+@pytest.mark.parametrize("batch_of", ["collection", "client"])
+def test_dynamic_batch_uses_controller(pi_controller_gains: List[float], batch_of: str) -> None:
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    if batch_of == "collection":
+        with collection.batch.dynamic(controller=PIControl(kp=0.25)) as batch:
+            batch.add_object(properties={"name": "obj"})
+            _wait_for(lambda: len(pi_controller_gains) > 0)
+    else:
+        with client.batch.dynamic(controller=PIControl(kp=0.25)) as client_batch:
+            client_batch.add_object(collection="BatchCollection", properties={"name": "obj"})
+            _wait_for(lambda: len(pi_controller_gains) > 0)
+    client.close()
+    assert len(pi_controller_gains) > 0 and set(pi_controller_gains) == {0.25}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_of", ["collection", "client"])
+async def test_async_dynamic_batch_uses_controller(
+    pi_controller_gains: List[float], batch_of: str
+) -> None:
+    async with weaviate.use_async_with_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        collection = client.collections.get("BatchCollection")
+        if batch_of == "collection":
+            async with collection.batch.dynamic(controller=PIControl(kp=0.25)) as batch:
+                await batch.add_object(properties={"name": "obj"})
+                await _wait_for_async(lambda: len(pi_controller_gains) > 0)
+        else:
+            async with client.batch.dynamic(controller=PIControl(kp=0.25)) as client_batch:
+                await client_batch.add_object(
+                    collection="BatchCollection", properties={"name": "obj"}
+                )
+                await _wait_for_async(lambda: len(pi_controller_gains) > 0)
+    assert len(pi_controller_gains) > 0 and set(pi_controller_gains) == {0.25}
+
+
+def test_batch_splits_requests_by_size(batch_requests: List[batch_pb2.BatchObjectsRequest]) -> None:
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    with collection.batch.fixed_size(batch_size=100, max_request_bytes=50_000) as batch:
+        batch.add_objects(properties=[{"text": "x" * 10_000} for _ in range(30)])
+    client.close()
+
+    assert sum(len(request.objects) for request in batch_requests) == 30
+    assert all(request.ByteSize() <= 50_000 for request in batch_requests)
+    assert len(batch_requests) == 8  # 4 objects of ~10kb per request
+
+
+def test_insert_many_reports_oversized_objects(
+    batch_requests: List[batch_pb2.BatchObjectsRequest], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(grpc_batch_objects, "MAX_GRPC_MESSAGE_LENGTH", 100_000)
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    ret = collection.data.insert_many(
+        [{"text": "x" * 30_000} for _ in range(6)] + [{"text": "x" * 200_000}]
+    )
+    client.close()
+
+    assert list(ret.errors) == [6]
+    assert "exceeds the maximum gRPC message size" in ret.errors[6].message
+    assert len(ret.uuids) == 6
+    assert [len(request.objects) for request in batch_requests] == [3, 3]
+
+
+def test_insert_many_chunks_concurrently(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+    lock = threading.Lock()
+    in_flight = [0]
+    max_in_flight = [0]
+    request_sizes: List[int] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+                request_sizes.append(len(request.objects))
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            if request.objects[0].properties.non_ref_properties["i"] == 200:
+                context.abort(grpc.StatusCode.INTERNAL, "chunk failed")
+            return batch_pb2.BatchObjectsReply(
+                errors=[
+                    batch_pb2.BatchObjectsReply.BatchError(index=idx, error="odd")
+                    for idx, obj in enumerate(request.objects)
+                    if obj.properties.non_ref_properties["i"] % 100 == 1
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    ret = collection.data.insert_many(
+        [{"i": i} for i in range(1000)], chunk_size=100, max_concurrency=3
+    )
+    client.close()
+
+    assert sorted(request_sizes) == [100] * 10
+    assert max_in_flight[0] == 3
+    failed_chunk = set(range(200, 300))
+    assert set(ret.errors) == set(range(1, 1000, 100)) | failed_chunk
+    assert "chunk failed" in ret.errors[250].message
+    assert ret.errors[101].message == "odd" and ret.errors[101].object_.properties == {"i": 101}
+    assert set(ret.uuids) == set(range(1000)) - set(ret.errors)
+
+
+def test_insert_many_raises_if_every_chunk_fails(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            context.abort(grpc.StatusCode.UNAVAILABLE, "overloaded")
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    with pytest.raises(WeaviateBatchError):
+        collection.data.insert_many([{"i": i} for i in range(50)], chunk_size=10)
+    client.close()
+
+
+def test_batch_retries_rate_limited_objects_without_blocking(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+    seen: List[str] = []
+    inserted: List[str] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            errors = []
+            for idx, obj in enumerate(request.objects):
+                if obj.uuid in seen or idx % 2 == 1:
+                    inserted.append(obj.uuid)
+                else:
+                    errors.append(
+                        batch_pb2.BatchObjectsReply.BatchError(
+                            index=idx, error="OpenAI API error: Rate limit reached for requests"
+                        )
+                    )
+                seen.append(obj.uuid)
+            return batch_pb2.BatchObjectsReply(errors=errors)
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    with pytest.warns(UserWarning, match="Rate limit reached"):
+        with collection.batch.fixed_size(batch_size=20) as batch:
+            uuids = batch.add_objects(properties=[{"i": i} for i in range(20)])
+            while len(seen) < 20:
+                time.sleep(0.01)
+            # the backoff must not block the event loop that is shared with all other requests
+            start = time.perf_counter()
+            _EventLoopSingleton.get_instance().run_until_complete(asyncio.sleep, 0)
+            assert time.perf_counter() - start < 0.1
+    client.close()
+
+    assert sorted(inserted) == sorted(str(uid) for uid in uuids)
+    assert len(collection.batch.failed_objects) == 0
+    assert len(collection.batch.results.objs.uuids) == 20
+
+
+@pytest.mark.parametrize("retry_budget", [None, RetryBudget(min_retries=0, ratio=0)])
+def test_batch_retries_user_retry_classes(
+    weaviate_mock: HTTPServer,
+    start_grpc_server: grpc.Server,
+    retry_budget: Optional[RetryBudget],
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+    seen: List[str] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            errors = [
+                batch_pb2.BatchObjectsReply.BatchError(
+                    index=idx, error="embedding service: quota exceeded, try again later"
+                )
+                for idx, obj in enumerate(request.objects)
+                if obj.uuid not in seen
+            ]
+            seen.extend(obj.uuid for obj in request.objects)
+            return batch_pb2.BatchObjectsReply(errors=errors)
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    retry_class = RetryClass(name="quota", patterns=["quota exceeded"], base_delay=0.01)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)  # warns about the rate limit of every retry
+        with collection.batch.fixed_size(
+            batch_size=10, retry_classes=[retry_class], retry_budget=retry_budget
+        ) as batch:
+            batch.add_objects(properties=[{"i": i} for i in range(10)])
+    client.close()
+
+    if retry_budget is None:
+        assert len(seen) == 20
+        assert len(collection.batch.failed_objects) == 0
+        assert len(collection.batch.results.objs.uuids) == 10
+    else:  # no retries are left in the budget
+        assert len(seen) == 10
+        assert len(collection.batch.failed_objects) == 10
+
+
+@pytest.mark.parametrize("async_callback", [False, True])
+def test_batch_streams_errors(
+    weaviate_mock: HTTPServer,
+    start_grpc_server: grpc.Server,
+    tmp_path: Path,
+    async_callback: bool,
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            return batch_pb2.BatchObjectsReply(
+                errors=[
+                    batch_pb2.BatchObjectsReply.BatchError(index=idx, error="invalid")
+                    for idx, obj in enumerate(request.objects)
+                    if obj.properties.non_ref_properties["i"] % 10 == 0
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    streamed: List[Union[ErrorObject, ErrorReference]] = []
+
+    def on_error(error: Union[ErrorObject, ErrorReference]) -> None:
+        streamed.append(error)
+
+    async def on_error_async(error: Union[ErrorObject, ErrorReference]) -> None:
+        streamed.append(error)
+
+    path = tmp_path / "failed.jsonl"
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    with collection.batch.fixed_size(
+        batch_size=25,
+        on_error=on_error_async if async_callback else on_error,
+        failed_objects_path=str(path),
+    ) as batch:
+        batch.add_objects(properties=[{"i": i} for i in range(100)], vectors=np.ones((100, 2)))
+    assert batch.number_errors == 10
+    client.close()
+
+    assert sorted(cast(ErrorObject, error).object_.index for error in streamed) == list(
+        range(0, 100, 10)
+    )
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert sorted(line["properties"]["i"] for line in lines) == list(range(0, 100, 10))
+    assert all(line["message"] == "invalid" and line["vector"] == [1, 1] for line in lines)
+
+    # failures are streamed instead of being kept
+    assert len(collection.batch.failed_objects) == 0
+    assert len(collection.batch.results.objs.errors) == 0
+    assert collection.batch.results.objs.has_errors
+    assert len(collection.batch.results.objs.uuids) == 90
+
+
+@pytest.mark.parametrize("failing_sink", ["callback", "file"])
+def test_batch_exits_if_streaming_errors_fails(
+    weaviate_mock: HTTPServer,
+    start_grpc_server: grpc.Server,
+    tmp_path: Path,
+    failing_sink: str,
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            return batch_pb2.BatchObjectsReply(
+                errors=[
+                    batch_pb2.BatchObjectsReply.BatchError(index=idx, error="invalid")
+                    for idx in range(len(request.objects))
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    def on_error(error: Union[ErrorObject, ErrorReference]) -> None:
+        raise ValueError("callback failed")
+
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    # a directory cannot be opened to write the failed objects into
+    kwargs: Dict[str, Any] = (
+        {"on_error": on_error}
+        if failing_sink == "callback"
+        else {"failed_objects_path": str(tmp_path)}
+    )
+    with collection.batch.fixed_size(batch_size=5, **kwargs) as batch:
+        batch.add_objects(properties=[{"i": i} for i in range(20)])
+    client.close()
+
+    if failing_sink == "callback":
+        # the results are still accounted for
+        assert batch.number_errors == 20
+
+
+def test_batch_journal_resumes(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server, tmp_path: Path
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+    sent: List[int] = []
+    failing = {12, 20}
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            sent.extend(int(obj.properties.non_ref_properties["i"]) for obj in request.objects)
+            return batch_pb2.BatchObjectsReply(
+                errors=[
+                    batch_pb2.BatchObjectsReply.BatchError(index=idx, error="invalid")
+                    for idx, obj in enumerate(request.objects)
+                    if obj.properties.non_ref_properties["i"] in failing
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    path = str(tmp_path / "journal")
+    source = [{"i": i} for i in range(30)]
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    with collection.batch.fixed_size(batch_size=10, journal_path=path) as batch:
+        for obj in source:
+            batch.add_object(properties=obj)
+
+    state = read_batch_journal(path)
+    assert state.resume_offset == 12
+    assert sorted(state.unacknowledged) == [12, 20]
+
+    # resume: only the objects that were not acknowledged are sent again
+    sent.clear()
+    failing.clear()
+    with collection.batch.fixed_size(batch_size=10, journal_path=path) as batch:
+        batch.add_objects(properties=source[state.resume_offset :])
+    client.close()
+    assert sorted(sent) == [12, 20]
+    assert sorted(collection.batch.results.objs.uuids) == [12, 20]
+    assert read_batch_journal(path).resume_offset == 30
+
+
+def test_batch_deduplicates(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server, tmp_path: Path
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+    sent: List[int] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            sent.extend(int(obj.properties.non_ref_properties["i"]) for obj in request.objects)
+            return batch_pb2.BatchObjectsReply()
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    dedup = Deduplication(path=str(tmp_path / "seen"))
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    with collection.batch.fixed_size(batch_size=10, deduplicate=dedup) as batch:
+        for i in list(range(20)) + list(range(10)):
+            batch.add_object(properties={"i": i}, uuid=uuid.UUID(int=i))
+    assert batch.number_duplicates == 10
+    assert sorted(sent) == list(range(20))
+
+    # the next run only sends the new objects
+    sent.clear()
+    with collection.batch.fixed_size(batch_size=10, deduplicate=dedup) as batch:
+        batch.add_objects(
+            properties=[{"i": i} for i in range(30)], uuids=[uuid.UUID(int=i) for i in range(30)]
+        )
+    client.close()
+    assert batch.number_duplicates == 20
+    assert sorted(sent) == list(range(20, 30))
+
+
+def test_batch_deduplicate_resends_objects_of_failed_requests(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+    sent: List[int] = []
+    num_requests = 0
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            nonlocal num_requests
+            num_requests += 1
+            if num_requests == 2:  # the whole second request fails
+                context.abort(grpc.StatusCode.INTERNAL, "internal error")
+            sent.extend(int(obj.properties.non_ref_properties["i"]) for obj in request.objects)
+            return batch_pb2.BatchObjectsReply()
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    failed: List[Union[ErrorObject, ErrorReference]] = []
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection")
+    with collection.batch.fixed_size(
+        batch_size=3, deduplicate=Deduplication(), on_error=failed.append
+    ) as batch:
+        for i in range(6):
+            batch.add_object(properties={"i": i}, uuid=uuid.UUID(int=i))
+            if i == 2:
+                batch.flush()
+        batch.flush()
+        assert sorted(cast(ErrorObject, err).object_.index for err in failed) == [3, 4, 5]
+        # re-added objects of the failed request are not duplicates
+        for err in failed:
+            obj = cast(ErrorObject, err).object_
+            batch.add_object(properties=obj.properties, uuid=obj.uuid)
+    client.close()
+    assert batch.number_duplicates == 0
+    assert sorted(sent) == list(range(6))
+
+
+def test_batch_serialization_executor(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+    requests: List[batch_pb2.BatchObjectsRequest] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            requests.append(request)
+            return batch_pb2.BatchObjectsReply()
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    collection = client.collections.get("BatchCollection").with_consistency_level(
+        ConsistencyLevel.QUORUM
+    )
+    with ThreadPoolExecutor(2) as executor:
+        with collection.batch.fixed_size(batch_size=10, serialization_executor=executor) as batch:
+            for i in range(25):
+                batch.add_object(properties={"i": i, "nested": {"a": [1, 2]}}, vector=[0.5, 1])
+    client.close()
+
+    assert len(collection.batch.results.objs.uuids) == 25
+    assert sorted(
+        int(obj.properties.non_ref_properties["i"]) for r in requests for obj in r.objects
+    ) == list(range(25))
+    assert all(
+        r.consistency_level == base_pb2.ConsistencyLevel.CONSISTENCY_LEVEL_QUORUM for r in requests
+    )
+
+
+@pytest.mark.parametrize("batch_size", [5, None])
+def test_ingest_parallel(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server, batch_size: Optional[int]
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/BatchCollection").respond_with_json(
+        response_json={}, status=404
+    )
+    sent: List[int] = []
+    lock = threading.Lock()
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            with lock:
+                sent.extend(int(obj.properties.non_ref_properties["i"]) for obj in request.objects)
+            return batch_pb2.BatchObjectsReply(
+                errors=[
+                    batch_pb2.BatchObjectsReply.BatchError(index=idx, error="invalid")
+                    for idx, obj in enumerate(request.objects)
+                    if obj.properties.non_ref_properties["i"] % 10 == 0
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    progress: List[weaviate.ingest.IngestProgress] = []
+    result = weaviate.ingest.parallel(
+        ({"i": i} for i in range(50)),
+        "BatchCollection",
+        functools.partial(
+            weaviate.connect_to_local, host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+        ),
+        processes=2,
+        batch_size=batch_size,
+        chunk_size=10,
+        on_progress=progress.append,
+    )
+    assert sorted(sent) == list(range(50))
+    assert result.num_objects == 50
+    assert len(progress) == 5 and progress[-1].num_objects == 50
+
+    # the indices are the positions in the source, no matter which worker imported an object
+    assert sorted(result.results.objs.errors) == list(range(0, 50, 10))
+    assert sorted(result.results.objs.uuids) == [i for i in range(50) if i % 10 != 0]
+    assert sorted(error.object_.index for error in result.failed_objects) == list(range(0, 50, 10))
+    assert all(
+        error.object_.properties == {"i": error.object_.index} for error in result.failed_objects
+    )
+
+
+def test_wait_for_vector_indexing(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    queue_sizes = [300, 200, 100, 0]
+    calls: List[str] = []
+
+    def nodes(request: Request) -> Response:
+        calls.append(request.query_string.decode())
+        size = queue_sizes[min(len(calls), len(queue_sizes)) - 1]
+        shard = {
+            "class": "BatchCollection",
+            "name": "abc",
+            "objectCount": 1000,
+            "vectorIndexingStatus": "INDEXING" if size > 0 else "READY",
+            "vectorQueueLength": size,
+            "compressed": False,
+            "loaded": True,
+        }
+        # the shard is replicated on both nodes
+        return Response(
+            json.dumps({"nodes": [{"name": f"node{i}", "shards": [shard]} for i in range(2)]})
+        )
+
+    weaviate_mock.expect_request("/v1/nodes/BatchCollection").respond_with_handler(nodes)
+
+    client = weaviate.connect_to_local(host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC)
+    progress: List[VectorIndexingProgress] = []
+    client.batch.wait_for_vector_indexing(
+        shards=[Shard(collection="BatchCollection")], on_progress=progress.append
+    )
+    client.close()
+
+    assert calls == ["output=verbose"] * 4
+    assert [p.vector_queue_size for p in progress] == [600, 400, 200, 0]
+    assert [p.shards_not_ready for p in progress] == [2, 2, 2, 0]
+    assert progress[-1].elapsed_seconds < 5
+
+
+@pytest.mark.asyncio
+async def test_insert_coalescing(weaviate_mock: HTTPServer, start_grpc_server: grpc.Server) -> None:
+    requests: List[batch_pb2.BatchObjectsRequest] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            requests.append(request)
+            return batch_pb2.BatchObjectsReply(
+                errors=[
+                    batch_pb2.BatchObjectsReply.BatchError(index=idx, error="invalid")
+                    for idx, obj in enumerate(request.objects)
+                    if obj.properties.non_ref_properties["i"] == 7
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    async with weaviate.use_async_with_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        data = client.collections.get("BatchCollection").data.with_coalescing(
+            max_delay=0.05, max_objects=10
+        )
+        uuids = [uuid.uuid4() for _ in range(25)]
+        results = await asyncio.gather(
+            *[data.insert(properties={"i": i}, uuid=uid) for i, uid in enumerate(uuids)],
+            return_exceptions=True,
+        )
+
+    assert [len(request.objects) for request in requests] == [10, 10, 5]
+    assert isinstance(results[7], WeaviateBatchError) and results[7].message == "invalid"
+    assert results[:7] + results[8:] == uuids[:7] + uuids[8:]
+
+    # a request with only a failing object raises its error instead of that every object failed
+    with weaviate.connect_to_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as sync_client:
+        data_sync = sync_client.collections.get("BatchCollection").data.with_coalescing()
+        with pytest.raises(WeaviateBatchError):
+            data_sync.insert(properties={"i": 7})
+        assert data_sync.insert(properties={"i": 8}, uuid=uuids[0]) == uuids[0]
+
+
+def test_insert_coalescing_vectors(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    requests: List[batch_pb2.BatchObjectsRequest] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def BatchObjects(
+            self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+        ) -> batch_pb2.BatchObjectsReply:
+            requests.append(request)
+            return batch_pb2.BatchObjectsReply()
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+
+    with weaviate.connect_to_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        data = client.collections.get("BatchCollection").data.with_coalescing()
+        data.insert(properties={"i": 0}, vector=np.array([0.5, 1.5], dtype=np.float32))
+        data.insert(properties={"i": 1}, vector={"named": np.array([2.5, 3.5])})
+
+    # vectors of every supported type are sent like with an insert that is not coalesced
+    assert np.frombuffer(requests[0].objects[0].vector_bytes, dtype="<f4").tolist() == [0.5, 1.5]
+    named = requests[1].objects[0].vectors[0]
+    assert named.name == "named"
+    assert np.frombuffer(named.vector_bytes, dtype="<f4").tolist() == [2.5, 3.5]
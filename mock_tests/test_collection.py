@@ -1,9 +1,12 @@
 import datetime
 import json
+import pickle
 import time
-from typing import Any, Dict
+import uuid
+from typing import Any, Dict, List
 
 import grpc
+import numpy as np
 import pytest
 from pytest_httpserver import HTTPServer
 from werkzeug import Request, Response
@@ -27,7 +30,12 @@ from weaviate.collections.classes.config import (
 )
 from weaviate.connect.base import ConnectionParams, ProtocolParams
 from weaviate.connect.integrations import _IntegrationConfig
-from weaviate.exceptions import UnexpectedStatusCodeError, WeaviateStartUpError
+from weaviate.exceptions import (
+    UnexpectedStatusCodeError,
+    WeaviateInvalidInputError,
+    WeaviateStartUpError,
+)
+from weaviate.proto.v1 import base_pb2, properties_pb2, search_get_pb2, weaviate_pb2_grpc
 
 ACCESS_TOKEN = "HELLO!IamAnAccessToken"
 REFRESH_TOKEN = "UseMeToRefreshYourAccessToken"
@@ -350,6 +358,35 @@ def test_year_zero(year_zero_collection: weaviate.collections.Collection) -> Non
         assert str(recwarn[0].message).startswith("Con004")
 
 
+def test_invalid_date(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> None:
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def Search(
+            self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+        ) -> search_get_pb2.SearchReply:
+            return search_get_pb2.SearchReply(
+                results=[
+                    search_get_pb2.SearchResult(
+                        properties=search_get_pb2.PropertiesResult(
+                            non_ref_props=properties_pb2.Properties(
+                                fields={
+                                    "date": properties_pb2.Value(date_value="2024-13-45T00:00:00Z"),
+                                    "name": properties_pb2.Value(text_value="object"),
+                                }
+                            )
+                        )
+                    ),
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    collection = weaviate_client.collections.get("InvalidDateCollection")
+    with pytest.warns(UserWarning, match="Grpc002"):
+        objs = collection.query.fetch_objects().objects
+    assert objs[0].properties == {"date": None, "name": "object"}
+
+
 @pytest.mark.parametrize("output", ["minimal", "verbose"])
 def test_node_with_timeout(
     httpserver: HTTPServer, start_grpc_server: grpc.Server, output: str
@@ -370,3 +407,260 @@ def test_node_with_timeout(
 
     nodes = client.cluster.nodes(output=output)
     assert nodes[0].status == "TIMEOUT"
+
+
+def test_query_vector_format(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> None:
+    vectors = np.arange(12, dtype="<f4").reshape(2, 2, 3)
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def Search(
+            self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+        ) -> search_get_pb2.SearchReply:
+            return search_get_pb2.SearchReply(
+                results=[
+                    search_get_pb2.SearchResult(
+                        metadata=search_get_pb2.MetadataResult(
+                            # the named vectors are returned even if not all were requested
+                            vectors=[
+                                base_pb2.Vectors(name=name, vector_bytes=vector.tobytes())
+                                for name, vector in zip(["a", "b"], object_vectors)
+                            ]
+                        )
+                    )
+                    for object_vectors in vectors
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    collection = weaviate_client.collections.get("VectorFormat")
+
+    res = collection.query.fetch_objects(include_vector=["a"], vector_format="numpy")
+    assert all(list(obj.vector) == ["a"] for obj in res.objects)
+    assert isinstance(res.objects[0].vector["a"], np.ndarray)
+    assert np.array_equal(res.vectors("a"), vectors[:, 0])
+
+    res = collection.query.fetch_objects(include_vector=True)
+    assert res.objects[1].vector == {"a": [6.0, 7.0, 8.0], "b": [9.0, 10.0, 11.0]}
+    assert np.array_equal(res.vectors("b"), vectors[:, 1])
+
+    # the default of the collection is kept by collection objects derived from it
+    collection = weaviate_client.collections.get("VectorFormat", vector_format="numpy")
+    res = collection.with_tenant("tenant").query.fetch_objects(include_vector=True)
+    assert isinstance(res.objects[0].vector["b"], np.ndarray)
+    res = collection.query.fetch_objects(include_vector=True, vector_format="list")
+    assert isinstance(res.objects[0].vector["b"], list)
+    with pytest.raises(WeaviateInvalidInputError):
+        res.vectors("c")
+
+
+def test_query_return_format_arrow(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> None:
+    uuids = [uuid.uuid4(), uuid.uuid4()]
+    vectors = np.arange(6, dtype="<f4").reshape(2, 3)
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def Search(
+            self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+        ) -> search_get_pb2.SearchReply:
+            results = [
+                search_get_pb2.SearchResult(
+                    metadata=search_get_pb2.MetadataResult(
+                        id_as_bytes=uuids[i].bytes,
+                        vector_bytes=vectors[i].tobytes(),
+                        distance=0.5 * i,
+                        distance_present=True,
+                        creation_time_unix=1700000000000 + i,
+                        creation_time_unix_present=True,
+                    ),
+                    properties=search_get_pb2.PropertiesResult(
+                        non_ref_props=properties_pb2.Properties(
+                            fields={
+                                "name": properties_pb2.Value(text_value=f"object {i}"),
+                                "count": properties_pb2.Value(int_value=i),
+                                "date": properties_pb2.Value(
+                                    date_value=f"2024-01-0{i + 1}T00:00:00Z"
+                                ),
+                                "numbers": properties_pb2.Value(
+                                    list_value=properties_pb2.ListValue(
+                                        number_values=properties_pb2.NumberValues(
+                                            values=np.arange(i + 1, dtype="<f8").tobytes()
+                                        )
+                                    )
+                                ),
+                                "nested": properties_pb2.Value(
+                                    object_value=properties_pb2.Properties(
+                                        fields={"flag": properties_pb2.Value(bool_value=i == 0)}
+                                    )
+                                ),
+                            }
+                        )
+                    ),
+                )
+                for i in range(2)
+            ]
+            if request.HasField("group_by"):
+                return search_get_pb2.SearchReply(
+                    group_by_results=[
+                        search_get_pb2.GroupByResult(name=f"group {i}", objects=[result])
+                        for i, result in enumerate(results)
+                    ]
+                )
+            return search_get_pb2.SearchReply(results=results)
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    collection = weaviate_client.collections.get("ArrowFormat")
+
+    table = collection.query.fetch_objects(
+        include_vector=True,
+        return_metadata=wvc.query.MetadataQuery(distance=True, creation_time=True),
+        return_format="arrow",
+    )
+    assert table.column_names == [
+        "uuid",
+        "distance",
+        "creation_time",
+        "vector",
+        "count",
+        "date",
+        "name",
+        "nested",
+        "numbers",
+    ]
+    assert [uuid.UUID(bytes=b) for b in table["uuid"].to_pylist()] == uuids
+    assert table["distance"].to_pylist() == [0.0, 0.5]
+    assert str(table["creation_time"].type) == "timestamp[ms, tz=UTC]"
+    assert np.array_equal(
+        table["vector"].combine_chunks().flatten().to_numpy().reshape(2, 3), vectors
+    )
+    assert table["count"].to_pylist() == [0, 1]
+    assert table["date"].to_pylist()[1] == datetime.datetime(
+        2024, 1, 2, tzinfo=datetime.timezone.utc
+    )
+    assert table["numbers"].to_pylist() == [[0.0], [0.0, 1.0]]
+    assert table["nested"].to_pylist() == [{"flag": True}, {"flag": False}]
+    assert list(table.to_pandas()["name"]) == ["object 0", "object 1"]
+
+    table = collection.query.near_vector(
+        [1.0, 2.0, 3.0],
+        group_by=wvc.query.GroupBy(prop="name", number_of_groups=2, objects_per_group=1),
+        return_format="arrow",
+    )
+    assert table["belongs_to_group"].to_pylist() == ["group 0", "group 1"]
+
+
+def test_query_return_format_lazy(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> None:
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def Search(
+            self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+        ) -> search_get_pb2.SearchReply:
+            return search_get_pb2.SearchReply(
+                results=[
+                    search_get_pb2.SearchResult(
+                        metadata=search_get_pb2.MetadataResult(
+                            id_as_bytes=uuid.uuid4().bytes,
+                            vector_bytes=np.arange(3, dtype="<f4").tobytes(),
+                            distance=0.5 * i,
+                            distance_present=True,
+                        ),
+                        properties=search_get_pb2.PropertiesResult(
+                            target_collection="LazyFormat",
+                            non_ref_props=properties_pb2.Properties(
+                                fields={
+                                    "name": properties_pb2.Value(text_value=f"object {i}"),
+                                    "date": properties_pb2.Value(date_value="2024-01-01T00:00:00Z"),
+                                }
+                            ),
+                        ),
+                    )
+                    for i in range(2)
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    collection = weaviate_client.collections.get("LazyFormat")
+
+    kwargs: Dict[str, Any] = {
+        "include_vector": True,
+        "return_metadata": wvc.query.MetadataQuery(distance=True),
+    }
+    objects = collection.query.fetch_objects(**kwargs).objects
+    lazy_objects = collection.query.fetch_objects(return_format="lazy", **kwargs).objects
+    for obj, lazy_obj in zip(objects, lazy_objects):
+        assert lazy_obj.properties["name"] == obj.properties["name"]
+        assert lazy_obj.properties == obj.properties
+        assert lazy_obj.metadata == obj.metadata
+        assert lazy_obj.vector == obj.vector
+        assert lazy_obj.collection == "LazyFormat"
+        assert isinstance(lazy_obj.uuid, uuid.UUID)
+
+    # lazy objects are pickled as decoded objects
+    unpickled = pickle.loads(pickle.dumps(lazy_objects[1]))
+    assert type(unpickled) is type(objects[1])
+    assert unpickled.properties == {
+        "name": "object 1",
+        "date": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    }
+
+
+def test_prepared_near_vector(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> None:
+    requests: List[search_get_pb2.SearchRequest] = []
+
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def Search(
+            self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+        ) -> search_get_pb2.SearchReply:
+            requests.append(request)
+            return search_get_pb2.SearchReply(
+                results=[
+                    search_get_pb2.SearchResult(
+                        metadata=search_get_pb2.MetadataResult(id_as_bytes=uuid.uuid4().bytes),
+                        properties=search_get_pb2.PropertiesResult(
+                            non_ref_props=properties_pb2.Properties(
+                                fields={"name": properties_pb2.Value(text_value="object")}
+                            )
+                        ),
+                    )
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    collection = weaviate_client.collections.get("Prepared")
+
+    prepared = collection.query.prepare(
+        [0.0, 0.0],
+        distance=0.5,
+        limit=3,
+        filters=wvc.query.Filter.by_property("name").equal("a"),
+        return_properties=["name"],
+    )
+    res = prepared.near_vector([1.0, 2.0])
+    assert res.objects[0].properties == {"name": "object"}
+    res = prepared.near_vector(
+        np.array([3.0, 4.0]), limit=5, filters=wvc.query.Filter.by_property("name").equal("b")
+    )
+
+    # each search sends the prepared request with only the vector and the given options replaced
+    assert [np.frombuffer(r.near_vector.vector_bytes, dtype="<f4").tolist() for r in requests] == [
+        [1.0, 2.0],
+        [3.0, 4.0],
+    ]
+    assert [r.limit for r in requests] == [3, 5]
+    assert [r.filters.value_text for r in requests] == ["a", "b"]
+    assert all(r.near_vector.distance == 0.5 for r in requests)
+    assert all(list(r.properties.non_ref_properties) == ["name"] for r in requests)
+
+    # a certainty replaces the prepared distance, a request with both is rejected by Weaviate
+    requests.clear()
+    prepared.near_vector([1.0, 2.0], certainty=0.7)
+    prepared.near_vector([1.0, 2.0], distance=0.2)
+    assert [r.near_vector.HasField("certainty") for r in requests] == [True, False]
+    assert [r.near_vector.HasField("distance") for r in requests] == [False, True]
+    assert requests[0].near_vector.certainty == pytest.approx(0.7)
+    assert requests[1].near_vector.distance == pytest.approx(0.2)
@@ -0,0 +1,199 @@
+# Deterministic offline simulation of the dynamic batching controllers. Weaviate is modelled as a FIFO batch queue
+# that is drained at a given capacity, the client sends batches whenever one of its request slots is free and feeds
+# synthetic `/nodes` batch statistics into `_BatchSizing.update` once per second, like the real batcher does.
+# No Weaviate instance, threads or clocks are involved, so every run produces the same numbers.
+# run:
+# - report: pytest profiling/test_batch_controller.py -s
+import math
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, List, Type
+
+import pytest
+
+from weaviate.collections.batch.base import _BatchSizing, _DynamicBatching
+from weaviate.collections.batch.controller import (
+    _BatchController,
+    _PIController,
+    _ThresholdController,
+)
+
+TICK = 0.01  # seconds
+UPDATE_INTERVAL = 1  # seconds between two calls of `_BatchSizing.update`
+DURATION = 180  # seconds
+WARMUP = 30  # seconds that are excluded from the queue statistics
+RATE_SMOOTHING = 0.2  # EMA factor of the simulated ratePerSecond
+REQUEST_OVERHEAD = 0.005  # seconds of server time per request, independent of its size
+NETWORK_LATENCY = 0.02  # seconds between sending a request and it reaching the queue, and back
+
+
+@dataclass
+class _Request:
+    num_objects: int
+    sent_at: float
+    remaining: float = 0
+    overhead: float = REQUEST_OVERHEAD
+
+
+@dataclass
+class SimulationResult:
+    name: str
+    throughput: float  # objects per second over the whole run
+    queue_seconds_mean: float  # length of the Weaviate queue in seconds of work, after the warmup
+    queue_seconds_stdev: float
+    batch_size_changes: float  # mean relative change of the batch size between two updates
+    max_latency: float
+    num_objects: List[int] = field(default_factory=list)
+
+
+def simulate(
+    name: str,
+    controller: Type[_BatchController],
+    capacity: Callable[[float], float],
+    duration: float = DURATION,
+) -> SimulationResult:
+    """Replay a dynamic batching run against a server with `capacity(t)` objects per second."""
+    sizing = _BatchSizing(_DynamicBatching(controller=controller), vectorizer_batching=False)
+
+    queue: Deque[_Request] = deque()  # requests waiting for or being processed by Weaviate
+    in_flight: List[_Request] = []  # requests on their way to Weaviate
+    rate = 0.0
+    processed_total = 0
+    queue_seconds: List[float] = []
+    latencies: List[float] = []
+    batch_sizes: List[int] = [sizing.num_objects]
+
+    steps = int(duration / TICK)
+    update_every = int(UPDATE_INTERVAL / TICK)
+    for step in range(steps):
+        now = step * TICK
+
+        # the client sends a new batch for every free request slot
+        while sizing.num_objects > 0 and len(queue) + len(in_flight) < sizing.concurrent_requests:
+            in_flight.append(_Request(sizing.num_objects, sent_at=now))
+
+        # requests reach Weaviate after the network latency
+        for request in [r for r in in_flight if now - r.sent_at >= NETWORK_LATENCY]:
+            in_flight.remove(request)
+            request.remaining = request.num_objects
+            queue.append(request)
+
+        # Weaviate processes the queue in order
+        budget = capacity(now) * TICK
+        processed = 0.0
+        while budget > 0 and len(queue) > 0:
+            head = queue[0]
+            if head.overhead > 0:
+                spent = min(head.overhead * capacity(now), budget)
+                head.overhead -= spent / capacity(now)
+                budget -= spent
+                continue
+            done = min(head.remaining, budget)
+            head.remaining -= done
+            budget -= done
+            processed += done
+            if head.remaining <= 0:
+                queue.popleft()
+                processed_total += head.num_objects
+                latency = now + TICK - head.sent_at + NETWORK_LATENCY
+                latencies.append(latency)
+                sizing.took_queue.append(latency)
+                sizing.batch_sent = True
+        rate = (1 - RATE_SMOOTHING * TICK) * rate + RATE_SMOOTHING * TICK * processed / TICK
+
+        queue_length = sum(request.remaining for request in queue)
+        if now >= WARMUP:
+            queue_seconds.append(queue_length / capacity(now))
+
+        if step % update_every == update_every - 1:
+            sizing.update(
+                [
+                    {  # type: ignore
+                        "batchStats": {
+                            "queueLength": int(queue_length),
+                            "ratePerSecond": int(rate),
+                        }
+                    }
+                ],
+                num_queued_objects=10**9,  # the client always has objects waiting
+                now=now,
+            )
+            batch_sizes.append(sizing.num_objects)
+
+    changes = [
+        abs(current - previous) / max(previous, 1)
+        for previous, current in zip(batch_sizes, batch_sizes[1:])
+    ]
+    return SimulationResult(
+        name=name,
+        throughput=processed_total / duration,
+        queue_seconds_mean=statistics.mean(queue_seconds),
+        queue_seconds_stdev=statistics.pstdev(queue_seconds),
+        batch_size_changes=statistics.mean(changes[int(WARMUP / UPDATE_INTERVAL) :]),
+        max_latency=max(latencies[len(latencies) // 10 :]),
+        num_objects=batch_sizes,
+    )
+
+
+def constant(value: float) -> Callable[[float], float]:
+    return lambda t: value
+
+
+def step(before: float, after: float, at: float = DURATION / 2) -> Callable[[float], float]:
+    return lambda t: before if t < at else after
+
+
+def wave(mean: float, amplitude: float, period: float = 60) -> Callable[[float], float]:
+    return lambda t: mean + amplitude * math.sin(2 * math.pi * t / period)
+
+
+SCENARIOS = {
+    "constant": constant(2000),
+    "step down": step(4000, 1000),
+    "step up": step(1000, 4000),
+    "wave": wave(2000, 1500),
+}
+CONTROLLERS = {"threshold": _ThresholdController, "pi": _PIController}
+
+
+def report(results: List[SimulationResult]) -> None:
+    print()
+    print(
+        f"{'scenario':<24} {'throughput':>10} {'queue mean':>10} {'queue sd':>9} "
+        f"{'size change':>11} {'max latency':>11}"
+    )
+    for result in results:
+        print(
+            f"{result.name:<24} {result.throughput:>10.0f} {result.queue_seconds_mean:>9.2f}s "
+            f"{result.queue_seconds_stdev:>8.2f}s {result.batch_size_changes:>10.1%} "
+            f"{result.max_latency:>10.2f}s"
+        )
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_simulation_is_deterministic(scenario: str) -> None:
+    first = simulate(scenario, _PIController, SCENARIOS[scenario], duration=60)
+    second = simulate(scenario, _PIController, SCENARIOS[scenario], duration=60)
+    assert first == second
+
+
+def test_compare_controllers() -> None:
+    results = [
+        simulate(f"{scenario} / {name}", controller, capacity)
+        for scenario, capacity in SCENARIOS.items()
+        for name, controller in CONTROLLERS.items()
+    ]
+    report(results)
+
+    by_name = {result.name: result for result in results}
+    for scenario in SCENARIOS:
+        pi = by_name[f"{scenario} / pi"]
+        threshold = by_name[f"{scenario} / threshold"]
+        assert pi.throughput >= 0.95 * threshold.throughput
+    # once the capacity is stable, the PI controller keeps the queue steadier, but the threshold controller reacts
+    # faster when the capacity drops
+    for scenario in ["constant", "step up"]:
+        pi = by_name[f"{scenario} / pi"]
+        threshold = by_name[f"{scenario} / threshold"]
+        assert pi.queue_seconds_stdev < threshold.queue_seconds_stdev
@@ -0,0 +1,94 @@
+# Measures the cost of encoding batch objects into protobuf messages for a wide schema with nested objects, with the
+# encoder compiled from the schema and with the encoding that inspects every value.
+# run:
+# - benchmark: pytest profiling/test_batch_encoding.py --benchmark-only --benchmark-disable-gc
+import datetime
+import uuid
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pytest
+
+from weaviate.collections.batch.encoders import _PropertyEncoder
+from weaviate.collections.batch.grpc_batch_objects import _grpc_objects
+from weaviate.collections.classes.batch import _BatchObject
+from weaviate.collections.classes.config import DataType
+
+NUM_OBJECTS = 1000
+NUM_COLUMNS = 10  # of every data type
+
+
+def wide_properties(i: int, numpy: bool = False) -> Dict[str, Any]:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    embedding: Any = np.arange(32, dtype=np.float64) if numpy else [float(x) for x in range(32)]
+    props: Dict[str, Any] = {}
+    for c in range(NUM_COLUMNS):
+        props[f"text{c}"] = f"some text {i}"
+        props[f"int{c}"] = i
+        props[f"number{c}"] = i / 3
+        props[f"date{c}"] = now
+        props[f"tags{c}"] = ["a", "b", "c"]
+        props[f"scores{c}"] = embedding
+        props[f"nested{c}"] = {
+            "name": "nested",
+            "count": i,
+            "when": now,
+            "items": [{"label": "x", "value": 1.5}, {"label": "y", "value": 2.5}],
+        }
+    return props
+
+
+def wide_encoder() -> _PropertyEncoder:
+    item = _PropertyEncoder({"label": DataType.TEXT, "value": DataType.NUMBER})
+    nested = _PropertyEncoder(
+        {
+            "name": DataType.TEXT,
+            "count": DataType.INT,
+            "when": DataType.DATE,
+            "items": DataType.OBJECT_ARRAY,
+        },
+        {"items": item},
+    )
+    encoder = _PropertyEncoder()
+    for c in range(NUM_COLUMNS):
+        encoder.data_types.update(
+            {
+                f"text{c}": DataType.TEXT,
+                f"int{c}": DataType.INT,
+                f"number{c}": DataType.NUMBER,
+                f"date{c}": DataType.DATE,
+                f"tags{c}": DataType.TEXT_ARRAY,
+                f"scores{c}": DataType.NUMBER_ARRAY,
+                f"nested{c}": DataType.OBJECT,
+            }
+        )
+        encoder.nested[f"nested{c}"] = nested
+    return encoder
+
+
+def batch_objects(numpy: bool = False) -> List[_BatchObject]:
+    return [
+        _BatchObject(
+            collection="Test",
+            vector=None,
+            uuid=str(uuid.uuid4()),
+            properties=wide_properties(i, numpy),
+            tenant=None,
+            references=None,
+            index=i,
+        )
+        for i in range(NUM_OBJECTS)
+    ]
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_benchmark_encode_wide_objects(benchmark: Any, compiled: bool) -> None:
+    objs = batch_objects()
+    encoders: Optional[Dict[str, _PropertyEncoder]] = {"Test": wide_encoder()} if compiled else None
+    benchmark.pedantic(lambda: _grpc_objects(objs, encoders), rounds=5)
+
+
+def test_benchmark_encode_wide_objects_numpy(benchmark: Any) -> None:
+    objs = batch_objects(numpy=True)
+    encoders = {"Test": wide_encoder()}
+    benchmark.pedantic(lambda: _grpc_objects(objs, encoders), rounds=5)
@@ -0,0 +1,138 @@
+# Measures the overhead of the thread-based batch scheduler without a running Weaviate instance. The gRPC
+# call is replaced by a fake that answers after a fixed latency, so only the client side is measured.
+# run:
+# - cpu/latency report: pytest -m profiling profiling/test_batch_scheduler.py -s
+# - benchmark: pytest profiling/test_batch_scheduler.py --benchmark-only --benchmark-disable-gc
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Any, Dict, Generator, List, Optional, Tuple, cast
+
+import pytest
+
+from weaviate.collections.batch.base import (
+    ReferencesBatchRequest,
+    _BatchBase,
+    _BatchDataWrapper,
+    _FixedSizeBatching,
+)
+from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
+from weaviate.collections.classes.batch import BatchObjectReturn, _BatchObject, _BatchReference
+from weaviate.connect import ConnectionV4
+from weaviate.event_loop import _EventLoopSingleton
+
+FAKE_REQUEST_LATENCY = 0.002
+
+
+@pytest.fixture
+def received(monkeypatch: pytest.MonkeyPatch) -> Generator[Dict[str, float], None, None]:
+    """Replace the gRPC batch call and record when each object reached the "server"."""
+    received_at: Dict[str, float] = {}
+
+    async def objects(
+        self: _BatchGRPC,
+        objects: List[_BatchObject],
+        timeout: Optional[int] = None,
+        max_request_bytes: Optional[int] = None,
+    ) -> BatchObjectReturn:
+        now = time.perf_counter()
+        for obj in objects:
+            received_at[obj.uuid] = now
+        await asyncio.sleep(FAKE_REQUEST_LATENCY)
+        return BatchObjectReturn(
+            _all_responses=[uuid.UUID(obj.uuid) for obj in objects],
+            uuids={obj.index: uuid.UUID(obj.uuid) for obj in objects},
+        )
+
+    monkeypatch.setattr(_BatchGRPC, "objects", objects)
+    yield received_at
+
+
+def new_batch(batch_size: int = 100, concurrent_requests: int = 2) -> _BatchBase:
+    return _BatchBase(
+        connection=cast(ConnectionV4, None),
+        consistency_level=None,
+        results=_BatchDataWrapper(),
+        batch_mode=_FixedSizeBatching(batch_size, concurrent_requests),
+        event_loop=_EventLoopSingleton.get_instance(),
+        vectorizer_batching=False,
+    )
+
+
+def percentile(values: List[float], q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(len(values) * q))]
+
+
+@pytest.mark.profiling
+def test_idle_cpu(received: Dict[str, float]) -> None:
+    batch = new_batch()
+    cpu_start = time.process_time()
+    time.sleep(2)
+    cpu = time.process_time() - cpu_start
+    batch._shutdown()
+    print(f"\nidle batch: {cpu * 1000 / 2:.2f}ms cpu per second")
+
+
+@pytest.mark.profiling
+def test_handoff_latency(received: Dict[str, float]) -> None:
+    """Add objects at a steady rate and measure how long each one waits in the queue."""
+    batch = new_batch(batch_size=10)
+    added_at: Dict[str, float] = {}
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for _ in range(2000):
+        uid = str(uuid.uuid4())
+        added_at[uid] = time.perf_counter()
+        batch._add_object(collection="Test", uuid=uid)
+        time.sleep(0.0005)
+    batch._shutdown()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    latencies = [(received[uid] - start) * 1000 for uid, start in added_at.items()]
+    print(
+        f"\nhandoff latency: p50={statistics.median(latencies):.2f}ms "
+        f"p99={percentile(latencies, 0.99):.2f}ms max={max(latencies):.2f}ms, "
+        f"cpu {cpu / wall * 100:.1f}% of one core"
+    )
+
+
+def test_benchmark_batch_throughput(benchmark: Any, received: Dict[str, float]) -> None:
+    def run() -> None:
+        batch = new_batch(batch_size=1000, concurrent_requests=4)
+        for _ in range(20000):
+            batch._add_object(collection="Test")
+        batch._shutdown()
+
+    benchmark.pedantic(run, rounds=5)
+
+
+def test_benchmark_batch_add_objects_throughput(benchmark: Any, received: Dict[str, float]) -> None:
+    def run() -> None:
+        batch = new_batch(batch_size=1000, concurrent_requests=4)
+        batch._add_objects_from_arrays(collection="Test", properties=({} for _ in range(20000)))
+        batch._shutdown()
+
+    benchmark.pedantic(run, rounds=5)
+
+
+@pytest.mark.parametrize("backlog", [10_000, 100_000])
+def test_benchmark_reference_release(benchmark: Any, backlog: int) -> None:
+    """Release references while a growing backlog of them still waits for pending objects."""
+    object_uuids = [str(uuid.uuid4()) for _ in range(1000)]
+    waiting = [str(uuid.uuid4()) for _ in range(backlog)]
+
+    def setup() -> Tuple[Tuple[ReferencesBatchRequest], Dict[str, Any]]:
+        queue = ReferencesBatchRequest()
+        queue.add_pending_objects(object_uuids + waiting)
+        queue.extend([_BatchReference("from", "to", None, uid) for uid in waiting])
+        queue.extend([_BatchReference("from", "to", None, uid) for uid in object_uuids])
+        return (queue,), {}
+
+    def run(queue: ReferencesBatchRequest) -> None:
+        for i in range(0, len(object_uuids), 100):
+            queue.release_objects(object_uuids[i : i + 100])
+            assert len(queue.pop_items(100)) == 100
+
+    benchmark.pedantic(run, setup=setup, rounds=5)
@@ -0,0 +1,110 @@
+# Measures the cost of decoding the gRPC reply of a query into objects for a wide schema with dates, arrays and nested
+# objects, eagerly and lazily with two properties read per object.
+# run:
+# - benchmark: pytest profiling/test_query_decoding.py --benchmark-only --benchmark-disable-gc
+import uuid
+from types import SimpleNamespace
+from typing import Any, List, cast
+
+import numpy as np
+import pytest
+
+from weaviate.collections.classes.internal import _QueryOptions
+from weaviate.collections.queries.base import _Base
+from weaviate.connect import ConnectionV4
+from weaviate.proto.v1 import properties_pb2, search_get_pb2
+from weaviate.util import _ServerVersion
+
+NUM_OBJECTS = 1000
+NUM_COLUMNS = 10  # of every data type
+
+DATE = "2024-01-02T03:04:05.123456Z"
+
+
+def wide_properties(i: int) -> properties_pb2.Properties:
+    nested = properties_pb2.Properties(
+        fields={
+            "name": properties_pb2.Value(text_value="nested"),
+            "count": properties_pb2.Value(int_value=i),
+            "when": properties_pb2.Value(date_value=DATE),
+            "items": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    object_values=properties_pb2.ObjectValues(
+                        values=[
+                            properties_pb2.Properties(
+                                fields={
+                                    "label": properties_pb2.Value(text_value=label),
+                                    "value": properties_pb2.Value(number_value=1.5),
+                                }
+                            )
+                            for label in ("x", "y")
+                        ]
+                    )
+                )
+            ),
+        }
+    )
+    fields = {}
+    for c in range(NUM_COLUMNS):
+        fields[f"text{c}"] = properties_pb2.Value(text_value=f"some text {i}")
+        fields[f"int{c}"] = properties_pb2.Value(int_value=i)
+        fields[f"number{c}"] = properties_pb2.Value(number_value=i / 3)
+        fields[f"date{c}"] = properties_pb2.Value(date_value=DATE)
+        fields[f"tags{c}"] = properties_pb2.Value(
+            list_value=properties_pb2.ListValue(
+                text_values=properties_pb2.TextValues(values=["a", "b", "c"])
+            )
+        )
+        fields[f"dates{c}"] = properties_pb2.Value(
+            list_value=properties_pb2.ListValue(
+                date_values=properties_pb2.DateValues(values=[DATE, DATE])
+            )
+        )
+        fields[f"scores{c}"] = properties_pb2.Value(
+            list_value=properties_pb2.ListValue(
+                number_values=properties_pb2.NumberValues(
+                    values=np.arange(32, dtype="<f8").tobytes()
+                )
+            )
+        )
+        fields[f"nested{c}"] = properties_pb2.Value(object_value=nested)
+    return properties_pb2.Properties(fields=fields)
+
+
+@pytest.fixture(scope="module")
+def reply() -> search_get_pb2.SearchReply:
+    return search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                metadata=search_get_pb2.MetadataResult(id_as_bytes=uuid.uuid4().bytes),
+                properties=search_get_pb2.PropertiesResult(non_ref_props=wide_properties(i)),
+            )
+            for i in range(NUM_OBJECTS)
+        ]
+    )
+
+
+def query_base() -> _Base:
+    connection = SimpleNamespace(_weaviate_version=_ServerVersion(1, 25, 0))
+    return _Base(cast(ConnectionV4, connection), "Test", None, None, None, None, False)
+
+
+def test_benchmark_decode_wide_objects(benchmark: Any, reply: search_get_pb2.SearchReply) -> None:
+    base = query_base()
+    options = _QueryOptions(False, True, False, False, False)
+    benchmark.pedantic(lambda: base._result_to_query_return(reply, options, None, None), rounds=5)
+
+
+def test_benchmark_decode_wide_objects_lazy(
+    benchmark: Any, reply: search_get_pb2.SearchReply
+) -> None:
+    base = query_base()
+    options = _QueryOptions(False, True, False, False, False, return_format="lazy")
+
+    def decode() -> List[Any]:
+        return [
+            (obj.properties["text0"], obj.properties["date0"])
+            for obj in base._result_to_query_return(reply, options, None, None).objects
+        ]
+
+    benchmark.pedantic(decode, rounds=5)
@@ -0,0 +1,134 @@
+import base64
+import datetime
+import decimal
+import uuid
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from weaviate.collections.batch.arrow import _ArrowConverter, _arrow_record_batches
+from weaviate.collections.queries.arrow import _list_column, _value_column
+from weaviate.exceptions import WeaviateInvalidInputError, WeaviateQueryError
+from weaviate.proto.v1 import properties_pb2
+
+
+def _vectors(matrix: np.ndarray) -> pa.FixedSizeListArray:
+    return pa.FixedSizeListArray.from_arrays(pa.array(matrix.ravel()), matrix.shape[1])
+
+
+def test_convert_record_batch() -> None:
+    uuids = [uuid.uuid4() for _ in range(3)]
+    matrix = np.arange(9, dtype=np.float64).reshape(3, 3)
+    table = pa.table(
+        {
+            "id": pa.array([uid.bytes for uid in uuids], pa.binary(16)),
+            "name": ["a", None, "c"],
+            "created": pa.array([datetime.datetime(2020, 1, 1)] * 3, pa.timestamp("ns")),
+            "day": pa.array([datetime.date(2021, 5, 6)] * 3),
+            "blob": [b"\x00\x01", b"", None],
+            "price": pa.array([decimal.Decimal("1.5")] * 3, pa.decimal128(4, 2)),
+            "tags": [["x"], [], ["y", "z"]],
+            "vec": _vectors(matrix),
+        }
+    )
+    properties, vectors, returned_uuids = _ArrowConverter("id", "vec").convert(
+        table.to_batches()[0]
+    )
+
+    assert returned_uuids == uuids
+    assert properties is not None and properties[1] == {
+        "created": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        "day": datetime.datetime(2021, 5, 6, tzinfo=datetime.timezone.utc),
+        "blob": "",
+        "price": 1.5,
+        "tags": [],
+    }
+    assert properties[0]["name"] == "a" and properties[0]["blob"] == base64.b64encode(
+        b"\x00\x01"
+    ).decode("utf-8")
+    assert "blob" not in properties[2]
+    assert vectors.dtype == np.float32 and np.array_equal(vectors, matrix)
+
+
+def test_convert_numeric_list_columns_of_sliced_batch() -> None:
+    batch = pa.record_batch(
+        {
+            "scores": pa.array([[1.5], [2.5, 3.5], None, [], [4.5]], pa.list_(pa.float64())),
+            "counts": pa.array([[1], [2, 3], [4], None, [5]], pa.large_list(pa.int32())),
+            "gaps": pa.array([[1.0], [None], [2.0], [3.0], [4.0]]),
+        }
+    ).slice(1, 3)
+    properties, _, _ = _ArrowConverter(None, None).convert(batch)
+
+    assert properties is not None and len(properties) == 3
+    scores, counts = properties[0]["scores"], properties[0]["counts"]
+    assert isinstance(scores, np.ndarray) and scores.tolist() == [2.5, 3.5]
+    assert isinstance(counts, np.ndarray) and counts.tolist() == [2, 3]
+    assert "scores" not in properties[1] and properties[1]["counts"].tolist() == [4]
+    assert properties[2]["scores"].size == 0 and "counts" not in properties[2]
+    # lists with null values are converted to Python lists
+    assert [props["gaps"] for props in properties] == [[None], [2.0], [3.0]]
+
+
+def test_convert_named_vectors_of_sliced_batch() -> None:
+    first, second = np.random.rand(4, 2).astype(np.float32), np.random.rand(4, 5)
+    batch = pa.record_batch({"a": _vectors(first), "b": _vectors(second)}).slice(1, 2)
+    properties, vectors, uuids = _ArrowConverter(None, {"first": "a", "second": "b"}).convert(batch)
+
+    assert properties is None and uuids is None
+    assert np.array_equal(vectors["first"], first[1:3])
+    assert np.array_equal(vectors["second"], second[1:3].astype(np.float32))
+
+
+def test_record_batches() -> None:
+    table = pa.concat_tables([pa.table({"a": [1, 2]}), pa.table({"a": [3]})])
+    assert [len(batch) for batch in _arrow_record_batches(table)] == [2, 1]
+    assert len(list(_arrow_record_batches(table.to_reader()))) == 2
+    assert len(list(_arrow_record_batches(table.to_batches()[0]))) == 1
+    with pytest.raises(WeaviateInvalidInputError):
+        _arrow_record_batches(1)
+
+
+@pytest.mark.parametrize(
+    "uuid_column,vector_column",
+    [("missing", None), (None, "missing"), (None, "list"), (None, {"named": "name"})],
+)
+def test_convert_invalid_columns(uuid_column: str, vector_column: str) -> None:
+    batch = pa.record_batch({"name": ["a"], "list": [[1.0, 2.0]]})
+    with pytest.raises(WeaviateInvalidInputError):
+        _ArrowConverter(uuid_column, vector_column).convert(batch)
+
+
+def test_convert_null_vectors() -> None:
+    batch = pa.record_batch({"vec": pa.array([[1.0], None], pa.list_(pa.float32(), 1))})
+    with pytest.raises(WeaviateInvalidInputError):
+        _ArrowConverter(None, "vec").convert(batch)
+
+
+def test_list_column_with_empty_first_list() -> None:
+    numbers = properties_pb2.ListValue(
+        number_values=properties_pb2.NumberValues(values=np.arange(3, dtype="<f8").tobytes())
+    )
+    column = _list_column(pa, [properties_pb2.ListValue(), numbers, None])
+    assert column.to_pylist() == [[], [0.0, 1.0, 2.0], None]
+    assert column.type == pa.list_(pa.float64())
+
+    texts = properties_pb2.ListValue(text_values=properties_pb2.TextValues(values=["a"]))
+    column = _value_column(
+        pa,
+        [
+            properties_pb2.Value(list_value=properties_pb2.ListValue()),
+            properties_pb2.Value(list_value=texts),
+        ],
+    )
+    assert column.to_pylist() == [[], ["a"]]
+
+
+def test_value_column_with_different_kinds() -> None:
+    with pytest.raises(WeaviateQueryError):
+        _value_column(pa, [properties_pb2.Value(int_value=1), properties_pb2.Value(text_value="a")])
+    texts = properties_pb2.ListValue(text_values=properties_pb2.TextValues(values=["a"]))
+    old_format = properties_pb2.ListValue(values=[properties_pb2.Value(text_value="b")])
+    with pytest.raises(WeaviateQueryError):
+        _list_column(pa, [texts, old_format])
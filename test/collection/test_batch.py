@@ -1,5 +1,93 @@
+import datetime
+import json
+import pickle
+import struct
 import uuid
-from weaviate.collections.classes.batch import BatchObjectReturn, MAX_STORED_RESULTS
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Type, cast
+
+import numpy as np
+import pytest
+from typing_extensions import TypedDict
+
+from weaviate.collections.batch import grpc_batch_objects
+from weaviate.collections.batch.base import (
+    MAX_DYNAMIC_BATCH_SIZE,
+    ObjectsBatchRequest,
+    ReferencesBatchRequest,
+    _BatchSizing,
+    _DynamicBatching,
+    _FixedSizeBatching,
+    _create_batch_objects_from_arrays,
+    _generate_uuids,
+    _iter_batch_objects_from_arrays,
+    _objects_error_response,
+    _split_retryable,
+)
+from weaviate.collections.batch.batch_wrapper import (
+    VECTOR_INDEXING_MAX_POLL_INTERVAL,
+    VECTOR_INDEXING_MIN_POLL_INTERVAL,
+    _next_poll_interval,
+)
+from weaviate.collections.batch.controller import (
+    MAX_CONCURRENT_REQUESTS,
+    _BatchObservation,
+    _PIController,
+    _ThresholdController,
+    _VectorizerController,
+    _controller_factory,
+)
+from weaviate.collections.batch.dedup import _BatchDeduplicator, _BloomFilter
+from weaviate.collections.batch.encoders import (
+    _PropertyEncoder,
+    _translate_properties_from_python_to_grpc,
+)
+from weaviate.collections.batch.error_sink import _BatchErrorSink
+from weaviate.collections.batch.journal import _BatchJournal, read_batch_journal
+from weaviate.collections.batch.rate_limit import (
+    _inferred_rate_limit,
+    _TokenBucket,
+    _VectorizerRateLimiter,
+)
+from weaviate.collections.batch.grpc_batch_objects import (
+    _estimate_grpc_size,
+    _grpc_objects,
+    _serialize_batch,
+    _split_requests,
+)
+from weaviate.collections.batch.retry import (
+    _Backoff,
+    _RetryBudget,
+    _RetryClass,
+    _RetryClassifier,
+    _message_matcher,
+    _retry_budget,
+    _retry_classifier,
+)
+from weaviate.collections.classes.batch import (
+    BatchObjectReturn,
+    BatchReferenceReturn,
+    Deduplication,
+    ErrorObject,
+    ErrorReference,
+    MAX_STORED_RESULTS,
+    PIControl,
+    RetryBudget,
+    RetryClass,
+    _BatchObject,
+    _BatchReference,
+    VectorizerRateLimit,
+)
+from weaviate.collections.classes.config import CollectionConfigSimple, DataType
+from weaviate.collections.classes.types import GeoCoordinate
+from weaviate.connect.base import MAX_GRPC_MESSAGE_LENGTH
+from weaviate.exceptions import (
+    WeaviateBatchValidationError,
+    WeaviateInsertInvalidPropertyError,
+    WeaviateInvalidInputError,
+)
+from weaviate.proto.v1 import base_pb2, batch_pb2
 
 
 def test_batch_object_return_add() -> None:
@@ -29,3 +117,816 @@ def test_batch_object_return_add() -> None:
         idx + len(rhs_uuids): v
         for idx, v in enumerate(lhs_uuids[len(rhs_uuids) : MAX_STORED_RESULTS] + rhs_uuids)
     }
+
+
+def test_batch_object_return_add_evicts_oldest() -> None:
+    result = BatchObjectReturn()
+    for start in range(0, 3 * MAX_STORED_RESULTS, 1000):
+        uuids = {i: uuid.uuid4() for i in range(start, start + 1000)}
+        result += BatchObjectReturn(_all_responses=list(uuids.values()), uuids=uuids)
+    assert list(result.uuids) == list(range(2 * MAX_STORED_RESULTS, 3 * MAX_STORED_RESULTS))
+    assert len(result._all_responses) <= 2 * MAX_STORED_RESULTS
+    assert result.all_responses == list(result.uuids.values())
+
+
+def test_batch_reference_return_add() -> None:
+    ref = _BatchReference(from_="A", to="B", tenant=None, from_uuid="a")
+    result = BatchReferenceReturn()
+    result += BatchReferenceReturn(
+        errors={1: ErrorReference("x", ref), 0: ErrorReference("y", ref)}
+    )
+    result += BatchReferenceReturn(errors={0: ErrorReference("z", ref)})
+    assert {k: v.message for k, v in result.errors.items()} == {0: "y", 1: "x", 2: "z"}
+
+
+@pytest.mark.asyncio
+async def test_error_sink_writes_jsonl(tmp_path: Any) -> None:
+    path = tmp_path / "errors.jsonl"
+    streamed: List[Any] = []
+    sink = _BatchErrorSink(streamed.append, str(path))
+    assert sink.streams and not _BatchErrorSink().streams
+
+    obj = _BatchObject(
+        collection="Test",
+        vector={"a": struct.pack("2f", 1, 2)},
+        uuid="uid",
+        properties={"date": datetime.datetime(2024, 1, 1), "ref": uuid.UUID(int=0)},
+        tenant=None,
+        references=None,
+        index=3,
+    )
+    ref = _BatchReference(from_="A", to="B", tenant="t", from_uuid="a", to_uuid="b")
+    await sink.errors([ErrorObject("bad object", obj), ErrorReference("bad ref", ref)])
+    sink.close()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[0]["index"] == 3 and lines[0]["vector"] == {"a": [1.0, 2.0]}
+    assert lines[0]["properties"] == {"date": "2024-01-01T00:00:00", "ref": str(uuid.UUID(int=0))}
+    assert lines[1] == {
+        "type": "reference",
+        "message": "bad ref",
+        "from": "A",
+        "to": "B",
+        "tenant": "t",
+        "from_uuid": "a",
+        "to_uuid": "b",
+    }
+    assert len(streamed) == 2
+
+
+def test_batch_journal_resume(tmp_path: Any) -> None:
+    path = str(tmp_path / "journal")
+    assert read_batch_journal(path).resume_offset == 0
+
+    objs = [
+        _BatchObject(
+            collection="Test",
+            vector=None,
+            uuid=str(uuid.UUID(int=i)),
+            properties=None,
+            tenant=None,
+            references=None,
+            index=i,
+        )
+        for i in range(10)
+    ]
+    journal = _BatchJournal(path)
+    journal.enqueued(objs[:8])
+    journal.enqueued([objs[9]])
+    journal.acknowledged([0, 1, 2, 4, 5])
+    journal.acknowledged([9])
+    journal.close()
+    with open(path, "a") as file:  # a line that was cut short by a crash
+        file.write("a 3")
+
+    state = read_batch_journal(path)
+    assert state.resume_offset == 3
+    assert state.num_acknowledged == 6
+    assert state.unacknowledged == {i: uuid.UUID(int=i) for i in [3, 6, 7]}
+
+    journal = _BatchJournal(path)
+    assert journal.state == state
+    assert [i for i in range(10) if journal.is_acknowledged(i)] == [0, 1, 2, 4, 5, 9]
+    journal.acknowledged([3, 6, 7, 8])
+    journal.close()
+    assert read_batch_journal(path).resume_offset == 10
+
+
+def test_bloom_filter() -> None:
+    bloom = _BloomFilter.for_capacity(1000, 0.01)
+    assert bloom.num_hashes == 7
+    assert sum(bloom.add(str(i).encode()) for i in range(1000)) < 20
+    assert all(str(i).encode() in bloom for i in range(1000))
+    false_positives = sum(str(i).encode() in bloom for i in range(1000, 11000))
+    assert false_positives < 200
+
+    copy = _BloomFilter.from_bytes(bloom.to_bytes())
+    assert copy.bits == bloom.bits and copy.count == bloom.count
+    with pytest.raises(ValueError):
+        _BloomFilter.from_bytes(b"x" * 40)
+
+
+def test_deduplicator(tmp_path: Any) -> None:
+    def obj(index: int, uid: int, value: int, vector: Any = None) -> _BatchObject:
+        return _BatchObject(
+            collection="Test",
+            vector=vector,
+            uuid=str(uuid.UUID(int=uid)),
+            properties={"value": value},
+            tenant=None,
+            references=None,
+            index=index,
+        )
+
+    dedup = _BatchDeduplicator(Deduplication())
+    assert not dedup.is_duplicate(obj(0, 1, 1, [1.0, 2.0]))
+    assert dedup.is_duplicate(obj(1, 1, 1, struct.pack("2f", 1, 2)))  # packed by add_objects
+    assert not dedup.is_duplicate(obj(2, 1, 2))  # changed content
+    assert dedup.num_duplicates == 1
+    assert _BatchDeduplicator(Deduplication(content=False)).is_duplicate(obj(0, 1, 1)) is False
+
+    # failed objects are sent again when they are re-added in the same run, acknowledged ones are not
+    dedup = _BatchDeduplicator(Deduplication())
+    assert not dedup.is_duplicate(obj(0, 1, 1)) and not dedup.is_duplicate(obj(1, 2, 1))
+    dedup.done(acknowledged=[0], failed=[1])
+    assert dedup.is_duplicate(obj(2, 1, 1))
+    assert not dedup.is_duplicate(obj(3, 2, 1))
+    assert dedup.is_duplicate(obj(4, 2, 1))  # still in flight
+    assert dedup.num_duplicates == 2
+
+    path = str(tmp_path / "seen")
+    dedup = _BatchDeduplicator(Deduplication(path=path))
+    assert not dedup.is_duplicate(obj(0, 1, 1)) and not dedup.is_duplicate(obj(1, 2, 1))
+    dedup.done(acknowledged=[0], failed=[1])
+    dedup.close()
+
+    # only acknowledged objects are skipped in the next run
+    dedup = _BatchDeduplicator(Deduplication(path=path))
+    assert dedup.is_duplicate(obj(0, 1, 1))
+    assert not dedup.is_duplicate(obj(1, 2, 1))
+
+
+def test_objects_error_response_is_keyed_by_index() -> None:
+    objs = [_batch_object() for _ in range(3)]
+    for idx, obj in enumerate(objs):
+        obj.index = 100 + idx
+    response = _objects_error_response(objs, ValueError("failed"), 0)
+    assert list(response.errors) == [100, 101, 102]
+
+    # the deduplicator forgets the objects of the failed request, so that they can be added again
+    dedup = _BatchDeduplicator(Deduplication())
+    assert not any(dedup.is_duplicate(obj) for obj in objs)
+    dedup.done(response.uuids.keys(), response.errors.keys())
+    objs[0].index = 103
+    assert not dedup.is_duplicate(objs[0])
+
+
+def test_create_batch_objects_from_arrays() -> None:
+    vectors = np.arange(6, dtype=np.float64).reshape(3, 2)
+    uuids = [uuid.uuid4() for _ in range(3)]
+    objs, returned_uuids = _create_batch_objects_from_arrays(
+        "test", [{"i": i} for i in range(3)], vectors, uuids, None, 5
+    )
+    assert returned_uuids == [str(uid) for uid in uuids]
+    assert [obj.index for obj in objs] == [5, 6, 7]
+    assert all(obj.collection == "Test" for obj in objs)
+    assert [obj.properties for obj in objs] == [{"i": 0}, {"i": 1}, {"i": 2}]
+    assert [obj.vector for obj in objs] == [
+        struct.pack("<2f", *row) for row in [[0, 1], [2, 3], [4, 5]]
+    ]
+
+
+def test_create_batch_objects_from_arrays_named_vectors() -> None:
+    objs, returned_uuids = _create_batch_objects_from_arrays(
+        "Test",
+        None,
+        {"a": np.ones((2, 3)), "b": np.asfortranarray(np.zeros((2, 4), dtype=np.float16))},
+        None,
+        "tenant",
+        0,
+    )
+    assert len(returned_uuids) == 2
+    assert all(obj.tenant == "tenant" for obj in objs)
+    assert objs[0].vector == {"a": struct.pack("<3f", 1, 1, 1), "b": struct.pack("<4f", 0, 0, 0, 0)}
+
+
+def test_generate_uuids() -> None:
+    uuids = [uuid.UUID(uid) for uid in _generate_uuids(1000)]
+    assert len(set(uuids)) == 1000
+    assert all(uid.version == 4 and uid.variant == uuid.RFC_4122 for uid in uuids)
+
+
+def test_iter_batch_objects_from_arrays_chunks() -> None:
+    consumed = []
+
+    def properties() -> Any:
+        for i in range(25):
+            consumed.append(i)
+            yield {"i": i}
+
+    chunks = _iter_batch_objects_from_arrays("test", properties(), None, None, None, 3, 10)
+    objs, _ = next(chunks)
+    assert len(objs) == 10 and len(consumed) == 10
+    assert [len(objs) for objs, _ in chunks] == [10, 5]
+    assert len(consumed) == 25
+
+    vectors = np.ones((25, 2))
+    chunks = _iter_batch_objects_from_arrays("test", properties(), vectors, None, None, 3, 10)
+    indices = [obj.index for objs, _ in chunks for obj in objs]
+    assert indices == list(range(3, 28))
+
+
+def test_iter_batch_objects_from_arrays_validates_before_first_chunk() -> None:
+    chunks = _iter_batch_objects_from_arrays("Test", [{}] * 25, np.ones((24, 2)), None, None, 0, 10)
+    with pytest.raises(WeaviateBatchValidationError):
+        next(chunks)
+
+
+@pytest.mark.parametrize(
+    "properties,vectors,uuids",
+    [
+        (None, None, None),
+        ([{}, {}], np.ones((3, 2)), None),
+        (None, np.ones((2, 2)), ["not-a-uuid", uuid.uuid4()]),
+    ],
+)
+def test_create_batch_objects_from_arrays_invalid(
+    properties: Optional[List[dict]], vectors: Any, uuids: Optional[list]
+) -> None:
+    with pytest.raises(WeaviateBatchValidationError):
+        _create_batch_objects_from_arrays("Test", properties, vectors, uuids, None, 0)
+
+
+@pytest.mark.parametrize(
+    "vectors",
+    [
+        np.ones(3),
+        np.ones((2, 2, 2)),
+        [[1.0, 2.0], [3.0]],
+        {"a": np.ones((3, 2)), "b": np.ones((2, 2))},
+    ],
+)
+def test_pack_vector_matrix_invalid(vectors: Any) -> None:
+    with pytest.raises(WeaviateInvalidInputError):
+        _create_batch_objects_from_arrays("Test", None, vectors, None, None, 0)
+
+
+def _batch_object(text: str = "", vector: Any = None) -> _BatchObject:
+    return _BatchObject(
+        collection="Test",
+        vector=vector,
+        uuid=str(uuid.uuid4()),
+        properties={"text": text, "number": 1.5, "tags": ["a", "b"]},
+        tenant=None,
+        references=None,
+        index=0,
+    )
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        _batch_object(),
+        _batch_object("x" * 10_000),
+        _batch_object("ü" * 1000),
+        _batch_object(vector=[0.5] * 1536),
+        _batch_object(vector={"a": struct.pack("<3f", 1, 2, 3), "b": [1.0] * 100}),
+    ],
+)
+def test_estimate_grpc_size(obj: _BatchObject) -> None:
+    exact = _grpc_objects([obj])[0].ByteSize()
+    assert exact / 2 <= _estimate_grpc_size(obj) <= exact * 2
+
+
+def test_split_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(grpc_batch_objects, "MAX_GRPC_MESSAGE_LENGTH", 5000)
+    objs = [
+        batch_pb2.BatchObject(collection="Test", vector_bytes=b"\x00" * size)
+        for size in [1000, 1000, 6000, 1000, 3000, 100]
+    ]
+    encoded = [obj.SerializeToString() for obj in objs]
+    requests, oversized = _split_requests(encoded, 2500)
+    assert requests == [[0, 1], [3], [4], [5]]
+    assert list(oversized) == [2]
+    for indices in requests[:-2]:
+        request = batch_pb2.BatchObjectsRequest(objects=[objs[idx] for idx in indices])
+        assert request.ByteSize() <= 2500
+
+    requests, _ = _split_requests(encoded, 10_000, max_objects_per_request=2)
+    assert requests == [[0, 1], [3, 4], [5]]
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor, ProcessPoolExecutor])
+def test_serialize_batch(executor: Optional[Type[Executor]]) -> None:
+    objs = [_batch_object("x" * 1000, vector=[0.5] * 10) for _ in range(5)]
+    args = (objs, base_pb2.ConsistencyLevel.CONSISTENCY_LEVEL_QUORUM, 2500, None)
+    if executor is None:
+        serialized = _serialize_batch(*args)
+    else:
+        with executor(1) as pool:
+            serialized = pool.submit(_serialize_batch, *args).result()
+
+    assert [indices for indices, _ in serialized.requests] == [[0, 1], [2, 3], [4]]
+    assert serialized.uuids == [obj.uuid for obj in objs]
+    for indices, request in serialized.requests:
+        assert len(request) <= 2500
+        parsed = batch_pb2.BatchObjectsRequest.FromString(request)
+        assert parsed.consistency_level == base_pb2.ConsistencyLevel.CONSISTENCY_LEVEL_QUORUM
+        assert [obj.uuid for obj in parsed.objects] == [serialized.uuids[idx] for idx in indices]
+        assert parsed.objects[0].properties.non_ref_properties["text"] == "x" * 1000
+
+
+class _Item(TypedDict):
+    label: str
+    value: float
+
+
+class _Nested(TypedDict):
+    name: str
+    when: datetime.datetime
+    items: List[_Item]
+
+
+class _DataModel(TypedDict):
+    text: str
+    count: int
+    score: float
+    flag: bool
+    when: datetime.datetime
+    id_: uuid.UUID
+    tags: List[str]
+    counts: List[int]
+    scores: List[float]
+    flags: List[bool]
+    dates: List[datetime.datetime]
+    ids: List[uuid.UUID]
+    location: GeoCoordinate
+    nested: Optional[_Nested]
+    nested_list: List[_Nested]
+    empty: List[str]
+
+
+def _wide_properties() -> Dict[str, Any]:
+    now = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    nested = {"name": "n", "when": now, "items": [{"label": "a", "value": 1.5}]}
+    return {
+        "text": "text",
+        "count": 3,
+        "score": 0.5,
+        "flag": True,
+        "when": now,
+        "id_": uuid.UUID(int=1),
+        "tags": ["a", "b"],
+        "counts": [1, 2],
+        "scores": [0.5, 1.5],
+        "flags": [True, False],
+        "dates": [now, now],
+        "ids": [uuid.UUID(int=2)],
+        "location": GeoCoordinate(latitude=1, longitude=2),
+        "nested": nested,
+        "nested_list": [nested, nested],
+        "empty": [],
+    }
+
+
+def test_property_encoder_from_data_model() -> None:
+    encoder = _PropertyEncoder.from_data_model(_DataModel)
+    assert encoder.data_types["nested"] == DataType.OBJECT
+    assert encoder.data_types["nested_list"] == DataType.OBJECT_ARRAY
+    assert encoder.data_types["dates"] == DataType.DATE_ARRAY
+    assert encoder.nested["nested"].nested["items"].data_types == {
+        "label": DataType.TEXT,
+        "value": DataType.NUMBER,
+    }
+
+
+def test_property_encoder_matches_inspection() -> None:
+    props = _wide_properties()
+    encoder = _PropertyEncoder.from_data_model(_DataModel)
+    refs = {"ref": uuid.UUID(int=3)}
+    assert _translate_properties_from_python_to_grpc(
+        props, refs, encoder
+    ) == _translate_properties_from_python_to_grpc(props, refs)
+
+    # numpy arrays are packed without a detour through Python lists
+    with_arrays = dict(
+        props, counts=np.array([1, 2]), scores=np.array([0.5, 1.5], dtype=np.float32)
+    )
+    assert _translate_properties_from_python_to_grpc(
+        with_arrays, {}, encoder
+    ) == _translate_properties_from_python_to_grpc(props, {})
+
+    # values that do not match the schema are encoded by inspecting them
+    mismatched = {"count": "three", "tags": [1, 2], "nested": "none"}
+    assert _translate_properties_from_python_to_grpc(
+        mismatched, {}, encoder
+    ) == _translate_properties_from_python_to_grpc(mismatched, {})
+
+    # a number array is sent as numbers even if the first value is an int
+    encoded = _translate_properties_from_python_to_grpc({"scores": [1, 2.5]}, {}, encoder)
+    assert encoded.number_array_properties[0].values_bytes == struct.pack("<2d", 1, 2.5)
+
+    with pytest.raises(WeaviateInsertInvalidPropertyError):
+        _translate_properties_from_python_to_grpc({"nested": {"id": 1}}, {}, encoder)
+
+
+def test_property_encoder_from_properties() -> None:
+    item = SimpleNamespace(name="value", data_type=DataType.NUMBER, nested_properties=None)
+    props = [
+        SimpleNamespace(name="text", data_type=DataType.TEXT, nested_properties=None),
+        SimpleNamespace(name="items", data_type=DataType.OBJECT_ARRAY, nested_properties=[item]),
+    ]
+    encoder = _PropertyEncoder.from_properties(cast(Any, props))
+    assert encoder == _PropertyEncoder(
+        {"text": DataType.TEXT, "items": DataType.OBJECT_ARRAY},
+        {"items": _PropertyEncoder({"value": DataType.NUMBER})},
+    )
+    encoded = _translate_properties_from_python_to_grpc(
+        {"text": "a", "items": [{"value": 1}]}, {}, encoder
+    )
+    assert encoded.object_array_properties[0].values[0].non_ref_properties["value"] == 1
+
+
+def _reference(from_uuid: str, to_uuid: Optional[str] = None) -> _BatchReference:
+    return _BatchReference(from_="A", to="B", tenant=None, from_uuid=from_uuid, to_uuid=to_uuid)
+
+
+def test_references_wait_for_pending_objects() -> None:
+    queue = ReferencesBatchRequest()
+    queue.add_pending_objects(["a", "b"])
+    blocked_by_both = _reference("a", "b")
+    blocked_by_a = _reference("a")
+    ready = _reference("c", "d")
+    assert queue.extend([blocked_by_both, blocked_by_a]) == 2
+    assert queue.add(ready) == 3
+
+    assert queue.pop_items(10) == [ready]
+    assert len(queue) == 2
+
+    queue.release_objects(["a"])
+    assert queue.pop_items(10) == [blocked_by_a]
+    queue.release_objects(["b"])
+    assert len(queue) == 1
+    assert queue.pop_items(10) == [blocked_by_both]
+    assert len(queue) == 0
+
+    # released objects do not block new references
+    queue.add(blocked_by_both)
+    assert queue.pop_items(10) == [blocked_by_both]
+
+
+def test_references_pop_in_order() -> None:
+    queue = ReferencesBatchRequest()
+    refs = [_reference(str(i)) for i in range(5)]
+    queue.extend(refs)
+    assert queue.pop_items(2) == refs[:2]
+    queue.prepend(refs[:2])
+    assert queue.pop_items(10) == refs
+
+
+def test_pop_items_by_size() -> None:
+    queue = ObjectsBatchRequest()
+    queue.extend([_batch_object("x" * 1000) for _ in range(10)])
+    size = _estimate_grpc_size(_batch_object("x" * 1000))
+
+    objs, num_bytes = queue.pop_items_by_size(100, 3 * size)
+    assert len(objs) == 3 and num_bytes == 3 * size
+    objs, _ = queue.pop_items_by_size(2, 3 * size)
+    assert len(objs) == 2
+    objs, _ = queue.pop_items_by_size(100, 10)  # a single object is always returned
+    assert len(objs) == 1
+    assert len(queue) == 4
+
+
+def test_batch_sizing_targets_bytes() -> None:
+    status = cast(Any, [{"batchStats": {"queueLength": 0, "ratePerSecond": 100}}])
+    sizing = _BatchSizing(_DynamicBatching(max_request_bytes=1_000_000), False)
+    assert sizing.max_request_bytes == 1_000_000
+
+    sizing.record_request(10, 10 * 100)
+    for _ in range(200):
+        sizing.update(status, 100_000)
+    assert sizing.num_objects == MAX_DYNAMIC_BATCH_SIZE
+
+    for _ in range(20):
+        sizing.record_request(10, 10 * 100_000)
+    sizing.update(status, 100_000)
+    assert sizing.num_objects == 10
+
+
+def test_batch_sizing_without_byte_target() -> None:
+    status = cast(Any, [{"batchStats": {"queueLength": 0, "ratePerSecond": 100}}])
+    sizing = _BatchSizing(_DynamicBatching(), False)
+    assert sizing.max_request_bytes == MAX_GRPC_MESSAGE_LENGTH
+    sizing.record_request(10, 10 * 100)
+    for _ in range(200):
+        sizing.update(status, 100_000)
+    assert sizing.num_objects == 1000
+
+
+def _observation(
+    queue_length: int, rate_per_second: float, latency: Optional[float] = None, now: float = 0
+) -> _BatchObservation:
+    return _BatchObservation(
+        now=now,
+        queue_length=queue_length,
+        rate_per_second=rate_per_second,
+        num_queued_objects=100_000,
+        latency=latency,
+    )
+
+
+def test_batch_sizing_default_controllers() -> None:
+    assert isinstance(_BatchSizing(_DynamicBatching(), False).controller, _ThresholdController)
+    assert isinstance(_BatchSizing(_DynamicBatching(), True).controller, _VectorizerController)
+    sizing = _BatchSizing(_DynamicBatching(controller=_PIController), False)
+    assert isinstance(sizing.controller, _PIController)
+
+    assert _controller_factory(None) is None
+    mode = _DynamicBatching(controller=_controller_factory(PIControl(kp=0.2, min_objects=5)))
+    sizing = _BatchSizing(pickle.loads(pickle.dumps(mode)), True)
+    assert isinstance(sizing.controller, _PIController)
+    assert sizing.controller.kp == 0.2 and sizing.controller.min_objects == 5
+    assert sizing.controller.ki == PIControl().ki
+
+
+def test_batch_sizing_passes_observation_to_controller() -> None:
+    observations: List[_BatchObservation] = []
+
+    class Recorder(_ThresholdController):
+        def update(self, sizing: _BatchSizing, observation: _BatchObservation) -> None:
+            observations.append(observation)
+
+    sizing = _BatchSizing(_DynamicBatching(controller=Recorder), False)
+    sizing.took_queue.extend([0.5, 1.5])
+    status = cast(Any, [{"batchStats": {"queueLength": 30, "ratePerSecond": 10}}])
+    sizing.update(status, 7, now=42)
+    assert observations == [_BatchObservation(42, 30, 10, 7, 1.5)]
+
+
+def test_batch_sizing_aggregates_nodes() -> None:
+    observations: List[_BatchObservation] = []
+
+    class Recorder(_ThresholdController):
+        def update(self, sizing: _BatchSizing, observation: _BatchObservation) -> None:
+            observations.append(observation)
+
+    sizing = _BatchSizing(_DynamicBatching(controller=Recorder), False)
+    status = cast(
+        Any,
+        [
+            {"name": "node1", "batchStats": {"queueLength": 30, "ratePerSecond": 10}},
+            {"name": "node2"},
+            {"name": "node3", "batchStats": {"queueLength": 5, "ratePerSecond": 20}},
+        ],
+    )
+    sizing.update(status, 7, now=42)
+    assert observations == [_BatchObservation(42, 35, 30, 7, None)]
+    assert set(sizing.node_stats) == {"node1", "node3"}
+    assert sizing.max_concurrent_requests == 2 * MAX_CONCURRENT_REQUESTS
+
+
+def test_batch_sizing_concurrency_share() -> None:
+    sizing = _BatchSizing(_DynamicBatching(concurrency_share=0.25), False)
+    assert sizing.max_concurrent_requests == MAX_CONCURRENT_REQUESTS // 4
+    assert sizing.concurrent_requests <= sizing.max_concurrent_requests
+    status = cast(
+        Any,
+        [
+            {"name": f"node{i}", "batchStats": {"queueLength": 0, "ratePerSecond": 100}}
+            for i in range(3)
+        ],
+    )
+    for _ in range(50):
+        sizing.update(status, 100_000)
+        assert sizing.concurrent_requests <= sizing.max_concurrent_requests
+    assert sizing.max_concurrent_requests == 3 * MAX_CONCURRENT_REQUESTS // 4
+
+    sizing.update(cast(Any, [{"name": "node1"}]), 100_000)
+    assert sizing.concurrent_requests == 2
+
+
+def test_pi_controller_holds_target_queue() -> None:
+    sizing = _BatchSizing(_DynamicBatching(), False)
+    sizing.num_objects = 500
+    controller = _PIController()
+
+    controller.update(sizing, _observation(queue_length=2000, rate_per_second=1000))
+    assert sizing.num_objects == 500
+
+    controller.update(sizing, _observation(queue_length=1000, rate_per_second=1000))
+    assert sizing.num_objects > 500
+
+    controller.update(sizing, _observation(queue_length=5000, rate_per_second=1000))
+    assert sizing.num_objects == controller.min_objects
+
+
+def test_pi_controller_reacts_to_latency() -> None:
+    sizing = _BatchSizing(_DynamicBatching(), False)
+    sizing.num_objects = 500
+    controller = _PIController()
+    controller.update(sizing, _observation(queue_length=0, rate_per_second=100, latency=15))
+    assert sizing.num_objects < 500
+
+
+def test_pi_controller_scales_concurrency() -> None:
+    sizing = _BatchSizing(_DynamicBatching(), False)
+    controller = _PIController()
+    sizing.num_objects = sizing.max_batch_size
+    concurrent_requests = sizing.concurrent_requests
+    controller.update(sizing, _observation(queue_length=0, rate_per_second=1000, now=10))
+    assert sizing.concurrent_requests == concurrent_requests + 1
+    controller.update(sizing, _observation(queue_length=0, rate_per_second=1000, now=10.5))
+    assert sizing.concurrent_requests == concurrent_requests + 1
+
+    sizing.num_objects = controller.min_objects
+    controller.update(sizing, _observation(queue_length=10_000, rate_per_second=1000))
+    assert sizing.concurrent_requests == concurrent_requests
+
+
+def test_pi_controller_pauses_on_full_queue() -> None:
+    sizing = _BatchSizing(_DynamicBatching(), False)
+    _PIController().update(sizing, _observation(queue_length=100_000, rate_per_second=1000))
+    assert sizing.num_objects == 0
+
+
+@pytest.mark.parametrize(
+    "message,expected",
+    [
+        ("Rate limit reached for requests, OpenAI API error", "openai_rate_limit"),
+        ("contact support@cohere.com: rate limit exceeded", "cohere_rate_limit"),
+        ("connection to: HuggingFace API failed with status: 503 error", "huggingface_unavailable"),
+        (
+            "WeaviateBatchError('<AioRpcError of RPC that terminated with: status = StatusCode.UNAVAILABLE>')",
+            "grpc_unavailable",
+        ),
+        ("invalid property 'name'", None),
+        ("OpenAI API error: invalid api key", None),
+    ],
+)
+def test_retry_classifier_defaults(message: str, expected: Optional[str]) -> None:
+    retry_class = _RetryClassifier().classify(message)
+    assert (retry_class.name if retry_class is not None else None) == expected
+
+
+def test_retry_classifier_register() -> None:
+    classifier = _RetryClassifier([])
+    assert classifier.classify("quota exceeded") is None
+    backoff = _Backoff(base_delay=1, max_delay=4, max_retries=2)
+    classifier.register(_RetryClass("quota", _message_matcher("quota"), backoff))
+    classifier.register(_RetryClass("special", _message_matcher("special quota"), backoff))
+    assert classifier.classify("quota exceeded").name == "quota"  # type: ignore
+    assert classifier.classify("special quota exceeded").name == "special"  # type: ignore
+
+
+def test_retry_classifier_from_config() -> None:
+    classifier = _retry_classifier(
+        [
+            RetryClass(name="quota", patterns=["quota", "exceeded"], max_retries=2),
+            RetryClass(name="openai", patterns=["OpenAI"], base_delay=0.5, max_delay=4),
+        ]
+    )
+    quota = classifier.classify("Quota Exceeded")
+    assert quota is not None and quota.name == "quota"
+    assert quota.backoff == _Backoff(base_delay=1, max_delay=64, max_retries=2)
+    assert classifier.classify("quota left") is None
+    # user classes take precedence over the default ones, in the given order
+    assert classifier.classify("OpenAI: quota exceeded").name == "quota"  # type: ignore
+    assert classifier.classify("OpenAI: Rate limit reached").name == "openai"  # type: ignore
+    assert classifier.classify("StatusCode.UNAVAILABLE").name == "grpc_unavailable"  # type: ignore
+    assert _retry_classifier(None).classify("quota exceeded") is None
+
+    with pytest.raises(ValueError):
+        RetryClass(name="invalid", patterns=["("])
+    with pytest.raises(ValueError):
+        RetryClass(name="empty", patterns=[])
+
+
+def test_backoff_delay() -> None:
+    backoff = _Backoff(base_delay=1, max_delay=8, max_retries=5)
+    for attempt, expected in enumerate([1, 2, 4, 8, 8]):
+        delays = [backoff.delay(attempt) for _ in range(100)]
+        assert all(expected / 2 <= delay <= expected for delay in delays)
+        assert len(set(delays)) > 1
+
+
+def test_retry_budget() -> None:
+    budget = _RetryBudget(ratio=0.5, min_retries=2)
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+    budget.record_success(2)
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+    budget = _retry_budget(RetryBudget(ratio=0, min_retries=1))
+    assert budget.try_spend()
+    budget.record_success(100)
+    assert not budget.try_spend()
+
+
+def _response_with_errors(objs: List[_BatchObject], message: str) -> BatchObjectReturn:
+    errors = {obj.index: ErrorObject(message, obj) for obj in objs[1:]}
+    return BatchObjectReturn(
+        _all_responses=[uuid.UUID(objs[0].uuid)] + list(errors.values()),
+        errors=errors,
+        has_errors=True,
+        uuids={objs[0].index: uuid.UUID(objs[0].uuid)},
+    )
+
+
+def test_split_retryable_requeues_with_backoff() -> None:
+    objs = [_batch_object() for _ in range(3)]
+    for idx, obj in enumerate(objs):
+        obj.index = idx
+    sizing = _BatchSizing(_FixedSizeBatching(10, 2), False)
+    response = _response_with_errors(objs, "OpenAI: Rate limit reached")
+
+    with pytest.warns(UserWarning):
+        readd, response = _split_retryable(response, sizing, _RetryClassifier(), _RetryBudget())
+    assert readd == objs[1:] and all(obj.retry_count == 1 for obj in readd)
+    assert not response.has_errors and list(response.uuids) == [0]
+    assert 0.5 <= sizing.time_until_next_request() <= 1
+
+
+def test_split_retryable_gives_up() -> None:
+    objs = [_batch_object() for _ in range(3)]
+    for idx, obj in enumerate(objs):
+        obj.index = idx
+    objs[1].retry_count = 6
+    sizing = _BatchSizing(_FixedSizeBatching(10, 2), False)
+
+    readd, response = _split_retryable(
+        _response_with_errors(objs, "OpenAI: Rate limit reached"),
+        sizing,
+        _RetryClassifier(),
+        _RetryBudget(min_retries=0),
+    )
+    assert readd == [] and list(response.errors) == [1, 2]
+    assert sizing.time_until_next_request() == 0
+
+    readd, response = _split_retryable(
+        _response_with_errors(objs, "invalid property"), sizing, _RetryClassifier(), _RetryBudget()
+    )
+    assert readd == [] and list(response.errors) == [1, 2]
+
+
+def test_token_bucket() -> None:
+    bucket = _TokenBucket(per_minute=600, now=0)
+    assert bucket.capacity == 100
+    assert bucket.delay(50, now=0) == 0
+    bucket.take(150, now=0)
+    assert bucket.delay(10, now=0) == pytest.approx(6)
+    assert bucket.delay(10, now=6) == 0
+    assert bucket.delay(1000, now=100) == 0  # never more than the capacity
+
+
+def test_vectorizer_rate_limiter() -> None:
+    limiter = _VectorizerRateLimiter(VectorizerRateLimit(tokens_per_minute=6000), now=0)
+    assert limiter.max_objects() is None and limiter.delay(100, now=0) == 0
+
+    # 398 characters of text and two tags are 100 tokens, objects with a vector are not vectorized
+    limiter.record([_batch_object("x" * 398) for _ in range(10)] + [_batch_object(vector=[1.0])], 0)
+    assert limiter.avg_tokens_per_object == 100
+    assert limiter.max_objects() == 9  # 10s of 90% of the limit
+    assert limiter.delay(9, now=0) == pytest.approx(1000 / 90)
+
+
+def test_batch_sizing_paces_vectorizer() -> None:
+    mode = _DynamicBatching(
+        vectorizer_rate_limit=VectorizerRateLimit(requests_per_minute=60, objects_per_request=10)
+    )
+    assert _BatchSizing(mode, vectorizer_batching=False).rate_limiter is None
+
+    sizing = _BatchSizing(mode, vectorizer_batching=True)
+    assert sizing.time_until_next_request() == 0
+    sizing.record_vectorizer_load([_batch_object() for _ in range(100)])  # 10 of 9 requests
+    assert 6 < sizing.time_until_next_request() <= 6.7
+
+    sizing.num_objects = 1000
+    sizing.update([{"batchStats": {"queueLength": 0, "ratePerSecond": 0}}], 0)  # type: ignore
+    assert sizing.num_objects == 90
+
+
+def test_inferred_rate_limit() -> None:
+    def config(vectorizer: str) -> CollectionConfigSimple:
+        return cast(
+            CollectionConfigSimple, SimpleNamespace(vector_config=None, vectorizer=vectorizer)
+        )
+
+    assert _inferred_rate_limit([config("none"), config("text2vec-contextionary")]) is None
+    assert _inferred_rate_limit([config("text2vec-openai"), config("text2vec-cohere")]) == (
+        VectorizerRateLimit(
+            requests_per_minute=2000, tokens_per_minute=1_000_000, objects_per_request=96
+        )
+    )
+
+
+def test_next_poll_interval() -> None:
+    assert _next_poll_interval(1.0, None, 10.0, 1000) == VECTOR_INDEXING_MIN_POLL_INTERVAL
+    # draining 100 vectors per second, the remaining 200 take 2 seconds
+    assert _next_poll_interval(1.0, (9.0, 300), 10.0, 200) == pytest.approx(1.0)
+    assert _next_poll_interval(1.0, (9.0, 1100), 10.0, 1000) == VECTOR_INDEXING_MAX_POLL_INTERVAL
+    assert _next_poll_interval(1.0, (9.9, 101), 10.0, 1) == VECTOR_INDEXING_MIN_POLL_INTERVAL
+    # backs off while the queue does not drain
+    assert _next_poll_interval(1.0, (9.0, 200), 10.0, 200) == 2.0
+    assert _next_poll_interval(4.0, (9.0, 200), 10.0, 300) == VECTOR_INDEXING_MAX_POLL_INTERVAL
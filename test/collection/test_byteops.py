@@ -1,3 +1,5 @@
+import numpy as np
+
 from weaviate.collections.queries.byteops import _ByteOps
 
 
@@ -22,3 +24,10 @@ def test_decode_int64s():
     assert _ByteOps.decode_int64s(
         b"\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00"
     ) == [1, 2]
+
+
+def test_decode_float32_array():
+    vector = _ByteOps.decode_float32_array(b"\x00\x00\x80?\x00\x00\x00@\x00\x00\x00\x00")
+    assert vector.dtype == np.float32
+    assert vector.tolist() == [1.0, 2.0, 0.0]
+    assert len(_ByteOps.decode_float32_array(b"")) == 0
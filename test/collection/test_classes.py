@@ -9,6 +9,7 @@ from weaviate.collections.classes.grpc import (
 )
 
 from weaviate.collections.classes.filters import Filter
+from weaviate.collections.classes.internal import _LazyProperties
 
 
 def test_link_to_errors_on_extra_variable() -> None:
@@ -34,3 +35,20 @@ def test_direct_init_filter() -> None:
 def test_direct_init_sort() -> None:
     with pytest.raises(TypeError):
         Sort()
+
+
+def test_lazy_properties_decode_each_value_once() -> None:
+    decoded = []
+
+    def decode(value: int) -> int:
+        decoded.append(value)
+        return value * 2
+
+    props = _LazyProperties({"a": 1, "b": 2}, decode)
+    assert props["a"] == 2
+    assert props["a"] == 2
+    assert decoded == [1]
+    assert props.get("c") is None
+    assert len(props) == 2
+    assert props == {"a": 2, "b": 4}
+    assert decoded == [1, 2]
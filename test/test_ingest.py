@@ -0,0 +1,24 @@
+from types import SimpleNamespace
+from typing import Dict
+
+import pytest
+
+from weaviate.exceptions import WeaviateIngestError
+from weaviate.ingest import EXIT_GRACE_SECONDS, _check_workers
+
+
+def test_check_workers() -> None:
+    workers = [SimpleNamespace(exitcode=None), SimpleNamespace(exitcode=0)]
+    exited: Dict[int, float] = {}
+
+    # the results of a worker that exited normally may still be in the pipe
+    _check_workers(workers, {}, exited, now=100)
+    _check_workers(workers, {}, exited, now=100 + EXIT_GRACE_SECONDS)
+    assert exited == {1: 100}
+    with pytest.raises(WeaviateIngestError, match="without sending its results"):
+        _check_workers(workers, {}, exited, now=101 + EXIT_GRACE_SECONDS)
+    _check_workers(workers, {1: None}, exited, now=101 + EXIT_GRACE_SECONDS)
+
+    workers[0].exitcode = 1
+    with pytest.raises(WeaviateIngestError, match="exited with code 1"):
+        _check_workers(workers, {1: None}, {}, now=100)
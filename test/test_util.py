@@ -1,3 +1,4 @@
+import datetime
 import unittest
 import uuid as uuid_lib
 from copy import deepcopy
@@ -23,6 +24,7 @@ from weaviate.util import (
     is_weaviate_client_too_old,
     MINIMUM_NO_WARNING_VERSION,
     _sanitize_str,
+    _datetime_from_weaviate_str,
 )
 
 schema_set = {
@@ -592,3 +594,49 @@ def test_is_weaviate_client_too_old(current_version: str, latest_version: str, t
 )
 def test_sanitize_str(in_str: str, out_str: str) -> None:
     assert _sanitize_str(in_str) == f'"{out_str}"'
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        (
+            "2024-01-02T03:04:05Z",
+            datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        ),
+        (
+            "2024-01-02T03:04:05.123456Z",
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc),
+        ),
+        (
+            "2024-01-02T03:04:05.12Z",
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 120000, tzinfo=datetime.timezone.utc),
+        ),
+        (
+            "2024-01-02T03:04:05+02:00",
+            datetime.datetime(
+                2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+            ),
+        ),
+        (
+            "2024-01-02T03:04:05.000001-05:30",
+            datetime.datetime(
+                2024,
+                1,
+                2,
+                3,
+                4,
+                5,
+                1,
+                tzinfo=datetime.timezone(-datetime.timedelta(hours=5, minutes=30)),
+            ),
+        ),
+    ],
+)
+def test_datetime_from_weaviate_str(string: str, expected: datetime.datetime) -> None:
+    assert _datetime_from_weaviate_str(string) == expected
+    assert _datetime_from_weaviate_str(string).utcoffset() == expected.utcoffset()
+
+
+def test_datetime_from_weaviate_str_year_zero() -> None:
+    with pytest.raises(ValueError, match="year 0 is out of range"):
+        _datetime_from_weaviate_str("0000-01-01T00:00:00Z")
@@ -13,7 +13,12 @@ except PackageNotFoundError:
     __version__ = "unknown version"
 
 from .client import Client, WeaviateAsyncClient, WeaviateClient
-from .collections.batch.client import BatchClient, ClientBatchingContextManager
+from .collections.batch.client import (
+    BatchClient,
+    BatchClientAsync,
+    ClientBatchingContextManager,
+    ClientBatchingContextManagerAsync,
+)
 from .connect.helpers import (
     connect_to_custom,
     connect_to_embedded,
@@ -38,6 +43,7 @@ from . import (
     embedded,
     exceptions,
     gql,
+    ingest,
     outputs,
     schema,
     types,
@@ -54,7 +60,9 @@ os.environ["GRPC_VERBOSITY"] = "ERROR"  # https://github.com/danielmiessler/fabr
 
 __all__ = [
     "BatchClient",
+    "BatchClientAsync",
     "ClientBatchingContextManager",
+    "ClientBatchingContextManagerAsync",
     "Client",
     "WeaviateClient",
     "WeaviateAsyncClient",
@@ -75,6 +83,7 @@ __all__ = [
     "embedded",
     "exceptions",
     "gql",
+    "ingest",
     "outputs",
     "schema",
     "types",
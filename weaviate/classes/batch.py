@@ -1,5 +1,17 @@
-from weaviate.collections.classes.batch import Shard
+from weaviate.collections.classes.batch import (
+    Deduplication,
+    PIControl,
+    RetryBudget,
+    RetryClass,
+    Shard,
+    VectorizerRateLimit,
+)
 
 __all__ = [
+    "Deduplication",
+    "PIControl",
+    "RetryBudget",
+    "RetryClass",
     "Shard",
+    "VectorizerRateLimit",
 ]
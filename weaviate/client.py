@@ -19,7 +19,7 @@ from .batch import Batch
 from .classification import Classification
 from .client_base import _WeaviateClientBase
 from .cluster import Cluster
-from .collections.batch.client import _BatchClientWrapper
+from .collections.batch.client import _BatchClientWrapper, _BatchClientWrapperAsync
 from .collections.cluster import _Cluster, _ClusterAsync
 from .collections.collections.async_ import _CollectionsAsync
 from .collections.collections.sync import _Collections
@@ -128,6 +128,8 @@ class WeaviateAsyncClient(_WeaviateClientBase):
     Attributes:
         `backup`
             A `Backup` object instance connected to the same Weaviate instance as the Client.
+        `batch`
+            A `_BatchClientWrapperAsync` object instance connected to the same Weaviate instance as the Client.
         `cluster`
             A `Cluster` object instance connected to the same Weaviate instance as the Client.
         `collections`
@@ -155,11 +157,18 @@ class WeaviateAsyncClient(_WeaviateClientBase):
             skip_init_checks=skip_init_checks,
         )
 
+        collections = _CollectionsAsync(self._connection)
+
+        self.batch = _BatchClientWrapperAsync(self._connection, config=collections)
+        """This namespace contains all the functionality to upload data in batches to Weaviate for all collections and tenants.
+
+        Use it as an async context manager, e.g. `async with client.batch.dynamic() as batch: await batch.add_object(...)`.
+        """
         self.backup = _BackupAsync(self._connection)
         """This namespace contains all functionality to backup data."""
         self.cluster = _ClusterAsync(self._connection)
         """This namespace contains all functionality to inspect the connected Weaviate cluster."""
-        self.collections = _CollectionsAsync(self._connection)
+        self.collections = collections
         """This namespace contains all the functionality to manage Weaviate data collections. It is your main entry point for all collection-related functionality.
 
         Use it to retrieve collection objects using `client.collections.get("MyCollection")` or to create new collections using `await client.collections.create("MyCollection", ...)`.
@@ -22,7 +22,7 @@ from .classification import Classification
 from .cluster import Cluster
 from weaviate.collections.collections.async_ import _CollectionsAsync
 from weaviate.collections.collections.sync import _Collections
-from .collections.batch.client import _BatchClientWrapper
+from .collections.batch.client import _BatchClientWrapper, _BatchClientWrapperAsync
 from .collections.cluster import _Cluster, _ClusterAsync
 from .config import AdditionalConfig, Config
 from .connect import Connection, ConnectionV4
@@ -59,6 +59,7 @@ from weaviate.client_base import _WeaviateClientInit
 class WeaviateAsyncClient(_WeaviateClientInit):
     _connection: ConnectionV4
     collections: _CollectionsAsync
+    batch: _BatchClientWrapperAsync
     backup: _BackupAsync
     cluster: _ClusterAsync
     async def close(self) -> None: ...
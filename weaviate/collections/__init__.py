@@ -1,4 +1,16 @@
-from weaviate.collections.batch.collection import BatchCollection, CollectionBatchingContextManager
+from weaviate.collections.batch.collection import (
+    BatchCollection,
+    BatchCollectionAsync,
+    CollectionBatchingContextManager,
+    CollectionBatchingContextManagerAsync,
+)
 from weaviate.collections.collection import Collection, CollectionAsync
 
-__all__ = ["BatchCollection", "Collection", "CollectionAsync", "CollectionBatchingContextManager"]
+__all__ = [
+    "BatchCollection",
+    "BatchCollectionAsync",
+    "Collection",
+    "CollectionAsync",
+    "CollectionBatchingContextManager",
+    "CollectionBatchingContextManagerAsync",
+]
@@ -1,6 +1,13 @@
-__all__ = ["_BatchClient", "_BatchCollection", "_BatchGRPC", "_BatchREST"]
+__all__ = [
+    "_BatchClient",
+    "_BatchClientAsync",
+    "_BatchCollection",
+    "_BatchCollectionAsync",
+    "_BatchGRPC",
+    "_BatchREST",
+]
 
-from .client import _BatchClient
-from .collection import _BatchCollection
+from .client import _BatchClient, _BatchClientAsync
+from .collection import _BatchCollection, _BatchCollectionAsync
 from .grpc_batch_objects import _BatchGRPC
 from .rest import _BatchREST
@@ -0,0 +1,172 @@
+import base64
+import uuid as uuid_package
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union, cast
+
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.types import UUID, VECTOR_MATRICES
+
+_ColumnConverter = Callable[[Any], List[Any]]
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow  # type: ignore
+    except ImportError as e:
+        raise WeaviateInvalidInputError("pyarrow must be installed to use Arrow data") from e
+    return pyarrow
+
+
+def _arrow_record_batches(data: Any) -> Iterator[Any]:
+    """Iterate over the record batches of a table, a single record batch or a stream of record batches.
+
+    Streams, e.g. a `pyarrow.RecordBatchReader` or `pyarrow.parquet.ParquetFile.iter_batches()`, are consumed lazily.
+    """
+    pa = _import_pyarrow()
+    if isinstance(data, pa.Table):
+        return iter(data.to_batches())
+    if isinstance(data, pa.RecordBatch):
+        return iter([data])
+    try:
+        return iter(data)
+    except TypeError as e:
+        raise WeaviateInvalidInputError(
+            f"Expected a pyarrow Table, RecordBatch or an iterable of RecordBatches, but got {type(data)}"
+        ) from e
+
+
+def _numeric_list_column(array: Any) -> List[Any]:
+    if array.values.null_count > 0:
+        return cast(List[Any], array.to_pylist())
+    # the offsets of a sliced array index into its unsliced values, so every row is a view without copying
+    values = array.values.to_numpy(zero_copy_only=False)
+    offsets = array.offsets.to_numpy().tolist()
+    if array.null_count == 0:
+        return [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+    return [
+        values[start:end] if valid else None
+        for start, end, valid in zip(
+            offsets[:-1], offsets[1:], array.is_valid().to_numpy(zero_copy_only=False).tolist()
+        )
+    ]
+
+
+class _ArrowConverter:
+    """Converts Arrow record batches into the columns accepted by `add_objects`.
+
+    The conversion of every column is derived once from the schema instead of inspecting every value:
+    - timestamps and dates become timezone-aware datetimes, naive timestamps are interpreted as UTC
+    - binary columns become base64 encoded blobs
+    - decimals become floats
+    - lists of numbers become numpy views into the values of the column, which the property encoders pack without
+      converting them to Python numbers
+    - vector columns must be fixed size lists and are read as one float32 matrix per record batch
+
+    The batch queues, retries and deduplicates single objects, so the converted columns are still zipped into one
+    properties dict per row. Only the values are converted column-wise, the protobuf messages are built per object.
+    """
+
+    def __init__(
+        self, uuid_column: Optional[str], vector_column: Optional[Union[str, Dict[str, str]]]
+    ) -> None:
+        self.__pa = _import_pyarrow()
+        self.__uuid_column = uuid_column
+        self.__vector_columns: Optional[Union[str, Dict[str, str]]] = vector_column
+        self.__schema: Optional[Any] = None
+        self.__property_converters: Dict[str, _ColumnConverter] = {}
+
+    def convert(
+        self, record_batch: Any
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[VECTOR_MATRICES], Optional[List[UUID]]]:
+        if not isinstance(record_batch, self.__pa.RecordBatch):
+            raise WeaviateInvalidInputError(
+                f"Expected a pyarrow RecordBatch, but got {type(record_batch)}"
+            )
+        if self.__schema is None or not record_batch.schema.equals(self.__schema):
+            self.__compile(record_batch.schema)
+
+        properties: Optional[List[Dict[str, Any]]] = None
+        if len(self.__property_converters) > 0:
+            names = list(self.__property_converters)
+            columns = [
+                converter(record_batch.column(name))
+                for name, converter in self.__property_converters.items()
+            ]
+            properties = [
+                {name: value for name, value in zip(names, row) if value is not None}
+                for row in zip(*columns)
+            ]
+
+        vectors: Optional[VECTOR_MATRICES] = None
+        if isinstance(self.__vector_columns, str):
+            vectors = self.__vector_matrix(record_batch.column(self.__vector_columns))
+        elif self.__vector_columns is not None:
+            vectors = {
+                name: self.__vector_matrix(record_batch.column(column))
+                for name, column in self.__vector_columns.items()
+            }
+
+        uuids: Optional[List[UUID]] = None
+        if self.__uuid_column is not None:
+            uuids = [
+                uuid_package.UUID(bytes=value) if isinstance(value, bytes) else value
+                for value in record_batch.column(self.__uuid_column).to_pylist()
+            ]
+        return properties, vectors, uuids
+
+    def __compile(self, schema: Any) -> None:
+        vector_columns = (
+            [self.__vector_columns]
+            if isinstance(self.__vector_columns, str)
+            else list((self.__vector_columns or {}).values())
+        )
+        special_columns = vector_columns + (
+            [self.__uuid_column] if self.__uuid_column is not None else []
+        )
+        for column in special_columns:
+            if column not in schema.names:
+                raise WeaviateInvalidInputError(
+                    f"Column '{column}' does not exist, available columns are {schema.names}"
+                )
+        for column in vector_columns:
+            if not self.__pa.types.is_fixed_size_list(schema.field(column).type):
+                raise WeaviateInvalidInputError(
+                    f"Vector column '{column}' must be a fixed size list, but is {schema.field(column).type}"
+                )
+
+        self.__property_converters = {
+            field.name: self.__property_converter(field.type)
+            for field in schema
+            if field.name not in special_columns
+        }
+        self.__schema = schema
+
+    def __property_converter(self, data_type: Any) -> _ColumnConverter:
+        pa = self.__pa
+        if pa.types.is_timestamp(data_type) or pa.types.is_date(data_type):
+            target = pa.timestamp("us", tz=getattr(data_type, "tz", None) or "UTC")
+            return lambda array: array.cast(target, safe=False).to_pylist()
+        if (
+            pa.types.is_binary(data_type)
+            or pa.types.is_large_binary(data_type)
+            or pa.types.is_fixed_size_binary(data_type)
+        ):
+            return lambda array: [
+                base64.b64encode(value).decode("utf-8") if value is not None else None
+                for value in array.to_pylist()
+            ]
+        if pa.types.is_decimal(data_type):
+            return lambda array: array.cast(pa.float64()).to_pylist()
+        if (pa.types.is_list(data_type) or pa.types.is_large_list(data_type)) and (
+            pa.types.is_integer(data_type.value_type) or pa.types.is_floating(data_type.value_type)
+        ):
+            return _numeric_list_column
+        return lambda array: array.to_pylist()
+
+    def __vector_matrix(self, array: Any) -> Any:
+        if array.null_count > 0:
+            raise WeaviateInvalidInputError("Vector columns must not contain null values")
+        # flatten() respects the offset of sliced arrays; for float32 values to_numpy() is a zero-copy view
+        values = array.flatten()
+        if not self.__pa.types.is_float32(values.type):
+            values = values.cast(self.__pa.float32())
+        return values.to_numpy(zero_copy_only=False).reshape(len(array), array.type.list_size)
@@ -1,21 +1,58 @@
+import itertools
 import math
+import os
 import threading
 import time
 import uuid as uuid_package
 from abc import ABC
 from collections import deque
+from concurrent.futures import Executor
 from copy import copy
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generic, List, Optional, Set, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from pydantic import ValidationError
 from typing_extensions import TypeAlias
 
 from httpx import ConnectError
 
-from weaviate.cluster.types import Node
-from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
+from weaviate.cluster.types import BatchStats, Node
+from weaviate.collections.batch.controller import (
+    MAX_CONCURRENT_REQUESTS,
+    VECTORIZER_BATCHING_STEP_SIZE,
+    _BatchController,
+    _BatchObservation,
+    _ThresholdController,
+    _VectorizerController,
+)
+from weaviate.collections.batch.dedup import _BatchDeduplicator
+from weaviate.collections.batch.encoders import _PropertyEncoder
+from weaviate.collections.batch.error_sink import _BatchErrorSink
+from weaviate.collections.batch.journal import _BatchJournal
+from weaviate.collections.batch.rate_limit import _VectorizerRateLimiter
+from weaviate.collections.batch.grpc_batch_objects import (
+    _BatchGRPC,
+    _estimate_grpc_size,
+    _pack_vector_matrices,
+)
 from weaviate.collections.batch.rest import _BatchREST
+from weaviate.collections.batch.retry import _RetryBudget, _RetryClassifier
 from weaviate.collections.classes.batch import (
     _BatchReference,
     BatchObject,
@@ -27,6 +64,7 @@ from weaviate.collections.classes.batch import (
     BatchObjectReturn,
     BatchReferenceReturn,
     Shard,
+    VectorizerRateLimit,
 )
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.internal import (
@@ -36,11 +74,12 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import WeaviateProperties
 from weaviate.connect import ConnectionV4
+from weaviate.connect.base import MAX_GRPC_MESSAGE_LENGTH
 from weaviate.event_loop import _EventLoop
 from weaviate.exceptions import WeaviateBatchValidationError, EmptyResponseException
 from weaviate.logger import logger
-from weaviate.types import UUID, VECTORS
-from weaviate.util import _decode_json_response_dict
+from weaviate.types import UUID, VECTOR_MATRICES, VECTORS
+from weaviate.util import _capitalize_first_letter, _decode_json_response_dict, get_valid_uuid
 from weaviate.warnings import _Warnings
 
 BatchResponse = List[Dict[str, Any]]
@@ -48,11 +87,13 @@ BatchResponse = List[Dict[str, Any]]
 
 TBatchInput = TypeVar("TBatchInput")
 TBatchReturn = TypeVar("TBatchReturn")
-MAX_CONCURRENT_REQUESTS = 10
 DEFAULT_REQUEST_TIMEOUT = 180
 CONCURRENT_REQUESTS_DYNAMIC_VECTORIZER = 2
-BATCH_TIME_TARGET = 10
-VECTORIZER_BATCHING_STEP_SIZE = 48  # cohere max batch size is 96
+BATCH_LINGER_TIME = 0.01  # max time a partial batch waits for more objects before it is sent
+BULK_ADD_CHUNK_SIZE = 1000  # number of objects that add_objects creates and enqueues at once
+MAX_DYNAMIC_BATCH_SIZE = (
+    10000  # upper bound for dynamic batching that targets a number of bytes per request
+)
 
 
 class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
@@ -65,11 +106,21 @@ class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
     def __len__(self) -> int:
         return len(self._items)
 
-    def add(self, item: TBatchInput) -> None:
-        """Add an item to the BatchRequest."""
+    def add(self, item: TBatchInput) -> int:
+        """Add an item to the BatchRequest and return the new length of the queue."""
         self._lock.acquire()
         self._items.append(item)
+        length = len(self._items)
         self._lock.release()
+        return length
+
+    def extend(self, items: List[TBatchInput]) -> int:
+        """Add several items to the BatchRequest at once and return the new length of the queue."""
+        self._lock.acquire()
+        self._items.extend(items)
+        length = len(self._items)
+        self._lock.release()
+        return length
 
     def prepend(self, item: List[TBatchInput]) -> None:
         """Add items to the front of the BatchRequest.
@@ -81,25 +132,92 @@ class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
         self._lock.release()
 
 
+@dataclass
+class _BlockedReference:
+    reference: _BatchReference
+    num_pending: int  # number of objects of the reference that are still pending
+
+
 class ReferencesBatchRequest(BatchRequest[_BatchReference, BatchReferenceReturn]):
-    """Collect Weaviate-object references to add them in one request to Weaviate."""
+    """Collect Weaviate-object references to add them in one request to Weaviate.
 
-    def pop_items(self, pop_amount: int, uuid_lookup: Set[str]) -> List[_BatchReference]:
-        """Pop the given number of items from the BatchRequest queue.
+    A reference must not be sent before the objects it connects have been acknowledged by Weaviate. The queue keeps
+    track of the objects that are still pending and indexes the references that wait for them by UUID. Releasing an
+    object moves the references that only waited for it to a FIFO of ready references in O(1) per reference, so
+    popping never has to scan references that are still blocked.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._ready: Deque[_BatchReference] = deque()
+        self._blocked: Dict[str, List[_BlockedReference]] = {}
+        self._num_blocked = 0
+        self._pending_objects: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._ready) + self._num_blocked
+
+    def add(self, item: _BatchReference) -> int:
+        """Add a reference to the queue and return the new length of the queue."""
+        self._lock.acquire()
+        self.__add(item)
+        length = len(self._ready) + self._num_blocked
+        self._lock.release()
+        return length
+
+    def extend(self, items: List[_BatchReference]) -> int:
+        """Add several references to the queue at once and return the new length of the queue."""
+        self._lock.acquire()
+        for item in items:
+            self.__add(item)
+        length = len(self._ready) + self._num_blocked
+        self._lock.release()
+        return length
+
+    def prepend(self, item: List[_BatchReference]) -> None:
+        """Add references that were ready before to the front of the queue, eg. to retry them."""
+        self._lock.acquire()
+        self._ready.extendleft(reversed(item))
+        self._lock.release()
+
+    def __add(self, item: _BatchReference) -> None:
+        blockers = {
+            uuid for uuid in (item.from_uuid, item.to_uuid) if uuid in self._pending_objects
+        }
+        if len(blockers) == 0:
+            self._ready.append(item)
+            return
+        blocked = _BlockedReference(item, len(blockers))
+        for uuid in blockers:
+            self._blocked.setdefault(uuid, []).append(blocked)
+        self._num_blocked += 1
+
+    def add_pending_objects(self, uuids: Iterable[str]) -> None:
+        """Mark objects as pending, references to or from them are held back until they are released."""
+        self._lock.acquire()
+        self._pending_objects.update(uuids)
+        self._lock.release()
+
+    def release_objects(self, uuids: Iterable[str]) -> None:
+        """Mark objects as processed by Weaviate and release the references that no longer wait for any object."""
+        self._lock.acquire()
+        for uuid in uuids:
+            self._pending_objects.discard(uuid)
+            for blocked in self._blocked.pop(uuid, ()):
+                blocked.num_pending -= 1
+                if blocked.num_pending == 0:
+                    self._ready.append(blocked.reference)
+                    self._num_blocked -= 1
+        self._lock.release()
+
+    def pop_items(self, pop_amount: int) -> List[_BatchReference]:
+        """Pop up to the given number of references whose objects are not pending anymore.
 
         Returns
             `List[_BatchReference]` items from the BatchRequest.
         """
-        ret: List[_BatchReference] = []
-        i = 0
         self._lock.acquire()
-        while len(ret) < pop_amount and len(self._items) > 0 and i < len(self._items):
-            if self._items[i].from_uuid not in uuid_lookup and (
-                self._items[i].to_uuid is None or self._items[i].to_uuid not in uuid_lookup
-            ):
-                ret.append(self._items.pop(i))
-            else:
-                i += 1
+        ret = [self._ready.popleft() for _ in range(min(pop_amount, len(self._ready)))]
         self._lock.release()
         return ret
 
@@ -124,6 +242,29 @@ class ObjectsBatchRequest(BatchRequest[_BatchObject, BatchObjectReturn]):
         self._lock.release()
         return ret
 
+    def pop_items_by_size(self, pop_amount: int, max_bytes: int) -> Tuple[List[_BatchObject], int]:
+        """Pop up to the given number of items, but stop before their estimated serialized size exceeds `max_bytes`.
+
+        At least one item is popped if the queue is not empty, even if it exceeds `max_bytes` on its own.
+
+        Returns
+            `List[_BatchObject]` items from the BatchRequest and their estimated size in bytes.
+        """
+        self._lock.acquire()
+        num_bytes = 0
+        n = 0
+        limit = min(pop_amount, len(self._items))
+        while n < limit:
+            size = _estimate_grpc_size(self._items[n])
+            if n > 0 and num_bytes + size > max_bytes:
+                break
+            num_bytes += size
+            n += 1
+        ret = self._items[:n]
+        self._items = self._items[n:]
+        self._lock.release()
+        return ret, num_bytes
+
 
 @dataclass
 class _BatchDataWrapper:
@@ -135,13 +276,18 @@ class _BatchDataWrapper:
 
 @dataclass
 class _DynamicBatching:
-    pass
+    max_request_bytes: Optional[int] = None
+    controller: Optional[Callable[[], _BatchController]] = None
+    vectorizer_rate_limit: Optional[VectorizerRateLimit] = None
+    # share of the concurrent requests that the cluster can take, for batches that run in several processes at once
+    concurrency_share: float = 1.0
 
 
 @dataclass
 class _FixedSizeBatching:
     batch_size: int
     concurrent_requests: int
+    max_request_bytes: Optional[int] = None
 
 
 @dataclass
@@ -152,6 +298,503 @@ class _RateLimitedBatching:
 _BatchMode: TypeAlias = Union[_DynamicBatching, _FixedSizeBatching, _RateLimitedBatching]
 
 
+class _BatchSizing:
+    """Batch size and concurrency recommendations for one batching run.
+
+    The values are initialised from the batching mode. For dynamic batching they are refreshed from the
+    `/nodes` batch statistics with `update`. The state is shared by the thread-based and the asyncio-based
+    batchers so that both behave identically.
+    """
+
+    def __init__(
+        self, batch_mode: _BatchMode, vectorizer_batching: bool, max_batch_size: int = 1000
+    ) -> None:
+        self.mode: _BatchMode = batch_mode
+        self.vectorizer_batching = vectorizer_batching
+        self.max_batch_size = max_batch_size
+
+        if isinstance(self.mode, _FixedSizeBatching):
+            self.num_objects = self.mode.batch_size
+            self.concurrent_requests = self.mode.concurrent_requests
+        elif isinstance(self.mode, _RateLimitedBatching):
+            # Batch with rate limiting should never send more than the given amount of objects per minute.
+            # We could send all objects in a single batch every 60 seconds but that could cause problems with too large requests. Therefore, we
+            # limit the size of a batch to self.max_batch_size and send multiple batches of equal size and send them in equally space in time.
+            # Example:
+            #  3000 objects, 1000/min -> 3 batches of 1000 objects, send every 20 seconds
+            self.concurrent_requests = (
+                self.mode.requests_per_minute + self.max_batch_size
+            ) // self.max_batch_size
+            self.num_objects = self.mode.requests_per_minute // self.concurrent_requests
+        elif isinstance(self.mode, _DynamicBatching) and not self.vectorizer_batching:
+            self.num_objects = 10
+            self.concurrent_requests = 2
+        else:
+            assert isinstance(self.mode, _DynamicBatching) and self.vectorizer_batching
+            self.num_objects = VECTORIZER_BATCHING_STEP_SIZE
+            self.concurrent_requests = 2
+
+        self.num_refs: int = 50
+
+        # with known provider limits, requests for vectorizers are also paced by token buckets
+        self.rate_limiter: Optional[_VectorizerRateLimiter] = None
+        if (
+            isinstance(self.mode, _DynamicBatching)
+            and self.vectorizer_batching
+            and self.mode.vectorizer_rate_limit is not None
+        ):
+            self.rate_limiter = _VectorizerRateLimiter(self.mode.vectorizer_rate_limit, time.time())
+
+        self.controller: _BatchController
+        if isinstance(self.mode, _DynamicBatching) and self.mode.controller is not None:
+            self.controller = self.mode.controller()
+        elif self.vectorizer_batching:
+            self.controller = _VectorizerController()
+        else:
+            self.controller = _ThresholdController()
+
+        # requests are cut once their estimated size reaches max_request_bytes. If dynamic batching is given a byte
+        # budget, the maximum batch size follows the average object size so that full batches use the budget
+        max_request_bytes = (
+            self.mode.max_request_bytes
+            if isinstance(self.mode, (_DynamicBatching, _FixedSizeBatching))
+            else None
+        )
+        self.max_request_bytes: int = min(
+            max_request_bytes or MAX_GRPC_MESSAGE_LENGTH, MAX_GRPC_MESSAGE_LENGTH
+        )
+        self.target_request_bytes = (
+            isinstance(self.mode, _DynamicBatching) and max_request_bytes is not None
+        )
+        self.avg_object_bytes: Optional[float] = None
+
+        # dynamic batching
+        self.rate_queue: deque = deque(maxlen=50)  # 5s with 0.1s refresh rate
+        # latest batch statistics of every node, the controller sees their sum over the whole cluster
+        self.node_stats: Dict[str, BatchStats] = {}
+        self.max_concurrent_requests = self.__concurrency_budget(MAX_CONCURRENT_REQUESTS)
+        if isinstance(self.mode, _DynamicBatching):
+            self.concurrent_requests = min(self.concurrent_requests, self.max_concurrent_requests)
+        self.took_queue: deque = deque(maxlen=CONCURRENT_REQUESTS_DYNAMIC_VECTORIZER)
+        self.dynamic_batching_sleep_time: float = 0
+        self.batch_sent: bool = False
+
+        # fixed rate batching
+        self.time_stamp_last_request: float = 0
+        # backoff after retryable errors, no request is sent before this time
+        self.retry_not_before: float = 0
+        # do 62 secs to give us some buffer to the "per-minute" calculation
+        self.fix_rate_batching_base_time = 62
+
+    def time_until_next_request(self) -> float:
+        """Return the number of seconds to wait before the next request may be sent."""
+        now = time.time()
+        interval: float
+        if isinstance(self.mode, _RateLimitedBatching):
+            interval = self.fix_rate_batching_base_time // self.concurrent_requests
+        elif isinstance(self.mode, _DynamicBatching) and self.vectorizer_batching:
+            interval = self.dynamic_batching_sleep_time
+        else:
+            interval = 0
+        return max(
+            0.0,
+            interval - (now - self.time_stamp_last_request),
+            self.retry_not_before - now,
+            self.rate_limiter.delay(self.num_objects, now) if self.rate_limiter is not None else 0,
+        )
+
+    def record_request(self, num_objects: int, num_bytes: int) -> None:
+        """Track the average estimated size of the objects that are sent."""
+        if num_objects == 0:
+            return
+        size = num_bytes / num_objects
+        self.avg_object_bytes = (
+            size if self.avg_object_bytes is None else 0.8 * self.avg_object_bytes + 0.2 * size
+        )
+
+    def record_vectorizer_load(self, objs: List[_BatchObject]) -> None:
+        """Take the provider requests and text tokens of the objects that are sent from the rate limiter."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(objs, time.time())
+
+    def update(
+        self, status: List[Node], num_queued_objects: int, now: Optional[float] = None
+    ) -> None:
+        """Adapt the recommendations of dynamic batching to the current load of Weaviate.
+
+        The batch statistics of all nodes are added up: every node coordinates requests and processes the objects of
+        its shards, so the cluster can take as many objects as all of its nodes together. The maximum number of
+        concurrent requests grows with the number of nodes for the same reason.
+        """
+        node_stats = {
+            node.get("name", str(i)): node["batchStats"]
+            for i, node in enumerate(status)
+            if "batchStats" in node and "queueLength" in node["batchStats"]
+        }
+        if len(node_stats) == 0:
+            # async indexing - just send a lot
+            concurrent_requests = self.__concurrency_budget(10)
+            self.mode = _FixedSizeBatching(1000, concurrent_requests)
+            self.num_objects = 1000
+            self.concurrent_requests = concurrent_requests
+            self.__limit_to_provider_budget()
+            return
+
+        self.node_stats = node_stats
+        self.max_concurrent_requests = self.__concurrency_budget(
+            MAX_CONCURRENT_REQUESTS * len(node_stats)
+        )
+        rate = sum(stats["ratePerSecond"] for stats in node_stats.values())
+        batch_length = sum(stats["queueLength"] for stats in node_stats.values())
+
+        self.rate_queue.append(rate)
+
+        if not self.vectorizer_batching and self.target_request_bytes:
+            if self.avg_object_bytes is not None:
+                self.max_batch_size = max(
+                    1,
+                    min(
+                        MAX_DYNAMIC_BATCH_SIZE,
+                        math.floor(self.max_request_bytes / self.avg_object_bytes),
+                    ),
+                )
+                self.num_objects = min(self.num_objects, self.max_batch_size)
+
+        self.controller.update(
+            self,
+            _BatchObservation(
+                now=time.time() if now is None else now,
+                queue_length=batch_length,
+                rate_per_second=rate,
+                num_queued_objects=num_queued_objects,
+                latency=max(self.took_queue) if len(self.took_queue) > 0 else None,
+            ),
+        )
+        self.concurrent_requests = min(self.concurrent_requests, self.max_concurrent_requests)
+        self.__limit_to_provider_budget()
+
+    def __concurrency_budget(self, concurrent_requests: int) -> int:
+        share = self.mode.concurrency_share if isinstance(self.mode, _DynamicBatching) else 1.0
+        return max(1, math.floor(concurrent_requests * share))
+
+    def __limit_to_provider_budget(self) -> None:
+        # a batch must fit into the budget of the provider, otherwise it is rejected however long we wait
+        if self.rate_limiter is not None and (max_objects := self.rate_limiter.max_objects()):
+            self.num_objects = min(self.num_objects, max_objects)
+
+
+def _split_retryable(
+    response_obj: BatchObjectReturn,
+    sizing: _BatchSizing,
+    classifier: _RetryClassifier,
+    budget: _RetryBudget,
+) -> Tuple[List[_BatchObject], BatchObjectReturn]:
+    """Split the objects that failed with a retryable error from the other results.
+
+    Returns the objects to re-add to the queue and the response without them. Instead of sleeping, the backoff is
+    applied by delaying the next request of the batch, see `_BatchSizing.time_until_next_request`.
+    """
+    readded_objects = []
+    delay = 0.0
+    message = ""
+    for i, err in response_obj.errors.items():
+        retry_class = classifier.classify(err.message)
+        if retry_class is None:
+            continue
+        if err.object_.retry_count >= retry_class.backoff.max_retries or not budget.try_spend():
+            continue  # too many retries, give up
+        delay = max(delay, retry_class.backoff.delay(err.object_.retry_count))
+        message = err.message
+        err.object_.retry_count += 1
+        readded_objects.append(i)
+
+    budget.record_success(len(response_obj.uuids))
+    if len(readded_objects) == 0:
+        return [], response_obj
+
+    readd_objects = [err.object_ for i, err in response_obj.errors.items() if i in readded_objects]
+
+    new_errors = {i: err for i, err in response_obj.errors.items() if i not in readded_objects}
+    response_obj = BatchObjectReturn(
+        uuids={i: uid for i, uid in response_obj.uuids.items() if i not in readded_objects},
+        errors=new_errors,
+        has_errors=len(new_errors) > 0,
+        _all_responses=[
+            err for i, err in enumerate(response_obj._all_responses) if i not in readded_objects
+        ],
+        elapsed_seconds=response_obj.elapsed_seconds,
+    )
+    if isinstance(sizing.mode, _RateLimitedBatching):
+        highest_retry_count = max(obj.retry_count for obj in readd_objects) - 1
+        # skip a full minute to recover from the rate limit
+        delay = max(delay, sizing.fix_rate_batching_base_time * (highest_retry_count + 1))
+        sizing.fix_rate_batching_base_time += (
+            1  # increase the base time as the current one is too low
+        )
+    _Warnings.batch_rate_limit_reached(message, math.ceil(delay))
+    sizing.retry_not_before = max(sizing.retry_not_before, time.time() + delay)
+    return readd_objects, response_obj
+
+
+def _objects_error_response(
+    objs: List[_BatchObject], error: Exception, start: float
+) -> BatchObjectReturn:
+    # keyed by the index of the objects in the batch like the responses of Weaviate
+    errors_obj = {obj.index: ErrorObject(message=repr(error), object_=obj) for obj in objs}
+    return BatchObjectReturn(
+        _all_responses=list(errors_obj.values()),
+        elapsed_seconds=time.time() - start,
+        errors=errors_obj,
+        has_errors=True,
+    )
+
+
+def _without_errors(response_obj: BatchObjectReturn) -> BatchObjectReturn:
+    """Drop the failed objects from a response once they have been streamed to an error sink."""
+    return BatchObjectReturn(
+        _all_responses=[
+            res for res in response_obj._all_responses if not isinstance(res, ErrorObject)
+        ],
+        elapsed_seconds=response_obj.elapsed_seconds,
+        uuids=response_obj.uuids,
+        has_errors=response_obj.has_errors,
+    )
+
+
+def _references_error_response(
+    refs: List[_BatchReference], error: Exception, start: float
+) -> BatchReferenceReturn:
+    return BatchReferenceReturn(
+        elapsed_seconds=time.time() - start,
+        errors={
+            idx: ErrorReference(message=repr(error), reference=ref) for idx, ref in enumerate(refs)
+        },
+        has_errors=True,
+    )
+
+
+class _BatchErrorLogger:
+    """Logs failed batches, but stops after a given amount of failures to not flood the logs."""
+
+    def __init__(self, max_logs: int = 30) -> None:
+        self.__max_logs = max_logs
+        self.__objs_logs_count = 0
+        self.__refs_logs_count = 0
+
+    def objects(self, n_obj_errs: int, n_objs: int) -> None:
+        if n_obj_errs > 0 and self.__objs_logs_count < self.__max_logs:
+            logger.error(
+                {
+                    "message": f"Failed to send {n_obj_errs} objects in a batch of {n_objs}. Please inspect client.batch.failed_objects or collection.batch.failed_objects for the failed objects.",
+                }
+            )
+            self.__objs_logs_count += 1
+        if self.__objs_logs_count > self.__max_logs:
+            logger.error(
+                {
+                    "message": f"There have been more than {self.__max_logs} failed object batches. Further errors will not be logged.",
+                }
+            )
+
+    def references(self, response_ref: BatchReferenceReturn, n_refs: int) -> None:
+        if (
+            n_ref_errs := len(response_ref.errors)
+        ) > 0 and self.__refs_logs_count < self.__max_logs:
+            logger.error(
+                {
+                    "message": f"Failed to send {n_ref_errs} references in a batch of {n_refs}. Please inspect client.batch.failed_references or collection.batch.failed_references for the failed references.",
+                    "errors": response_ref.errors,
+                }
+            )
+            self.__refs_logs_count += 1
+        if self.__refs_logs_count > self.__max_logs:
+            logger.error(
+                {
+                    "message": f"There have been more than {self.__max_logs} failed reference batches. Further errors will not be logged.",
+                }
+            )
+
+
+def _create_batch_object(
+    collection: str,
+    properties: Optional[WeaviateProperties],
+    references: Optional[ReferenceInputs],
+    uuid: Optional[UUID],
+    vector: Optional[VECTORS],
+    tenant: Optional[str],
+    index: int,
+) -> BatchObject:
+    try:
+        return BatchObject(
+            collection=collection,
+            properties=properties,
+            references=references,
+            uuid=uuid,
+            vector=vector,
+            tenant=tenant,
+            index=index,
+        )
+    except ValidationError as e:
+        raise WeaviateBatchValidationError(repr(e))
+
+
+def _generate_uuids(count: int) -> List[UUID]:
+    """Generate `count` random UUIDv4s from a single call to the OS random source.
+
+    This is several times faster than calling `uuid.uuid4()` for every object.
+    """
+    raw = bytearray(os.urandom(16 * count))
+    # set the version (4) and variant (RFC 4122) bits of every UUID
+    raw[6::16] = bytes(b & 0x0F | 0x40 for b in raw[6::16])
+    raw[8::16] = bytes(b & 0x3F | 0x80 for b in raw[8::16])
+    h = raw.hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
+
+
+def _iter_batch_objects_from_arrays(
+    collection: str,
+    properties: Optional[Iterable[Optional[WeaviateProperties]]],
+    vectors: Optional[VECTOR_MATRICES],
+    uuids: Optional[Sequence[UUID]],
+    tenant: Optional[str],
+    start_index: int,
+    chunk_size: int = BULK_ADD_CHUNK_SIZE,
+) -> Iterator[Tuple[List[_BatchObject], List[UUID]]]:
+    """Create the objects for one row of each of the given arrays in chunks of at most `chunk_size` objects.
+
+    The collection name is validated and the vectors are packed to float32 bytes once for all objects, no pydantic
+    models are created. All arrays are validated before the first chunk is returned. The only exception are properties
+    given as an iterator without vectors and uuids, which are consumed lazily one chunk at a time.
+    """
+    if len(collection) == 0:
+        raise WeaviateBatchValidationError("The collection name must not be empty")
+    collection = _capitalize_first_letter(collection)
+
+    def create_chunk(
+        chunk_properties: Optional[Sequence[Optional[WeaviateProperties]]],
+        chunk_vectors: Optional[Sequence[Union[bytes, Dict[str, bytes]]]],
+        chunk_uuids: List[UUID],
+        index: int,
+    ) -> Tuple[List[_BatchObject], List[UUID]]:
+        objs = [
+            _BatchObject(
+                collection=collection,
+                vector=chunk_vectors[i] if chunk_vectors is not None else None,
+                uuid=str(uid),
+                properties=(
+                    cast(dict, chunk_properties[i]) if chunk_properties is not None else None
+                ),
+                tenant=tenant,
+                references=None,
+                index=index + i,
+            )
+            for i, uid in enumerate(chunk_uuids)
+        ]
+        return objs, chunk_uuids
+
+    if properties is not None and not isinstance(properties, Sequence):
+        if vectors is None and uuids is None:
+            iterator = iter(properties)
+            while len(chunk := list(itertools.islice(iterator, chunk_size))) > 0:
+                yield create_chunk(chunk, None, _generate_uuids(len(chunk)), start_index)
+                start_index += len(chunk)
+            return
+        properties = list(properties)
+
+    packed_vectors = _pack_vector_matrices(vectors) if vectors is not None else None
+    lengths = {
+        name: len(array)
+        for name, array in (
+            ("properties", properties),
+            ("vectors", packed_vectors),
+            ("uuids", uuids),
+        )
+        if array is not None
+    }
+    if len(lengths) == 0:
+        raise WeaviateBatchValidationError(
+            "At least one of properties, vectors or uuids must be given"
+        )
+    if len(set(lengths.values())) > 1:
+        raise WeaviateBatchValidationError(
+            f"properties, vectors and uuids must have the same length, but got {lengths}"
+        )
+    num_objects = max(lengths.values())
+
+    try:
+        valid_uuids = [get_valid_uuid(uid) for uid in uuids] if uuids is not None else None
+    except (TypeError, ValueError) as e:
+        raise WeaviateBatchValidationError(repr(e))
+
+    for start in range(0, num_objects, chunk_size):
+        stop = min(start + chunk_size, num_objects)
+        yield create_chunk(
+            properties[start:stop] if properties is not None else None,
+            packed_vectors[start:stop] if packed_vectors is not None else None,
+            (
+                cast(List[UUID], valid_uuids[start:stop])
+                if valid_uuids is not None
+                else _generate_uuids(stop - start)
+            ),
+            start_index + start,
+        )
+
+
+def _create_batch_objects_from_arrays(
+    collection: str,
+    properties: Optional[Iterable[Optional[WeaviateProperties]]],
+    vectors: Optional[VECTOR_MATRICES],
+    uuids: Optional[Sequence[UUID]],
+    tenant: Optional[str],
+    start_index: int,
+) -> Tuple[List[_BatchObject], List[UUID]]:
+    """Create the objects for one row of each of the given arrays, see `_iter_batch_objects_from_arrays`."""
+    objs: List[_BatchObject] = []
+    object_uuids: List[UUID] = []
+    for chunk_objs, chunk_uuids in _iter_batch_objects_from_arrays(
+        collection, properties, vectors, uuids, tenant, start_index
+    ):
+        objs.extend(chunk_objs)
+        object_uuids.extend(chunk_uuids)
+    return objs, object_uuids
+
+
+def _create_batch_references(
+    from_object_uuid: UUID,
+    from_object_collection: str,
+    from_property_name: str,
+    to: ReferenceInput,
+    tenant: Optional[str],
+) -> List[_BatchReference]:
+    if isinstance(to, ReferenceToMulti):
+        to_strs: Union[List[str], List[UUID]] = to.uuids_str
+    elif isinstance(to, str) or isinstance(to, uuid_package.UUID):
+        to_strs = [to]
+    else:
+        to_strs = list(to)
+
+    refs: List[_BatchReference] = []
+    for uid in to_strs:
+        try:
+            batch_reference = BatchReference(
+                from_object_collection=from_object_collection,
+                from_object_uuid=from_object_uuid,
+                from_property_name=from_property_name,
+                to_object_collection=(
+                    to.target_collection if isinstance(to, ReferenceToMulti) else None
+                ),
+                to_object_uuid=uid,
+                tenant=tenant,
+            )
+        except ValidationError as e:
+            raise WeaviateBatchValidationError(repr(e))
+        refs.append(batch_reference._to_internal())
+    return refs
+
+
 class _BatchBase:
     def __init__(
         self,
@@ -163,85 +806,73 @@ class _BatchBase:
         vectorizer_batching: bool,
         objects_: Optional[ObjectsBatchRequest] = None,
         references: Optional[ReferencesBatchRequest] = None,
+        error_sink: Optional[_BatchErrorSink] = None,
+        journal: Optional[_BatchJournal] = None,
+        deduplicator: Optional[_BatchDeduplicator] = None,
+        retry_classifier: Optional[_RetryClassifier] = None,
+        retry_budget: Optional[_RetryBudget] = None,
+        serialization_executor: Optional[Executor] = None,
+        property_encoders: Optional[Dict[str, _PropertyEncoder]] = None,
     ) -> None:
         self.__batch_objects = objects_ or ObjectsBatchRequest()
         self.__batch_references = references or ReferencesBatchRequest()
         self.__connection = connection
         self.__consistency_level: Optional[ConsistencyLevel] = consistency_level
-        self.__vectorizer_batching = vectorizer_batching
 
-        self.__batch_grpc = _BatchGRPC(connection, self.__consistency_level)
+        self.__batch_grpc = _BatchGRPC(
+            connection, self.__consistency_level, serialization_executor, property_encoders
+        )
         self.__batch_rest = _BatchREST(connection, self.__consistency_level)
 
-        # lookup table for objects that are currently being processed - is used to not send references from objects that have not been added yet
-        self.__uuid_lookup_lock = threading.Lock()
-        self.__uuid_lookup: Set[str] = set()
-
         # we do not want that users can access the results directly as they are not thread-safe
         self.__results_for_wrapper_backup = results
         self.__results_for_wrapper = _BatchDataWrapper()
+        self.__error_sink = error_sink or _BatchErrorSink()
+        self.__journal = journal
+        self.__deduplicator = deduplicator
+        self.__num_errors = 0
 
         self.__results_lock = threading.Lock()
 
         self.__cluster = _ClusterBatch(self.__connection)
 
-        self.__batching_mode: _BatchMode = batch_mode
-        self.__max_batch_size: int = 1000
+        self.__sizing = _BatchSizing(batch_mode, vectorizer_batching)
 
         self.__loop = event_loop
-        self.__objs_count = 0
-        self.__objs_logs_count = 0
-        self.__refs_logs_count = 0
-
-        if isinstance(self.__batching_mode, _FixedSizeBatching):
-            self.__recommended_num_objects = self.__batching_mode.batch_size
-            self.__concurrent_requests = self.__batching_mode.concurrent_requests
-        elif isinstance(self.__batching_mode, _RateLimitedBatching):
-            # Batch with rate limiting should never send more than the given amount of objects per minute.
-            # We could send all objects in a single batch every 60 seconds but that could cause problems with too large requests. Therefore, we
-            # limit the size of a batch to self.__max_batch_size and send multiple batches of equal size and send them in equally space in time.
-            # Example:
-            #  3000 objects, 1000/min -> 3 batches of 1000 objects, send every 20 seconds
-            self.__concurrent_requests = (
-                self.__batching_mode.requests_per_minute + self.__max_batch_size
-            ) // self.__max_batch_size
-            self.__recommended_num_objects = (
-                self.__batching_mode.requests_per_minute // self.__concurrent_requests
-            )
-        elif isinstance(self.__batching_mode, _DynamicBatching) and not self.__vectorizer_batching:
-            self.__recommended_num_objects = 10
-            self.__concurrent_requests = 2
-        else:
-            assert isinstance(self.__batching_mode, _DynamicBatching) and self.__vectorizer_batching
-            self.__recommended_num_objects = VECTORIZER_BATCHING_STEP_SIZE
-            self.__concurrent_requests = 2
-            self.__dynamic_batching_sleep_time: int = 0
-            self._batch_send: bool = False
-
-        self.__recommended_num_refs: int = 50
+        # the indices of a resumed import continue where the acknowledged prefix of its journal ends
+        self.__objs_count = journal.state.resume_offset if journal is not None else 0
+        self.__error_logger = _BatchErrorLogger()
+        self.__retry_classifier = retry_classifier or _RetryClassifier()
+        self.__retry_budget = retry_budget or _RetryBudget()
 
         self.__active_requests = 0
-        self.__active_requests_lock = threading.Lock()
 
-        # dynamic batching
-        self.__time_last_scale_up: float = 0
-        self.__rate_queue: deque = deque(maxlen=50)  # 5s with 0.1s refresh rate
-        self.__took_queue: deque = deque(maxlen=CONCURRENT_REQUESTS_DYNAMIC_VECTORIZER)
+        # notified whenever the queues, the number of active requests or the batch sizing change. The sender thread
+        # and blocked producers wait on it instead of polling. It also protects `__active_requests`.
+        self.__state_changed = threading.Condition()
+        self.__flushing = 0
 
-        # fixed rate batching
-        self.__time_stamp_last_request: float = 0
-        # do 62 secs to give us some buffer to the "per-minute" calculation
-        self.__fix_rate_batching_base_time = 62
-
-        self.__bg_thread = self.__start_bg_threads()
         self.__bg_thread_exception: Optional[Exception] = None
+        self.__bg_thread = self.__start_bg_threads()
 
     @property
     def number_errors(self) -> int:
         """Return the number of errors in the batch."""
-        return len(self.__results_for_wrapper.failed_objects) + len(
-            self.__results_for_wrapper.failed_references
-        )
+        return self.__num_errors
+
+    @property
+    def number_duplicates(self) -> int:
+        """Return the number of objects that were skipped because they were added before."""
+        return self.__deduplicator.num_duplicates if self.__deduplicator is not None else 0
+
+    @property
+    def node_batch_stats(self) -> Dict[str, BatchStats]:
+        """Return the latest batch statistics of every node, by node name.
+
+        Dynamic batching refreshes them about once per second and sizes the batches for the sum over all nodes. The
+        statistics are empty for the other batching modes.
+        """
+        return dict(self.__sizing.node_stats)
 
     def _shutdown(self) -> None:
         """Shutdown the current batch and wait for all requests to be finished."""
@@ -249,8 +880,13 @@ class _BatchBase:
 
         # we are done, shut bg threads down and end the event loop
         self.__shut_background_thread_down.set()
-        while self.__bg_thread.is_alive():
-            time.sleep(0.01)
+        self.__notify()
+        self.__bg_thread.join()
+        self.__error_sink.close()
+        if self.__journal is not None:
+            self.__journal.close()
+        if self.__deduplicator is not None:
+            self.__deduplicator.close()
 
         # copy the results to the public results
         self.__results_for_wrapper_backup.results = self.__results_for_wrapper.results
@@ -262,55 +898,57 @@ class _BatchBase:
             self.__results_for_wrapper.imported_shards
         )
 
+    def __notify(self) -> None:
+        with self.__state_changed:
+            self.__state_changed.notify_all()
+
+    def __can_send(self) -> bool:
+        return self.__shut_background_thread_down.is_set() or (
+            self.__active_requests < self.__sizing.concurrent_requests
+            and len(self.__batch_objects) + len(self.__batch_references) > 0
+        )
+
+    def __batch_ready(self) -> bool:
+        return (
+            self.__flushing > 0
+            or self.__shut_background_thread_down.is_set()
+            or len(self.__batch_objects) >= self.__sizing.num_objects
+            or len(self.__batch_references) >= self.__sizing.num_refs
+        )
+
     def __batch_send(self) -> None:
-        refresh_time: float = 0.01
-        while (
-            self.__shut_background_thread_down is not None
-            and not self.__shut_background_thread_down.is_set()
-        ):
-            if isinstance(self.__batching_mode, _RateLimitedBatching):
-                if (
-                    time.time() - self.__time_stamp_last_request
-                    < self.__fix_rate_batching_base_time // self.__concurrent_requests
-                ):
-                    time.sleep(1)
+        while not self.__shut_background_thread_down.is_set():
+            with self.__state_changed:
+                self.__state_changed.wait_for(self.__can_send)
+                if self.__shut_background_thread_down.is_set():
+                    return
+
+                if (wait := self.__sizing.time_until_next_request()) > 0:
+                    self.__state_changed.wait(timeout=wait)
                     continue
-                refresh_time = 0
-            elif isinstance(self.__batching_mode, _DynamicBatching) and self.__vectorizer_batching:
-                if self.__dynamic_batching_sleep_time > 0:
-                    if (
-                        time.time() - self.__time_stamp_last_request
-                        < self.__dynamic_batching_sleep_time
-                    ):
-                        time.sleep(1)
-                        continue
-
-            if (
-                self.__active_requests < self.__concurrent_requests
-                and len(self.__batch_objects) + len(self.__batch_references) > 0
-            ):
-                self.__time_stamp_last_request = time.time()
-
-                self._batch_send = True
-                self.__active_requests_lock.acquire()
-                self.__active_requests += 1
-                self.__active_requests_lock.release()
 
-                objs = self.__batch_objects.pop_items(self.__recommended_num_objects)
-                self.__uuid_lookup_lock.acquire()
-                refs = self.__batch_references.pop_items(
-                    self.__recommended_num_refs, uuid_lookup=self.__uuid_lookup
-                )
-                self.__uuid_lookup_lock.release()
-                # do not block the thread - the results are written to a central (locked) list and we want to have multiple concurrent batch-requests
-                self.__loop.schedule(
-                    self.__send_batch,
-                    objs,
-                    refs,
-                    readd_rate_limit=isinstance(self.__batching_mode, _RateLimitedBatching),
+                # producers only wake us for the first queued item, so give them a moment to fill the batch
+                self.__state_changed.wait_for(self.__batch_ready, timeout=BATCH_LINGER_TIME)
+
+                objs, objs_bytes = self.__batch_objects.pop_items_by_size(
+                    self.__sizing.num_objects, self.__sizing.max_request_bytes
                 )
+                refs = self.__batch_references.pop_items(self.__sizing.num_refs)
+                if len(objs) == 0 and len(refs) == 0:
+                    # weaviate is overloaded or all queued references wait for objects that are still in flight
+                    self.__state_changed.wait()
+                    continue
 
-            time.sleep(refresh_time)
+                self.__sizing.time_stamp_last_request = time.time()
+                self.__sizing.batch_sent = True
+                self.__sizing.record_request(len(objs), objs_bytes)
+                self.__sizing.record_vectorizer_load(objs)
+                self.__active_requests += 1
+                # wake producers that are blocked on a full queue
+                self.__state_changed.notify_all()
+
+            # do not block the thread - the results are written to a central (locked) list and we want to have multiple concurrent batch-requests
+            self.__loop.schedule(self.__send_batch, objs, refs)
 
     def __dynamic_batch_rate_loop(self) -> None:
         refresh_time = 1
@@ -318,15 +956,18 @@ class _BatchBase:
             self.__shut_background_thread_down is not None
             and not self.__shut_background_thread_down.is_set()
         ):
-            if not isinstance(self.__batching_mode, _DynamicBatching):
+            if not isinstance(self.__sizing.mode, _DynamicBatching):
                 return
 
             try:
-                self.__dynamic_batching()
+                status = self.__loop.run_until_complete(self.__cluster.get_nodes_status)
+                with self.__state_changed:
+                    self.__sizing.update(status, len(self.__batch_objects))
+                    self.__state_changed.notify_all()
             except Exception as e:
                 _Warnings.batch_refresh_failed(repr(e))
 
-            time.sleep(refresh_time)
+            self.__shut_background_thread_down.wait(refresh_time)
 
     def __start_bg_threads(self) -> threading.Thread:
         """Create a background thread that periodically checks how congested the batch queue is."""
@@ -337,6 +978,7 @@ class _BatchBase:
                 self.__dynamic_batch_rate_loop()
             except Exception as e:
                 self.__bg_thread_exception = e
+                self.__notify()
 
         demonDynamic = threading.Thread(
             target=dynamic_batch_rate_wrapper,
@@ -350,6 +992,8 @@ class _BatchBase:
                 self.__batch_send()
             except Exception as e:
                 self.__bg_thread_exception = e
+            finally:
+                self.__notify()
 
         demonBatchSend = threading.Thread(
             target=batch_send_wrapper,
@@ -359,261 +1003,91 @@ class _BatchBase:
         demonBatchSend.start()
         return demonBatchSend
 
-    def __dynamic_batching(self) -> None:
-        status = self.__loop.run_until_complete(self.__cluster.get_nodes_status)
-        if "batchStats" not in status[0] or "queueLength" not in status[0]["batchStats"]:
-            # async indexing - just send a lot
-            self.__batching_mode = _FixedSizeBatching(1000, 10)
-            self.__recommended_num_objects = 1000
-            self.__concurrent_requests = 10
-            return
-
-        rate: int = status[0]["batchStats"]["ratePerSecond"]
-        rate_per_worker = rate / self.__concurrent_requests
-
-        batch_length = status[0]["batchStats"]["queueLength"]
-
-        self.__rate_queue.append(rate)
-
-        if self.__vectorizer_batching:
-            # slow vectorizer, we want to send larger batches that can take a bit longer, but fewer of them. We might need to sleep
-            if len(self.__took_queue) > 0 and self._batch_send:
-                max_took = max(self.__took_queue)
-                self.__dynamic_batching_sleep_time = 0
-                if max_took > 2 * BATCH_TIME_TARGET:
-                    self.__concurrent_requests = 1
-                    self.__recommended_num_objects = VECTORIZER_BATCHING_STEP_SIZE
-                elif max_took > BATCH_TIME_TARGET:
-                    current_step = self.__recommended_num_objects // VECTORIZER_BATCHING_STEP_SIZE
-
-                    if self.__concurrent_requests > 1:
-                        self.__concurrent_requests -= 1
-                    elif current_step > 1:
-                        self.__recommended_num_objects = VECTORIZER_BATCHING_STEP_SIZE * (
-                            current_step - 1
-                        )
-                    else:
-                        # cannot scale down, sleep a bit
-                        self.__dynamic_batching_sleep_time = max_took - BATCH_TIME_TARGET
-
-                elif max_took < 3 * BATCH_TIME_TARGET // 4:
-                    if self.__dynamic_batching_sleep_time > 0:
-                        self.__dynamic_batching_sleep_time = 0
-                    elif self.__concurrent_requests < 3:
-                        self.__concurrent_requests += 1
-                    else:
-                        current_step = (
-                            self.__recommended_num_objects // VECTORIZER_BATCHING_STEP_SIZE
-                        )
-                        self.__recommended_num_objects = VECTORIZER_BATCHING_STEP_SIZE * (
-                            current_step + 1
-                        )
-                self._batch_send = False
-        else:
-            if batch_length == 0:  # scale up if queue is empty
-                self.__recommended_num_objects = min(
-                    self.__recommended_num_objects + 50,
-                    self.__max_batch_size,
-                )
-
-                if (
-                    self.__max_batch_size == self.__recommended_num_objects
-                    and len(self.__batch_objects) > self.__recommended_num_objects
-                    and time.time() - self.__time_last_scale_up > 1
-                    and self.__concurrent_requests < MAX_CONCURRENT_REQUESTS
-                ):
-                    self.__concurrent_requests += 1
-                    self.__time_last_scale_up = time.time()
-
-            else:
-                ratio = batch_length / rate
-                if 2.1 > ratio > 1.9:  # ideal, send exactly as many objects as weaviate can process
-                    self.__recommended_num_objects = math.floor(rate_per_worker)
-                elif ratio <= 1.9:  # we can send more
-                    self.__recommended_num_objects = math.floor(
-                        min(
-                            self.__recommended_num_objects * 1.5,
-                            rate_per_worker * 2 / ratio,
-                        )
+    async def __send_batch(self, objs: List[_BatchObject], refs: List[_BatchReference]) -> None:
+        try:
+            if (n_objs := len(objs)) > 0:
+                start = time.time()
+                try:
+                    response_obj = await self.__batch_grpc.objects(
+                        objects=objs,
+                        timeout=DEFAULT_REQUEST_TIMEOUT,
+                        max_request_bytes=self.__sizing.max_request_bytes,
+                        # every object keeps its own error, even if all of them failed
+                        raise_if_all_failed=False,
                     )
+                except Exception as e:
+                    response_obj = _objects_error_response(objs, e, start)
 
-                    if self.__max_batch_size == self.__recommended_num_objects:
-                        self.__concurrent_requests += 1
-
-                elif ratio < 10:  # too high, scale down
-                    self.__recommended_num_objects = math.floor(rate_per_worker * 2 / ratio)
-
-                    if self.__recommended_num_objects < 100 and self.__concurrent_requests > 2:
-                        self.__concurrent_requests -= 1
-
-                else:  # way too high, stop sending new batches
-                    self.__recommended_num_objects = 0
-                    self.__concurrent_requests = 2
-
-    async def __send_batch(
-        self, objs: List[_BatchObject], refs: List[_BatchReference], readd_rate_limit: bool
-    ) -> None:
-        if (n_objs := len(objs)) > 0:
-            start = time.time()
-            try:
-                response_obj = await self.__batch_grpc.objects(
-                    objects=objs, timeout=DEFAULT_REQUEST_TIMEOUT
-                )
-            except Exception as e:
-                errors_obj = {
-                    idx: ErrorObject(message=repr(e), object_=obj) for idx, obj in enumerate(objs)
-                }
-                response_obj = BatchObjectReturn(
-                    _all_responses=list(errors_obj.values()),
-                    elapsed_seconds=time.time() - start,
-                    errors=errors_obj,
-                    has_errors=True,
+                readd_objects, response_obj = _split_retryable(
+                    response_obj, self.__sizing, self.__retry_classifier, self.__retry_budget
                 )
-
-            readded_uuids = set()
-            readded_objects = []
-            highest_retry_count = 0
-            for i, err in response_obj.errors.items():
-                if (
-                    (
-                        "support@cohere.com" in err.message
-                        and (
-                            "rate limit" in err.message
-                            or "500 error: internal server error" in err.message
-                        )
-                    )
-                    or (
-                        "OpenAI" in err.message
-                        and (
-                            "Rate limit reached" in err.message
-                            or "on tokens per min (TPM)" in err.message
-                            or "503 error: Service Unavailable." in err.message
-                            or "500 error: The server had an error while processing your request."
-                            in err.message
-                        )
-                    )
-                    or ("failed with status: 503 error" in err.message)  # huggingface
-                ):
-                    if err.object_.retry_count > highest_retry_count:
-                        highest_retry_count = err.object_.retry_count
-
-                    if err.object_.retry_count > 5:
-                        continue  # too many retries, give up
-                    err.object_.retry_count += 1
-                    readded_objects.append(i)
-
-            if len(readded_objects) > 0:
-                _Warnings.batch_rate_limit_reached(
-                    response_obj.errors[readded_objects[0]].message,
-                    self.__fix_rate_batching_base_time * (highest_retry_count + 1),
-                )
-
-                readd_objects = [
-                    err.object_ for i, err in response_obj.errors.items() if i in readded_objects
-                ]
                 readded_uuids = {obj.uuid for obj in readd_objects}
-
-                self.__batch_objects.prepend(readd_objects)
-
-                new_errors = {
-                    i: err for i, err in response_obj.errors.items() if i not in readded_objects
-                }
-                response_obj = BatchObjectReturn(
-                    uuids={
-                        i: uid for i, uid in response_obj.uuids.items() if i not in readded_objects
-                    },
-                    errors=new_errors,
-                    has_errors=len(new_errors) > 0,
-                    _all_responses=[
-                        err
-                        for i, err in enumerate(response_obj.all_responses)
-                        if i not in readded_objects
-                    ],
-                    elapsed_seconds=response_obj.elapsed_seconds,
+                if len(readd_objects) > 0:
+                    self.__batch_objects.prepend(readd_objects)
+                if self.__journal is not None:
+                    self.__journal.acknowledged(response_obj.uuids.keys())
+                if self.__deduplicator is not None:
+                    self.__deduplicator.done(response_obj.uuids.keys(), response_obj.errors.keys())
+
+                self.__batch_references.release_objects(
+                    obj.uuid for obj in objs if obj.uuid not in readded_uuids
                 )
-                if readd_rate_limit:
-                    # for rate limited batching the timing is handled by the outer loop => no sleep here
-                    self.__time_stamp_last_request = (
-                        time.time() + self.__fix_rate_batching_base_time * (highest_retry_count + 1)
-                    )  # skip a full minute to recover from the rate limit
-                    self.__fix_rate_batching_base_time += (
-                        1  # increase the base time as the current one is too low
+
+                self.__error_logger.objects(len(response_obj.errors), n_objs)
+                if self.__error_sink.streams:
+                    await self.__error_sink.errors(response_obj.errors.values())
+                self.__results_lock.acquire()
+                self.__num_errors += len(response_obj.errors)
+                if self.__error_sink.streams:
+                    self.__results_for_wrapper.results.objs += _without_errors(response_obj)
+                else:
+                    self.__results_for_wrapper.results.objs += response_obj
+                    self.__results_for_wrapper.failed_objects.extend(response_obj.errors.values())
+                self.__results_lock.release()
+                self.__sizing.took_queue.append(time.time() - start)
+
+            if (n_refs := len(refs)) > 0:
+                start = time.time()
+                try:
+                    response_ref = await self.__batch_rest.references(references=refs)
+                except Exception as e:
+                    response_ref = _references_error_response(refs, e, start)
+                self.__error_logger.references(response_ref, n_refs)
+                if self.__error_sink.streams:
+                    await self.__error_sink.errors(response_ref.errors.values())
+                self.__results_lock.acquire()
+                self.__num_errors += len(response_ref.errors)
+                if self.__error_sink.streams:
+                    self.__results_for_wrapper.results.refs += BatchReferenceReturn(
+                        elapsed_seconds=response_ref.elapsed_seconds,
+                        has_errors=response_ref.has_errors,
                     )
                 else:
-                    # sleep a bit to recover from the rate limit in other cases
-                    time.sleep(2**highest_retry_count)
-            self.__uuid_lookup_lock.acquire()
-            self.__uuid_lookup.difference_update(
-                obj.uuid for obj in objs if obj.uuid not in readded_uuids
-            )
-            self.__uuid_lookup_lock.release()
-
-            if (n_obj_errs := len(response_obj.errors)) > 0 and self.__objs_logs_count < 30:
-                logger.error(
-                    {
-                        "message": f"Failed to send {n_obj_errs} objects in a batch of {n_objs}. Please inspect client.batch.failed_objects or collection.batch.failed_objects for the failed objects.",
-                    }
-                )
-                self.__objs_logs_count += 1
-            if self.__objs_logs_count > 30:
-                logger.error(
-                    {
-                        "message": "There have been more than 30 failed object batches. Further errors will not be logged.",
-                    }
-                )
-            self.__results_lock.acquire()
-            self.__results_for_wrapper.results.objs += response_obj
-            self.__results_for_wrapper.failed_objects.extend(response_obj.errors.values())
-            self.__results_lock.release()
-            self.__took_queue.append(time.time() - start)
-
-        if (n_refs := len(refs)) > 0:
-            start = time.time()
-            try:
-                response_ref = await self.__batch_rest.references(references=refs)
-            except Exception as e:
-                errors_ref = {
-                    idx: ErrorReference(message=repr(e), reference=ref)
-                    for idx, ref in enumerate(refs)
-                }
-                response_ref = BatchReferenceReturn(
-                    elapsed_seconds=time.time() - start,
-                    errors=errors_ref,
-                    has_errors=True,
-                )
-            if (n_ref_errs := len(response_ref.errors)) > 0 and self.__refs_logs_count < 30:
-                logger.error(
-                    {
-                        "message": f"Failed to send {n_ref_errs} references in a batch of {n_refs}. Please inspect client.batch.failed_references or collection.batch.failed_references for the failed references.",
-                        "errors": response_ref.errors,
-                    }
-                )
-                self.__refs_logs_count += 1
-            if self.__refs_logs_count > 30:
-                logger.error(
-                    {
-                        "message": "There have been more than 30 failed reference batches. Further errors will not be logged.",
-                    }
-                )
-            self.__results_lock.acquire()
-            self.__results_for_wrapper.results.refs += response_ref
-            self.__results_for_wrapper.failed_references.extend(response_ref.errors.values())
-            self.__results_lock.release()
-
-        self.__active_requests_lock.acquire()
-        self.__active_requests -= 1
-        self.__active_requests_lock.release()
+                    self.__results_for_wrapper.results.refs += response_ref
+                    self.__results_for_wrapper.failed_references.extend(
+                        response_ref.errors.values()
+                    )
+                self.__results_lock.release()
+        finally:
+            # the slot is given back even if reporting the results fails, flush and exit would wait for it forever
+            with self.__state_changed:
+                self.__active_requests -= 1
+                self.__state_changed.notify_all()
 
     def flush(self) -> None:
         """Flush the batch queue and wait for all requests to be finished."""
         # bg thread is sending objs+refs automatically, so simply wait for everything to be done
-        while (
-            self.__active_requests > 0
-            or len(self.__batch_objects) > 0
-            or len(self.__batch_references) > 0
-        ):
-            time.sleep(0.01)
-            self.__check_bg_thread_alive()
+        with self.__state_changed:
+            self.__flushing += 1
+            self.__state_changed.notify_all()
+            try:
+                self.__wait_until(
+                    lambda: self.__active_requests == 0
+                    and len(self.__batch_objects) == 0
+                    and len(self.__batch_references) == 0
+                )
+            finally:
+                self.__flushing -= 1
 
     def _add_object(
         self,
@@ -625,38 +1099,73 @@ class _BatchBase:
         tenant: Optional[str] = None,
     ) -> UUID:
         self.__check_bg_thread_alive()
-        try:
-            batch_object = BatchObject(
-                collection=collection,
-                properties=properties,
-                references=references,
-                uuid=uuid,
-                vector=vector,
-                tenant=tenant,
-                index=self.__objs_count,
-            )
-            self.__objs_count += 1
-            self.__results_for_wrapper.imported_shards.add(
-                Shard(collection=collection, tenant=tenant)
-            )
-        except ValidationError as e:
-            raise WeaviateBatchValidationError(repr(e))
-        self.__uuid_lookup_lock.acquire()
-        self.__uuid_lookup.add(str(batch_object.uuid))
-        self.__uuid_lookup_lock.release()
-        self.__batch_objects.add(batch_object._to_internal())
+        batch_object = _create_batch_object(
+            collection, properties, references, uuid, vector, tenant, self.__objs_count
+        )
+        self.__objs_count += 1
+        self.__results_for_wrapper.imported_shards.add(Shard(collection=collection, tenant=tenant))
+        internal_object = batch_object._to_internal()
+        if not self.__is_skipped(internal_object):
+            self.__enqueue_object(internal_object)
+
+        assert batch_object.uuid is not None
+        return batch_object.uuid
+
+    def _add_objects_from_arrays(
+        self,
+        collection: str,
+        properties: Optional[Iterable[Optional[WeaviateProperties]]] = None,
+        vectors: Optional[VECTOR_MATRICES] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+        tenant: Optional[str] = None,
+    ) -> List[UUID]:
+        self.__check_bg_thread_alive()
+        object_uuids: List[UUID] = []
+        for objs, chunk_uuids in _iter_batch_objects_from_arrays(
+            collection, properties, vectors, uuids, tenant, self.__objs_count
+        ):
+            self.__objs_count += len(objs)
+            if self.__journal is not None or self.__deduplicator is not None:
+                objs = [obj for obj in objs if not self.__is_skipped(obj)]
+            if len(objs) > 0:
+                self.__enqueue_objects(objs)
+            object_uuids.extend(chunk_uuids)
+        self.__results_for_wrapper.imported_shards.add(Shard(collection=collection, tenant=tenant))
+        return object_uuids
+
+    def __is_skipped(self, obj: _BatchObject) -> bool:
+        if self.__journal is not None and self.__journal.is_acknowledged(obj.index):
+            return True
+        if self.__deduplicator is not None and self.__deduplicator.is_duplicate(obj):
+            # a resumed import does not need to send the duplicate either
+            if self.__journal is not None:
+                self.__journal.acknowledged((obj.index,))
+            return True
+        return False
+
+    def __enqueue_object(self, batch_object: _BatchObject) -> None:
+        if self.__journal is not None:
+            self.__journal.enqueued([batch_object])
+        self.__batch_references.add_pending_objects((batch_object.uuid,))
+        queue_length = self.__batch_objects.add(batch_object)
+        # wake the sender for the first queued object and once a full batch is ready
+        if queue_length == 1 or queue_length == self.__sizing.num_objects:
+            self.__notify()
 
         # block if queue gets too long or weaviate is overloaded - reading files is faster them sending them so we do
         # not need a long queue
-        while (
-            self.__recommended_num_objects == 0
-            or len(self.__batch_objects) >= self.__recommended_num_objects * 2
-        ):
-            self.__check_bg_thread_alive()
-            time.sleep(0.01)
+        self.__wait_until(self.__has_capacity)
 
-        assert batch_object.uuid is not None
-        return batch_object.uuid
+    def __enqueue_objects(self, batch_objects: List[_BatchObject]) -> None:
+        if self.__journal is not None:
+            self.__journal.enqueued(batch_objects)
+        self.__batch_references.add_pending_objects(obj.uuid for obj in batch_objects)
+        queue_length = self.__batch_objects.extend(batch_objects)
+        previous_length = queue_length - len(batch_objects)
+        if previous_length == 0 or previous_length < self.__sizing.num_objects <= queue_length:
+            self.__notify()
+
+        self.__wait_until(self.__has_capacity)
 
     def _add_reference(
         self,
@@ -667,36 +1176,34 @@ class _BatchBase:
         tenant: Optional[str] = None,
     ) -> None:
         self.__check_bg_thread_alive()
-        if isinstance(to, ReferenceToMulti):
-            to_strs: Union[List[str], List[UUID]] = to.uuids_str
-        elif isinstance(to, str) or isinstance(to, uuid_package.UUID):
-            to_strs = [to]
-        else:
-            to_strs = list(to)
+        for batch_reference in _create_batch_references(
+            from_object_uuid, from_object_collection, from_property_name, to, tenant
+        ):
+            self.__batch_references.add(batch_reference)
+        self.__notify()
 
-        for uid in to_strs:
-            try:
-                batch_reference = BatchReference(
-                    from_object_collection=from_object_collection,
-                    from_object_uuid=from_object_uuid,
-                    from_property_name=from_property_name,
-                    to_object_collection=(
-                        to.target_collection if isinstance(to, ReferenceToMulti) else None
-                    ),
-                    to_object_uuid=uid,
-                    tenant=tenant,
-                )
-            except ValidationError as e:
-                raise WeaviateBatchValidationError(repr(e))
-            self.__batch_references.add(batch_reference._to_internal())
+        # block if weaviate is overloaded, also do not send any refs
+        self.__wait_until(lambda: self.__sizing.num_objects > 0)
 
-        # block if queue gets too long or weaviate is overloaded
-        while self.__recommended_num_objects == 0:
-            time.sleep(0.01)  # block if weaviate is overloaded, also do not send any refs
+    def __has_capacity(self) -> bool:
+        return (
+            self.__sizing.num_objects > 0
+            and len(self.__batch_objects) < self.__sizing.num_objects * 2
+        )
+
+    def __wait_until(self, predicate: Callable[[], bool]) -> None:
+        if predicate():
             self.__check_bg_thread_alive()
+            return
+        with self.__state_changed:
+            while not predicate():
+                self.__check_bg_thread_alive()
+                # the timeout only guards against a background thread that died without notifying
+                self.__state_changed.wait(timeout=1)
+        self.__check_bg_thread_alive()
 
     def __check_bg_thread_alive(self) -> None:
-        if self.__bg_thread.is_alive():
+        if self.__bg_thread_exception is None and self.__bg_thread.is_alive():
             return
 
         raise self.__bg_thread_exception or Exception("Batch thread died unexpectedly")
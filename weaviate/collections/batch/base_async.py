@@ -0,0 +1,394 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Coroutine, Dict, Iterable, List, Optional, Sequence, Set
+
+from weaviate.cluster.types import BatchStats
+from weaviate.collections.batch.base import (
+    DEFAULT_REQUEST_TIMEOUT,
+    ObjectsBatchRequest,
+    ReferencesBatchRequest,
+    _BatchDataWrapper,
+    _BatchErrorLogger,
+    _BatchMode,
+    _BatchSizing,
+    _ClusterBatch,
+    _DynamicBatching,
+    _create_batch_object,
+    _create_batch_references,
+    _iter_batch_objects_from_arrays,
+    _objects_error_response,
+    _references_error_response,
+    _split_retryable,
+    _without_errors,
+)
+from weaviate.collections.batch.dedup import _BatchDeduplicator
+from weaviate.collections.batch.encoders import _PropertyEncoder
+from weaviate.collections.batch.error_sink import _BatchErrorSink
+from weaviate.collections.batch.journal import _BatchJournal
+from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
+from weaviate.collections.batch.rest import _BatchREST
+from weaviate.collections.batch.retry import _RetryBudget, _RetryClassifier
+from weaviate.collections.classes.batch import (
+    BatchReferenceReturn,
+    Shard,
+    _BatchObject,
+    _BatchReference,
+)
+from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.internal import ReferenceInput, ReferenceInputs
+from weaviate.collections.classes.types import WeaviateProperties
+from weaviate.connect import ConnectionV4
+from weaviate.types import UUID, VECTOR_MATRICES, VECTORS
+from weaviate.warnings import _Warnings
+
+
+class _BatchBaseAsync:
+    """The asyncio-native counterpart of `_BatchBase`.
+
+    Instead of background threads, the batch is driven by two tasks running on the event loop of the caller:
+    one that sends batches whenever a request slot is free and one that refreshes the dynamic batch size.
+    Producers are suspended, instead of blocked, while the queue is full.
+    """
+
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        consistency_level: Optional[ConsistencyLevel],
+        results: _BatchDataWrapper,
+        batch_mode: _BatchMode,
+        vectorizer_batching: bool,
+        objects_: Optional[ObjectsBatchRequest] = None,
+        references: Optional[ReferencesBatchRequest] = None,
+        error_sink: Optional[_BatchErrorSink] = None,
+        journal: Optional[_BatchJournal] = None,
+        deduplicator: Optional[_BatchDeduplicator] = None,
+        retry_classifier: Optional[_RetryClassifier] = None,
+        retry_budget: Optional[_RetryBudget] = None,
+        serialization_executor: Optional[Executor] = None,
+        property_encoders: Optional[Dict[str, _PropertyEncoder]] = None,
+    ) -> None:
+        self.__batch_objects = objects_ or ObjectsBatchRequest()
+        self.__batch_references = references or ReferencesBatchRequest()
+
+        self.__batch_grpc = _BatchGRPC(
+            connection, consistency_level, serialization_executor, property_encoders
+        )
+        self.__batch_rest = _BatchREST(connection, consistency_level)
+        self.__cluster = _ClusterBatch(connection)
+
+        self.__results_for_wrapper_backup = results
+        self.__results_for_wrapper = _BatchDataWrapper()
+        self.__error_sink = error_sink or _BatchErrorSink()
+        self.__journal = journal
+        self.__deduplicator = deduplicator
+        self.__num_errors = 0
+
+        self.__sizing = _BatchSizing(batch_mode, vectorizer_batching)
+        # the indices of a resumed import continue where the acknowledged prefix of its journal ends
+        self.__objs_count = journal.state.resume_offset if journal is not None else 0
+        self.__error_logger = _BatchErrorLogger()
+        self.__retry_classifier = retry_classifier or _RetryClassifier()
+        self.__retry_budget = retry_budget or _RetryBudget()
+
+        self.__active_requests = 0
+        self.__requests: Set[asyncio.Task] = set()
+
+        # set whenever the queues, the number of active requests or the batch sizing changes
+        self.__state_changed = asyncio.Event()
+        self.__shutdown = False
+        self.__bg_tasks: List[asyncio.Task] = []
+        self.__bg_task_exception: Optional[BaseException] = None
+
+    @property
+    def number_errors(self) -> int:
+        """Return the number of errors in the batch."""
+        return self.__num_errors
+
+    @property
+    def number_duplicates(self) -> int:
+        """Return the number of objects that were skipped because they were added before."""
+        return self.__deduplicator.num_duplicates if self.__deduplicator is not None else 0
+
+    @property
+    def node_batch_stats(self) -> Dict[str, BatchStats]:
+        """Return the latest batch statistics of every node, by node name.
+
+        Dynamic batching refreshes them about once per second and sizes the batches for the sum over all nodes. The
+        statistics are empty for the other batching modes.
+        """
+        return dict(self.__sizing.node_stats)
+
+    def _start(self) -> None:
+        """Start the background tasks on the running event loop."""
+        self.__bg_tasks.append(asyncio.create_task(self.__run_bg_task(self.__batch_send)))
+        if isinstance(self.__sizing.mode, _DynamicBatching):
+            self.__bg_tasks.append(
+                asyncio.create_task(self.__run_bg_task(self.__dynamic_batch_rate_loop))
+            )
+
+    async def _shutdown(self) -> None:
+        """Shutdown the current batch and wait for all requests to be finished."""
+        try:
+            await self.flush()
+        finally:
+            self.__shutdown = True
+            self.__state_changed.set()
+            for task in self.__bg_tasks:
+                task.cancel()
+            await asyncio.gather(*self.__bg_tasks, *self.__requests, return_exceptions=True)
+            self.__error_sink.close()
+            if self.__journal is not None:
+                self.__journal.close()
+            if self.__deduplicator is not None:
+                self.__deduplicator.close()
+
+        # copy the results to the public results
+        self.__results_for_wrapper_backup.results = self.__results_for_wrapper.results
+        self.__results_for_wrapper_backup.failed_objects = self.__results_for_wrapper.failed_objects
+        self.__results_for_wrapper_backup.failed_references = (
+            self.__results_for_wrapper.failed_references
+        )
+        self.__results_for_wrapper_backup.imported_shards = (
+            self.__results_for_wrapper.imported_shards
+        )
+
+    async def __run_bg_task(self, f: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        try:
+            await f()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.__bg_task_exception = e
+            self.__state_changed.set()
+
+    async def __wait_until(self, predicate: Callable[[], bool]) -> None:
+        while not predicate():
+            self.__check_bg_tasks_alive()
+            self.__state_changed.clear()
+            await self.__state_changed.wait()
+        self.__check_bg_tasks_alive()
+
+    def __check_bg_tasks_alive(self) -> None:
+        if self.__bg_task_exception is not None:
+            raise self.__bg_task_exception
+
+    def __can_send(self) -> bool:
+        return self.__shutdown or (
+            self.__active_requests < self.__sizing.concurrent_requests
+            and len(self.__batch_objects) + len(self.__batch_references) > 0
+        )
+
+    async def __batch_send(self) -> None:
+        while not self.__shutdown:
+            await self.__wait_until(self.__can_send)
+            if self.__shutdown:
+                return
+
+            if (wait := self.__sizing.time_until_next_request()) > 0:
+                await asyncio.sleep(wait)
+                continue
+
+            objs, objs_bytes = self.__batch_objects.pop_items_by_size(
+                self.__sizing.num_objects, self.__sizing.max_request_bytes
+            )
+            refs = self.__batch_references.pop_items(self.__sizing.num_refs)
+            if len(objs) == 0 and len(refs) == 0:
+                # weaviate is overloaded or all queued references wait for objects that are still in flight
+                self.__state_changed.clear()
+                await self.__state_changed.wait()
+                continue
+
+            self.__sizing.time_stamp_last_request = time.time()
+            self.__sizing.batch_sent = True
+            self.__sizing.record_request(len(objs), objs_bytes)
+            self.__sizing.record_vectorizer_load(objs)
+            self.__active_requests += 1
+            self.__state_changed.set()
+            task = asyncio.create_task(self.__send_batch(objs, refs))
+            self.__requests.add(task)
+            task.add_done_callback(self.__requests.discard)
+
+    async def __dynamic_batch_rate_loop(self) -> None:
+        refresh_time = 1
+        while not self.__shutdown:
+            if not isinstance(self.__sizing.mode, _DynamicBatching):
+                return
+            try:
+                status = await self.__cluster.get_nodes_status()
+                self.__sizing.update(status, len(self.__batch_objects))
+                self.__state_changed.set()
+            except Exception as e:
+                _Warnings.batch_refresh_failed(repr(e))
+            await asyncio.sleep(refresh_time)
+
+    async def __send_batch(self, objs: List[_BatchObject], refs: List[_BatchReference]) -> None:
+        try:
+            if (n_objs := len(objs)) > 0:
+                start = time.time()
+                try:
+                    response_obj = await self.__batch_grpc.objects(
+                        objects=objs,
+                        timeout=DEFAULT_REQUEST_TIMEOUT,
+                        max_request_bytes=self.__sizing.max_request_bytes,
+                        # every object keeps its own error, even if all of them failed
+                        raise_if_all_failed=False,
+                    )
+                except Exception as e:
+                    response_obj = _objects_error_response(objs, e, start)
+
+                readd_objects, response_obj = _split_retryable(
+                    response_obj, self.__sizing, self.__retry_classifier, self.__retry_budget
+                )
+                readded_uuids = {obj.uuid for obj in readd_objects}
+                if len(readd_objects) > 0:
+                    self.__batch_objects.prepend(readd_objects)
+                if self.__journal is not None:
+                    self.__journal.acknowledged(response_obj.uuids.keys())
+                if self.__deduplicator is not None:
+                    self.__deduplicator.done(response_obj.uuids.keys(), response_obj.errors.keys())
+
+                self.__batch_references.release_objects(
+                    obj.uuid for obj in objs if obj.uuid not in readded_uuids
+                )
+
+                self.__error_logger.objects(len(response_obj.errors), n_objs)
+                self.__num_errors += len(response_obj.errors)
+                if self.__error_sink.streams:
+                    await self.__error_sink.errors(response_obj.errors.values())
+                    self.__results_for_wrapper.results.objs += _without_errors(response_obj)
+                else:
+                    self.__results_for_wrapper.results.objs += response_obj
+                    self.__results_for_wrapper.failed_objects.extend(response_obj.errors.values())
+                self.__sizing.took_queue.append(time.time() - start)
+
+            if (n_refs := len(refs)) > 0:
+                start = time.time()
+                try:
+                    response_ref = await self.__batch_rest.references(references=refs)
+                except Exception as e:
+                    response_ref = _references_error_response(refs, e, start)
+                self.__error_logger.references(response_ref, n_refs)
+                self.__num_errors += len(response_ref.errors)
+                if self.__error_sink.streams:
+                    await self.__error_sink.errors(response_ref.errors.values())
+                    self.__results_for_wrapper.results.refs += BatchReferenceReturn(
+                        elapsed_seconds=response_ref.elapsed_seconds,
+                        has_errors=response_ref.has_errors,
+                    )
+                else:
+                    self.__results_for_wrapper.results.refs += response_ref
+                    self.__results_for_wrapper.failed_references.extend(
+                        response_ref.errors.values()
+                    )
+        finally:
+            self.__active_requests -= 1
+            self.__state_changed.set()
+
+    def __is_flushed(self) -> bool:
+        return (
+            self.__active_requests == 0
+            and len(self.__batch_objects) == 0
+            and len(self.__batch_references) == 0
+        )
+
+    async def flush(self) -> None:
+        """Flush the batch queue and wait for all requests to be finished."""
+        await self.__wait_until(self.__is_flushed)
+
+    def __has_capacity(self) -> bool:
+        return (
+            self.__sizing.num_objects > 0
+            and len(self.__batch_objects) < self.__sizing.num_objects * 2
+        )
+
+    async def _add_object(
+        self,
+        collection: str,
+        properties: Optional[WeaviateProperties] = None,
+        references: Optional[ReferenceInputs] = None,
+        uuid: Optional[UUID] = None,
+        vector: Optional[VECTORS] = None,
+        tenant: Optional[str] = None,
+    ) -> UUID:
+        self.__check_bg_tasks_alive()
+        batch_object = _create_batch_object(
+            collection, properties, references, uuid, vector, tenant, self.__objs_count
+        )
+        self.__objs_count += 1
+        self.__results_for_wrapper.imported_shards.add(Shard(collection=collection, tenant=tenant))
+        internal_object = batch_object._to_internal()
+        if not self.__is_skipped(internal_object):
+            await self.__enqueue_object(internal_object)
+
+        assert batch_object.uuid is not None
+        return batch_object.uuid
+
+    async def _add_objects_from_arrays(
+        self,
+        collection: str,
+        properties: Optional[Iterable[Optional[WeaviateProperties]]] = None,
+        vectors: Optional[VECTOR_MATRICES] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+        tenant: Optional[str] = None,
+    ) -> List[UUID]:
+        self.__check_bg_tasks_alive()
+        object_uuids: List[UUID] = []
+        for objs, chunk_uuids in _iter_batch_objects_from_arrays(
+            collection, properties, vectors, uuids, tenant, self.__objs_count
+        ):
+            self.__objs_count += len(objs)
+            if self.__journal is not None or self.__deduplicator is not None:
+                objs = [obj for obj in objs if not self.__is_skipped(obj)]
+            if len(objs) > 0:
+                await self.__enqueue_objects(objs)
+            object_uuids.extend(chunk_uuids)
+        self.__results_for_wrapper.imported_shards.add(Shard(collection=collection, tenant=tenant))
+        return object_uuids
+
+    def __is_skipped(self, obj: _BatchObject) -> bool:
+        if self.__journal is not None and self.__journal.is_acknowledged(obj.index):
+            return True
+        if self.__deduplicator is not None and self.__deduplicator.is_duplicate(obj):
+            # a resumed import does not need to send the duplicate either
+            if self.__journal is not None:
+                self.__journal.acknowledged((obj.index,))
+            return True
+        return False
+
+    async def __enqueue_object(self, batch_object: _BatchObject) -> None:
+        if self.__journal is not None:
+            self.__journal.enqueued([batch_object])
+        self.__batch_references.add_pending_objects((batch_object.uuid,))
+        self.__batch_objects.add(batch_object)
+        self.__state_changed.set()
+
+        # suspend the producer if the queue gets too long or weaviate is overloaded
+        await self.__wait_until(self.__has_capacity)
+
+    async def __enqueue_objects(self, batch_objects: List[_BatchObject]) -> None:
+        if self.__journal is not None:
+            self.__journal.enqueued(batch_objects)
+        self.__batch_references.add_pending_objects(obj.uuid for obj in batch_objects)
+        self.__batch_objects.extend(batch_objects)
+        self.__state_changed.set()
+
+        await self.__wait_until(self.__has_capacity)
+
+    async def _add_reference(
+        self,
+        from_object_uuid: UUID,
+        from_object_collection: str,
+        from_property_name: str,
+        to: ReferenceInput,
+        tenant: Optional[str] = None,
+    ) -> None:
+        self.__check_bg_tasks_alive()
+        for batch_reference in _create_batch_references(
+            from_object_uuid, from_object_collection, from_property_name, to, tenant
+        ):
+            self.__batch_references.add(batch_reference)
+        self.__state_changed.set()
+
+        # suspend if weaviate is overloaded, also do not send any refs
+        await self.__wait_until(lambda: self.__sizing.num_objects > 0)
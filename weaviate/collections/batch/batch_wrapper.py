@@ -1,6 +1,21 @@
 import asyncio
+import dataclasses
 import time
-from typing import Generic, List, Optional, Any, TypeVar, cast
+from collections import defaultdict
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 from weaviate.collections.batch.base import (
     _BatchBase,
@@ -8,15 +23,58 @@ from weaviate.collections.batch.base import (
     _DynamicBatching,
     _BatchMode,
 )
-from weaviate.collections.classes.batch import BatchResult, ErrorObject, ErrorReference, Shard
+from weaviate.collections.batch.base_async import _BatchBaseAsync
+from weaviate.collections.batch.encoders import _PropertyEncoder
+from weaviate.collections.batch.error_sink import BatchErrorCallback
+from weaviate.collections.classes.batch import (
+    BatchResult,
+    Deduplication,
+    ErrorObject,
+    ErrorReference,
+    RetryBudget,
+    RetryClass,
+    Shard,
+    VectorIndexingProgress,
+    VectorizerRateLimit,
+)
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.connect import ConnectionV4
 from weaviate.event_loop import _EventLoopSingleton
 from weaviate.logger import logger
-from weaviate.util import _capitalize_first_letter, _decode_json_response_list
+from weaviate.util import (
+    _capitalize_first_letter,
+    _decode_json_response_dict,
+    _decode_json_response_list,
+)
+
+
+# bounds of the interval between two status polls of `wait_for_vector_indexing`
+VECTOR_INDEXING_MIN_POLL_INTERVAL = 0.25
+VECTOR_INDEXING_MAX_POLL_INTERVAL = 5.0
+# shards that the nodes endpoint does not report are read one request each, this many at a time
+MAX_CONCURRENT_SHARD_REQUESTS = 8
+
+
+def _next_poll_interval(
+    interval: float, previous: Optional[Tuple[float, int]], now: float, queue_size: int
+) -> float:
+    """Return when to poll the vector queues again, given the time and size of the previous and the current poll.
+
+    While the queues drain, this is half the time they need to drain at the current rate, so the end of the indexing is
+    not overslept by more than that. While they do not drain, the interval is doubled.
+    """
+    if previous is None:
+        return VECTOR_INDEXING_MIN_POLL_INTERVAL
+    previous_time, previous_size = previous
+    if queue_size < previous_size and now > previous_time:
+        rate = (previous_size - queue_size) / (now - previous_time)
+        interval = queue_size / rate / 2
+    else:
+        interval *= 2
+    return min(max(interval, VECTOR_INDEXING_MIN_POLL_INTERVAL), VECTOR_INDEXING_MAX_POLL_INTERVAL)
 
 
-class _BatchWrapper:
+class _BatchWrapperBase:
     def __init__(
         self,
         connection: ConnectionV4,
@@ -24,80 +82,155 @@ class _BatchWrapper:
     ):
         self._connection = connection
         self._consistency_level = consistency_level
-        self._current_batch: Optional[_BatchBase] = None
         # config options
         self._batch_mode: _BatchMode = _DynamicBatching()
+        self._on_error: Optional[BatchErrorCallback] = None
+        self._failed_objects_path: Optional[str] = None
+        self._journal_path: Optional[str] = None
+        self._deduplicate: Optional[Deduplication] = None
+        self._retry_classes: Optional[Sequence[RetryClass]] = None
+        self._retry_budget: Optional[RetryBudget] = None
+        self._serialization_executor: Optional[Executor] = None
+        # limits of the model providers of the vectorizers that are used, if they are known
+        self._inferred_rate_limit: Optional[VectorizerRateLimit] = None
+        # encoders compiled from the schemas or data models of the collections, by collection name
+        self._property_encoders: Dict[str, _PropertyEncoder] = {}
 
         self._batch_data = _BatchDataWrapper()
 
-        self._event_loop = _EventLoopSingleton.get_instance()
+    def _batch_mode_with_rate_limit(self) -> _BatchMode:
+        """Return the batch mode, with the inferred provider limits if dynamic batching was not given any."""
+        if (
+            isinstance(self._batch_mode, _DynamicBatching)
+            and self._batch_mode.vectorizer_rate_limit is None
+            and self._inferred_rate_limit is not None
+        ):
+            return dataclasses.replace(
+                self._batch_mode, vectorizer_rate_limit=self._inferred_rate_limit
+            )
+        return self._batch_mode
 
-    def wait_for_vector_indexing(
-        self, shards: Optional[List[Shard]] = None, how_many_failures: int = 5
-    ) -> None:
-        """Wait for the all the vectors of the batch imported objects to be indexed.
+    async def _get_shards_status_async(self, shard: Shard) -> List[Dict[str, Any]]:
+        path = f"/schema/{_capitalize_first_letter(shard.collection)}/shards{'' if shard.tenant is None else f'?tenant={shard.tenant}'}"
+        response = await self._connection.get(path=path)
 
-        Upon network error, it will retry to get the shards' status for `how_many_failures` times
-        with exponential backoff (2**n seconds with n=0,1,2,...,how_many_failures).
+        res = _decode_json_response_list(response, "Get shards' status")
+        assert res is not None
+        return res
 
-        Arguments:
-            `shards`
-                The shards to check the status of. If `None` it will
-                check the status of all the shards of the imported objects in the batch.
-            `how_many_failures`
-                How many times to try to get the shards' status before
-                raising an exception. Default 5.
+    async def _get_shards_readiness_async(self, shard: Shard) -> List[bool]:
+        return [
+            (cast(str, shard.get("status")) == "READY")
+            & (cast(int, shard.get("vectorQueueSize")) == 0)
+            for shard in await self._get_shards_status_async(shard)
+        ]
+
+    async def _get_vector_indexing_status_async(self, shards: List[Shard]) -> Tuple[int, int]:
+        """Return the number of queued vectors and of shards that are not indexed yet.
+
+        All shards are read from a single verbose `/nodes` call. Only shards that it does not report, e.g. with Weaviate
+        versions that do not include the indexing status, are read from the shards endpoint of their collection.
         """
-        if shards is not None and not isinstance(shards, list):
-            raise TypeError(f"'shards' must be of type List[Shard]. Given type: {type(shards)}.")
-        if shards is not None and not isinstance(shards[0], Shard):
-            raise TypeError(f"'shards' must be of type List[Shard]. Given type: {type(shards)}.")
+        collections = {_capitalize_first_letter(shard.collection) for shard in shards}
+        path = f"/nodes/{next(iter(collections))}" if len(collections) == 1 else "/nodes"
+        response = await self._connection.get(path=path + "?output=verbose")
+        res = _decode_json_response_dict(response, "Get nodes status")
+        assert res is not None
 
-        async def is_ready(how_many: int) -> bool:
-            try:
-                readinesses = await asyncio.gather(
-                    *[
-                        self.__get_shards_readiness(shard)
-                        for shard in shards or self._batch_data.imported_shards
-                    ]
+        # the replicas of a shard are reported by every node that holds one
+        reported: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for node in res.get("nodes") or []:
+            for node_shard in node.get("shards") or []:
+                reported[node_shard["class"]].append(node_shard)
+
+        queue_size = 0
+        not_ready = 0
+        unreported: List[Shard] = []
+        for shard in shards:
+            matches = [
+                node_shard
+                for node_shard in reported[_capitalize_first_letter(shard.collection)]
+                if shard.tenant is None or node_shard["name"] == shard.tenant
+            ]
+            if len(matches) == 0 or any("vectorIndexingStatus" not in m for m in matches):
+                unreported.append(shard)
+                continue
+            for node_shard in matches:
+                queue_size += node_shard.get("vectorQueueLength", 0)
+                not_ready += (
+                    node_shard["vectorIndexingStatus"] != "READY"
+                    or node_shard.get("vectorQueueLength", 0) > 0
                 )
-                return all(all(readiness) for readiness in readinesses)
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SHARD_REQUESTS)
+
+        async def get_status(shard: Shard) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._get_shards_status_async(shard)
+
+        for statuses in await asyncio.gather(*[get_status(shard) for shard in unreported]):
+            for status in statuses:
+                queue_size += status.get("vectorQueueSize", 0)
+                not_ready += status.get("status") != "READY" or status.get("vectorQueueSize", 0) > 0
+        return queue_size, not_ready
+
+    async def _wait_for_vector_indexing_async(
+        self,
+        shards: Optional[List[Shard]],
+        how_many_failures: int,
+        on_progress: Optional[Callable[[VectorIndexingProgress], None]],
+    ) -> None:
+        self._validate_shards(shards)
+        awaited = list(set(shards or self._batch_data.imported_shards))
+        if len(awaited) == 0:
+            return
+
+        start = time.perf_counter()
+        interval = VECTOR_INDEXING_MIN_POLL_INTERVAL
+        previous: Optional[Tuple[float, int]] = None
+        failures = 0
+        while True:
+            try:
+                queue_size, not_ready = await self._get_vector_indexing_status_async(awaited)
             except Exception as e:
                 logger.warning(
-                    f"Error while getting class shards statuses: {e}, trying again with 2**n={2**how_many}s exponential backoff with n={how_many}"
+                    f"Error while getting class shards statuses: {e}, trying again with 2**n={2**failures}s exponential backoff with n={failures}"
                 )
-                if how_many_failures == how_many:
+                if how_many_failures == failures:
                     raise e
-                time.sleep(2**how_many)
-                return await is_ready(how_many + 1)
-
-        count = 0
-        while not self._event_loop.run_until_complete(is_ready, count):
-            if count % 20 == 0:  # print every 5s
-                logger.debug("Waiting for async indexing to finish...")
-            time.sleep(0.25)
-            count += 1
-        logger.debug("Async indexing finished!")
-
-    async def __get_shards_readiness(self, shard: Shard) -> List[bool]:
-        path = f"/schema/{_capitalize_first_letter(shard.collection)}/shards{'' if shard.tenant is None else f'?tenant={shard.tenant}'}"
-        response = await self._connection.get(path=path)
+                await asyncio.sleep(2**failures)
+                failures += 1
+                continue
+            failures = 0
 
-        res = _decode_json_response_list(response, "Get shards' status")
-        assert res is not None
-        return [
-            (cast(str, shard.get("status")) == "READY")
-            & (cast(int, shard.get("vectorQueueSize")) == 0)
-            for shard in res
-        ]
+            now = time.perf_counter()
+            if on_progress is not None:
+                on_progress(VectorIndexingProgress(queue_size, not_ready, now - start))
+            if not_ready == 0:
+                break
+            interval = _next_poll_interval(interval, previous, now, queue_size)
+            previous = (now, queue_size)
+            logger.debug(
+                f"Waiting for async indexing to finish, {queue_size} vectors are queued in {not_ready} shards..."
+            )
+            await asyncio.sleep(interval)
+        logger.debug("Async indexing finished!")
 
-    def _get_shards_readiness(self, shard: Shard) -> List[bool]:
-        return self._event_loop.run_until_complete(self.__get_shards_readiness, shard)
+    @staticmethod
+    def _validate_shards(shards: Optional[List[Shard]]) -> None:
+        if shards is not None and not isinstance(shards, list):
+            raise TypeError(f"'shards' must be of type List[Shard]. Given type: {type(shards)}.")
+        if shards is not None and not isinstance(shards[0], Shard):
+            raise TypeError(f"'shards' must be of type List[Shard]. Given type: {type(shards)}.")
 
     @property
     def failed_objects(self) -> List[ErrorObject]:
         """Get all failed objects from the batch manager.
 
+        Unlike the UUIDs of the results, the failed objects are not limited to the last `MAX_STORED_RESULTS`: without
+        an `on_error` callback or a `failed_objects_path`, this list grows with every failure. With either of them, the
+        failures are streamed there instead and the list stays empty.
+
         Returns:
             `List[ErrorObject]`
                 A list of all the failed objects from the batch.
@@ -108,6 +241,9 @@ class _BatchWrapper:
     def failed_references(self) -> List[ErrorReference]:
         """Get all failed references from the batch manager.
 
+        Like `failed_objects`, this list grows with every failure unless an `on_error` callback or a
+        `failed_objects_path` is given.
+
         Returns:
             `List[ErrorReference]`
                 A list of all the failed references from the batch.
@@ -125,6 +261,79 @@ class _BatchWrapper:
         return self._batch_data.results
 
 
+class _BatchWrapper(_BatchWrapperBase):
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        consistency_level: Optional[ConsistencyLevel],
+    ):
+        super().__init__(connection, consistency_level)
+        self._current_batch: Optional[_BatchBase] = None
+
+        self._event_loop = _EventLoopSingleton.get_instance()
+
+    def wait_for_vector_indexing(
+        self,
+        shards: Optional[List[Shard]] = None,
+        how_many_failures: int = 5,
+        on_progress: Optional[Callable[[VectorIndexingProgress], None]] = None,
+    ) -> None:
+        """Wait for the all the vectors of the batch imported objects to be indexed.
+
+        The status of all shards is read with a single call to the nodes endpoint. It is polled more often while the
+        vector queues drain and less often, up to every few seconds, while they do not.
+
+        Upon network error, it will retry to get the shards' status for `how_many_failures` times
+        with exponential backoff (2**n seconds with n=0,1,2,...,how_many_failures).
+
+        Arguments:
+            `shards`
+                The shards to check the status of. If `None` it will
+                check the status of all the shards of the imported objects in the batch.
+            `how_many_failures`
+                How many times to try to get the shards' status before
+                raising an exception. Default 5.
+            `on_progress`
+                A function that is called with a `VectorIndexingProgress` after every status poll, e.g. to report the
+                number of vectors that are still queued. It is called from the thread of the client's event loop.
+        """
+        self._event_loop.run_until_complete(
+            self._wait_for_vector_indexing_async, shards, how_many_failures, on_progress
+        )
+
+    def _get_shards_readiness(self, shard: Shard) -> List[bool]:
+        return self._event_loop.run_until_complete(self._get_shards_readiness_async, shard)
+
+
+class _BatchWrapperAsync(_BatchWrapperBase):
+    async def wait_for_vector_indexing(
+        self,
+        shards: Optional[List[Shard]] = None,
+        how_many_failures: int = 5,
+        on_progress: Optional[Callable[[VectorIndexingProgress], None]] = None,
+    ) -> None:
+        """Wait for the all the vectors of the batch imported objects to be indexed.
+
+        The status of all shards is read with a single call to the nodes endpoint. It is polled more often while the
+        vector queues drain and less often, up to every few seconds, while they do not.
+
+        Upon network error, it will retry to get the shards' status for `how_many_failures` times
+        with exponential backoff (2**n seconds with n=0,1,2,...,how_many_failures).
+
+        Arguments:
+            `shards`
+                The shards to check the status of. If `None` it will
+                check the status of all the shards of the imported objects in the batch.
+            `how_many_failures`
+                How many times to try to get the shards' status before
+                raising an exception. Default 5.
+            `on_progress`
+                A function that is called with a `VectorIndexingProgress` after every status poll, e.g. to report the
+                number of vectors that are still queued.
+        """
+        await self._wait_for_vector_indexing_async(shards, how_many_failures, on_progress)
+
+
 T = TypeVar("T", bound=_BatchBase)
 
 
@@ -137,3 +346,21 @@ class _ContextManagerWrapper(Generic[T]):
 
     def __enter__(self) -> T:
         return self.__current_batch
+
+
+TAsync = TypeVar("TAsync", bound=_BatchBaseAsync)
+
+
+class _ContextManagerWrapperAsync(Generic[TAsync]):
+    def __init__(self, create_batch: Callable[[], Awaitable[TAsync]]):
+        self.__create_batch = create_batch
+        self.__current_batch: Optional[TAsync] = None
+
+    async def __aenter__(self) -> TAsync:
+        self.__current_batch = await self.__create_batch()
+        self.__current_batch._start()
+        return self.__current_batch
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        assert self.__current_batch is not None
+        await self.__current_batch._shutdown()
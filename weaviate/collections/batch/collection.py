@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Generic, List, Optional, Union
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Dict, Generic, Iterable, List, Optional, Sequence, Type, Union
 
 from weaviate.collections.batch.base import (
     _BatchBase,
@@ -8,17 +9,55 @@ from weaviate.collections.batch.base import (
     _FixedSizeBatching,
     _RateLimitedBatching,
 )
-from weaviate.collections.batch.batch_wrapper import _BatchWrapper, _ContextManagerWrapper
-from weaviate.collections.classes.config import ConsistencyLevel, Vectorizers
+from weaviate.collections.batch.base_async import _BatchBaseAsync
+from weaviate.collections.batch.controller import _controller_factory
+from weaviate.collections.batch.dedup import _BatchDeduplicator
+from weaviate.collections.batch.encoders import _PropertyEncoder
+from weaviate.collections.batch.error_sink import BatchErrorCallback, _BatchErrorSink
+from weaviate.collections.batch.journal import _BatchJournal
+from weaviate.collections.batch.rate_limit import _inferred_rate_limit
+from weaviate.collections.batch.retry import (
+    _RetryBudget,
+    _RetryClassifier,
+    _retry_budget,
+    _retry_classifier,
+)
+from weaviate.collections.batch.batch_wrapper import (
+    _BatchWrapper,
+    _BatchWrapperAsync,
+    _ContextManagerWrapper,
+    _ContextManagerWrapperAsync,
+)
+from weaviate.collections.classes.batch import (
+    Deduplication,
+    PIControl,
+    RetryBudget,
+    RetryClass,
+    VectorizerRateLimit,
+)
+from weaviate.collections.classes.config import (
+    CollectionConfigSimple,
+    ConsistencyLevel,
+    Vectorizers,
+)
 from weaviate.collections.classes.internal import ReferenceInputs, ReferenceInput
 from weaviate.collections.classes.types import Properties
 from weaviate.connect import ConnectionV4
 from weaviate.event_loop import _EventLoop
 from weaviate.exceptions import UnexpectedStatusCodeError
-from weaviate.types import UUID, VECTORS
+from weaviate.types import UUID, VECTOR_MATRICES, VECTORS
 
 if TYPE_CHECKING:
-    from weaviate.collections.config import _ConfigCollection
+    from weaviate.collections.config import _ConfigCollection, _ConfigCollectionAsync
+
+
+def _uses_vectorizer(config: CollectionConfigSimple) -> bool:
+    if config.vector_config is not None:
+        return any(
+            vec_config.vectorizer.vectorizer is not Vectorizers.NONE
+            for vec_config in config.vector_config.values()
+        )
+    return config.vectorizer is not Vectorizers.NONE
 
 
 class _BatchCollection(Generic[Properties], _BatchBase):
@@ -32,6 +71,13 @@ class _BatchCollection(Generic[Properties], _BatchBase):
         name: str,
         tenant: Optional[str],
         vectorizer_batching: bool,
+        error_sink: Optional[_BatchErrorSink] = None,
+        journal: Optional[_BatchJournal] = None,
+        deduplicator: Optional[_BatchDeduplicator] = None,
+        retry_classifier: Optional[_RetryClassifier] = None,
+        retry_budget: Optional[_RetryBudget] = None,
+        serialization_executor: Optional[Executor] = None,
+        property_encoders: Optional[Dict[str, _PropertyEncoder]] = None,
     ) -> None:
         super().__init__(
             connection=connection,
@@ -40,6 +86,13 @@ class _BatchCollection(Generic[Properties], _BatchBase):
             batch_mode=batch_mode,
             event_loop=event_loop,
             vectorizer_batching=vectorizer_batching,
+            error_sink=error_sink,
+            journal=journal,
+            deduplicator=deduplicator,
+            retry_classifier=retry_classifier,
+            retry_budget=retry_budget,
+            serialization_executor=serialization_executor,
+            property_encoders=property_encoders,
         )
         self.__name = name
         self.__tenant = tenant
@@ -87,6 +140,46 @@ class _BatchCollection(Generic[Properties], _BatchBase):
             tenant=self.__tenant,
         )
 
+    def add_objects(
+        self,
+        properties: Optional[Iterable[Properties]] = None,
+        vectors: Optional[VECTOR_MATRICES] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+    ) -> List[UUID]:
+        """Add one object per row of the given arrays to this batch.
+
+        NOTE: If the UUID of one of the objects already exists then the existing object will be replaced by the new object.
+
+        Arguments:
+            `properties`
+                The data properties of the objects, one dictionary per object. Any iterable is accepted, a generator
+                is consumed lazily in chunks if neither `vectors` nor `uuids` are given.
+            `vectors`
+                The embeddings of the objects as a 2D matrix with one row per object, e.g. a `numpy.ndarray` of shape
+                (number of objects, dimensions). The matrix is converted to float32 once and each row is sent as-is,
+                which is much faster than adding the vectors one by one.
+                For named vectors, provide a dictionary with one matrix per vector name. Requires `numpy`.
+            `uuids`
+                The UUIDs of the objects. If None, UUIDv4s will be generated, by default None.
+
+        Returns:
+            `List[UUID]`
+                The UUIDs of the added objects in the order of the rows.
+
+        Raises:
+            `WeaviateBatchValidationError`
+                If the arrays are of different lengths or a UUID is invalid.
+            `WeaviateInvalidInputError`
+                If the vectors cannot be converted to a float32 matrix.
+        """
+        return self._add_objects_from_arrays(
+            collection=self.__name,
+            properties=properties,
+            vectors=vectors,
+            uuids=uuids,
+            tenant=self.__tenant,
+        )
+
     def add_reference(
         self, from_uuid: UUID, from_property: str, to: Union[ReferenceInput, List[UUID]]
     ) -> None:
@@ -126,31 +219,33 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
         name: str,
         tenant: Optional[str],
         config: "_ConfigCollection",
+        data_model: Optional[Type[Properties]] = None,
     ) -> None:
         super().__init__(connection, consistency_level)
         self.__name = name
         self.__tenant = tenant
         self.__config = config
+        self.__data_model = data_model
         self._vectorizer_batching: Optional[bool] = None
 
     def __create_batch_and_reset(self) -> _ContextManagerWrapper[_BatchCollection[Properties]]:
         if self._vectorizer_batching is None:
             try:
                 config = self.__config.get(simple=True)
-                if config.vector_config is not None:
-                    vectorizer_batching = False
-                    for vec_config in config.vector_config.values():
-                        if vec_config.vectorizer.vectorizer is not Vectorizers.NONE:
-                            vectorizer_batching = True
-                            break
-                    self._vectorizer_batching = vectorizer_batching
-                else:
-                    self._vectorizer_batching = config.vectorizer is not Vectorizers.NONE
+                self._vectorizer_batching = _uses_vectorizer(config)
+                self._inferred_rate_limit = _inferred_rate_limit([config])
+                self._property_encoders = {
+                    self.__name: _PropertyEncoder.from_properties(config.properties)
+                }
             except UnexpectedStatusCodeError as e:
                 # collection does not have to exist if autoschema is enabled. Individual objects will be validated and might fail
                 if e.status_code != 404:
                     raise e
                 self._vectorizer_batching = False
+                if self.__data_model is not None:
+                    self._property_encoders = {
+                        self.__name: _PropertyEncoder.from_data_model(self.__data_model)
+                    }
 
         self._batch_data = _BatchDataWrapper()  # clear old data
         return _ContextManagerWrapper(
@@ -159,23 +254,115 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
                 connection=self._connection,
                 consistency_level=self._consistency_level,
                 results=self._batch_data,
-                batch_mode=self._batch_mode,
+                batch_mode=self._batch_mode_with_rate_limit(),
                 name=self.__name,
                 tenant=self.__tenant,
                 vectorizer_batching=self._vectorizer_batching,
+                error_sink=_BatchErrorSink(self._on_error, self._failed_objects_path),
+                journal=(
+                    _BatchJournal(self._journal_path) if self._journal_path is not None else None
+                ),
+                deduplicator=(
+                    _BatchDeduplicator(self._deduplicate) if self._deduplicate is not None else None
+                ),
+                retry_classifier=_retry_classifier(self._retry_classes),
+                retry_budget=_retry_budget(self._retry_budget),
+                serialization_executor=self._serialization_executor,
+                property_encoders=self._property_encoders,
             )
         )
 
-    def dynamic(self) -> CollectionBatchingContextManager[Properties]:
+    def dynamic(
+        self,
+        max_request_bytes: Optional[int] = None,
+        on_error: Optional[BatchErrorCallback] = None,
+        failed_objects_path: Optional[str] = None,
+        journal_path: Optional[str] = None,
+        deduplicate: Optional[Deduplication] = None,
+        retry_classes: Optional[Sequence[RetryClass]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        vectorizer_rate_limit: Optional[VectorizerRateLimit] = None,
+        controller: Optional[PIControl] = None,
+        concurrency_share: float = 1.0,
+        serialization_executor: Optional[Executor] = None,
+    ) -> CollectionBatchingContextManager[Properties]:
         """Configure dynamic batching.
 
         When you exit the context manager, the final batch will be sent automatically.
+
+        Arguments:
+            `max_request_bytes`
+                The maximum size of one request in bytes. If provided, the batch size also follows the average size of
+                the objects so that requests make use of this budget. If not provided, requests are only split to stay
+                below the maximum gRPC message size.
+            `on_error`
+                A function that is called with every failed object and reference as soon as Weaviate reports it, a
+                coroutine function is awaited. If this or `failed_objects_path` is provided, failures are not kept in
+                `failed_objects`, `failed_references` and the results of the batch, so that memory does not grow with
+                the number of failures.
+            `failed_objects_path`
+                A path to a file that every failed object and reference is appended to as one JSON line, including
+                its properties and vector so that it can be re-imported later.
+            `journal_path`
+                A path to a file that records the index and UUID of every added object and which of them Weaviate
+                acknowledged. If the import is interrupted, the next batch with the same journal continues at the
+                `resume_offset` reported by `weaviate.collections.batch.journal.read_batch_journal`: read the source
+                again from there and objects that were acknowledged after it are skipped.
+            `deduplicate`
+                Skip objects that were already added, see `weaviate.classes.batch.Deduplication`. The number of
+                skipped objects is available as `number_duplicates` of the batch.
+            `retry_classes`
+                Additional errors whose objects are sent again, see `weaviate.classes.batch.RetryClass`. They take
+                precedence over the built-in retries for rate limited vectorizers and unavailable nodes.
+            `retry_budget`
+                The share of the successfully sent objects that may be retried, see
+                `weaviate.classes.batch.RetryBudget`. If not provided, 1000 objects and one for every five
+                acknowledged objects may be retried.
+            `vectorizer_rate_limit`
+                The rate limits of the model provider of the vectorizer, see
+                `weaviate.classes.batch.VectorizerRateLimit`. If not provided, the limits of the lowest paid tier are
+                assumed for OpenAI and Cohere vectorizers.
+            `controller`
+                How the batch size and the number of concurrent requests follow the load of Weaviate, see
+                `weaviate.classes.batch.PIControl`. If not provided, the batch size jumps to the size that keeps the
+                batch queue of Weaviate at about two seconds of work, or steps in multiples of 48 objects for
+                collections with a vectorizer.
+            `concurrency_share`
+                The share of the concurrent requests that the cluster can take that this batch may use, for imports
+                that run several batches in separate processes at once, e.g. `0.25` for each of four processes. By
+                default, the batch may use all of them.
+            `serialization_executor`
+                A `concurrent.futures.Executor` that encodes the requests, so that the next batch is encoded while the
+                previous one is sent. A `ProcessPoolExecutor` also takes the encoding off the GIL. If not provided,
+                the requests are encoded on the event loop of the batch. The executor is not shut down by the batch.
         """
-        self._batch_mode: _BatchMode = _DynamicBatching()
+        self._batch_mode: _BatchMode = _DynamicBatching(
+            max_request_bytes,
+            controller=_controller_factory(controller),
+            vectorizer_rate_limit=vectorizer_rate_limit,
+            concurrency_share=concurrency_share,
+        )
+        self._on_error = on_error
+        self._failed_objects_path = failed_objects_path
+        self._journal_path = journal_path
+        self._deduplicate = deduplicate
+        self._retry_classes = retry_classes
+        self._retry_budget = retry_budget
+        self._serialization_executor = serialization_executor
         return self.__create_batch_and_reset()
 
     def fixed_size(
-        self, batch_size: int = 100, concurrent_requests: int = 2
+        self,
+        batch_size: int = 100,
+        concurrent_requests: int = 2,
+        max_request_bytes: Optional[int] = None,
+        on_error: Optional[BatchErrorCallback] = None,
+        failed_objects_path: Optional[str] = None,
+        journal_path: Optional[str] = None,
+        deduplicate: Optional[Deduplication] = None,
+        retry_classes: Optional[Sequence[RetryClass]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        serialization_executor: Optional[Executor] = None,
     ) -> CollectionBatchingContextManager[Properties]:
         """Configure fixed size batches. Note that the default is dynamic batching.
 
@@ -187,11 +374,58 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
             `concurrent_requests`
                 The number of concurrent requests when sending batches. This controls the number of concurrent requests
                 made to Weaviate and not the speed of batch creation within Python.
+            `max_request_bytes`
+                The maximum size of one request in bytes, a batch is cut early once it reaches this size. If not
+                provided, requests are only split to stay below the maximum gRPC message size.
+            `on_error`
+                A function that is called with every failed object and reference as soon as Weaviate reports it, a
+                coroutine function is awaited. If this or `failed_objects_path` is provided, failures are not kept in
+                `failed_objects`, `failed_references` and the results of the batch, so that memory does not grow with
+                the number of failures.
+            `failed_objects_path`
+                A path to a file that every failed object and reference is appended to as one JSON line, including
+                its properties and vector so that it can be re-imported later.
+            `journal_path`
+                A path to a file that records the index and UUID of every added object and which of them Weaviate
+                acknowledged. If the import is interrupted, the next batch with the same journal continues at the
+                `resume_offset` reported by `weaviate.collections.batch.journal.read_batch_journal`: read the source
+                again from there and objects that were acknowledged after it are skipped.
+            `deduplicate`
+                Skip objects that were already added, see `weaviate.classes.batch.Deduplication`. The number of
+                skipped objects is available as `number_duplicates` of the batch.
+            `retry_classes`
+                Additional errors whose objects are sent again, see `weaviate.classes.batch.RetryClass`. They take
+                precedence over the built-in retries for rate limited vectorizers and unavailable nodes.
+            `retry_budget`
+                The share of the successfully sent objects that may be retried, see
+                `weaviate.classes.batch.RetryBudget`. If not provided, 1000 objects and one for every five
+                acknowledged objects may be retried.
+            `serialization_executor`
+                A `concurrent.futures.Executor` that encodes the requests, so that the next batch is encoded while the
+                previous one is sent. A `ProcessPoolExecutor` also takes the encoding off the GIL. If not provided,
+                the requests are encoded on the event loop of the batch. The executor is not shut down by the batch.
         """
-        self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests)
+        self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests, max_request_bytes)
+        self._on_error = on_error
+        self._failed_objects_path = failed_objects_path
+        self._journal_path = journal_path
+        self._deduplicate = deduplicate
+        self._retry_classes = retry_classes
+        self._retry_budget = retry_budget
+        self._serialization_executor = serialization_executor
         return self.__create_batch_and_reset()
 
-    def rate_limit(self, requests_per_minute: int) -> CollectionBatchingContextManager[Properties]:
+    def rate_limit(
+        self,
+        requests_per_minute: int,
+        on_error: Optional[BatchErrorCallback] = None,
+        failed_objects_path: Optional[str] = None,
+        journal_path: Optional[str] = None,
+        deduplicate: Optional[Deduplication] = None,
+        retry_classes: Optional[Sequence[RetryClass]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        serialization_executor: Optional[Executor] = None,
+    ) -> CollectionBatchingContextManager[Properties]:
         """Configure batches with a rate limited vectorizer.
 
         When you exit the context manager, the final batch will be sent automatically.
@@ -199,6 +433,451 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
         Arguments:
             `requests_per_minute`
                 The number of requests that the vectorizer can process per minute.
+            `on_error`
+                A function that is called with every failed object and reference as soon as Weaviate reports it, a
+                coroutine function is awaited. If this or `failed_objects_path` is provided, failures are not kept in
+                `failed_objects`, `failed_references` and the results of the batch, so that memory does not grow with
+                the number of failures.
+            `failed_objects_path`
+                A path to a file that every failed object and reference is appended to as one JSON line, including
+                its properties and vector so that it can be re-imported later.
+            `journal_path`
+                A path to a file that records the index and UUID of every added object and which of them Weaviate
+                acknowledged. If the import is interrupted, the next batch with the same journal continues at the
+                `resume_offset` reported by `weaviate.collections.batch.journal.read_batch_journal`: read the source
+                again from there and objects that were acknowledged after it are skipped.
+            `deduplicate`
+                Skip objects that were already added, see `weaviate.classes.batch.Deduplication`. The number of
+                skipped objects is available as `number_duplicates` of the batch.
+            `retry_classes`
+                Additional errors whose objects are sent again, see `weaviate.classes.batch.RetryClass`. They take
+                precedence over the built-in retries for rate limited vectorizers and unavailable nodes.
+            `retry_budget`
+                The share of the successfully sent objects that may be retried, see
+                `weaviate.classes.batch.RetryBudget`. If not provided, 1000 objects and one for every five
+                acknowledged objects may be retried.
+            `serialization_executor`
+                A `concurrent.futures.Executor` that encodes the requests, so that the next batch is encoded while the
+                previous one is sent. A `ProcessPoolExecutor` also takes the encoding off the GIL. If not provided,
+                the requests are encoded on the event loop of the batch. The executor is not shut down by the batch.
         """
         self._batch_mode = _RateLimitedBatching(requests_per_minute)
+        self._on_error = on_error
+        self._failed_objects_path = failed_objects_path
+        self._journal_path = journal_path
+        self._deduplicate = deduplicate
+        self._retry_classes = retry_classes
+        self._retry_budget = retry_budget
+        self._serialization_executor = serialization_executor
         return self.__create_batch_and_reset()
+
+
+class _BatchCollectionAsync(Generic[Properties], _BatchBaseAsync):
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        consistency_level: Optional[ConsistencyLevel],
+        results: _BatchDataWrapper,
+        batch_mode: _BatchMode,
+        name: str,
+        tenant: Optional[str],
+        vectorizer_batching: bool,
+        error_sink: Optional[_BatchErrorSink] = None,
+        journal: Optional[_BatchJournal] = None,
+        deduplicator: Optional[_BatchDeduplicator] = None,
+        retry_classifier: Optional[_RetryClassifier] = None,
+        retry_budget: Optional[_RetryBudget] = None,
+        serialization_executor: Optional[Executor] = None,
+        property_encoders: Optional[Dict[str, _PropertyEncoder]] = None,
+    ) -> None:
+        super().__init__(
+            connection=connection,
+            consistency_level=consistency_level,
+            results=results,
+            batch_mode=batch_mode,
+            vectorizer_batching=vectorizer_batching,
+            error_sink=error_sink,
+            journal=journal,
+            deduplicator=deduplicator,
+            retry_classifier=retry_classifier,
+            retry_budget=retry_budget,
+            serialization_executor=serialization_executor,
+            property_encoders=property_encoders,
+        )
+        self.__name = name
+        self.__tenant = tenant
+
+    async def add_object(
+        self,
+        properties: Optional[Properties] = None,
+        references: Optional[ReferenceInputs] = None,
+        uuid: Optional[UUID] = None,
+        vector: Optional[VECTORS] = None,
+    ) -> UUID:
+        """Add one object to this batch.
+
+        NOTE: If the UUID of one of the objects already exists then the existing object will be replaced by the new object.
+
+        The call is suspended while the internal queue is full or Weaviate is overloaded.
+
+        Arguments:
+            `properties`
+                The data properties of the object to be added as a dictionary.
+            `references`
+                The references of the object to be added as a dictionary.
+            `uuid`:
+                The UUID of the object as an uuid.UUID object or str. If it is None an UUIDv4 will generated, by default None
+            `vector`:
+                The embedding of the object. Can be used when a collection does not have a vectorization module or the given
+                vector was generated using the _identical_ vectorization module that is configured for the class. In this
+                case this vector takes precedence.
+                Supported types are
+                - for single vectors: `list`, 'numpy.ndarray`, `torch.Tensor` and `tf.Tensor`, by default None.
+                - for named vectors: Dict[str, *list above*], where the string is the name of the vector.
+
+        Returns:
+            `str`
+                The UUID of the added object. If one was not provided a UUIDv4 will be auto-generated for you and returned here.
+
+        Raises:
+            `WeaviateBatchValidationError`
+                If the provided options are in the format required by Weaviate.
+        """
+        return await self._add_object(
+            collection=self.__name,
+            properties=properties,
+            references=references,
+            uuid=uuid,
+            vector=vector,
+            tenant=self.__tenant,
+        )
+
+    async def add_objects(
+        self,
+        properties: Optional[Iterable[Properties]] = None,
+        vectors: Optional[VECTOR_MATRICES] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+    ) -> List[UUID]:
+        """Add one object per row of the given arrays to this batch.
+
+        NOTE: If the UUID of one of the objects already exists then the existing object will be replaced by the new object.
+
+        The call is suspended while the internal queue is full or Weaviate is overloaded.
+
+        Arguments:
+            `properties`
+                The data properties of the objects, one dictionary per object. Any iterable is accepted, a generator
+                is consumed lazily in chunks if neither `vectors` nor `uuids` are given.
+            `vectors`
+                The embeddings of the objects as a 2D matrix with one row per object, e.g. a `numpy.ndarray` of shape
+                (number of objects, dimensions). The matrix is converted to float32 once and each row is sent as-is,
+                which is much faster than adding the vectors one by one.
+                For named vectors, provide a dictionary with one matrix per vector name. Requires `numpy`.
+            `uuids`
+                The UUIDs of the objects. If None, UUIDv4s will be generated, by default None.
+
+        Returns:
+            `List[UUID]`
+                The UUIDs of the added objects in the order of the rows.
+
+        Raises:
+            `WeaviateBatchValidationError`
+                If the arrays are of different lengths or a UUID is invalid.
+            `WeaviateInvalidInputError`
+                If the vectors cannot be converted to a float32 matrix.
+        """
+        return await self._add_objects_from_arrays(
+            collection=self.__name,
+            properties=properties,
+            vectors=vectors,
+            uuids=uuids,
+            tenant=self.__tenant,
+        )
+
+    async def add_reference(
+        self, from_uuid: UUID, from_property: str, to: Union[ReferenceInput, List[UUID]]
+    ) -> None:
+        """Add a reference to this batch.
+
+        Arguments:
+            `from_uuid`
+                The UUID of the object, as an uuid.UUID object or str, that should reference another object.
+            `from_property`
+                The name of the property that contains the reference.
+            `to`
+                The UUID of the referenced object, as an uuid.UUID object or str, that is actually referenced.
+                For multi-target references use wvc.Reference.to_multi_target().
+
+        Raises:
+            `WeaviateBatchValidationError`
+                If the provided options are in the format required by Weaviate.
+        """
+        await self._add_reference(
+            from_uuid,
+            self.__name,
+            from_property,
+            to,
+            self.__tenant,
+        )
+
+
+BatchCollectionAsync = _BatchCollectionAsync[Properties]
+CollectionBatchingContextManagerAsync = _ContextManagerWrapperAsync[
+    BatchCollectionAsync[Properties]
+]
+
+
+class _BatchCollectionWrapperAsync(Generic[Properties], _BatchWrapperAsync):
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        consistency_level: Optional[ConsistencyLevel],
+        name: str,
+        tenant: Optional[str],
+        config: "_ConfigCollectionAsync",
+        data_model: Optional[Type[Properties]] = None,
+    ) -> None:
+        super().__init__(connection, consistency_level)
+        self.__name = name
+        self.__tenant = tenant
+        self.__config = config
+        self.__data_model = data_model
+        self._vectorizer_batching: Optional[bool] = None
+
+    async def __create_batch_and_reset(self) -> _BatchCollectionAsync[Properties]:
+        if self._vectorizer_batching is None:
+            try:
+                config = await self.__config.get(simple=True)
+                self._vectorizer_batching = _uses_vectorizer(config)
+                self._inferred_rate_limit = _inferred_rate_limit([config])
+                self._property_encoders = {
+                    self.__name: _PropertyEncoder.from_properties(config.properties)
+                }
+            except UnexpectedStatusCodeError as e:
+                # collection does not have to exist if autoschema is enabled. Individual objects will be validated and might fail
+                if e.status_code != 404:
+                    raise e
+                self._vectorizer_batching = False
+                if self.__data_model is not None:
+                    self._property_encoders = {
+                        self.__name: _PropertyEncoder.from_data_model(self.__data_model)
+                    }
+
+        self._batch_data = _BatchDataWrapper()  # clear old data
+        return _BatchCollectionAsync[Properties](
+            connection=self._connection,
+            consistency_level=self._consistency_level,
+            results=self._batch_data,
+            batch_mode=self._batch_mode_with_rate_limit(),
+            name=self.__name,
+            tenant=self.__tenant,
+            vectorizer_batching=self._vectorizer_batching,
+            error_sink=_BatchErrorSink(self._on_error, self._failed_objects_path),
+            journal=_BatchJournal(self._journal_path) if self._journal_path is not None else None,
+            deduplicator=(
+                _BatchDeduplicator(self._deduplicate) if self._deduplicate is not None else None
+            ),
+            retry_classifier=_retry_classifier(self._retry_classes),
+            retry_budget=_retry_budget(self._retry_budget),
+            serialization_executor=self._serialization_executor,
+            property_encoders=self._property_encoders,
+        )
+
+    def dynamic(
+        self,
+        max_request_bytes: Optional[int] = None,
+        on_error: Optional[BatchErrorCallback] = None,
+        failed_objects_path: Optional[str] = None,
+        journal_path: Optional[str] = None,
+        deduplicate: Optional[Deduplication] = None,
+        retry_classes: Optional[Sequence[RetryClass]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        vectorizer_rate_limit: Optional[VectorizerRateLimit] = None,
+        controller: Optional[PIControl] = None,
+        concurrency_share: float = 1.0,
+        serialization_executor: Optional[Executor] = None,
+    ) -> CollectionBatchingContextManagerAsync[Properties]:
+        """Configure dynamic batching.
+
+        Use the returned object as an async context manager. When you exit it, the final batch will be sent automatically.
+
+        Arguments:
+            `max_request_bytes`
+                The maximum size of one request in bytes. If provided, the batch size also follows the average size of
+                the objects so that requests make use of this budget. If not provided, requests are only split to stay
+                below the maximum gRPC message size.
+            `on_error`
+                A function that is called with every failed object and reference as soon as Weaviate reports it, a
+                coroutine function is awaited. If this or `failed_objects_path` is provided, failures are not kept in
+                `failed_objects`, `failed_references` and the results of the batch, so that memory does not grow with
+                the number of failures.
+            `failed_objects_path`
+                A path to a file that every failed object and reference is appended to as one JSON line, including
+                its properties and vector so that it can be re-imported later.
+            `journal_path`
+                A path to a file that records the index and UUID of every added object and which of them Weaviate
+                acknowledged. If the import is interrupted, the next batch with the same journal continues at the
+                `resume_offset` reported by `weaviate.collections.batch.journal.read_batch_journal`: read the source
+                again from there and objects that were acknowledged after it are skipped.
+            `deduplicate`
+                Skip objects that were already added, see `weaviate.classes.batch.Deduplication`. The number of
+                skipped objects is available as `number_duplicates` of the batch.
+            `retry_classes`
+                Additional errors whose objects are sent again, see `weaviate.classes.batch.RetryClass`. They take
+                precedence over the built-in retries for rate limited vectorizers and unavailable nodes.
+            `retry_budget`
+                The share of the successfully sent objects that may be retried, see
+                `weaviate.classes.batch.RetryBudget`. If not provided, 1000 objects and one for every five
+                acknowledged objects may be retried.
+            `vectorizer_rate_limit`
+                The rate limits of the model provider of the vectorizer, see
+                `weaviate.classes.batch.VectorizerRateLimit`. If not provided, the limits of the lowest paid tier are
+                assumed for OpenAI and Cohere vectorizers.
+            `controller`
+                How the batch size and the number of concurrent requests follow the load of Weaviate, see
+                `weaviate.classes.batch.PIControl`. If not provided, the batch size jumps to the size that keeps the
+                batch queue of Weaviate at about two seconds of work, or steps in multiples of 48 objects for
+                collections with a vectorizer.
+            `concurrency_share`
+                The share of the concurrent requests that the cluster can take that this batch may use, for imports
+                that run several batches in separate processes at once, e.g. `0.25` for each of four processes. By
+                default, the batch may use all of them.
+            `serialization_executor`
+                A `concurrent.futures.Executor` that encodes the requests, so that the next batch is encoded while the
+                previous one is sent. A `ProcessPoolExecutor` also takes the encoding off the GIL. If not provided,
+                the requests are encoded on the event loop of the batch. The executor is not shut down by the batch.
+        """
+        self._batch_mode = _DynamicBatching(
+            max_request_bytes,
+            controller=_controller_factory(controller),
+            vectorizer_rate_limit=vectorizer_rate_limit,
+            concurrency_share=concurrency_share,
+        )
+        self._on_error = on_error
+        self._failed_objects_path = failed_objects_path
+        self._journal_path = journal_path
+        self._deduplicate = deduplicate
+        self._retry_classes = retry_classes
+        self._retry_budget = retry_budget
+        self._serialization_executor = serialization_executor
+        return _ContextManagerWrapperAsync(self.__create_batch_and_reset)
+
+    def fixed_size(
+        self,
+        batch_size: int = 100,
+        concurrent_requests: int = 2,
+        max_request_bytes: Optional[int] = None,
+        on_error: Optional[BatchErrorCallback] = None,
+        failed_objects_path: Optional[str] = None,
+        journal_path: Optional[str] = None,
+        deduplicate: Optional[Deduplication] = None,
+        retry_classes: Optional[Sequence[RetryClass]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        serialization_executor: Optional[Executor] = None,
+    ) -> CollectionBatchingContextManagerAsync[Properties]:
+        """Configure fixed size batches. Note that the default is dynamic batching.
+
+        Use the returned object as an async context manager. When you exit it, the final batch will be sent automatically.
+
+        Arguments:
+            `batch_size`
+                The number of objects/references to be sent in one batch. If not provided, the default value is 100.
+            `concurrent_requests`
+                The number of concurrent requests when sending batches. This controls the number of concurrent requests
+                made to Weaviate and not the speed of batch creation within Python.
+            `max_request_bytes`
+                The maximum size of one request in bytes, a batch is cut early once it reaches this size. If not
+                provided, requests are only split to stay below the maximum gRPC message size.
+            `on_error`
+                A function that is called with every failed object and reference as soon as Weaviate reports it, a
+                coroutine function is awaited. If this or `failed_objects_path` is provided, failures are not kept in
+                `failed_objects`, `failed_references` and the results of the batch, so that memory does not grow with
+                the number of failures.
+            `failed_objects_path`
+                A path to a file that every failed object and reference is appended to as one JSON line, including
+                its properties and vector so that it can be re-imported later.
+            `journal_path`
+                A path to a file that records the index and UUID of every added object and which of them Weaviate
+                acknowledged. If the import is interrupted, the next batch with the same journal continues at the
+                `resume_offset` reported by `weaviate.collections.batch.journal.read_batch_journal`: read the source
+                again from there and objects that were acknowledged after it are skipped.
+            `deduplicate`
+                Skip objects that were already added, see `weaviate.classes.batch.Deduplication`. The number of
+                skipped objects is available as `number_duplicates` of the batch.
+            `retry_classes`
+                Additional errors whose objects are sent again, see `weaviate.classes.batch.RetryClass`. They take
+                precedence over the built-in retries for rate limited vectorizers and unavailable nodes.
+            `retry_budget`
+                The share of the successfully sent objects that may be retried, see
+                `weaviate.classes.batch.RetryBudget`. If not provided, 1000 objects and one for every five
+                acknowledged objects may be retried.
+            `serialization_executor`
+                A `concurrent.futures.Executor` that encodes the requests, so that the next batch is encoded while the
+                previous one is sent. A `ProcessPoolExecutor` also takes the encoding off the GIL. If not provided,
+                the requests are encoded on the event loop of the batch. The executor is not shut down by the batch.
+        """
+        self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests, max_request_bytes)
+        self._on_error = on_error
+        self._failed_objects_path = failed_objects_path
+        self._journal_path = journal_path
+        self._deduplicate = deduplicate
+        self._retry_classes = retry_classes
+        self._retry_budget = retry_budget
+        self._serialization_executor = serialization_executor
+        return _ContextManagerWrapperAsync(self.__create_batch_and_reset)
+
+    def rate_limit(
+        self,
+        requests_per_minute: int,
+        on_error: Optional[BatchErrorCallback] = None,
+        failed_objects_path: Optional[str] = None,
+        journal_path: Optional[str] = None,
+        deduplicate: Optional[Deduplication] = None,
+        retry_classes: Optional[Sequence[RetryClass]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        serialization_executor: Optional[Executor] = None,
+    ) -> CollectionBatchingContextManagerAsync[Properties]:
+        """Configure batches with a rate limited vectorizer.
+
+        Use the returned object as an async context manager. When you exit it, the final batch will be sent automatically.
+
+        Arguments:
+            `requests_per_minute`
+                The number of requests that the vectorizer can process per minute.
+            `on_error`
+                A function that is called with every failed object and reference as soon as Weaviate reports it, a
+                coroutine function is awaited. If this or `failed_objects_path` is provided, failures are not kept in
+                `failed_objects`, `failed_references` and the results of the batch, so that memory does not grow with
+                the number of failures.
+            `failed_objects_path`
+                A path to a file that every failed object and reference is appended to as one JSON line, including
+                its properties and vector so that it can be re-imported later.
+            `journal_path`
+                A path to a file that records the index and UUID of every added object and which of them Weaviate
+                acknowledged. If the import is interrupted, the next batch with the same journal continues at the
+                `resume_offset` reported by `weaviate.collections.batch.journal.read_batch_journal`: read the source
+                again from there and objects that were acknowledged after it are skipped.
+            `deduplicate`
+                Skip objects that were already added, see `weaviate.classes.batch.Deduplication`. The number of
+                skipped objects is available as `number_duplicates` of the batch.
+            `retry_classes`
+                Additional errors whose objects are sent again, see `weaviate.classes.batch.RetryClass`. They take
+                precedence over the built-in retries for rate limited vectorizers and unavailable nodes.
+            `retry_budget`
+                The share of the successfully sent objects that may be retried, see
+                `weaviate.classes.batch.RetryBudget`. If not provided, 1000 objects and one for every five
+                acknowledged objects may be retried.
+            `serialization_executor`
+                A `concurrent.futures.Executor` that encodes the requests, so that the next batch is encoded while the
+                previous one is sent. A `ProcessPoolExecutor` also takes the encoding off the GIL. If not provided,
+                the requests are encoded on the event loop of the batch. The executor is not shut down by the batch.
+        """
+        self._batch_mode = _RateLimitedBatching(requests_per_minute)
+        self._on_error = on_error
+        self._failed_objects_path = failed_objects_path
+        self._journal_path = journal_path
+        self._deduplicate = deduplicate
+        self._retry_classes = retry_classes
+        self._retry_budget = retry_budget
+        self._serialization_executor = serialization_executor
+        return _ContextManagerWrapperAsync(self.__create_batch_and_reset)
@@ -0,0 +1,203 @@
+import functools
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional
+
+from weaviate.collections.classes.batch import PIControl
+
+if TYPE_CHECKING:
+    from weaviate.collections.batch.base import _BatchSizing
+
+MAX_CONCURRENT_REQUESTS = 10  # per node
+BATCH_TIME_TARGET = 10
+VECTORIZER_BATCHING_STEP_SIZE = 48  # cohere max batch size is 96
+
+
+@dataclass
+class _BatchObservation:
+    """What dynamic batching knows about the load of Weaviate at one point in time."""
+
+    now: float
+    queue_length: int  # objects waiting in the batch queue of Weaviate
+    rate_per_second: float  # objects processed by Weaviate per second
+    num_queued_objects: int  # objects waiting in the queue of the client
+    latency: Optional[float]  # duration of the slowest of the most recent requests in seconds
+
+
+class _BatchController(ABC):
+    """Adapts the batch size and the number of concurrent requests of dynamic batching.
+
+    `update` is called with a new observation about once per second and changes `num_objects`,
+    `concurrent_requests` and, if the controller needs to pause, `dynamic_batching_sleep_time` of the sizing.
+    """
+
+    @abstractmethod
+    def update(self, sizing: "_BatchSizing", observation: _BatchObservation) -> None:
+        raise NotImplementedError()
+
+
+class _ThresholdController(_BatchController):
+    """Aim for a Weaviate batch queue of two seconds of work by jumping to the batch size that would reach it."""
+
+    def __init__(self) -> None:
+        self.time_last_scale_up: float = 0
+
+    def update(self, sizing: "_BatchSizing", observation: _BatchObservation) -> None:
+        rate = observation.rate_per_second
+        rate_per_worker = rate / sizing.concurrent_requests
+        batch_length = observation.queue_length
+
+        if batch_length == 0:  # scale up if queue is empty
+            sizing.num_objects = min(sizing.num_objects + 50, sizing.max_batch_size)
+
+            if (
+                sizing.max_batch_size == sizing.num_objects
+                and observation.num_queued_objects > sizing.num_objects
+                and observation.now - self.time_last_scale_up > 1
+                and sizing.concurrent_requests < sizing.max_concurrent_requests
+            ):
+                sizing.concurrent_requests += 1
+                self.time_last_scale_up = observation.now
+
+        else:
+            ratio = batch_length / rate
+            if 2.1 > ratio > 1.9:  # ideal, send exactly as many objects as weaviate can process
+                sizing.num_objects = math.floor(rate_per_worker)
+            elif ratio <= 1.9:  # we can send more
+                sizing.num_objects = math.floor(
+                    min(sizing.num_objects * 1.5, rate_per_worker * 2 / ratio)
+                )
+
+                if sizing.max_batch_size == sizing.num_objects:
+                    sizing.concurrent_requests += 1
+
+            elif ratio < 10:  # too high, scale down
+                sizing.num_objects = math.floor(rate_per_worker * 2 / ratio)
+
+                if sizing.num_objects < 100 and sizing.concurrent_requests > 2:
+                    sizing.concurrent_requests -= 1
+
+            else:  # way too high, stop sending new batches
+                sizing.num_objects = 0
+                sizing.concurrent_requests = 2
+
+
+class _PIController(_BatchController):
+    """Proportional-integral control of the Weaviate batch queue.
+
+    The queue is measured in seconds of work, `queue_length / rate_per_second`, and the error is its distance to
+    `target_queue_seconds`. If requests take longer than `target_latency`, the error is at most the relative latency
+    overshoot, so slow requests shrink the batches even while the queue is short. The batch size changes by
+    `rate_per_worker * (kp * change_of_error + ki * error)` objects per update; this scales the gains with the
+    throughput of Weaviate and keeps the batch size steady once the queue is at its target. At the maximum batch size
+    one more concurrent request is allowed per second while the client has a backlog, at the minimum batch size one is
+    dropped. If the queue exceeds `pause_queue_seconds`, no new batches are sent until it has drained.
+    """
+
+    def __init__(
+        self,
+        target_queue_seconds: float = 2,
+        target_latency: float = BATCH_TIME_TARGET,
+        kp: float = 0.5,
+        ki: float = 1,
+        min_objects: int = 10,
+        pause_queue_seconds: float = 20,
+        startup_increase: int = 50,
+    ) -> None:
+        self.target_queue_seconds = target_queue_seconds
+        self.target_latency = target_latency
+        self.kp = kp
+        self.ki = ki
+        self.min_objects = min_objects
+        self.pause_queue_seconds = pause_queue_seconds
+        self.startup_increase = startup_increase
+        self.previous_error: Optional[float] = None
+        self.time_last_scale_up: float = 0
+
+    def update(self, sizing: "_BatchSizing", observation: _BatchObservation) -> None:
+        if observation.queue_length == 0:
+            queue_seconds = 0.0
+        elif observation.rate_per_second > 0:
+            queue_seconds = observation.queue_length / observation.rate_per_second
+        else:
+            queue_seconds = math.inf
+
+        if queue_seconds > self.pause_queue_seconds:
+            sizing.num_objects = 0
+            self.previous_error = None
+            return
+
+        error = self.target_queue_seconds - queue_seconds
+        if observation.latency is not None and observation.latency > self.target_latency:
+            latency_error = (self.target_latency - observation.latency) / self.target_latency
+            error = min(error, latency_error * self.target_queue_seconds)
+        previous_error = error if self.previous_error is None else self.previous_error
+        self.previous_error = error
+
+        if observation.rate_per_second > 0:
+            rate_per_worker = observation.rate_per_second / sizing.concurrent_requests
+            change = rate_per_worker * (self.kp * (error - previous_error) + self.ki * error)
+        else:  # nothing has been processed yet
+            change = self.startup_increase
+        sizing.num_objects = math.floor(
+            max(self.min_objects, min(sizing.max_batch_size, sizing.num_objects + change))
+        )
+
+        if (
+            error > 0
+            and sizing.num_objects == sizing.max_batch_size
+            and observation.num_queued_objects > sizing.num_objects
+            and observation.now - self.time_last_scale_up > 1
+            and sizing.concurrent_requests < sizing.max_concurrent_requests
+        ):
+            sizing.concurrent_requests += 1
+            self.time_last_scale_up = observation.now
+        elif (
+            error < 0 and sizing.num_objects == self.min_objects and sizing.concurrent_requests > 1
+        ):
+            sizing.concurrent_requests -= 1
+
+
+def _controller_factory(control: Optional[PIControl]) -> Optional[Callable[[], _BatchController]]:
+    """Return the factory of the controller that is configured by `control`, `None` for the default controller."""
+    if control is None:
+        return None
+    # a partial instead of a closure, so that the batch mode can still be sent to other processes
+    return functools.partial(_PIController, **control.model_dump())
+
+
+class _VectorizerController(_BatchController):
+    """For slow vectorizers, send larger batches that can take a bit longer, but fewer of them.
+
+    Only the request latency is used, if a single batch of the smallest size takes too long the controller sleeps.
+    """
+
+    def update(self, sizing: "_BatchSizing", observation: _BatchObservation) -> None:
+        if observation.latency is None or not sizing.batch_sent:
+            return
+        max_took = observation.latency
+        sizing.dynamic_batching_sleep_time = 0
+        if max_took > 2 * BATCH_TIME_TARGET:
+            sizing.concurrent_requests = 1
+            sizing.num_objects = VECTORIZER_BATCHING_STEP_SIZE
+        elif max_took > BATCH_TIME_TARGET:
+            current_step = sizing.num_objects // VECTORIZER_BATCHING_STEP_SIZE
+
+            if sizing.concurrent_requests > 1:
+                sizing.concurrent_requests -= 1
+            elif current_step > 1:
+                sizing.num_objects = VECTORIZER_BATCHING_STEP_SIZE * (current_step - 1)
+            else:
+                # cannot scale down, sleep a bit
+                sizing.dynamic_batching_sleep_time = max_took - BATCH_TIME_TARGET
+
+        elif max_took < 3 * BATCH_TIME_TARGET // 4:
+            if sizing.dynamic_batching_sleep_time > 0:
+                sizing.dynamic_batching_sleep_time = 0
+            elif sizing.concurrent_requests < 3:
+                sizing.concurrent_requests += 1
+            else:
+                current_step = sizing.num_objects // VECTORIZER_BATCHING_STEP_SIZE
+                sizing.num_objects = VECTORIZER_BATCHING_STEP_SIZE * (current_step + 1)
+        sizing.batch_sent = False
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import math
+import os
+import struct
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from weaviate.collections.batch.error_sink import _json_default
+from weaviate.collections.classes.batch import Deduplication, _BatchObject
+
+_MAGIC = b"WVBF"
+_HEADER = struct.Struct("<4sQQQ")  # magic, number of bits, number of hashes, number of added keys
+
+
+class _BloomFilter:
+    """A Bloom filter whose bit positions are derived from one 128-bit hash per key by double hashing."""
+
+    def __init__(
+        self, num_bits: int, num_hashes: int, count: int = 0, bits: Optional[bytearray] = None
+    ):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.count = count
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, expected_keys: int, false_positive_rate: float) -> "_BloomFilter":
+        num_bits = math.ceil(-expected_keys * math.log(false_positive_rate) / math.log(2) ** 2)
+        num_hashes = max(1, round(num_bits / expected_keys * math.log(2)))
+        return cls(num_bits, num_hashes)
+
+    def __positions(self, key: bytes) -> Tuple[int, ...]:
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        return tuple((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self.__positions(key))
+
+    def add(self, key: bytes) -> bool:
+        """Add the key and return whether it was (probably) added before."""
+        seen = True
+        for pos in self.__positions(key):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not self.bits[byte] & mask:
+                seen = False
+                self.bits[byte] |= mask
+        if not seen:
+            self.count += 1
+        return seen
+
+    def to_bytes(self) -> bytes:
+        return _HEADER.pack(_MAGIC, self.num_bits, self.num_hashes, self.count) + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "_BloomFilter":
+        magic, num_bits, num_hashes, count = _HEADER.unpack_from(data)
+        bits = bytearray(data[_HEADER.size :])
+        if magic != _MAGIC or len(bits) != (num_bits + 7) // 8:
+            raise ValueError("not a batch deduplication filter")
+        return cls(num_bits, num_hashes, count, bits)
+
+
+def _hash_default(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return value.hex()
+    return _json_default(value)
+
+
+def _vector_bytes(vector: Any) -> bytes:
+    # vectors from `add_objects` are already packed as float32, pack the others the same way so that the hash does not
+    # depend on how an object was added
+    if vector is None:
+        return b""
+    if isinstance(vector, bytes):
+        return vector
+    if isinstance(vector, dict):
+        return b"".join(
+            name.encode("utf-8") + b"\0" + _vector_bytes(value)
+            for name, value in sorted(vector.items())
+        )
+    try:
+        return struct.pack(f"{len(vector)}f", *vector)
+    except (struct.error, TypeError):  # multi-vectors
+        return json.dumps(vector, default=_hash_default).encode("utf-8")
+
+
+def _object_key(obj: _BatchObject, content: bool) -> bytes:
+    key = f"{obj.collection}\0{obj.tenant or ''}\0{obj.uuid}".encode("utf-8")
+    if not content:
+        return key
+    payload = json.dumps(
+        [obj.properties, obj.references], sort_keys=True, default=_hash_default
+    ).encode("utf-8")
+    return key + b"\0" + payload + b"\0" + _vector_bytes(obj.vector)
+
+
+class _BatchDeduplicator:
+    """Skips objects that were already added to a batch, see `Deduplication`.
+
+    Objects are remembered once Weaviate acknowledged them, until then they are only tracked exactly while they are in
+    flight. Objects that failed are therefore sent again when they are added again, in this run as well as in a later
+    one. If a `path` is given, the acknowledged objects are also remembered in a second filter that is loaded from and
+    saved to it, so that incremental loads skip the objects of earlier runs. A saved filter keeps its size, the sizing
+    of the configuration only applies to new filters.
+    """
+
+    def __init__(self, config: Deduplication) -> None:
+        self.__content = config.content
+        self.__path = config.path
+        self.__added = _BloomFilter.for_capacity(
+            config.expected_objects, config.false_positive_rate
+        )
+        self.__imported: Optional[_BloomFilter] = None
+        # keys of the objects that were added but not acknowledged or failed yet, by index
+        self.__pending: Dict[int, bytes] = {}
+        self.__in_flight: Set[bytes] = set()
+        if self.__path is not None:
+            if os.path.exists(self.__path):
+                with open(self.__path, "rb") as file:
+                    self.__imported = _BloomFilter.from_bytes(file.read())
+            else:
+                self.__imported = _BloomFilter.for_capacity(
+                    config.expected_objects, config.false_positive_rate
+                )
+        self.num_duplicates = 0
+
+    def is_duplicate(self, obj: _BatchObject) -> bool:
+        """Remember the object and return whether it was added before."""
+        key = _object_key(obj, self.__content)
+        if (
+            key in self.__in_flight
+            or key in self.__added
+            or (self.__imported is not None and key in self.__imported)
+        ):
+            self.num_duplicates += 1
+            return True
+        self.__pending[obj.index] = key
+        self.__in_flight.add(key)
+        return False
+
+    def done(self, acknowledged: Iterable[int], failed: Iterable[int]) -> None:
+        """Record the outcome of the objects with the given indices."""
+        for index in acknowledged:
+            if (key := self.__pending.pop(index, None)) is not None:
+                self.__in_flight.discard(key)
+                self.__added.add(key)
+                if self.__imported is not None:
+                    self.__imported.add(key)
+        # failed objects are forgotten, so that they are not skipped when they are added again
+        for index in failed:
+            if (key := self.__pending.pop(index, None)) is not None:
+                self.__in_flight.discard(key)
+
+    def close(self) -> None:
+        if self.__path is None or self.__imported is None:
+            return
+        # write a new file and swap it in, so that a crash while saving does not lose the previous filter
+        tmp_path = self.__path + ".tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(self.__imported.to_bytes())
+        os.replace(tmp_path, self.__path)
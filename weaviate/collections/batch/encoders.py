@@ -0,0 +1,390 @@
+import datetime
+import struct
+import sys
+import uuid as uuid_package
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+from typing_extensions import is_typeddict
+
+from weaviate.collections.classes.config import DataType, _NestedProperty, _Property
+from weaviate.collections.classes.internal import ReferenceInputs, ReferenceToMulti
+from weaviate.collections.classes.types import GeoCoordinate, PhoneNumber
+from weaviate.exceptions import WeaviateInsertInvalidPropertyError, WeaviateInvalidInputError
+from weaviate.proto.v1 import base_pb2, batch_pb2
+from weaviate.util import _datetime_to_string
+
+if sys.version_info < (3, 9):
+    from typing_extensions import get_args, get_origin, get_type_hints
+else:
+    from typing import get_args, get_origin, get_type_hints
+
+# The properties of objects and of nested objects have the same fields apart from the references, so both are encoded
+# by the same functions. The values are written into the messages in place, building intermediate messages and
+# passing them to a constructor would copy them.
+_Target = Union[batch_pb2.BatchObject.Properties, base_pb2.ObjectPropertiesValue]
+
+# A writer encodes a value of its data type and returns False if the value does not have the expected Python type, the
+# value is then encoded by inspecting it instead.
+_Writer = Callable[[_Target, str, Any, Optional["_PropertyEncoder"]], bool]
+
+
+@dataclass
+class _PropertyEncoder:
+    """The data types of the properties of a collection, compiled from its schema or data model.
+
+    Properties with a known data type are encoded by a writer for that type, without inspecting the values to find out
+    how to encode them. Unknown properties and values that do not have the expected Python type, e.g. with
+    auto-schema, fall back to the type inspection. The writers are module level functions, so that an encoder can be
+    sent to a process pool together with the objects.
+    """
+
+    data_types: Dict[str, DataType] = field(default_factory=dict)
+    nested: Dict[str, "_PropertyEncoder"] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.__writers: Optional[Dict[str, Tuple[_Writer, Optional["_PropertyEncoder"]]]] = None
+
+    def writer(self, name: str) -> Optional[Tuple[_Writer, Optional["_PropertyEncoder"]]]:
+        # compiled on first use, so that properties added after the creation of the encoder are included
+        if self.__writers is None:
+            self.__writers = {
+                prop: (_WRITERS[data_type], self.nested.get(prop))
+                for prop, data_type in self.data_types.items()
+            }
+        return self.__writers.get(name)
+
+    @classmethod
+    def from_properties(
+        cls, properties: Sequence[Union[_Property, _NestedProperty]]
+    ) -> "_PropertyEncoder":
+        return cls(
+            data_types={prop.name: prop.data_type for prop in properties},
+            nested={
+                prop.name: cls.from_properties(prop.nested_properties)
+                for prop in properties
+                if prop.nested_properties is not None
+            },
+        )
+
+    @classmethod
+    def from_data_model(cls, data_model: Any) -> "_PropertyEncoder":
+        encoder = cls()
+        for name, hint in get_type_hints(data_model).items():
+            data_type = _data_type_of_hint(hint)
+            if data_type is None:
+                continue
+            encoder.data_types[name] = data_type
+            if data_type in (DataType.OBJECT, DataType.OBJECT_ARRAY):
+                inner = _unwrap_optional(hint)
+                if data_type == DataType.OBJECT_ARRAY:
+                    inner = get_args(inner)[0]
+                encoder.nested[name] = cls.from_data_model(inner)
+        return encoder
+
+
+_HINT_DATA_TYPES: Dict[Any, DataType] = {
+    str: DataType.TEXT,
+    bool: DataType.BOOL,
+    int: DataType.INT,
+    float: DataType.NUMBER,
+    datetime.datetime: DataType.DATE,
+    uuid_package.UUID: DataType.UUID,
+    GeoCoordinate: DataType.GEO_COORDINATES,
+    PhoneNumber: DataType.PHONE_NUMBER,
+}
+_HINT_ARRAY_DATA_TYPES: Dict[Any, DataType] = {
+    str: DataType.TEXT_ARRAY,
+    bool: DataType.BOOL_ARRAY,
+    int: DataType.INT_ARRAY,
+    float: DataType.NUMBER_ARRAY,
+    datetime.datetime: DataType.DATE_ARRAY,
+    uuid_package.UUID: DataType.UUID_ARRAY,
+}
+
+
+def _unwrap_optional(hint: Any) -> Any:
+    if get_origin(hint) is Union:
+        args = [arg for arg in get_args(hint) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return hint
+
+
+def _data_type_of_hint(hint: Any) -> Optional[DataType]:
+    hint = _unwrap_optional(hint)
+    if is_typeddict(hint):
+        return DataType.OBJECT
+    if get_origin(hint) is list and len(get_args(hint)) == 1:
+        item = get_args(hint)[0]
+        if is_typeddict(item):
+            return DataType.OBJECT_ARRAY
+        return _HINT_ARRAY_DATA_TYPES.get(item)
+    return _HINT_DATA_TYPES.get(hint)
+
+
+def _is_ndarray(value: Any) -> bool:
+    # numpy is optional, so arrays are recognised without importing it
+    return type(value).__module__ == "numpy" and hasattr(value, "ndim")
+
+
+def _write_text(target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]) -> bool:
+    if type(entry) is not str:
+        return False
+    target.non_ref_properties.fields[key].string_value = entry
+    return True
+
+
+def _write_number(target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]) -> bool:
+    if type(entry) is not int and type(entry) is not float:
+        return False
+    target.non_ref_properties.fields[key].number_value = entry
+    return True
+
+
+def _write_bool(target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]) -> bool:
+    if type(entry) is not bool:
+        return False
+    target.non_ref_properties.fields[key].bool_value = entry
+    return True
+
+
+def _write_date(target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]) -> bool:
+    if isinstance(entry, datetime.datetime):
+        target.non_ref_properties.fields[key].string_value = _datetime_to_string(entry)
+    elif type(entry) is str:
+        target.non_ref_properties.fields[key].string_value = entry
+    else:
+        return False
+    return True
+
+
+def _write_uuid(target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]) -> bool:
+    if not isinstance(entry, (uuid_package.UUID, str)):
+        return False
+    target.non_ref_properties.fields[key].string_value = str(entry)
+    return True
+
+
+def _write_struct(target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]) -> bool:
+    if not isinstance(entry, (GeoCoordinate, PhoneNumber)):
+        return False
+    target.non_ref_properties.fields[key].struct_value.update(entry._to_dict())
+    return True
+
+
+def _write_empty(target: _Target, key: str, entry: Any) -> bool:
+    if type(entry) is not list or len(entry) > 0:
+        return False
+    target.empty_list_props.append(key)
+    return True
+
+
+def _write_text_array(target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]) -> bool:
+    if type(entry) is not list or len(entry) == 0 or type(entry[0]) is not str:
+        return _write_empty(target, key, entry)
+    target.text_array_properties.add(prop_name=key, values=entry)
+    return True
+
+
+def _write_date_array(target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]) -> bool:
+    if type(entry) is not list or len(entry) == 0:
+        return _write_empty(target, key, entry)
+    if isinstance(entry[0], datetime.datetime):
+        values = [_datetime_to_string(value) for value in entry]
+    elif type(entry[0]) is str:
+        values = entry
+    else:
+        return False
+    target.text_array_properties.add(prop_name=key, values=values)
+    return True
+
+
+def _write_uuid_array(target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]) -> bool:
+    if type(entry) is not list or len(entry) == 0:
+        return _write_empty(target, key, entry)
+    if not isinstance(entry[0], (uuid_package.UUID, str)):
+        return False
+    target.text_array_properties.add(prop_name=key, values=[str(value) for value in entry])
+    return True
+
+
+def _write_bool_array(target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]) -> bool:
+    if type(entry) is not list or len(entry) == 0 or type(entry[0]) is not bool:
+        return _write_empty(target, key, entry)
+    target.boolean_array_properties.add(prop_name=key, values=entry)
+    return True
+
+
+def _write_int_array(target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]) -> bool:
+    if _is_ndarray(entry) and entry.dtype.kind in "iu":
+        entry = entry.tolist()
+    elif type(entry) is not list or len(entry) == 0 or type(entry[0]) is not int:
+        return _write_empty(target, key, entry)
+    if len(entry) == 0:
+        target.empty_list_props.append(key)
+    else:
+        target.int_array_properties.add(prop_name=key, values=entry)
+    return True
+
+
+def _write_number_array(
+    target: _Target, key: str, entry: Any, _: Optional[_PropertyEncoder]
+) -> bool:
+    if _is_ndarray(entry):
+        if entry.size == 0:
+            target.empty_list_props.append(key)
+            return True
+        # packed directly from the array, without a detour through a list of Python floats
+        values_bytes = entry.astype("<f8", copy=False).tobytes()
+    elif type(entry) is list and len(entry) > 0 and isinstance(entry[0], (int, float)):
+        values_bytes = struct.pack("<{}d".format(len(entry)), *entry)
+    else:
+        return _write_empty(target, key, entry)
+    target.number_array_properties.add(prop_name=key, values_bytes=values_bytes)
+    return True
+
+
+def _write_object(
+    target: _Target, key: str, entry: Any, encoder: Optional[_PropertyEncoder]
+) -> bool:
+    if not isinstance(entry, dict):
+        return False
+    _encode_nested(target.object_properties.add(prop_name=key).value, entry, encoder)
+    return True
+
+
+def _write_object_array(
+    target: _Target, key: str, entry: Any, encoder: Optional[_PropertyEncoder]
+) -> bool:
+    if type(entry) is not list or len(entry) == 0 or not isinstance(entry[0], dict):
+        return _write_empty(target, key, entry)
+    values = target.object_array_properties.add(prop_name=key).values
+    for value in entry:
+        _encode_nested(values.add(), value, encoder)
+    return True
+
+
+_WRITERS: Dict[DataType, _Writer] = {
+    DataType.TEXT: _write_text,
+    DataType.BLOB: _write_text,
+    DataType.INT: _write_number,
+    DataType.NUMBER: _write_number,
+    DataType.BOOL: _write_bool,
+    DataType.DATE: _write_date,
+    DataType.UUID: _write_uuid,
+    DataType.GEO_COORDINATES: _write_struct,
+    DataType.PHONE_NUMBER: _write_struct,
+    DataType.TEXT_ARRAY: _write_text_array,
+    DataType.DATE_ARRAY: _write_date_array,
+    DataType.UUID_ARRAY: _write_uuid_array,
+    DataType.BOOL_ARRAY: _write_bool_array,
+    DataType.INT_ARRAY: _write_int_array,
+    DataType.NUMBER_ARRAY: _write_number_array,
+    DataType.OBJECT: _write_object,
+    DataType.OBJECT_ARRAY: _write_object_array,
+}
+
+
+def _encode_nested(
+    target: base_pb2.ObjectPropertiesValue,
+    data: Dict[str, Any],
+    encoder: Optional[_PropertyEncoder],
+) -> None:
+    _validate_props(data)
+    target.non_ref_properties.SetInParent()
+    _encode_values(target, data, encoder)
+
+
+def _encode_values(
+    target: _Target, data: Dict[str, Any], encoder: Optional[_PropertyEncoder]
+) -> None:
+    for key, entry in data.items():
+        if encoder is not None and (writer := encoder.writer(key)) is not None:
+            if writer[0](target, key, entry, writer[1]):
+                continue
+        _encode_value(target, key, entry)
+
+
+def _encode_value(target: _Target, key: str, entry: Any) -> None:
+    """Encode a property whose data type is unknown by inspecting its value."""
+    if _is_ndarray(entry):
+        entry = entry.tolist()
+    if isinstance(entry, dict):
+        _encode_nested(target.object_properties.add(prop_name=key).value, entry, None)
+    elif isinstance(entry, list) and len(entry) == 0:
+        target.empty_list_props.append(key)
+    elif isinstance(entry, list) and isinstance(entry[0], dict):
+        values = target.object_array_properties.add(prop_name=key).values
+        for v in entry:
+            _encode_nested(values.add(), v, None)
+    elif isinstance(entry, list) and isinstance(entry[0], bool):
+        target.boolean_array_properties.add(prop_name=key, values=entry)
+    elif isinstance(entry, list) and isinstance(entry[0], str):
+        target.text_array_properties.add(prop_name=key, values=entry)
+    elif isinstance(entry, list) and isinstance(entry[0], datetime.datetime):
+        target.text_array_properties.add(
+            prop_name=key, values=[_datetime_to_string(x) for x in entry]
+        )
+    elif isinstance(entry, list) and isinstance(entry[0], uuid_package.UUID):
+        target.text_array_properties.add(prop_name=key, values=[str(x) for x in entry])
+    elif isinstance(entry, list) and isinstance(entry[0], int):
+        target.int_array_properties.add(prop_name=key, values=entry)
+    elif isinstance(entry, list) and isinstance(entry[0], float):
+        values_bytes = struct.pack("{}d".format(len(entry)), *entry)
+        target.number_array_properties.add(prop_name=key, values_bytes=values_bytes)
+    elif isinstance(entry, GeoCoordinate):
+        target.non_ref_properties.update({key: entry._to_dict()})
+    elif isinstance(entry, PhoneNumber):
+        target.non_ref_properties.update({key: entry._to_dict()})
+    else:
+        target.non_ref_properties.update({key: _serialize_primitive(entry)})
+
+
+def _encode_properties(
+    target: batch_pb2.BatchObject.Properties,
+    data: Dict[str, Any],
+    refs: ReferenceInputs,
+    encoder: Optional[_PropertyEncoder] = None,
+) -> None:
+    """Encode the properties and references of an object into the `properties` of its BatchObject."""
+    _validate_props(data)
+    target.non_ref_properties.SetInParent()
+
+    for key, ref in refs.items():
+        if isinstance(ref, ReferenceToMulti):
+            target.multi_target_ref_props.add(
+                uuids=ref.uuids_str, target_collection=ref.target_collection, prop_name=key
+            )
+        elif isinstance(ref, str) or isinstance(ref, uuid_package.UUID):
+            target.single_target_ref_props.add(uuids=[str(ref)], prop_name=key)
+        elif isinstance(ref, list):
+            target.single_target_ref_props.add(uuids=[str(v) for v in ref], prop_name=key)
+        else:
+            raise WeaviateInvalidInputError(f"Invalid reference: {ref}")
+
+    _encode_values(target, data, encoder)
+
+
+def _translate_properties_from_python_to_grpc(
+    data: Dict[str, Any], refs: ReferenceInputs, encoder: Optional[_PropertyEncoder] = None
+) -> batch_pb2.BatchObject.Properties:
+    properties = batch_pb2.BatchObject.Properties()
+    _encode_properties(properties, data, refs, encoder)
+    return properties
+
+
+def _validate_props(props: Dict[str, Any]) -> None:
+    if "id" in props or "vector" in props:
+        raise WeaviateInsertInvalidPropertyError(props)
+
+
+def _serialize_primitive(value: Any) -> Any:
+    if isinstance(value, uuid_package.UUID):
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        return _datetime_to_string(value)
+    if isinstance(value, list):
+        return [_serialize_primitive(val) for val in value]
+
+    return value
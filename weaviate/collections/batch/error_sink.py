@@ -0,0 +1,104 @@
+import datetime
+import inspect
+import json
+import struct
+import uuid as uuid_package
+from typing import IO, Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+
+from pydantic import BaseModel
+
+from weaviate.collections.classes.batch import ErrorObject, ErrorReference
+from weaviate.logger import logger
+
+BatchErrorCallback = Callable[[Union[ErrorObject, ErrorReference]], Optional[Awaitable[None]]]
+
+
+def _unpack_vector(vector: Any) -> Any:
+    if isinstance(vector, bytes):  # already packed as float32
+        return list(struct.unpack(f"{len(vector) // 4}f", vector))
+    if isinstance(vector, dict):
+        return {name: _unpack_vector(value) for name, value in vector.items()}
+    return vector
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, uuid_package.UUID):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(exclude_none=True)
+    if hasattr(value, "tolist"):  # numpy, torch and tensorflow
+        return value.tolist()
+    return str(value)
+
+
+def _error_to_json(error: Union[ErrorObject, ErrorReference]) -> Dict[str, Any]:
+    if isinstance(error, ErrorObject):
+        obj = error.object_
+        return {
+            "type": "object",
+            "message": error.message,
+            "index": obj.index,
+            "collection": obj.collection,
+            "uuid": obj.uuid,
+            "tenant": obj.tenant,
+            "properties": obj.properties,
+            "references": obj.references,
+            "vector": _unpack_vector(obj.vector),
+        }
+    ref = error.reference
+    return {
+        "type": "reference",
+        "message": error.message,
+        "from": ref.from_,
+        "to": ref.to,
+        "tenant": ref.tenant,
+        "from_uuid": ref.from_uuid,
+        "to_uuid": ref.to_uuid,
+    }
+
+
+class _BatchErrorSink:
+    """Streams failed objects and references out of a batch as they are reported by Weaviate.
+
+    Failures are passed to `on_error`, which may also be a coroutine function, and/or appended as one JSON line each to
+    `failed_objects_path`. If either is given, the batch does not keep the failed objects and references in memory but
+    only counts them, so that the memory of the client does not grow with the number of failures.
+    """
+
+    def __init__(
+        self,
+        on_error: Optional[BatchErrorCallback] = None,
+        failed_objects_path: Optional[str] = None,
+    ) -> None:
+        self.__on_error = on_error
+        self.__path = failed_objects_path
+        self.__file: Optional[IO[str]] = None
+
+    @property
+    def streams(self) -> bool:
+        """Whether failures are streamed out instead of being kept by the batch."""
+        return self.__on_error is not None or self.__path is not None
+
+    async def errors(self, errors: Iterable[Union[ErrorObject, ErrorReference]]) -> None:
+        for error in errors:
+            if self.__path is not None:
+                if self.__file is None:
+                    self.__file = open(self.__path, "a", encoding="utf-8")
+                self.__file.write(json.dumps(_error_to_json(error), default=_json_default) + "\n")
+            if self.__on_error is not None:
+                # a failing callback must not stop the batch from accounting for its results
+                try:
+                    ret = self.__on_error(error)
+                    if inspect.isawaitable(ret):
+                        await ret
+                except Exception as e:
+                    logger.error(f"The on_error callback of the batch raised an exception: {e!r}")
+        if self.__file is not None:
+            self.__file.flush()
+
+    def close(self) -> None:
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
@@ -1,42 +1,263 @@
-import datetime
+import asyncio
 import struct
 import time
 import uuid as uuid_package
-from typing import Any, Dict, List, Optional, Union, cast
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union, cast
 
 from grpc.aio import AioRpcError  # type: ignore
-from google.protobuf.struct_pb2 import Struct
 
 from weaviate.collections.classes.batch import (
     ErrorObject,
     _BatchObject,
     BatchObjectReturn,
 )
+from weaviate.collections.batch.encoders import _PropertyEncoder, _encode_properties
 from weaviate.collections.classes.config import ConsistencyLevel
-from weaviate.collections.classes.types import GeoCoordinate, PhoneNumber
-from weaviate.collections.classes.internal import ReferenceToMulti, ReferenceInputs
 from weaviate.collections.grpc.shared import _BaseGRPC
 from weaviate.connect import ConnectionV4
+from weaviate.connect.base import MAX_GRPC_MESSAGE_LENGTH
 from weaviate.exceptions import (
     WeaviateBatchError,
-    WeaviateInsertInvalidPropertyError,
     WeaviateInsertManyAllFailedError,
     WeaviateInvalidInputError,
 )
 from weaviate.proto.v1 import batch_pb2, base_pb2
-from weaviate.util import _datetime_to_string, _get_vector_v4
+from weaviate.util import _get_vector_v4
 
 
-def _pack_named_vectors(vectors: Dict[str, List[float]]) -> List[base_pb2.Vectors]:
+_BATCH_OBJECTS_METHOD = "/weaviate.v1.Weaviate/BatchObjects"
+# tag of the repeated `objects` field of a BatchObjectsRequest, field 1 with wire type 2 (length-delimited)
+_OBJECTS_TAG = b"\x0a"
+# the remaining fields of a BatchObjectsRequest, e.g. the consistency level
+_REQUEST_BASE_BYTES = 16
+
+
+def _estimate_value_size(value: Any) -> int:
+    if isinstance(value, str):
+        return (len(value) if value.isascii() else len(value.encode("utf-8"))) + 4
+    if isinstance(value, bytes):
+        return len(value) + 4
+    if isinstance(value, Mapping):
+        return sum(len(k) + _estimate_value_size(v) + 4 for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_value_size(v) for v in value) + 4
+    return 12  # numbers, booleans, dates, UUIDs and other scalars
+
+
+def _estimate_grpc_size(obj: _BatchObject) -> int:
+    """Estimate the serialized size of an object in a BatchObjectsRequest without building the protobuf message.
+
+    The estimate is cheap enough to be used while batches are assembled, the exact size is only known once the object
+    is converted in `_BatchGRPC.objects`, which splits requests that would still exceed the budget.
+    """
+    size = 64 + len(obj.collection) + (len(obj.tenant) if obj.tenant is not None else 0)
+    if isinstance(obj.vector, bytes):
+        size += len(obj.vector)
+    elif isinstance(obj.vector, Mapping):
+        size += sum(
+            len(name) + (len(v) if isinstance(v, bytes) else 4 * len(v)) + 8
+            for name, v in obj.vector.items()
+        )
+    elif obj.vector is not None:
+        size += 4 * len(obj.vector)
+    if obj.properties is not None:
+        size += _estimate_value_size(obj.properties)
+    if obj.references is not None:
+        size += 48 * len(obj.references)
+    return size
+
+
+def _framed_size(encoded: bytes) -> int:
+    """Return the size of an encoded object within the repeated `objects` field of a BatchObjectsRequest."""
+    return 1 + len(_varint(len(encoded))) + len(encoded)
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _split_requests(
+    objects: List[bytes],
+    max_request_bytes: int,
+    max_objects_per_request: Optional[int] = None,
+) -> Tuple[List[List[int]], Dict[int, str]]:
+    """Group the encoded objects into requests of at most `max_request_bytes` bytes and `max_objects_per_request`.
+
+    Returns the indices of the objects of every request and an error for every object that is too large to be sent
+    at all, these are reported without contacting Weaviate.
+    """
+    max_request_bytes = min(max_request_bytes, MAX_GRPC_MESSAGE_LENGTH)
+    requests: List[List[int]] = []
+    oversized: Dict[int, str] = {}
+    current: List[int] = []
+    current_bytes = _REQUEST_BASE_BYTES
+    for idx, obj in enumerate(objects):
+        size = _framed_size(obj)
+        if size + _REQUEST_BASE_BYTES > MAX_GRPC_MESSAGE_LENGTH:
+            oversized[idx] = (
+                f"The object is {size} bytes when serialized, which exceeds the maximum gRPC message size of "
+                f"{MAX_GRPC_MESSAGE_LENGTH} bytes."
+            )
+            continue
+        if len(current) > 0 and (
+            current_bytes + size > max_request_bytes
+            or (max_objects_per_request is not None and len(current) >= max_objects_per_request)
+        ):
+            requests.append(current)
+            current = []
+            current_bytes = _REQUEST_BASE_BYTES
+        current.append(idx)
+        current_bytes += size
+    if len(current) > 0:
+        requests.append(current)
+    return requests, oversized
+
+
+def _pack_named_vectors(vectors: Mapping[str, Union[List[float], bytes]]) -> List[base_pb2.Vectors]:
     return [
         base_pb2.Vectors(
             name=name,
-            vector_bytes=struct.pack("{}f".format(len(vector)), *vector),
+            vector_bytes=(
+                vector
+                if isinstance(vector, bytes)
+                else struct.pack("{}f".format(len(vector)), *vector)
+            ),
         )
         for name, vector in vectors.items()
     ]
 
 
+def _pack_vector_matrix(matrix: Any) -> List[bytes]:
+    """Pack every row of a 2D array into the little-endian float32 layout of `vector_bytes`.
+
+    The matrix is converted to a contiguous float32 array once, so that each row only costs a single `tobytes()` copy.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise WeaviateInvalidInputError(
+            "numpy must be installed to insert vectors given as a matrix"
+        ) from e
+
+    try:
+        array = np.ascontiguousarray(matrix, dtype="<f4")
+    except (TypeError, ValueError) as e:
+        raise WeaviateInvalidInputError(
+            f"The vectors you supplied could not be converted to a float32 matrix: {e}"
+        ) from e
+    if array.ndim != 2:
+        raise WeaviateInvalidInputError(
+            f"The vectors must be a 2D matrix of shape (number of objects, dimensions), but got shape {array.shape}"
+        )
+    return [row.tobytes() for row in array]
+
+
+def _pack_vector_matrices(vectors: Any) -> Union[List[bytes], List[Dict[str, bytes]]]:
+    """Pack a matrix, or a mapping of vector names to matrices, into the vectors of the individual objects."""
+    if not isinstance(vectors, Mapping):
+        return _pack_vector_matrix(vectors)
+
+    packed = {name: _pack_vector_matrix(matrix) for name, matrix in vectors.items()}
+    num_rows = {len(rows) for rows in packed.values()}
+    if len(num_rows) > 1:
+        raise WeaviateInvalidInputError(
+            f"All named vector matrices must have the same number of rows, but got {sorted(num_rows)}"
+        )
+    return [
+        {name: rows[i] for name, rows in packed.items()}
+        for i in range(num_rows.pop() if num_rows else 0)
+    ]
+
+
+def _grpc_objects(
+    objects: List[_BatchObject], encoders: Optional[Mapping[str, _PropertyEncoder]] = None
+) -> List[batch_pb2.BatchObject]:
+    def pack_vector(vector: Any) -> bytes:
+        if isinstance(vector, bytes):
+            return vector
+        vector_list = _get_vector_v4(vector)
+        return struct.pack("{}f".format(len(vector_list)), *vector_list)
+
+    grpc_objs: List[batch_pb2.BatchObject] = []
+    for obj in objects:
+        grpc_obj = batch_pb2.BatchObject(
+            collection=obj.collection,
+            vector_bytes=(
+                pack_vector(obj.vector)
+                if obj.vector is not None and isinstance(obj.vector, (list, bytes))
+                else None
+            ),
+            uuid=str(obj.uuid) if obj.uuid is not None else str(uuid_package.uuid4()),
+            tenant=obj.tenant,
+            vectors=(
+                _pack_named_vectors(obj.vector)
+                if obj.vector is not None and isinstance(obj.vector, dict)
+                else None
+            ),
+        )
+        if obj.properties is not None:
+            _encode_properties(
+                grpc_obj.properties,
+                obj.properties,
+                obj.references if obj.references is not None else {},
+                encoders.get(obj.collection) if encoders is not None else None,
+            )
+        grpc_objs.append(grpc_obj)
+    return grpc_objs
+
+
+@dataclass
+class _SerializedBatch:
+    """The requests of a batch, encoded ahead of sending so that this can happen outside of the event loop."""
+
+    uuids: List[str]
+    """The UUIDs of all objects, including the ones generated for objects without one."""
+    requests: List[Tuple[List[int], bytes]]
+    """The indices of the objects of every request and the encoded BatchObjectsRequest."""
+    oversized: Dict[int, str]
+    """An error for every object that is too large to be sent at all."""
+
+
+def _serialize_batch(
+    objects: List[_BatchObject],
+    consistency_level: Optional["base_pb2.ConsistencyLevel"],
+    max_request_bytes: int,
+    max_objects_per_request: Optional[int],
+    encoders: Optional[Mapping[str, _PropertyEncoder]] = None,
+) -> _SerializedBatch:
+    """Build the BatchObjectsRequests of the objects as bytes.
+
+    Every object is encoded once, and the requests are assembled by concatenating the framed objects with the encoded
+    remaining fields, which protobuf merges into one message. This is a module level function, so that it can run in
+    a process pool.
+    """
+    grpc_objs = _grpc_objects(objects, encoders)
+    encoded = [obj.SerializeToString() for obj in grpc_objs]
+    requests, oversized = _split_requests(encoded, max_request_bytes, max_objects_per_request)
+    base = batch_pb2.BatchObjectsRequest(consistency_level=consistency_level).SerializeToString()
+    return _SerializedBatch(
+        uuids=[obj.uuid for obj in grpc_objs],
+        requests=[
+            (
+                indices,
+                b"".join(
+                    _OBJECTS_TAG + _varint(len(encoded[idx])) + encoded[idx] for idx in indices
+                )
+                + base,
+            )
+            for indices in requests
+        ],
+        oversized=oversized,
+    )
+
+
 class _BatchGRPC(_BaseGRPC):
     """This class is used to insert multiple objects into Weaviate using the gRPC API.
 
@@ -44,43 +265,25 @@ class _BatchGRPC(_BaseGRPC):
     and abstractions so as not to couple to strongly to either use-case.
     """
 
-    def __init__(self, connection: ConnectionV4, consistency_level: Optional[ConsistencyLevel]):
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        consistency_level: Optional[ConsistencyLevel],
+        executor: Optional[Executor] = None,
+        encoders: Optional[Mapping[str, _PropertyEncoder]] = None,
+    ):
         super().__init__(connection, consistency_level)
-
-    def __grpc_objects(self, objects: List[_BatchObject]) -> List[batch_pb2.BatchObject]:
-        def pack_vector(vector: Any) -> bytes:
-            vector_list = _get_vector_v4(vector)
-            return struct.pack("{}f".format(len(vector_list)), *vector_list)
-
-        return [
-            batch_pb2.BatchObject(
-                collection=obj.collection,
-                vector_bytes=(
-                    pack_vector(obj.vector)
-                    if obj.vector is not None and isinstance(obj.vector, list)
-                    else None
-                ),
-                uuid=str(obj.uuid) if obj.uuid is not None else str(uuid_package.uuid4()),
-                properties=(
-                    self.__translate_properties_from_python_to_grpc(
-                        obj.properties,
-                        obj.references if obj.references is not None else {},
-                    )
-                    if obj.properties is not None
-                    else None
-                ),
-                tenant=obj.tenant,
-                vectors=(
-                    _pack_named_vectors(obj.vector)
-                    if obj.vector is not None and isinstance(obj.vector, dict)
-                    else None
-                ),
-            )
-            for obj in objects
-        ]
+        self.__executor = executor
+        self.__encoders = encoders
 
     async def objects(
-        self, objects: List[_BatchObject], timeout: Union[int, float]
+        self,
+        objects: List[_BatchObject],
+        timeout: Union[int, float],
+        max_request_bytes: int = MAX_GRPC_MESSAGE_LENGTH,
+        max_objects_per_request: Optional[int] = None,
+        max_concurrency: int = 1,
+        raise_if_all_failed: bool = True,
     ) -> BatchObjectReturn:
         """Insert multiple objects into Weaviate through the gRPC API.
 
@@ -92,14 +295,68 @@ class _BatchGRPC(_BaseGRPC):
                 The UUIDs of the objects that failed to be inserted will be returned in the `errors` attribute of the returned `_BatchReturn` object.
             `tenant`
                 The tenant to be used for this batch operation
+            `timeout`
+                The timeout of every request in seconds.
+            `max_request_bytes`
+                The maximum serialized size of one request. Larger batches are split into several requests. Objects
+                that exceed the maximum gRPC message size on their own are reported as errors without being sent.
+            `max_objects_per_request`
+                The maximum number of objects in one request. If None, requests are only split by size.
+            `max_concurrency`
+                The maximum number of requests that are sent at the same time.
+            `raise_if_all_failed`
+                Whether to raise a `WeaviateInsertManyAllFailedError` if every object failed. If False, the errors are
+                returned like partial failures.
+
+        If some of the requests fail, their objects are reported as errors. Only if every request fails, the error of
+        the first one is raised. If an executor was given, the requests are encoded in it while the event loop keeps
+        serving other requests.
         """
-        weaviate_objs = self.__grpc_objects(objects)
+        if self.__executor is None:
+            serialized = _serialize_batch(
+                objects,
+                self._consistency_level,
+                max_request_bytes,
+                max_objects_per_request,
+                self.__encoders,
+            )
+        else:
+            serialized = await asyncio.get_running_loop().run_in_executor(
+                self.__executor,
+                _serialize_batch,
+                objects,
+                self._consistency_level,
+                max_request_bytes,
+                max_objects_per_request,
+                self.__encoders,
+            )
+        requests = [indices for indices, _ in serialized.requests]
+        errors = serialized.oversized
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(request: bytes) -> Dict[int, str]:
+            async with semaphore:
+                return await self.__send_batch(request, timeout=timeout)
 
         start = time.time()
-        errors = await self.__send_batch(weaviate_objs, timeout=timeout)
+        responses = await asyncio.gather(
+            *(send(request) for _, request in serialized.requests), return_exceptions=True
+        )
         elapsed_time = time.time() - start
 
-        if len(errors) == len(weaviate_objs):
+        failures = [response for response in responses if isinstance(response, BaseException)]
+        if len(failures) > 0 and (
+            len(failures) == len(responses)
+            or any(not isinstance(failure, Exception) for failure in failures)
+        ):
+            raise failures[0]
+        for indices, response in zip(requests, responses):
+            if isinstance(response, BaseException):
+                errors.update((idx, repr(response)) for idx in indices)
+            else:
+                errors.update((indices[idx], error) for idx, error in response.items())
+
+        if raise_if_all_failed and len(errors) == len(objects):
             # Escape sequence (backslash) not allowed in expression portion of f-string prior to Python 3.12: pylance
             raise WeaviateInsertManyAllFailedError(
                 "Here is the set of all errors: {}".format(
@@ -108,19 +365,18 @@ class _BatchGRPC(_BaseGRPC):
             )
 
         all_responses: List[Union[uuid_package.UUID, ErrorObject]] = cast(
-            List[Union[uuid_package.UUID, ErrorObject]], list(range(len(weaviate_objs)))
+            List[Union[uuid_package.UUID, ErrorObject]], list(range(len(objects)))
         )
         return_success: Dict[int, uuid_package.UUID] = {}
         return_errors: Dict[int, ErrorObject] = {}
 
-        for idx, weav_obj in enumerate(weaviate_objs):
-            obj = objects[idx]
+        for idx, (obj, uuid) in enumerate(zip(objects, serialized.uuids)):
             if idx in errors:
                 error = ErrorObject(errors[idx], obj, original_uuid=obj.uuid)
                 return_errors[obj.index] = error
                 all_responses[idx] = error
             else:
-                success = uuid_package.UUID(weav_obj.uuid)
+                success = uuid_package.UUID(uuid)
                 return_success[obj.index] = success
                 all_responses[idx] = success
 
@@ -132,20 +388,14 @@ class _BatchGRPC(_BaseGRPC):
             elapsed_seconds=elapsed_time,
         )
 
-    async def __send_batch(
-        self, batch: List[batch_pb2.BatchObject], timeout: Union[int, float]
-    ) -> Dict[int, str]:
+    async def __send_batch(self, request: bytes, timeout: Union[int, float]) -> Dict[int, str]:
         metadata = self._get_metadata()
         try:
-            assert self._connection.grpc_stub is not None
-            res = await self._connection.grpc_stub.BatchObjects(
-                batch_pb2.BatchObjectsRequest(
-                    objects=batch,
-                    consistency_level=self._consistency_level,
-                ),
-                metadata=metadata,
-                timeout=timeout,
-            )
+            # the request is already encoded, so it is passed through without a serializer
+            res = await self._connection.grpc_channel.unary_unary(
+                _BATCH_OBJECTS_METHOD,
+                response_deserializer=batch_pb2.BatchObjectsReply.FromString,
+            )(request, metadata=metadata, timeout=timeout)
             res = cast(batch_pb2.BatchObjectsReply, res)
 
             objects: Dict[int, str] = {}
@@ -154,137 +404,3 @@ class _BatchGRPC(_BaseGRPC):
             return objects
         except AioRpcError as e:
             raise WeaviateBatchError(str(e)) from e
-
-    def __translate_properties_from_python_to_grpc(
-        self, data: Dict[str, Any], refs: ReferenceInputs
-    ) -> batch_pb2.BatchObject.Properties:
-        _validate_props(data)
-
-        multi_target: List[batch_pb2.BatchObject.MultiTargetRefProps] = []
-        single_target: List[batch_pb2.BatchObject.SingleTargetRefProps] = []
-        non_ref_properties: Struct = Struct()
-        bool_arrays: List[base_pb2.BooleanArrayProperties] = []
-        text_arrays: List[base_pb2.TextArrayProperties] = []
-        int_arrays: List[base_pb2.IntArrayProperties] = []
-        float_arrays: List[base_pb2.NumberArrayProperties] = []
-        object_properties: List[base_pb2.ObjectProperties] = []
-        object_array_properties: List[base_pb2.ObjectArrayProperties] = []
-        empty_lists: List[str] = []
-
-        for key, ref in refs.items():
-            if isinstance(ref, ReferenceToMulti):
-                multi_target.append(
-                    batch_pb2.BatchObject.MultiTargetRefProps(
-                        uuids=ref.uuids_str, target_collection=ref.target_collection, prop_name=key
-                    )
-                )
-            elif isinstance(ref, str) or isinstance(ref, uuid_package.UUID):
-                single_target.append(
-                    batch_pb2.BatchObject.SingleTargetRefProps(uuids=[str(ref)], prop_name=key)
-                )
-            elif isinstance(ref, list):
-                single_target.append(
-                    batch_pb2.BatchObject.SingleTargetRefProps(
-                        uuids=[str(v) for v in ref], prop_name=key
-                    )
-                )
-            else:
-                raise WeaviateInvalidInputError(f"Invalid reference: {ref}")
-
-        for key, entry in data.items():
-            if isinstance(entry, dict):
-                parsed = self.__translate_properties_from_python_to_grpc(entry, {})
-                object_properties.append(
-                    base_pb2.ObjectProperties(
-                        prop_name=key,
-                        value=base_pb2.ObjectPropertiesValue(
-                            non_ref_properties=parsed.non_ref_properties,
-                            int_array_properties=parsed.int_array_properties,
-                            text_array_properties=parsed.text_array_properties,
-                            number_array_properties=parsed.number_array_properties,
-                            boolean_array_properties=parsed.boolean_array_properties,
-                            object_properties=parsed.object_properties,
-                            object_array_properties=parsed.object_array_properties,
-                            empty_list_props=parsed.empty_list_props,
-                        ),
-                    )
-                )
-            elif isinstance(entry, list) and len(entry) == 0:
-                empty_lists.append(key)
-            elif isinstance(entry, list) and isinstance(entry[0], dict):
-                entry = cast(List[Dict[str, Any]], entry)
-                object_array_properties.append(
-                    base_pb2.ObjectArrayProperties(
-                        values=[
-                            base_pb2.ObjectPropertiesValue(
-                                non_ref_properties=parsed.non_ref_properties,
-                                int_array_properties=parsed.int_array_properties,
-                                text_array_properties=parsed.text_array_properties,
-                                number_array_properties=parsed.number_array_properties,
-                                boolean_array_properties=parsed.boolean_array_properties,
-                                object_properties=parsed.object_properties,
-                                object_array_properties=parsed.object_array_properties,
-                                empty_list_props=parsed.empty_list_props,
-                            )
-                            for v in entry
-                            if (parsed := self.__translate_properties_from_python_to_grpc(v, {}))
-                        ],
-                        prop_name=key,
-                    )
-                )
-            elif isinstance(entry, list) and isinstance(entry[0], bool):
-                bool_arrays.append(base_pb2.BooleanArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], str):
-                text_arrays.append(base_pb2.TextArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], datetime.datetime):
-                text_arrays.append(
-                    base_pb2.TextArrayProperties(
-                        prop_name=key, values=[_datetime_to_string(x) for x in entry]
-                    )
-                )
-            elif isinstance(entry, list) and isinstance(entry[0], uuid_package.UUID):
-                text_arrays.append(
-                    base_pb2.TextArrayProperties(prop_name=key, values=[str(x) for x in entry])
-                )
-            elif isinstance(entry, list) and isinstance(entry[0], int):
-                int_arrays.append(base_pb2.IntArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], float):
-                values_bytes = struct.pack("{}d".format(len(entry)), *entry)
-                float_arrays.append(
-                    base_pb2.NumberArrayProperties(prop_name=key, values_bytes=values_bytes)
-                )
-            elif isinstance(entry, GeoCoordinate):
-                non_ref_properties.update({key: entry._to_dict()})
-            elif isinstance(entry, PhoneNumber):
-                non_ref_properties.update({key: entry._to_dict()})
-            else:
-                non_ref_properties.update({key: _serialize_primitive(entry)})
-
-        return batch_pb2.BatchObject.Properties(
-            non_ref_properties=non_ref_properties,
-            multi_target_ref_props=multi_target,
-            single_target_ref_props=single_target,
-            text_array_properties=text_arrays,
-            number_array_properties=float_arrays,
-            int_array_properties=int_arrays,
-            boolean_array_properties=bool_arrays,
-            object_properties=object_properties,
-            object_array_properties=object_array_properties,
-            empty_list_props=empty_lists,
-        )
-
-
-def _validate_props(props: Dict[str, Any]) -> None:
-    if "id" in props or "vector" in props:
-        raise WeaviateInsertInvalidPropertyError(props)
-
-
-def _serialize_primitive(value: Any) -> Any:
-    if isinstance(value, uuid_package.UUID):
-        return str(value)
-    if isinstance(value, datetime.datetime):
-        return _datetime_to_string(value)
-    if isinstance(value, list):
-        return [_serialize_primitive(val) for val in value]
-
-    return value
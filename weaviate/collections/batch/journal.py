@@ -0,0 +1,151 @@
+import os
+import threading
+import uuid as uuid_package
+from typing import IO, Dict, Iterable, List, Optional, Set, Tuple
+
+from weaviate.collections.classes.batch import BatchJournalState, _BatchObject
+
+# One record per line, so that a line that was cut short by a crash can be recognised and dropped:
+#   e <index> <uuid> <uuid> ...  objects with consecutive indices, starting at <index>, were added to the batch
+#   a <first>-<last> <index> ... objects with these indices were acknowledged by Weaviate
+_ENQUEUED = "e"
+_ACKNOWLEDGED = "a"
+
+
+def _consecutive_runs(indices: Iterable[int]) -> List[Tuple[int, int]]:
+    runs: List[Tuple[int, int]] = []
+    for index in sorted(indices):
+        if len(runs) > 0 and runs[-1][1] == index - 1:
+            runs[-1] = (runs[-1][0], index)
+        else:
+            runs.append((index, index))
+    return runs
+
+
+class _Acknowledged:
+    """The set of acknowledged indices, stored as the contiguous prefix plus the indices above it."""
+
+    def __init__(self) -> None:
+        self.prefix = 0
+        self.above: Set[int] = set()
+        self.count = 0
+
+    def add(self, first: int, last: int) -> None:
+        self.count += last - first + 1
+        if first <= self.prefix:
+            self.prefix = max(self.prefix, last + 1)
+        else:
+            self.above.update(range(first, last + 1))
+        while self.prefix in self.above:
+            self.above.remove(self.prefix)
+            self.prefix += 1
+
+    def __contains__(self, index: int) -> bool:
+        return index < self.prefix or index in self.above
+
+
+def _read(path: str) -> Tuple[BatchJournalState, _Acknowledged, int]:
+    """Replay the journal and return its state, the acknowledged indices and the length of its complete lines."""
+    acknowledged = _Acknowledged()
+    enqueued: Dict[int, str] = {}
+    valid_bytes = 0
+    if os.path.exists(path):
+        with open(path, "rb") as file:
+            for raw in file:
+                if not raw.endswith(b"\n"):  # cut short by a crash
+                    break
+                valid_bytes += len(raw)
+                kind, *fields = raw.decode("utf-8").split()
+                if kind == _ENQUEUED:
+                    start = int(fields[0])
+                    for offset, uuid in enumerate(fields[1:]):
+                        enqueued[start + offset] = uuid
+                elif kind == _ACKNOWLEDGED:
+                    for run in fields:
+                        first, _, last = run.partition("-")
+                        first_index = int(first)
+                        last_index = int(last) if last else first_index
+                        acknowledged.add(first_index, last_index)
+                        for index in range(first_index, last_index + 1):
+                            enqueued.pop(index, None)
+
+    state = BatchJournalState(
+        resume_offset=acknowledged.prefix,
+        unacknowledged={
+            index: uuid_package.UUID(uuid)
+            for index, uuid in sorted(enqueued.items())
+            if index not in acknowledged
+        },
+        num_acknowledged=acknowledged.count,
+    )
+    return state, acknowledged, valid_bytes
+
+
+def read_batch_journal(path: str) -> BatchJournalState:
+    """Read the journal that a batch wrote with `journal_path` without modifying it.
+
+    Arguments:
+        `path`
+            The path of the journal file.
+
+    Returns:
+        The resume offset and the objects that were never acknowledged. An empty state if the file does not exist.
+    """
+    return _read(path)[0]
+
+
+class _BatchJournal:
+    """An append-only log of the objects that were added to a batch and of the ones that Weaviate acknowledged.
+
+    The index of every object, its position in the order in which it was added to the batch, is its offset in the
+    source. When the journal of an interrupted import is opened again, the indices continue at its resume offset and
+    objects whose index was already acknowledged are skipped, so only what did not reach Weaviate is sent again. As
+    the skipped objects are not compared to the ones in the journal, the source has to be read in the same order as
+    before, and deterministic UUIDs keep objects that are sent twice from being duplicated. Every write is flushed to
+    the operating system, so the journal survives the process being killed, but it is not synced to disk.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.__state, self.__acknowledged, valid_bytes = _read(path)
+        if os.path.exists(path) and os.path.getsize(path) > valid_bytes:
+            os.truncate(path, valid_bytes)
+        self.__file: Optional[IO[str]] = open(path, "a", encoding="utf-8")
+        self.__lock = threading.Lock()
+
+    @property
+    def state(self) -> BatchJournalState:
+        """The state of the journal when it was opened."""
+        return self.__state
+
+    def is_acknowledged(self, index: int) -> bool:
+        return index in self.__acknowledged
+
+    def enqueued(self, objs: List[_BatchObject]) -> None:
+        lines: List[str] = []
+        start = 0
+        for i in range(1, len(objs) + 1):
+            if i == len(objs) or objs[i].index != objs[i - 1].index + 1:
+                uuids = " ".join(str(obj.uuid) for obj in objs[start:i])
+                lines.append(f"{_ENQUEUED} {objs[start].index} {uuids}\n")
+                start = i
+        self.__write("".join(lines))
+
+    def acknowledged(self, indices: Iterable[int]) -> None:
+        runs = _consecutive_runs(indices)
+        if len(runs) == 0:
+            return
+        line = " ".join(str(first) if first == last else f"{first}-{last}" for first, last in runs)
+        self.__write(f"{_ACKNOWLEDGED} {line}\n")
+
+    def __write(self, data: str) -> None:
+        with self.__lock:
+            if self.__file is None or len(data) == 0:
+                return
+            self.__file.write(data)
+            self.__file.flush()
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
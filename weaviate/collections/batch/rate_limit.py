@@ -0,0 +1,150 @@
+import math
+from typing import Dict, Iterable, List, Optional, Union
+
+from weaviate.collections.classes.batch import VectorizerRateLimit, _BatchObject
+from weaviate.collections.classes.config import CollectionConfigSimple
+from weaviate.collections.classes.config_vectorizers import Vectorizers
+
+RATE_LIMIT_HEADROOM = 0.9  # use at most this share of the limits of the provider
+BURST_SECONDS = 10  # the buckets hold the budget of this many seconds, a full minute would overshoot sliding windows
+CHARS_PER_TOKEN = 4  # rule of thumb for English text with the tokenizers of OpenAI and Cohere
+
+# the limits of the lowest paid tiers, used if a collection uses one of these vectorizers and no limit is declared
+_PROVIDER_RATE_LIMITS: Dict[str, VectorizerRateLimit] = {
+    Vectorizers.TEXT2VEC_OPENAI: VectorizerRateLimit(
+        requests_per_minute=3000, tokens_per_minute=1_000_000, objects_per_request=2000
+    ),
+    Vectorizers.TEXT2VEC_COHERE: VectorizerRateLimit(
+        requests_per_minute=2000, objects_per_request=96
+    ),
+}
+
+
+def _vectorizers(config: CollectionConfigSimple) -> List[Union[Vectorizers, str]]:
+    if config.vector_config is not None:
+        return [vec_config.vectorizer.vectorizer for vec_config in config.vector_config.values()]
+    return [config.vectorizer] if config.vectorizer is not None else []
+
+
+def _inferred_rate_limit(
+    configs: Iterable[CollectionConfigSimple],
+) -> Optional[VectorizerRateLimit]:
+    """Return the most restrictive known provider limits of the vectorizers of the given collections."""
+    known = [
+        _PROVIDER_RATE_LIMITS[vectorizer]
+        for config in configs
+        for vectorizer in _vectorizers(config)
+        if vectorizer in _PROVIDER_RATE_LIMITS
+    ]
+    if len(known) == 0:
+        return None
+
+    def most_restrictive(values: List[Optional[int]]) -> Optional[int]:
+        defined = [value for value in values if value is not None]
+        return min(defined) if len(defined) > 0 else None
+
+    return VectorizerRateLimit(
+        requests_per_minute=most_restrictive([limit.requests_per_minute for limit in known]),
+        tokens_per_minute=most_restrictive([limit.tokens_per_minute for limit in known]),
+        objects_per_request=most_restrictive([limit.objects_per_request for limit in known]),
+    )
+
+
+def _estimate_tokens(obj: _BatchObject) -> int:
+    chars = 0
+    for value in (obj.properties or {}).values():
+        if isinstance(value, str):
+            chars += len(value)
+        elif isinstance(value, list):
+            chars += sum(len(item) for item in value if isinstance(item, str))
+    return max(1, math.ceil(chars / CHARS_PER_TOKEN))
+
+
+class _TokenBucket:
+    """Refills at `per_minute / 60` per second up to the budget of `BURST_SECONDS`.
+
+    Requests may take more than is left, the bucket then goes negative and the next request waits longer.
+    """
+
+    def __init__(self, per_minute: float, now: float) -> None:
+        self.rate = per_minute / 60
+        self.capacity = max(1.0, self.rate * BURST_SECONDS)
+        self.level = self.capacity
+        self.updated = now
+
+    def __refill(self, now: float) -> None:
+        if now > self.updated:
+            self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def delay(self, amount: float, now: float) -> float:
+        """Return the number of seconds until `amount` can be taken, a request is never larger than the bucket."""
+        self.__refill(now)
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+    def take(self, amount: float, now: float) -> None:
+        self.__refill(now)
+        self.level -= amount
+
+
+class _VectorizerRateLimiter:
+    """Spaces and sizes the requests of a batch so that the vectorizer of Weaviate stays below the provider limits.
+
+    One bucket counts requests to the provider and one counts text tokens. The tokens of the next batch are
+    estimated from the average of the objects that were sent so far.
+    """
+
+    def __init__(self, limit: VectorizerRateLimit, now: float) -> None:
+        self.objects_per_request = limit.objects_per_request
+        self.requests = (
+            _TokenBucket(limit.requests_per_minute * RATE_LIMIT_HEADROOM, now)
+            if limit.requests_per_minute is not None
+            else None
+        )
+        self.tokens = (
+            _TokenBucket(limit.tokens_per_minute * RATE_LIMIT_HEADROOM, now)
+            if limit.tokens_per_minute is not None
+            else None
+        )
+        self.avg_tokens_per_object: Optional[float] = None
+
+    def __provider_requests(self, num_objects: int) -> int:
+        if num_objects == 0:
+            return 0
+        if self.objects_per_request is None:
+            return 1
+        return math.ceil(num_objects / self.objects_per_request)
+
+    def max_objects(self) -> Optional[int]:
+        """Return the largest batch that fits into full buckets, if the limits bound it."""
+        limits: List[int] = []
+        if self.requests is not None and self.objects_per_request is not None:
+            limits.append(math.floor(self.requests.capacity) * self.objects_per_request)
+        if self.tokens is not None and self.avg_tokens_per_object is not None:
+            limits.append(math.floor(self.tokens.capacity / self.avg_tokens_per_object))
+        return max(1, min(limits)) if len(limits) > 0 else None
+
+    def delay(self, num_objects: int, now: float) -> float:
+        """Return the number of seconds to wait before a batch of `num_objects` may be sent."""
+        wait = 0.0
+        if self.requests is not None:
+            wait = self.requests.delay(self.__provider_requests(num_objects), now)
+        if self.tokens is not None and self.avg_tokens_per_object is not None:
+            wait = max(wait, self.tokens.delay(num_objects * self.avg_tokens_per_object, now))
+        return wait
+
+    def record(self, objs: List[_BatchObject], now: float) -> None:
+        vectorized = [obj for obj in objs if obj.vector is None]
+        if len(vectorized) == 0:
+            return
+        num_tokens = sum(_estimate_tokens(obj) for obj in vectorized)
+        if self.requests is not None:
+            self.requests.take(self.__provider_requests(len(vectorized)), now)
+        if self.tokens is not None:
+            self.tokens.take(num_tokens, now)
+        avg = num_tokens / len(vectorized)
+        self.avg_tokens_per_object = (
+            avg
+            if self.avg_tokens_per_object is None
+            else 0.8 * self.avg_tokens_per_object + 0.2 * avg
+        )
@@ -0,0 +1,130 @@
+import random
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+from weaviate.collections.classes.batch import RetryBudget, RetryClass
+
+RetryMatcher = Callable[[str], bool]
+
+
+def _message_matcher(*patterns: str) -> RetryMatcher:
+    """Return a matcher that accepts an error message if every one of the given regular expressions is found in it."""
+    regexes = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    return lambda message: all(regex.search(message) is not None for regex in regexes)
+
+
+@dataclass(frozen=True)
+class _Backoff:
+    """Exponential backoff with jitter.
+
+    Half of the delay is fixed and the other half is random, so that concurrent batches, and clients, that hit the
+    same limit do not retry in lockstep.
+    """
+
+    base_delay: float
+    max_delay: float
+    max_retries: int
+
+    def delay(self, attempt: int) -> float:
+        delay = min(self.max_delay, self.base_delay * 2.0**attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+@dataclass(frozen=True)
+class _RetryClass:
+    """A class of errors that are retried with the same backoff."""
+
+    name: str
+    matches: RetryMatcher
+    backoff: _Backoff
+
+
+_VECTORIZER_BACKOFF = _Backoff(base_delay=1, max_delay=64, max_retries=6)
+
+DEFAULT_RETRY_CLASSES: List[_RetryClass] = [
+    _RetryClass(
+        "cohere_rate_limit",
+        _message_matcher(r"support@cohere\.com", r"rate limit|500 error: internal server error"),
+        _VECTORIZER_BACKOFF,
+    ),
+    _RetryClass(
+        "openai_rate_limit",
+        _message_matcher(
+            r"OpenAI",
+            r"rate limit reached|on tokens per min \(TPM\)|503 error: Service Unavailable\."
+            r"|500 error: The server had an error while processing your request\.",
+        ),
+        _VECTORIZER_BACKOFF,
+    ),
+    _RetryClass(
+        "huggingface_unavailable",
+        _message_matcher(r"failed with status: 503 error"),
+        _VECTORIZER_BACKOFF,
+    ),
+    # the whole request failed, e.g. while Weaviate restarts or sheds load
+    _RetryClass(
+        "grpc_unavailable",
+        _message_matcher(r"StatusCode\.(UNAVAILABLE|RESOURCE_EXHAUSTED)"),
+        _Backoff(base_delay=0.5, max_delay=8, max_retries=3),
+    ),
+]
+
+
+class _RetryClassifier:
+    """Registry of retryable error classes, the first class that matches an error message wins."""
+
+    def __init__(self, retry_classes: Optional[Sequence[_RetryClass]] = None) -> None:
+        self.__classes = list(retry_classes if retry_classes is not None else DEFAULT_RETRY_CLASSES)
+
+    def register(self, retry_class: _RetryClass) -> None:
+        """Add a retry class that takes precedence over the already registered ones."""
+        self.__classes.insert(0, retry_class)
+
+    def classify(self, message: str) -> Optional[_RetryClass]:
+        for retry_class in self.__classes:
+            if retry_class.matches(message):
+                return retry_class
+        return None
+
+
+class _RetryBudget:
+    """Limit retries to a fraction of the successfully sent objects.
+
+    Every successful object deposits `ratio` tokens and every retried object withdraws one, starting from
+    `min_retries` tokens. This way a failure that affects every object, e.g. an exhausted vectorizer quota, fails fast
+    instead of retrying the whole import `max_retries` times.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 1000) -> None:
+        self.__ratio = ratio
+        self.__tokens = float(min_retries)
+
+    def record_success(self, num_objects: int) -> None:
+        self.__tokens += num_objects * self.__ratio
+
+    def try_spend(self) -> bool:
+        if self.__tokens < 1:
+            return False
+        self.__tokens -= 1
+        return True
+
+
+def _retry_classifier(retry_classes: Optional[Sequence[RetryClass]]) -> _RetryClassifier:
+    """Return a classifier with the given retry classes ahead of the default ones, in the given order."""
+    classifier = _RetryClassifier()
+    for retry_class in reversed(retry_classes or []):
+        classifier.register(
+            _RetryClass(
+                retry_class.name,
+                _message_matcher(*retry_class.patterns),
+                _Backoff(retry_class.base_delay, retry_class.max_delay, retry_class.max_retries),
+            )
+        )
+    return classifier
+
+
+def _retry_budget(retry_budget: Optional[RetryBudget]) -> _RetryBudget:
+    if retry_budget is None:
+        return _RetryBudget()
+    return _RetryBudget(retry_budget.ratio, retry_budget.min_retries)
@@ -1,3 +1,5 @@
+import itertools
+import re
 import uuid as uuid_package
 from dataclasses import dataclass, field
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union, cast
@@ -16,7 +18,7 @@ MAX_STORED_RESULTS = 100000
 @dataclass
 class _BatchObject:
     collection: str
-    vector: Optional[VECTORS]
+    vector: Optional[Union[VECTORS, bytes, Dict[str, bytes]]]  # bytes are already packed as float32
     uuid: str
     properties: Optional[Dict[str, WeaviateField]]
     tenant: Optional[str]
@@ -91,6 +93,93 @@ class Shard(BaseModel):
         return hash((self.collection, self.tenant))
 
 
+class Deduplication(BaseModel):
+    """Use this class to skip objects in a batch that were already added, in this or, with a `path`, a previous run.
+
+    Objects are remembered in a Bloom filter by collection, tenant and UUID and, if `content` is enabled, by a hash of
+    their properties, references and vector, so an object with a known UUID but changed content is still sent. A
+    false positive skips an object that is new, its probability is `false_positive_rate` as long as not more than
+    `expected_objects` objects were added. The filter takes about `-1.44 * log2(false_positive_rate)` bits per
+    expected object.
+    """
+
+    expected_objects: int = Field(default=1_000_000, gt=0)
+    false_positive_rate: float = Field(default=1e-6, gt=0, lt=1)
+    content: bool = Field(default=True)
+    path: Optional[str] = Field(default=None)
+
+
+class RetryClass(BaseModel):
+    """Use this class to retry the objects of a batch that failed with a matching error.
+
+    An error matches if every one of the regular expressions in `patterns` is found in its message, ignoring case.
+    Matching objects are sent again up to `max_retries` times. The delay before a retry doubles from `base_delay` up
+    to `max_delay` seconds, half of it is random so that concurrent batches do not retry in lockstep. Retry classes
+    that are given to a batch take precedence over the built-in ones for rate limited vectorizers and unavailable
+    nodes, in the given order.
+    """
+
+    name: str
+    patterns: List[str] = Field(min_length=1)
+    base_delay: float = Field(default=1, gt=0)
+    max_delay: float = Field(default=64, gt=0)
+    max_retries: int = Field(default=6, ge=0)
+
+    @field_validator("patterns")
+    def _validate_patterns(cls, v: List[str]) -> List[str]:
+        for pattern in v:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"invalid regular expression {pattern!r}: {e}") from e
+        return v
+
+
+class RetryBudget(BaseModel):
+    """Use this class to limit the retries of a batch to a share of the objects that were sent successfully.
+
+    A batch may retry `min_retries` objects and `ratio` more objects for every acknowledged one, so that a failure
+    that affects every object, e.g. an exhausted vectorizer quota, fails fast instead of retrying the whole import.
+    """
+
+    ratio: float = Field(default=0.2, ge=0)
+    min_retries: int = Field(default=1000, ge=0)
+
+
+class PIControl(BaseModel):
+    """Use this class to let dynamic batching size its requests with a proportional-integral controller.
+
+    The controller aims for a batch queue in Weaviate of `target_queue_seconds` of work and shrinks the batches when
+    requests take longer than `target_latency` seconds. `kp` and `ki` are the proportional and integral gains, higher
+    values react faster but may overshoot. Batches never get smaller than `min_objects` and no new batches are sent
+    while the queue holds more than `pause_queue_seconds` of work. Until Weaviate reports a processing rate, the batch
+    size grows by `startup_increase` objects per update.
+    """
+
+    target_queue_seconds: float = Field(default=2, gt=0)
+    target_latency: float = Field(default=10, gt=0)
+    kp: float = Field(default=0.5, ge=0)
+    ki: float = Field(default=1, ge=0)
+    min_objects: int = Field(default=10, gt=0)
+    pause_queue_seconds: float = Field(default=20, gt=0)
+    startup_increase: int = Field(default=50, gt=0)
+
+
+class VectorizerRateLimit(BaseModel):
+    """Use this class to declare the rate limits of the model provider behind the vectorizer of a collection.
+
+    Dynamic batching then spaces and sizes its requests so that the vectorizer stays just below these limits instead of
+    running into them. `objects_per_request` is the number of objects that the vectorizer module of Weaviate sends to
+    the provider in one request, if not given every request to Weaviate counts as one request to the provider. The
+    text tokens of an object are estimated from the length of its text properties, objects that come with their own
+    vector are not counted.
+    """
+
+    requests_per_minute: Optional[int] = Field(default=None, gt=0)
+    tokens_per_minute: Optional[int] = Field(default=None, gt=0)
+    objects_per_request: Optional[int] = Field(default=None, gt=0)
+
+
 class BatchReference(BaseModel):
     """
     A reference between two objects in Weaviate.
@@ -163,6 +252,7 @@ class BatchObjectReturn:
     NOTE:
         Due to concerns over memory usage, this object will only ever store the last `MAX_STORED_RESULTS` uuids in the `uuids` dictionary and `MAX_STORED_RESULTS` in the `all_responses` list.
         If more than `MAX_STORED_RESULTS` uuids are added to the dictionary, the oldest uuids will be removed. If the number of objects inserted in this batch exceeds `MAX_STORED_RESULTS`, the `all_responses` list will only contain the last `MAX_STORED_RESULTS` objects.
+        The `errors` dictionary is not limited, every failed object is kept unless the batch streams its failures to an `on_error` callback or a `failed_objects_path`.
         The keys of the `errors` and `uuids` dictionaries will always be equivalent to the `original_index` of the objects as you added them to the batching loop but won't necessarily be the same as the indices in the `all_responses` list because of this.
 
     Attributes:
@@ -195,6 +285,8 @@ class BatchObjectReturn:
         WARNING: This only stores the last `MAX_STORED_RESULTS` objects. If more than `MAX_STORED_RESULTS` objects are added to the batch, the oldest objects will be removed from this list.
         """
         _Warnings.batch_results_objects_all_responses_attribute()
+        if len(self._all_responses) > MAX_STORED_RESULTS:
+            self._all_responses = self._all_responses[-MAX_STORED_RESULTS:]
         return self._all_responses
 
     def __add__(self, other: "BatchObjectReturn") -> "BatchObjectReturn":
@@ -204,12 +296,12 @@ class BatchObjectReturn:
         self.uuids.update(other.uuids)
         self.has_errors = self.has_errors or other.has_errors
 
-        if len(self.uuids) >= MAX_STORED_RESULTS:
-            old_max = max(self.uuids.keys())
-            old_min = min(self.uuids.keys())
-            for k in range(old_min, old_max - MAX_STORED_RESULTS + 1):
+        # evict in insertion order so that the cost depends on the size of `other` and not on MAX_STORED_RESULTS
+        if len(self.uuids) > MAX_STORED_RESULTS:
+            for k in list(itertools.islice(self.uuids, len(self.uuids) - MAX_STORED_RESULTS)):
                 del self.uuids[k]
-        if len(self._all_responses) > MAX_STORED_RESULTS:
+        # the deprecated list is trimmed when it holds twice the results, reading it only returns the newest ones
+        if len(self._all_responses) > 2 * MAX_STORED_RESULTS:
             self._all_responses = self._all_responses[-MAX_STORED_RESULTS:]
 
         return self
@@ -236,8 +328,9 @@ class BatchReferenceReturn:
 
     def __add__(self, other: "BatchReferenceReturn") -> "BatchReferenceReturn":
         self.elapsed_seconds += other.elapsed_seconds
-        prev_max = max(self.errors.keys()) if len(self.errors) > 0 else -1
-        for key, value in other.errors.items():
+        # the keys are added in increasing order, so the last key is the largest one
+        prev_max = next(reversed(self.errors)) if len(self.errors) > 0 else -1
+        for key, value in sorted(other.errors.items()):
             self.errors[prev_max + key + 1] = value
         self.has_errors = self.has_errors or other.has_errors
         return self
@@ -261,6 +354,43 @@ class BatchResult:
         self.refs: BatchReferenceReturn = BatchReferenceReturn()
 
 
+@dataclass
+class BatchJournalState:
+    """This class contains what a batch journal recorded about a previous, possibly interrupted, import.
+
+    Attributes:
+        `resume_offset`
+            All objects with a smaller index were acknowledged by Weaviate, so the source can be read again from here.
+        `unacknowledged`
+            The objects that were added to the batch but never acknowledged, by index. They either failed or were still
+            queued or in flight when the import stopped.
+        `num_acknowledged`
+            The number of objects that were acknowledged by Weaviate.
+    """
+
+    resume_offset: int = 0
+    unacknowledged: Dict[int, uuid_package.UUID] = field(default_factory=dict)
+    num_acknowledged: int = 0
+
+
+@dataclass
+class VectorIndexingProgress:
+    """This class contains the progress of the vector indexing that `wait_for_vector_indexing` is waiting for.
+
+    Attributes:
+        `vector_queue_size`
+            The number of vectors that are still queued for indexing in the awaited shards, summed over all nodes.
+        `shards_not_ready`
+            The number of awaited shards, counted once per node holding a replica, that are not indexed yet.
+        `elapsed_seconds`
+            The time since the wait started.
+    """
+
+    vector_queue_size: int
+    shards_not_ready: int
+    elapsed_seconds: float
+
+
 @dataclass
 class DeleteManyObject:
     """This class contains the objects of a `delete_many` operation."""
@@ -2,14 +2,19 @@ import datetime
 import sys
 import uuid as uuid_package
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import (
     Any,
+    Callable,
     Dict,
     Generic,
+    Iterator,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -46,9 +51,10 @@ from weaviate.collections.classes.types import (
     WeaviateProperties,
     _WeaviateInput,
 )
+from weaviate.collections.queries.byteops import _import_numpy
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.util import _to_beacons
-from weaviate.types import INCLUDE_VECTOR, UUID, UUIDS
+from weaviate.types import INCLUDE_VECTOR, RETURN_FORMAT, UUID, UUIDS, VECTOR_FORMAT
 
 from weaviate.proto.v1 import search_get_pb2
 
@@ -103,6 +109,97 @@ class Object(Generic[P, R], _Object[P, R, MetadataReturn]):
     """A single Weaviate object returned by a query within the `.query` namespace of a collection."""
 
 
+class _LazyProperties(Mapping[str, Any]):
+    """The properties of an object, each decoded from its protobuf value the first time it is accessed."""
+
+    def __init__(self, fields: Mapping[str, Any], decode: Callable[[Any], Any]) -> None:
+        self.__fields = fields
+        self.__decode = decode
+        self.__decoded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__decoded:
+            # accessing a missing key of a protobuf map would insert it
+            if key not in self.__fields:
+                raise KeyError(key)
+            self.__decoded[key] = self.__decode(self.__fields[key])
+        return self.__decoded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__fields)
+
+    def __len__(self) -> int:
+        return len(self.__fields)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return dict, (dict(self),)
+
+
+class _ObjectDecoder(NamedTuple):
+    """Decodes the fields of an object from the protobuf results of a query with the options of the query."""
+
+    uuid: Callable[[search_get_pb2.MetadataResult], uuid_package.UUID]
+    metadata: Callable[[search_get_pb2.MetadataResult], MetadataReturn]
+    properties: Callable[[search_get_pb2.PropertiesResult], Any]
+    references: Callable[[search_get_pb2.PropertiesResult], Any]
+    vector: Callable[[search_get_pb2.MetadataResult], Dict[str, List[float]]]
+
+
+class _LazyObject(Object[P, R]):
+    """An `Object` that keeps the protobuf results of the query and decodes each field the first time it is accessed.
+
+    The properties are decoded one by one, reading a single property does not decode the others.
+    """
+
+    def __init__(
+        self,
+        props: search_get_pb2.PropertiesResult,
+        meta: search_get_pb2.MetadataResult,
+        decoder: _ObjectDecoder,
+    ) -> None:
+        self.__props = props
+        self.__meta = meta
+        self.__decoder = decoder
+
+    @cached_property
+    def uuid(self) -> uuid_package.UUID:  # type: ignore[override]
+        return self.__decoder.uuid(self.__meta)
+
+    @cached_property
+    def metadata(self) -> MetadataReturn:  # type: ignore[override]
+        return self.__decoder.metadata(self.__meta)
+
+    @cached_property
+    def properties(self) -> P:  # type: ignore[override]
+        return cast(P, self.__decoder.properties(self.__props))
+
+    @cached_property
+    def references(self) -> R:  # type: ignore[override]
+        return cast(R, self.__decoder.references(self.__props))
+
+    @cached_property
+    def vector(self) -> Dict[str, List[float]]:  # type: ignore[override]
+        return self.__decoder.vector(self.__meta)
+
+    @cached_property
+    def collection(self) -> str:  # type: ignore[override]
+        return self.__props.target_collection
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # pickled and copied as a decoded object, the decoder holds functions of the query
+        return Object, (
+            self.uuid,
+            self.metadata,
+            self.properties,
+            self.references,
+            self.vector,
+            self.collection,
+        )
+
+
 @dataclass
 class MetadataSingleObjectReturn:
     """Metadata of an object returned by the `fetch_object_by_id` query."""
@@ -124,6 +221,17 @@ class GroupByObject(Generic[P, R], _Object[P, R, GroupByMetadataReturn]):
     belongs_to_group: str
 
 
+def _stack_vectors(objects: Sequence[_Object[Any, Any, Any]], name: str) -> Any:
+    np = _import_numpy()
+    if any(name not in obj.vector for obj in objects):
+        raise WeaviateInvalidInputError(
+            f"Not every object has a vector named '{name}', use `include_vector` to return it"
+        )
+    if len(objects) == 0:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.array([obj.vector[name] for obj in objects], dtype=np.float32)
+
+
 @dataclass
 class GenerativeObject(Generic[P, R], Object[P, R]):
     """A single Weaviate object returned by a query within the `generate` namespace of a collection."""
@@ -138,6 +246,17 @@ class GenerativeReturn(Generic[P, R]):
     objects: List[GenerativeObject[P, R]]
     generated: Optional[str]
 
+    def vectors(self, name: str = "default") -> Any:
+        """Return the vectors with the given name of all objects as a float32 `numpy` matrix with one row per object.
+
+        With `vector_format="numpy"` the matrix is built with a single copy of the returned vectors. Requires `numpy`.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `numpy` is not installed or an object was returned without the vector.
+        """
+        return _stack_vectors(self.objects, name)
+
 
 @dataclass
 class Group(Generic[P, R]):
@@ -181,6 +300,17 @@ class QueryReturn(Generic[P, R]):
 
     objects: List[Object[P, R]]
 
+    def vectors(self, name: str = "default") -> Any:
+        """Return the vectors with the given name of all objects as a float32 `numpy` matrix with one row per object.
+
+        With `vector_format="numpy"` the matrix is built with a single copy of the returned vectors. Requires `numpy`.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `numpy` is not installed or an object was returned without the vector.
+        """
+        return _stack_vectors(self.objects, name)
+
 
 _GQLEntryReturnType: TypeAlias = Dict[str, List[Dict[str, Any]]]
 
@@ -497,6 +627,11 @@ class _QueryOptions:
     include_references: bool
     include_vector: bool
     is_group_by: bool
+    # the format of the returned vectors, if None the default of the collection
+    vector_format: Optional[VECTOR_FORMAT] = None
+    # the names of the vectors to decode, if None all returned vectors
+    vector_names: Optional[Set[str]] = None
+    return_format: RETURN_FORMAT = "objects"
 
     @classmethod
     def from_input(
@@ -508,6 +643,8 @@ class _QueryOptions:
         query_references: Optional[ReturnReferences[Any]],
         rerank: Optional[Rerank] = None,
         group_by: Optional[GroupBy] = None,
+        vector_format: Optional[VECTOR_FORMAT] = None,
+        return_format: RETURN_FORMAT = "objects",
     ) -> "_QueryOptions":
         return cls(
             include_metadata=return_metadata is not None or rerank is not None,
@@ -517,6 +654,13 @@ class _QueryOptions:
             include_references=collection_references is not None or query_references is not None,
             include_vector=include_vector if isinstance(include_vector, bool) else True,
             is_group_by=group_by is not None,
+            vector_format=vector_format,
+            vector_names=(
+                {include_vector}
+                if isinstance(include_vector, str)
+                else set(include_vector) if isinstance(include_vector, list) else None
+            ),
+            return_format=return_format,
         )
 
 
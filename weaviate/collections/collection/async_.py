@@ -5,6 +5,7 @@ from typing import Generic, List, Literal, Optional, Type, Union, overload
 from weaviate.collections.classes.cluster import Shard
 from weaviate.collections.aggregate import _AggregateCollectionAsync
 from weaviate.collections.backups import _CollectionBackupAsync
+from weaviate.collections.batch.collection import _BatchCollectionWrapperAsync
 from weaviate.collections.cluster import _ClusterAsync
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.grpc import METADATA, PROPERTIES, REFERENCES
@@ -21,7 +22,7 @@ from weaviate.collections.generate import _GenerateCollectionAsync
 from weaviate.collections.iterator import _IteratorInputs, _ObjectAIterator
 from weaviate.collections.tenants import _TenantsAsync
 from weaviate.connect import ConnectionV4
-from weaviate.types import UUID
+from weaviate.types import UUID, VECTOR_FORMAT
 
 from .base import _CollectionBase
 
@@ -63,6 +64,7 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Propertie
         tenant: Optional[str] = None,
         properties: Optional[Type[Properties]] = None,
         references: Optional[Type[References]] = None,
+        vector_format: VECTOR_FORMAT = "list",
     ) -> None:
         super().__init__(
             connection,
@@ -72,6 +74,7 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Propertie
             tenant,
             properties,
             references,
+            vector_format,
         )
 
         self.__cluster = _ClusterAsync(connection)
@@ -80,6 +83,15 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Propertie
         """This namespace includes all the querying methods available to you when using Weaviate's standard aggregation capabilities."""
         self.backup = _CollectionBackupAsync(connection, name)
         """This namespace includes all the backup methods available to you when backing up a collection in Weaviate."""
+        self.batch = _BatchCollectionWrapperAsync[Properties](
+            connection,
+            consistency_level,
+            name,
+            tenant,
+            self._config,
+            properties,
+        )
+        """This namespace contains all the functionality to upload data in batches to Weaviate for this specific collection."""
         self.config = self._config
         """This namespace includes all the CRUD methods available to you when modifying the configuration of the collection in Weaviate."""
         self.data = _DataCollectionAsync[Properties](
@@ -94,6 +106,7 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Propertie
             properties,
             references,
             validate_arguments,
+            vector_format,
         )
         """This namespace includes all the querying methods available to you when using Weaviate's generative capabilities."""
         self.query = self._query
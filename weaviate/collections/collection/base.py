@@ -8,6 +8,7 @@ from weaviate.collections.classes.types import Properties
 from weaviate.collections.config import _ConfigCollectionAsync
 from weaviate.collections.query import _QueryCollectionAsync
 from weaviate.connect import ConnectionV4
+from weaviate.types import VECTOR_FORMAT
 from weaviate.util import _capitalize_first_letter
 from weaviate.validator import _validate_input, _ValidateArgument
 
@@ -44,6 +45,7 @@ class _CollectionBase(Generic[Properties, References]):
         tenant: Optional[str] = None,
         properties: Optional[Type[Properties]] = None,
         references: Optional[Type[References]] = None,
+        vector_format: VECTOR_FORMAT = "list",
     ) -> None:
         self._connection = connection
         self.name = _capitalize_first_letter(name)
@@ -58,12 +60,14 @@ class _CollectionBase(Generic[Properties, References]):
             properties,
             references,
             validate_arguments,
+            vector_format,
         )
 
         self.__tenant = tenant
         self.__consistency_level = consistency_level
         self.__properties = properties
         self.__references = references
+        self.__vector_format = vector_format
 
     def __init_subclass__(cls, **kwargs) -> None:
         super().__init_subclass__(**kwargs)
@@ -78,6 +82,7 @@ class _CollectionBase(Generic[Properties, References]):
             tenant=tenant.name if isinstance(tenant, Tenant) else tenant,
             properties=cast(_CollectionBase, self).__properties,
             references=cast(_CollectionBase, self).__references,
+            vector_format=cast(_CollectionBase, self).__vector_format,
         )
         cls.with_consistency_level = (  # pyright: ignore
             lambda self, consistency_level: _with_consistency_level(
@@ -89,6 +94,7 @@ class _CollectionBase(Generic[Properties, References]):
                 tenant=cast(_CollectionBase, self).tenant,
                 properties=cast(_CollectionBase, self).__properties,
                 references=cast(_CollectionBase, self).__references,
+                vector_format=cast(_CollectionBase, self).__vector_format,
             )
         )
 
@@ -14,7 +14,7 @@ from weaviate.collections.cluster import _ClusterAsync
 from weaviate.collections.config import _ConfigCollectionAsync
 from weaviate.collections.query import _QueryCollectionAsync
 from weaviate.collections.classes.types import Properties, TProperties
-from weaviate.types import UUID
+from weaviate.types import UUID, VECTOR_FORMAT
 
 Collection = TypeVar("Collection", bound="_CollectionBase")
 
@@ -35,6 +35,7 @@ class _CollectionBase(Generic[Properties, References]):
         tenant: Optional[str] = None,
         properties: Optional[Type[Properties]] = None,
         references: Optional[Type[References]] = None,
+        vector_format: VECTOR_FORMAT = "list",
     ) -> None: ...
     def with_tenant(self: Collection, tenant: Optional[Union[str, Tenant]] = None) -> Collection:
         """Use this method to return a collection object specific to a single tenant.
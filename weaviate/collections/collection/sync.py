@@ -24,7 +24,7 @@ from weaviate.collections.iterator import _IteratorInputs, _ObjectIterator
 from weaviate.collections.query import _QueryCollection
 from weaviate.collections.tenants import _Tenants
 from weaviate.connect import ConnectionV4
-from weaviate.types import UUID
+from weaviate.types import UUID, VECTOR_FORMAT
 
 from .base import _CollectionBase
 
@@ -66,6 +66,7 @@ class Collection(Generic[Properties, References], _CollectionBase[Properties, Re
         tenant: Optional[str] = None,
         properties: Optional[Type[Properties]] = None,
         references: Optional[Type[References]] = None,
+        vector_format: VECTOR_FORMAT = "list",
     ) -> None:
         super().__init__(
             connection,
@@ -75,6 +76,7 @@ class Collection(Generic[Properties, References], _CollectionBase[Properties, Re
             tenant,
             properties,
             references,
+            vector_format,
         )
 
         self.__cluster = _Cluster(connection)
@@ -103,6 +105,7 @@ class Collection(Generic[Properties, References], _CollectionBase[Properties, Re
             name,
             tenant,
             config,
+            properties,
         )
         """This namespace contains all the functionality to upload data in batches to Weaviate for this specific collection."""
         self.config = config
@@ -119,6 +122,7 @@ class Collection(Generic[Properties, References], _CollectionBase[Properties, Re
             properties=properties,
             references=references,
             validate_arguments=validate_arguments,
+            vector_format=vector_format,
         )
         """This namespace includes all the querying methods available to you when using Weaviate's generative capabilities."""
         self.query = _QueryCollection[Properties, References](
@@ -129,6 +133,7 @@ class Collection(Generic[Properties, References], _CollectionBase[Properties, Re
             properties=properties,
             references=references,
             validate_arguments=validate_arguments,
+            vector_format=vector_format,
         )
         """This namespace includes all the querying methods available to you when using Weaviate's standard query capabilities."""
         self.tenants = _Tenants(
@@ -24,6 +24,8 @@ from weaviate.collections.classes.types import (
 from weaviate.collections.collection import Collection
 from weaviate.collections.collections.async_ import _CollectionsAsync
 from weaviate.event_loop import _EventLoop
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.types import VECTOR_FORMAT
 from weaviate.util import _capitalize_first_letter
 from weaviate.validator import _validate_input, _ValidateArgument
 
@@ -135,6 +137,7 @@ class _Collections:
         data_model_properties: Optional[Type[Properties]] = None,
         data_model_references: Optional[Type[References]] = None,
         skip_argument_validation: bool = False,
+        vector_format: VECTOR_FORMAT = "list",
     ) -> Collection[Properties, References]:
         """Use this method to return a collection object to be used when interacting with your Weaviate collection.
 
@@ -153,6 +156,10 @@ class _Collections:
                 If you do not provide a generic, the methods in `.query` will return properties of referenced objects as `Dict[str, Any]`.
             `skip_argument_validation`
                 If arguments to functions such as near_vector should be validated. Disable this if you need to squeeze out some extra performance.
+            `vector_format`
+                The default format of the vectors returned by queries, `"list"` for lists of floats or `"numpy"` for
+                float32 `numpy` arrays that share the memory of the response. Queries can override it with their
+                `vector_format` argument.
         Raises:
             `weaviate.WeaviateInvalidInputError`
                 If the input parameters are invalid.
@@ -163,6 +170,10 @@ class _Collections:
             _validate_input([_ValidateArgument(expected=[str], name="name", value=name)])
             _check_properties_generic(data_model_properties)
             _check_references_generic(data_model_references)
+            if vector_format not in ("list", "numpy"):
+                raise WeaviateInvalidInputError(
+                    f"vector_format must be 'list' or 'numpy', but is {vector_format}"
+                )
         name = _capitalize_first_letter(name)
         return Collection[Properties, References](
             self.__collections._connection,
@@ -170,6 +181,7 @@ class _Collections:
             properties=data_model_properties,
             references=data_model_references,
             validate_arguments=not skip_argument_validation,
+            vector_format=vector_format,
         )
 
     def delete(self, name: Union[str, List[str]]) -> None:
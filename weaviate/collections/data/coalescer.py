@@ -0,0 +1,78 @@
+import asyncio
+import dataclasses
+import uuid as uuid_package
+from typing import List, Optional, Set, Tuple, Union
+
+from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
+from weaviate.collections.classes.batch import _BatchObject
+from weaviate.exceptions import WeaviateBatchError
+
+# defaults of `with_coalescing`
+COALESCING_MAX_DELAY = 0.005
+COALESCING_MAX_OBJECTS = 100
+
+
+class _InsertCoalescer:
+    """Gathers concurrent single-object inserts and sends them together in one gRPC batch request.
+
+    An object waits at most `max_delay` seconds for others to join it, a batch is sent right away once it holds
+    `max_objects` objects. Every caller receives the UUID or the error of its own object. All inserts must be made from
+    the same event loop, which is the case for the sync client as it runs every request in its own event loop.
+    """
+
+    def __init__(
+        self,
+        batch_grpc: _BatchGRPC,
+        max_delay: float,
+        max_objects: int,
+        timeout: Union[int, float],
+    ) -> None:
+        self.__batch_grpc = batch_grpc
+        self.__max_delay = max_delay
+        self.__max_objects = max_objects
+        self.__timeout = timeout
+        self.__pending: List[Tuple[_BatchObject, "asyncio.Future[uuid_package.UUID]"]] = []
+        self.__timer: Optional[asyncio.TimerHandle] = None
+        # keeps references to the running sends, the event loop only holds weak ones
+        self.__sends: Set["asyncio.Task[None]"] = set()
+
+    async def insert(self, obj: _BatchObject) -> uuid_package.UUID:
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[uuid_package.UUID]" = loop.create_future()
+        self.__pending.append((obj, future))
+        if len(self.__pending) >= self.__max_objects:
+            self.__flush()
+        elif self.__timer is None:
+            self.__timer = loop.call_later(self.__max_delay, self.__flush)
+        return await future
+
+    def __flush(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        pending, self.__pending = self.__pending, []
+        task = asyncio.get_running_loop().create_task(self.__send(pending))
+        self.__sends.add(task)
+        task.add_done_callback(self.__sends.discard)
+
+    async def __send(
+        self, pending: List[Tuple[_BatchObject, "asyncio.Future[uuid_package.UUID]"]]
+    ) -> None:
+        objs = [dataclasses.replace(obj, index=idx) for idx, (obj, _) in enumerate(pending)]
+        try:
+            res = await self.__batch_grpc.objects(
+                objs, timeout=self.__timeout, raise_if_all_failed=False
+            )
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for idx, (_, future) in enumerate(pending):
+            if future.done():  # the caller was cancelled
+                continue
+            if idx in res.errors:
+                future.set_exception(WeaviateBatchError(res.errors[idx].message))
+            else:
+                future.set_result(res.uuids[idx])
@@ -27,6 +27,7 @@ from weaviate.collections.classes.batch import (
 )
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.data import DataObject, DataReferences
+from weaviate.collections.config.config import _ConfigCollectionAsync
 from weaviate.collections.classes.filters import _Filters
 from weaviate.collections.classes.internal import (
     _Reference,
@@ -47,13 +48,21 @@ from weaviate.collections.classes.types import (
 from weaviate.connect import ConnectionV4
 from weaviate.connect.v4 import _ExpectedStatusCodes
 from weaviate.logger import logger
-from weaviate.types import BEACON, UUID, VECTORS
+from weaviate.types import BEACON, UUID, VECTOR_MATRICES, VECTORS
 from weaviate.util import _datetime_to_string, _get_vector_v4
 from weaviate.validator import _validate_input, _ValidateArgument
 
+from weaviate.collections.batch.arrow import _ArrowConverter, _arrow_record_batches
+from weaviate.collections.batch.base import _create_batch_objects_from_arrays
+from weaviate.collections.batch.collection import _BatchCollectionWrapperAsync
 from weaviate.collections.batch.grpc_batch_delete import _BatchDeleteGRPC
 from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
 from weaviate.collections.batch.rest import _BatchREST
+from weaviate.collections.data.coalescer import (
+    COALESCING_MAX_DELAY,
+    COALESCING_MAX_OBJECTS,
+    _InsertCoalescer,
+)
 from weaviate.exceptions import WeaviateInvalidInputError
 
 
@@ -266,9 +275,11 @@ class _DataCollectionAsync(Generic[Properties], _Data):
         tenant: Optional[str],
         validate_arguments: bool,
         type_: Optional[Type[Properties]] = None,
+        coalescer: Optional[_InsertCoalescer] = None,
     ):
         super().__init__(connection, name, consistency_level, tenant, validate_arguments)
         self.__type = type_
+        self._coalescer = coalescer
 
     def with_data_model(self, data_model: Type[TProperties]) -> "_DataCollectionAsync[TProperties]":
         _check_properties_generic(data_model)
@@ -279,6 +290,50 @@ class _DataCollectionAsync(Generic[Properties], _Data):
             self._tenant,
             self._validate_arguments,
             data_model,
+            self._coalescer,
+        )
+
+    def _create_coalescer(self, max_delay: float, max_objects: int) -> _InsertCoalescer:
+        if max_delay < 0:
+            raise WeaviateInvalidInputError(f"max_delay must not be negative, but is {max_delay}")
+        if max_objects < 1:
+            raise WeaviateInvalidInputError(f"max_objects must be at least 1, but is {max_objects}")
+        return _InsertCoalescer(
+            _BatchGRPC(self._connection, self._consistency_level),
+            max_delay,
+            max_objects,
+            self._connection.timeout_config.insert,
+        )
+
+    def with_coalescing(
+        self, max_delay: float = COALESCING_MAX_DELAY, max_objects: int = COALESCING_MAX_OBJECTS
+    ) -> "_DataCollectionAsync[Properties]":
+        """Use this method to return a data object whose `insert` calls are coalesced into gRPC batch requests.
+
+        Concurrent `insert` calls, e.g. of the requests that an API server handles at the same time, are gathered for
+        up to `max_delay` seconds and sent together in one batch request. Every call still returns the UUID of its own
+        object or raises its own error. Unlike an uncoalesced `insert`, an object with the UUID of an existing one
+        replaces it instead of raising an error, like in batching.
+
+        Arguments:
+            `max_delay`
+                The maximum time in seconds that an object waits for others before it is sent, by default 0.005.
+            `max_objects`
+                The maximum number of objects sent in one request. A request is sent right away once it is full, by
+                default 100.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `max_delay` is negative or `max_objects` is smaller than 1.
+        """
+        return type(self)(
+            self._connection,
+            self.name,
+            self._consistency_level,
+            self._tenant,
+            self._validate_arguments,
+            self.__type,
+            self._create_coalescer(max_delay, max_objects),
         )
 
     def __parse_vector(self, obj: Dict[str, Any], vector: VECTORS) -> Dict[str, Any]:
@@ -316,6 +371,8 @@ class _DataCollectionAsync(Generic[Properties], _Data):
         Raises:
             `weaviate.exceptions.UnexpectedStatusCodeError`:
                 If any unexpected error occurs during the insert operation, for example the given UUID already exists.
+            `weaviate.exceptions.WeaviateBatchError`:
+                If the insert is coalesced, see `with_coalescing`, and the object was not inserted.
         """
         if self._validate_arguments:
             _validate_input(
@@ -327,6 +384,23 @@ class _DataCollectionAsync(Generic[Properties], _Data):
                     ),
                 ],
             )
+        if self._coalescer is not None:
+            # the gRPC batch only packs lists, other vector types are converted like for the REST insert
+            if isinstance(vector, dict):
+                vector = {key: _get_vector_v4(val) for key, val in vector.items()}
+            elif vector is not None:
+                vector = _get_vector_v4(vector)
+            return await self._coalescer.insert(
+                _BatchObject(
+                    collection=self.name,
+                    vector=vector,
+                    uuid=str(uuid if uuid is not None else uuid_package.uuid4()),
+                    properties=cast(dict, properties),
+                    tenant=self._tenant,
+                    references=references,
+                    index=0,
+                )
+            )
         props = self._serialize_props(properties) if properties is not None else {}
         refs = self._serialize_refs(references) if references is not None else {}
         weaviate_obj: Dict[str, Any] = {
@@ -342,14 +416,24 @@ class _DataCollectionAsync(Generic[Properties], _Data):
     async def insert_many(
         self,
         objects: Sequence[Union[Properties, DataObject[Properties, Optional[ReferenceInputs]]]],
+        chunk_size: Optional[int] = 1000,
+        max_concurrency: int = 4,
     ) -> BatchObjectReturn:
         """Insert multiple objects into the collection.
 
+        The objects are split into chunks that are sent concurrently. The results of all chunks are merged, the keys of
+        `uuids` and `errors` are the indices of the objects in `objects`.
+
         Arguments:
             `objects`
                 The objects to insert. This can be either a list of `Properties` or `DataObject[Properties, ReferenceInputs]`
                     If you didn't set `data_model` then `Properties` will be `Data[str, Any]` in which case you can insert simple dictionaries here.
                         If you want to insert references, vectors, or UUIDs alongside your properties, you will have to use `DataObject` instead.
+            `chunk_size`
+                The maximum number of objects sent in one request. If None, the objects are only split into several
+                requests when they exceed the maximum gRPC message size. By default 1000.
+            `max_concurrency`
+                The maximum number of requests that are sent to Weaviate at the same time, by default 4.
 
         Raises:
             `weaviate.exceptions.WeaviateGRPCBatchError`:
@@ -383,7 +467,116 @@ class _DataCollectionAsync(Generic[Properties], _Data):
             )
             for idx, obj in enumerate(objects)
         ]
-        res = await self._batch_grpc.objects(objs, timeout=self._connection.timeout_config.insert)
+        return await self.__insert_batch_objects(objs, chunk_size, max_concurrency)
+
+    async def insert_many_arrays(
+        self,
+        properties: Optional[Sequence[Properties]] = None,
+        vectors: Optional[VECTOR_MATRICES] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+        chunk_size: Optional[int] = 1000,
+        max_concurrency: int = 4,
+    ) -> BatchObjectReturn:
+        """Insert one object per row of the given arrays into the collection.
+
+        This is the fastest way to insert objects with vectors from `numpy`, as the vectors are converted to float32
+        once for the whole matrix instead of to a list per object.
+
+        Arguments:
+            `properties`
+                The data properties of the objects, one dictionary per object.
+            `vectors`
+                The embeddings of the objects as a 2D matrix with one row per object, e.g. a `numpy.ndarray` of shape
+                (number of objects, dimensions). For named vectors, provide a dictionary with one matrix per vector name.
+                Requires `numpy`.
+            `uuids`
+                The UUIDs of the objects. If None, UUIDv4s will be generated, by default None.
+            `chunk_size`
+                The maximum number of objects sent in one request. If None, the objects are only split into several
+                requests when they exceed the maximum gRPC message size. By default 1000.
+            `max_concurrency`
+                The maximum number of requests that are sent to Weaviate at the same time, by default 4.
+
+        Raises:
+            `weaviate.exceptions.WeaviateBatchValidationError`:
+                If the arrays are of different lengths or a UUID is invalid.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If the vectors cannot be converted to a float32 matrix.
+            `weaviate.exceptions.WeaviateGRPCBatchError`:
+                If any unexpected error occurs during the batch operation.
+            `weaviate.exceptions.WeaviateInsertManyAllFailedError`:
+                If every object in the batch fails to be inserted. The exception message contains details about the failure.
+        """
+        objs, _ = _create_batch_objects_from_arrays(
+            self.name, cast(Optional[Sequence[dict]], properties), vectors, uuids, self._tenant, 0
+        )
+        return await self.__insert_batch_objects(objs, chunk_size, max_concurrency)
+
+    async def insert_arrow(
+        self,
+        data: Any,
+        uuid_column: Optional[str] = None,
+        vector_column: Optional[Union[str, Dict[str, str]]] = None,
+    ) -> BatchObjectReturn:
+        """Insert the rows of Apache Arrow data into the collection, one object per row.
+
+        The record batches are streamed through dynamic batching, so that data much larger than the available memory,
+        e.g. `pyarrow.parquet.ParquetFile(path).iter_batches()`, can be inserted. All columns apart from the uuid and
+        vector columns are inserted as properties, null values are skipped. Requires `pyarrow`.
+
+        Arguments:
+            `data`
+                A `pyarrow.Table`, a `pyarrow.RecordBatch` or an iterable of record batches like a `pyarrow.RecordBatchReader`.
+            `uuid_column`
+                The name of the column that contains the UUIDs of the objects as strings or 16 byte binaries. If None,
+                UUIDv4s will be generated, by default None.
+            `vector_column`
+                The name of the column that contains the vectors of the objects as fixed size lists. For named vectors,
+                provide a dictionary that maps vector names to column names. By default None.
+
+        Returns:
+            `BatchObjectReturn`
+                The results of the insertion. Like for batching, only the last `MAX_STORED_RESULTS` results are kept.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `pyarrow` is not installed, a column does not exist or a vector column is not a fixed size list.
+            `weaviate.exceptions.WeaviateBatchValidationError`:
+                If a UUID is invalid.
+        """
+        converter = _ArrowConverter(uuid_column, vector_column)
+        batch_wrapper = _BatchCollectionWrapperAsync[Properties](
+            self._connection,
+            self._consistency_level,
+            self.name,
+            self._tenant,
+            _ConfigCollectionAsync(self._connection, self.name, self._tenant),
+        )
+        async with batch_wrapper.dynamic() as batch:
+            for record_batch in _arrow_record_batches(data):
+                properties, vectors, uuids = converter.convert(record_batch)
+                await batch.add_objects(
+                    properties=cast(Optional[Sequence[Properties]], properties),
+                    vectors=vectors,
+                    uuids=uuids,
+                )
+        return batch_wrapper.results.objs
+
+    async def __insert_batch_objects(
+        self, objs: List[_BatchObject], chunk_size: Optional[int], max_concurrency: int
+    ) -> BatchObjectReturn:
+        if chunk_size is not None and chunk_size < 1:
+            raise WeaviateInvalidInputError(f"chunk_size must be at least 1, but is {chunk_size}")
+        if max_concurrency < 1:
+            raise WeaviateInvalidInputError(
+                f"max_concurrency must be at least 1, but is {max_concurrency}"
+            )
+        res = await self._batch_grpc.objects(
+            objs,
+            timeout=self._connection.timeout_config.insert,
+            max_objects_per_request=chunk_size,
+            max_concurrency=max_concurrency,
+        )
         if (n_obj_errs := len(res.errors)) > 0:
             logger.error(
                 {
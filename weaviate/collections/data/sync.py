@@ -16,4 +16,5 @@ class _DataCollection(Generic[Properties], _DataCollectionAsync[Properties]):
             self._tenant,
             self._validate_arguments,
             data_model,
+            self._coalescer,
         )
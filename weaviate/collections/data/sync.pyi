@@ -1,5 +1,7 @@
 import uuid as uuid_package
 from typing import (
+    Any,
+    Dict,
     Optional,
     List,
     Literal,
@@ -27,11 +29,15 @@ from weaviate.collections.classes.internal import (
 from weaviate.collections.classes.types import (
     Properties,
 )
+from weaviate.collections.data.coalescer import COALESCING_MAX_DELAY, COALESCING_MAX_OBJECTS
 from weaviate.collections.data.data import _DataBase
-from weaviate.types import UUID, VECTORS
+from weaviate.types import UUID, VECTOR_MATRICES, VECTORS
 
 class _DataCollection(Generic[Properties], _DataBase):
     def with_data_model(self, data_model: Type[TProperties]) -> "_DataCollection[TProperties]": ...
+    def with_coalescing(
+        self, max_delay: float = COALESCING_MAX_DELAY, max_objects: int = COALESCING_MAX_OBJECTS
+    ) -> "_DataCollection[Properties]": ...
     def insert(
         self,
         properties: Properties,
@@ -42,6 +48,22 @@ class _DataCollection(Generic[Properties], _DataBase):
     def insert_many(
         self,
         objects: Sequence[Union[Properties, DataObject[Properties, Optional[ReferenceInputs]]]],
+        chunk_size: Optional[int] = 1000,
+        max_concurrency: int = 4,
+    ) -> BatchObjectReturn: ...
+    def insert_many_arrays(
+        self,
+        properties: Optional[Sequence[Properties]] = None,
+        vectors: Optional[VECTOR_MATRICES] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+        chunk_size: Optional[int] = 1000,
+        max_concurrency: int = 4,
+    ) -> BatchObjectReturn: ...
+    def insert_arrow(
+        self,
+        data: Any,
+        uuid_column: Optional[str] = None,
+        vector_column: Optional[Union[str, Dict[str, str]]] = None,
     ) -> BatchObjectReturn: ...
     def replace(
         self,
@@ -20,6 +20,7 @@ from typing import (
 from grpc.aio import AioRpcError  # type: ignore
 from typing_extensions import TypeAlias
 
+from weaviate.collections.batch.encoders import _is_ndarray
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.filters import _Filters
 from weaviate.collections.classes.grpc import (
@@ -357,6 +358,42 @@ class _QueryGRPC(_BaseGRPC):
         return_properties: Optional[PROPERTIES] = None,
         return_references: Optional[REFERENCES] = None,
     ) -> Awaitable[search_get_pb2.SearchReply]:
+        return self.__call(
+            self.near_vector_request(
+                near_vector=near_vector,
+                certainty=certainty,
+                distance=distance,
+                limit=limit,
+                offset=offset,
+                autocut=autocut,
+                filters=filters,
+                group_by=group_by,
+                generative=generative,
+                rerank=rerank,
+                target_vector=target_vector,
+                return_metadata=return_metadata,
+                return_properties=return_properties,
+                return_references=return_references,
+            )
+        )
+
+    def near_vector_request(
+        self,
+        near_vector: NearVectorInputType,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        autocut: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[_GroupBy] = None,
+        generative: Optional[_Generative] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        return_metadata: Optional[_MetadataQuery] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Optional[REFERENCES] = None,
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -381,22 +418,8 @@ class _QueryGRPC(_BaseGRPC):
         certainty, distance = self.__parse_near_options(certainty, distance)
 
         targets, target_vectors = self.__target_vector_to_grpc(target_vector)
-
-        if (
-            isinstance(near_vector, list)
-            and len(near_vector) > 0
-            and isinstance(near_vector[0], float)
-        ):
-            # fast path for simple vector
-            near_vector_grpc: Optional[bytes] = struct.pack(
-                "{}f".format(len(near_vector)), *near_vector
-            )
-            vector_per_target_tmp = None
-        else:
-            vector_per_target_tmp, near_vector_grpc = self.__vector_per_target(
-                near_vector, targets, "near_vector"
-            )
-        request = self.__create_request(
+        vector_per_target_tmp, near_vector_grpc = self.__near_vector_to_grpc(near_vector, targets)
+        return self.__create_request(
             limit=limit,
             offset=offset,
             filters=filters,
@@ -417,6 +440,57 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
+    def patch_near_vector(
+        self,
+        request: search_get_pb2.SearchRequest,
+        near_vector: NearVectorInputType,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+    ) -> None:
+        """Replace the vector and the given search options of a request built by `near_vector_request` in place."""
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(
+                        [
+                            List,
+                            Dict,
+                            _ExtraTypes.PANDAS,
+                            _ExtraTypes.POLARS,
+                            _ExtraTypes.NUMPY,
+                            _ExtraTypes.TF,
+                        ],
+                        "near_vector",
+                        near_vector,
+                    ),
+                ]
+            )
+        certainty, distance = self.__parse_near_options(certainty, distance)
+
+        search = request.near_vector
+        vector_per_target, vector_bytes = self.__near_vector_to_grpc(
+            near_vector, search.targets if search.HasField("targets") else None
+        )
+        if vector_bytes is not None:
+            search.vector_bytes = vector_bytes
+            search.vector_per_target.clear()
+        else:
+            search.ClearField("vector_bytes")
+            search.vector_per_target.clear()
+            search.vector_per_target.update(cast(Dict[str, bytes], vector_per_target))
+        # a certainty replaces the distance of the prepared request and the other way round, Weaviate rejects both
+        if certainty is not None:
+            search.certainty = certainty
+            if distance is None:
+                search.ClearField("distance")
+        if distance is not None:
+            search.distance = distance
+            if certainty is None:
+                search.ClearField("certainty")
+
+    def search(
+        self, request: search_get_pb2.SearchRequest
+    ) -> Awaitable[search_get_pb2.SearchReply]:
         return self.__call(request)
 
     def near_object(
@@ -880,6 +954,23 @@ class _QueryGRPC(_BaseGRPC):
         else:
             return target_vector.to_grpc_target_vector(), None
 
+    def __near_vector_to_grpc(
+        self, near_vector: NearVectorInputType, targets: Optional[search_get_pb2.Targets]
+    ) -> Tuple[Optional[Dict[str, bytes]], Optional[bytes]]:
+        if (
+            isinstance(near_vector, list)
+            and len(near_vector) > 0
+            and isinstance(near_vector[0], float)
+        ):
+            # fast path for simple vector
+            return None, struct.pack("{}f".format(len(near_vector)), *near_vector)
+        if _is_ndarray(near_vector):
+            # fast path for numpy vectors, which are packed without converting them to a list first
+            array: Any = near_vector
+            if array.ndim == 1 and array.dtype.kind == "f" and len(array) > 0:
+                return None, array.astype("<f4", copy=False).tobytes()
+        return self.__vector_per_target(near_vector, targets, "near_vector")
+
     @staticmethod
     def __vector_per_target(
         vector: NearVectorInputType, targets: Optional[search_get_pb2.Targets], argument_name: str
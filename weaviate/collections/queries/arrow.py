@@ -0,0 +1,296 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from weaviate.collections.batch.arrow import _import_pyarrow
+from weaviate.collections.classes.internal import _QueryOptions
+from weaviate.exceptions import WeaviateQueryError
+from weaviate.proto.v1 import properties_pb2, search_get_pb2
+
+# the metadata columns with the name of their protobuf field and their type
+_METADATA_COLUMNS = [
+    ("distance", "distance", "float64"),
+    ("certainty", "certainty", "float64"),
+    ("score", "score", "float64"),
+    ("explain_score", "explain_score", "string"),
+    ("is_consistent", "is_consistent", "bool_"),
+    ("rerank_score", "rerank_score", "float64"),
+]
+_TIME_COLUMNS = [
+    ("creation_time", "creation_time_unix"),
+    ("last_update_time", "last_update_time_unix"),
+]
+_SCALAR_TYPES = {
+    "text_value": "string",
+    "string_value": "string",
+    "uuid_value": "string",
+    "blob_value": "string",
+    "int_value": "int64",
+    "number_value": "float64",
+    "bool_value": "bool_",
+}
+_GEO_FIELDS = ["latitude", "longitude"]
+_PHONE_FIELDS = [
+    ("country_code", "country_code"),
+    ("default_country", "default_country"),
+    ("international_formatted", "international_formatted"),
+    ("national", "national"),
+    ("national_formatted", "national_formatted"),
+    ("number", "input"),
+    ("valid", "valid"),
+]
+
+
+def _search_reply_to_arrow(res: search_get_pb2.SearchReply, options: _QueryOptions) -> Any:
+    """Build a `pyarrow.Table` with one row per returned object straight from the protobuf reply.
+
+    Every column is built from the reply fields of all objects at once, so no Python object is created per returned
+    object. The columns are `uuid` as 16 byte binaries, `belongs_to_group` for group by queries, the returned metadata,
+    `vector` or `vector_<name>` for named vectors as fixed size lists of float32, and one column per property, typed by
+    the values that Weaviate returned for it. References are not included.
+    """
+    pa = _import_pyarrow()
+    if options.is_group_by:
+        results: Sequence[Any] = [obj for group in res.group_by_results for obj in group.objects]
+    else:
+        results = res.results
+    metadata = [result.metadata for result in results]
+
+    names: List[str] = ["uuid"]
+    columns: List[Any] = [
+        pa.Array.from_buffers(
+            pa.binary(16),
+            len(metadata),
+            [None, pa.py_buffer(b"".join(meta.id_as_bytes for meta in metadata))],
+        )
+    ]
+    if options.is_group_by:
+        names.append("belongs_to_group")
+        columns.append(
+            pa.array(
+                [group.name for group in res.group_by_results for _ in group.objects], pa.string()
+            )
+        )
+    if options.include_metadata:
+        for name, field, type_ in _METADATA_COLUMNS:
+            present = [getattr(meta, f"{field}_present") for meta in metadata]
+            if any(present):
+                names.append(name)
+                columns.append(
+                    pa.array(
+                        [getattr(meta, field) if p else None for meta, p in zip(metadata, present)],
+                        getattr(pa, type_)(),
+                    )
+                )
+        for name, field in _TIME_COLUMNS:
+            present = [getattr(meta, f"{field}_present") for meta in metadata]
+            if any(present):
+                times = [getattr(meta, field) if p else None for meta, p in zip(metadata, present)]
+                # like for objects, timestamps are given in milliseconds or, with more digits, in nanoseconds
+                unit = "ms" if max(t for t in times if t is not None) < 10**13 else "ns"
+                names.append(name)
+                columns.append(pa.array(times, pa.timestamp(unit, tz="UTC")))
+    if options.include_vector:
+        for name, vectors in _vectors(metadata, options).items():
+            names.append(name)
+            columns.append(_vector_column(pa, vectors))
+
+    property_names, property_columns = _properties_columns(
+        pa, [result.properties.non_ref_props.fields for result in results]
+    )
+    names.extend(property_names)
+    columns.extend(property_columns)
+    return pa.Table.from_arrays(columns, names=names)
+
+
+def _vectors(
+    metadata: List[search_get_pb2.MetadataResult], options: _QueryOptions
+) -> Dict[str, List[bytes]]:
+    vectors: Dict[str, List[bytes]] = {}
+    if any(len(meta.vector_bytes) > 0 for meta in metadata):
+        vectors["vector"] = [meta.vector_bytes for meta in metadata]
+    for idx, meta in enumerate(metadata):
+        for vec in meta.vectors:
+            if options.vector_names is None or vec.name in options.vector_names:
+                vectors.setdefault(f"vector_{vec.name}", [b""] * len(metadata))[
+                    idx
+                ] = vec.vector_bytes
+    return vectors
+
+
+def _vector_column(pa: Any, vectors: List[bytes]) -> Any:
+    """Build a fixed size list column of float32 from packed vectors, or a list column if their lengths differ."""
+    values = pa.Array.from_buffers(
+        pa.float32(),
+        sum(len(vector) for vector in vectors) // 4,
+        [None, pa.py_buffer(b"".join(vectors))],
+    )
+    lengths = {len(vector) for vector in vectors}
+    if len(lengths) == 1 and 0 not in lengths:
+        return pa.FixedSizeListArray.from_arrays(values, lengths.pop() // 4)
+    return _list_array(
+        pa, [len(vector) // 4 if len(vector) > 0 else None for vector in vectors], values
+    )
+
+
+def _list_array(pa: Any, lengths: List[Optional[int]], values: Any) -> Any:
+    offsets = [0]
+    for length in lengths:
+        offsets.append(offsets[-1] + (length or 0))
+    return pa.ListArray.from_arrays(
+        pa.array(offsets, pa.int32()),
+        values,
+        mask=pa.array([length is None for length in lengths], pa.bool_()),
+    )
+
+
+def _properties_columns(pa: Any, fields: List[Optional[Any]]) -> Tuple[List[str], List[Any]]:
+    """Build one column per property from the property maps of the objects, `None` for objects without the map.
+
+    The columns are sorted by name, protobuf maps have no fixed order and the tables of several queries must share the
+    same schema to be concatenated.
+    """
+    names = sorted(
+        {name for object_fields in fields if object_fields is not None for name in object_fields}
+    )
+    columns = [
+        _value_column(
+            pa,
+            [
+                object_fields[name] if object_fields is not None and name in object_fields else None
+                for object_fields in fields
+            ],
+        )
+        for name in names
+    ]
+    return names, columns
+
+
+def _single_kind(values: Iterable[Optional[Any]]) -> Optional[str]:
+    """Return the kind of the values that have one set, raise if they are not all of the same kind."""
+    kinds = {value.WhichOneof("kind") for value in values if value is not None} - {None}
+    if len(kinds) > 1:
+        raise WeaviateQueryError(
+            f"a property has values of different types ({', '.join(sorted(kinds))}) that do not fit into one "
+            "Arrow column, use another return format",
+            "GRPC search",
+        )
+    return kinds.pop() if len(kinds) == 1 else None
+
+
+def _value_column(pa: Any, values: List[Optional[properties_pb2.Value]]) -> Any:
+    values = [
+        (
+            value
+            if value is not None and value.WhichOneof("kind") not in (None, "null_value")
+            else None
+        )
+        for value in values
+    ]
+    kind = _single_kind(values)
+    if kind is None:
+        return pa.nulls(len(values))
+    if kind in _SCALAR_TYPES:
+        return pa.array(
+            [getattr(value, kind) if value is not None else None for value in values],
+            getattr(pa, _SCALAR_TYPES[kind])(),
+        )
+    if kind == "date_value":
+        return _date_array(
+            pa, [value.date_value if value is not None else None for value in values]
+        )
+    if kind == "geo_value":
+        return pa.array(
+            [
+                (
+                    {field: getattr(value.geo_value, field) for field in _GEO_FIELDS}
+                    if value is not None
+                    else None
+                )
+                for value in values
+            ],
+            pa.struct([(field, pa.float32()) for field in _GEO_FIELDS]),
+        )
+    if kind == "phone_value":
+        return pa.array(
+            [
+                (
+                    {name: getattr(value.phone_value, field) for name, field in _PHONE_FIELDS}
+                    if value is not None
+                    else None
+                )
+                for value in values
+            ]
+        )
+    if kind == "object_value":
+        return _struct_array(
+            pa,
+            [value.object_value.fields if value is not None else None for value in values],
+        )
+    return _list_column(pa, [value.list_value if value is not None else None for value in values])
+
+
+def _struct_array(pa: Any, fields: List[Optional[Any]]) -> Any:
+    names, columns = _properties_columns(pa, fields)
+    mask = pa.array([object_fields is None for object_fields in fields], pa.bool_())
+    if len(names) == 0:
+        return pa.array([{} if f is not None else None for f in fields], pa.struct([]))
+    return pa.StructArray.from_arrays(columns, names=names, mask=mask)
+
+
+def _date_array(pa: Any, dates: List[Optional[str]]) -> Any:
+    """Parse RFC 3339 dates, in microseconds to cover all years or in nanoseconds for a higher precision."""
+    strings = pa.array(dates, pa.string())
+    for unit in ("us", "ns"):
+        try:
+            return strings.cast(pa.timestamp(unit, tz="UTC"))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            continue
+    return strings
+
+
+def _list_column(pa: Any, lists: List[Optional[properties_pb2.ListValue]]) -> Any:
+    # empty lists have no kind, they are read as empty lists of the kind of the others
+    kind = _single_kind(lists)
+    if kind is not None and any(
+        value is not None and value.WhichOneof("kind") is None and len(value.values) > 0
+        for value in lists
+    ):
+        raise WeaviateQueryError(
+            "a property has lists in different formats that do not fit into one Arrow column, use another "
+            "return format",
+            "GRPC search",
+        )
+    lengths: List[Optional[int]]
+    if kind in ("number_values", "int_values"):
+        packed = [getattr(value, kind).values if value is not None else None for value in lists]
+        lengths = [len(p) // 8 if p is not None else None for p in packed]
+        values = pa.Array.from_buffers(
+            pa.float64() if kind == "number_values" else pa.int64(),
+            sum(length or 0 for length in lengths),
+            [None, pa.py_buffer(b"".join(p for p in packed if p is not None))],
+        )
+        return _list_array(pa, lengths, values)
+    if kind == "object_values":
+        objects = [value.object_values.values if value is not None else None for value in lists]
+        return _list_array(
+            pa,
+            [len(o) if o is not None else None for o in objects],
+            _struct_array(pa, [obj.fields for o in objects if o is not None for obj in o]),
+        )
+    if kind in ("bool_values", "text_values", "date_values", "uuid_values"):
+        elements = [
+            list(getattr(value, kind).values) if value is not None else None for value in lists
+        ]
+        flat = [element for e in elements if e is not None for element in e]
+        values = (
+            _date_array(pa, flat)
+            if kind == "date_values"
+            else pa.array(flat, pa.bool_() if kind == "bool_values" else pa.string())
+        )
+        return _list_array(pa, [len(e) if e is not None else None for e in elements], values)
+    # before Weaviate 1.25, lists are returned as lists of values
+    values_lists = [list(value.values) if value is not None else None for value in lists]
+    return _list_array(
+        pa,
+        [len(v) if v is not None else None for v in values_lists],
+        _value_column(pa, [element for v in values_lists if v is not None for element in v]),
+    )
@@ -1,9 +1,10 @@
 import datetime
 import io
+import operator
 import os
 import pathlib
 import uuid as uuid_lib
-from typing import Any, Dict, Generic, List, Optional, Sequence, Type, Union, cast
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Type, Union, cast
 
 from typing_extensions import is_typeddict
 
@@ -39,6 +40,9 @@ from weaviate.collections.classes.internal import (
     ReturnReferences,
     CrossReferences,
     _CrossReference,
+    _LazyObject,
+    _LazyProperties,
+    _ObjectDecoder,
 )
 from weaviate.collections.classes.types import (
     GeoCoordinate,
@@ -49,11 +53,12 @@ from weaviate.collections.classes.types import (
     TReferences,
 )
 from weaviate.collections.grpc.query import _QueryGRPC
+from weaviate.collections.queries.arrow import _search_reply_to_arrow
 from weaviate.collections.queries.byteops import _ByteOps
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.proto.v1 import search_get_pb2, properties_pb2
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.types import INCLUDE_VECTOR, VECTOR_FORMAT
 from weaviate.util import (
     file_encoder_b64,
     _datetime_from_weaviate_str,
@@ -65,6 +70,8 @@ from weaviate.warnings import _Warnings
 class _WeaviateUUIDInt(uuid_lib.UUID):
     def __init__(self, hex_: int) -> None:
         object.__setattr__(self, "int", hex_)
+        # read when pickling
+        object.__setattr__(self, "is_safe", uuid_lib.SafeUUID.unknown)
 
 
 class _Base(Generic[Properties, References]):
@@ -77,6 +84,7 @@ class _Base(Generic[Properties, References]):
         properties: Optional[Type[Properties]],
         references: Optional[Type[References]],
         validate_arguments: bool,
+        vector_format: VECTOR_FORMAT = "list",
     ):
         self._connection = connection
         self._name = name
@@ -85,8 +93,13 @@ class _Base(Generic[Properties, References]):
         self._properties = properties
         self._references = references
         self._validate_arguments = validate_arguments
+        self._vector_format = vector_format
 
         self.__uses_125_api = self._connection._weaviate_version.is_at_least(1, 25, 0)
+        # the decoders of the protobuf values by the kind of value that is set, so that each value is decoded after a
+        # single lookup instead of testing every kind in turn
+        self.__decoders = self.__value_decoders()
+        self.__list_decoders = self.__list_value_decoders()
         self._query = _QueryGRPC(
             self._connection,
             self._name,
@@ -148,6 +161,7 @@ class _Base(Generic[Properties, References]):
     def __extract_vector_for_object(
         self,
         add_props: "search_get_pb2.MetadataResult",
+        options: _QueryOptions,
     ) -> Dict[str, List[float]]:
         if (
             len(add_props.vector_bytes) == 0
@@ -156,12 +170,19 @@ class _Base(Generic[Properties, References]):
         ):
             return {}
 
+        decode = (
+            _ByteOps.decode_float32_array
+            if (options.vector_format or self._vector_format) == "numpy"
+            else _ByteOps.decode_float32s
+        )
         if len(add_props.vector_bytes) > 0:
-            return {"default": _ByteOps.decode_float32s(add_props.vector_bytes)}
+            return {"default": decode(add_props.vector_bytes)}
 
+        names = options.vector_names
         vecs = {}
         for vec in add_props.vectors:
-            vecs[vec.name] = _ByteOps.decode_float32s(vec.vector_bytes)
+            if names is None or vec.name in names:
+                vecs[vec.name] = decode(vec.vector_bytes)
         return vecs
 
     def __extract_generated_for_object(
@@ -170,83 +191,89 @@ class _Base(Generic[Properties, References]):
     ) -> Optional[str]:
         return add_props.generative if add_props.generative_present else None
 
+    def __value_decoders(self) -> Dict[str, Callable[[properties_pb2.Value], Any]]:
+        deserialize_list = (
+            self.__deserialize_list_value_prop_125
+            if self.__uses_125_api
+            else self.__deserialize_list_value_prop_123
+        )
+        return {
+            "uuid_value": lambda value: uuid_lib.UUID(value.uuid_value),
+            "date_value": self.__deserialize_date,
+            "string_value": operator.attrgetter("string_value"),
+            "text_value": operator.attrgetter("text_value"),
+            "int_value": operator.attrgetter("int_value"),
+            "number_value": operator.attrgetter("number_value"),
+            "bool_value": operator.attrgetter("bool_value"),
+            "list_value": lambda value: deserialize_list(value.list_value),
+            "object_value": lambda value: self.__parse_nonref_properties_result(value.object_value),
+            "geo_value": lambda value: GeoCoordinate(
+                latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
+            ),
+            "blob_value": operator.attrgetter("blob_value"),
+            "phone_value": self.__deserialize_phone,
+            "null_value": lambda _: None,
+        }
+
+    def __list_value_decoders(self) -> Dict[str, Callable[[properties_pb2.ListValue], List[Any]]]:
+        return {
+            "bool_values": lambda value: list(value.bool_values.values),
+            "date_values": lambda value: [
+                _datetime_from_weaviate_str(val) for val in value.date_values.values
+            ],
+            "int_values": lambda value: _ByteOps.decode_int64s(value.int_values.values),
+            "number_values": lambda value: _ByteOps.decode_float64s(value.number_values.values),
+            "text_values": lambda value: list(value.text_values.values),
+            "uuid_values": lambda value: [uuid_lib.UUID(val) for val in value.uuid_values.values],
+            "object_values": lambda value: [
+                self.__parse_nonref_properties_result(val) for val in value.object_values.values
+            ],
+        }
+
     def __deserialize_list_value_prop_125(
         self, value: properties_pb2.ListValue
     ) -> Optional[List[Any]]:
-        if value.HasField("bool_values"):
-            return list(value.bool_values.values)
-        if value.HasField("date_values"):
-            return [_datetime_from_weaviate_str(val) for val in value.date_values.values]
-        if value.HasField("int_values"):
-            return _ByteOps.decode_int64s(value.int_values.values)
-        if value.HasField("number_values"):
-            return _ByteOps.decode_float64s(value.number_values.values)
-        if value.HasField("text_values"):
-            return list(value.text_values.values)
-        if value.HasField("uuid_values"):
-            return [uuid_lib.UUID(val) for val in value.uuid_values.values]
-        if value.HasField("object_values"):
-            return [
-                self.__parse_nonref_properties_result(val) for val in value.object_values.values
-            ]
-        _Warnings.unknown_type_encountered(value.WhichOneof("Value"))
-        return None
+        kind = value.WhichOneof("kind")
+        decode = self.__list_decoders.get(kind) if kind is not None else None
+        if decode is None:
+            _Warnings.unknown_type_encountered(str(kind))
+            return None
+        return decode(value)
 
     def __deserialize_list_value_prop_123(self, value: properties_pb2.ListValue) -> List[Any]:
         return [self.__deserialize_non_ref_prop(val) for val in value.values]
 
-    def __deserialize_non_ref_prop(self, value: properties_pb2.Value) -> Any:
-        if value.HasField("uuid_value"):
-            return uuid_lib.UUID(value.uuid_value)
-        if value.HasField("date_value"):
-            try:
-                return _datetime_from_weaviate_str(value.date_value)
-            except ValueError as e:
-                # note that the year 9999 is valid and does not need to be handled. for 5 digit years only the first
-                # 4 digits are considered and it wrapps around
-                if "year 0 is out of range" in str(e):
-                    _Warnings.datetime_year_zero(value.date_value)
-                    return datetime.datetime.min
-
-        if value.HasField("string_value"):
-            return str(value.string_value)
-        if value.HasField("text_value"):
-            return str(value.text_value)
-        if value.HasField("int_value"):
-            return int(value.int_value)
-        if value.HasField("number_value"):
-            return float(value.number_value)
-        if value.HasField("bool_value"):
-            return bool(value.bool_value)
-        if value.HasField("list_value"):
-            return (
-                self.__deserialize_list_value_prop_125(value.list_value)
-                if self.__uses_125_api
-                else self.__deserialize_list_value_prop_123(value.list_value)
-            )
-        if value.HasField("object_value"):
-            return self.__parse_nonref_properties_result(value.object_value)
-        if value.HasField("geo_value"):
-            return GeoCoordinate(
-                latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
-            )
-        if value.HasField("blob_value"):
-            return value.blob_value
-        if value.HasField("phone_value"):
-            return _PhoneNumber(
-                country_code=value.phone_value.country_code,
-                default_country=value.phone_value.default_country,
-                international_formatted=value.phone_value.international_formatted,
-                national=value.phone_value.national,
-                national_formatted=value.phone_value.national_formatted,
-                number=value.phone_value.input,
-                valid=value.phone_value.valid,
-            )
-        if value.HasField("null_value"):
+    def __deserialize_date(self, value: properties_pb2.Value) -> Optional[datetime.datetime]:
+        try:
+            return _datetime_from_weaviate_str(value.date_value)
+        except ValueError as e:
+            # note that the year 9999 is valid and does not need to be handled. for 5 digit years only the first
+            # 4 digits are considered and it wrapps around
+            if "year 0 is out of range" in str(e):
+                _Warnings.datetime_year_zero(value.date_value)
+                return datetime.datetime.min
+            # like any other value that cannot be decoded, the query does not fail because of it
+            _Warnings.unknown_type_encountered("date_value")
             return None
 
-        _Warnings.unknown_type_encountered(value.WhichOneof("Value"))
-        return None
+    def __deserialize_phone(self, value: properties_pb2.Value) -> _PhoneNumber:
+        return _PhoneNumber(
+            country_code=value.phone_value.country_code,
+            default_country=value.phone_value.default_country,
+            international_formatted=value.phone_value.international_formatted,
+            national=value.phone_value.national,
+            national_formatted=value.phone_value.national_formatted,
+            number=value.phone_value.input,
+            valid=value.phone_value.valid,
+        )
+
+    def __deserialize_non_ref_prop(self, value: properties_pb2.Value) -> Any:
+        kind = value.WhichOneof("kind")
+        decode = self.__decoders.get(kind) if kind is not None else None
+        if decode is None:
+            _Warnings.unknown_type_encountered(str(kind))
+            return None
+        return decode(value)
 
     def __parse_nonref_properties_result(
         self,
@@ -298,7 +325,30 @@ class _Base(Generic[Properties, References]):
                 self.__parse_ref_properties_result(props) if options.include_references else None
             ),
             uuid=self.__extract_id_for_object(meta),
-            vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
+            vector=(
+                self.__extract_vector_for_object(meta, options) if options.include_vector else {}
+            ),
+        )
+
+    def __lazy_object_decoder(self, options: _QueryOptions) -> _ObjectDecoder:
+        return _ObjectDecoder(
+            uuid=self.__extract_id_for_object,
+            metadata=lambda meta: (
+                self.__extract_metadata_for_object(meta)
+                if options.include_metadata
+                else MetadataReturn()
+            ),
+            properties=lambda props: (
+                _LazyProperties(props.non_ref_props.fields, self.__deserialize_non_ref_prop)
+                if options.include_properties
+                else {}
+            ),
+            references=lambda props: (
+                self.__parse_ref_properties_result(props) if options.include_references else None
+            ),
+            vector=lambda meta: (
+                self.__extract_vector_for_object(meta, options) if options.include_vector else {}
+            ),
         )
 
     def __result_to_generative_object(
@@ -323,7 +373,9 @@ class _Base(Generic[Properties, References]):
                 self.__parse_ref_properties_result(props) if options.include_references else None
             ),
             uuid=self.__extract_id_for_object(meta),
-            vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
+            vector=(
+                self.__extract_vector_for_object(meta, options) if options.include_vector else {}
+            ),
             generated=self.__extract_generated_for_object(meta),
         )
 
@@ -385,7 +437,9 @@ class _Base(Generic[Properties, References]):
                 self.__parse_ref_properties_result(props) if options.include_references else None
             ),
             uuid=self.__extract_id_for_object(meta),
-            vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
+            vector=(
+                self.__extract_vector_for_object(meta, options) if options.include_vector else {}
+            ),
             belongs_to_group=group_name,
         )
 
@@ -407,6 +461,15 @@ class _Base(Generic[Properties, References]):
         QueryReturn[TProperties, CrossReferences],
         QueryReturn[TProperties, TReferences],
     ]:
+        if options.return_format == "arrow":
+            # the overloads of the query methods type the table separately
+            return cast(QueryReturn[Properties, References], _search_reply_to_arrow(res, options))
+        if options.return_format == "lazy":
+            decoder = self.__lazy_object_decoder(options)
+            objects: List[Object[Any, Any]] = [
+                _LazyObject(obj.properties, obj.metadata, decoder) for obj in res.results
+            ]
+            return QueryReturn(objects=objects)
         return QueryReturn(
             objects=[
                 self.__result_to_query_object(obj.properties, obj.metadata, options)
@@ -534,7 +597,7 @@ class _Base(Generic[Properties, References]):
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]:
         return (
             self._result_to_query_return(res, options, properties, references)
-            if not options.is_group_by
+            if not options.is_group_by or options.return_format == "arrow"
             else self._result_to_groupby_return(res, options, properties, references)
         )
 
@@ -17,7 +17,7 @@ from weaviate.collections.classes.types import Properties, TProperties, Referenc
 from weaviate.collections.queries.base import _Base
 from weaviate.exceptions import WeaviateUnsupportedFeatureError
 
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.types import INCLUDE_VECTOR, VECTOR_FORMAT
 
 
 class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, References]):
@@ -36,6 +36,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: Optional[GroupBy] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
@@ -69,6 +70,9 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
                 How the results should be reranked. NOTE: A `rerank-*` module must be enabled for this functionality to work.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format of the returned vectors, `"list"` for lists of floats or `"numpy"` for float32 `numpy` arrays.
+                If not specified, the default of the collection is used, see `client.collections.get`.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -123,6 +127,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
                 query_references=return_references,
                 rerank=rerank,
                 group_by=group_by,
+                vector_format=vector_format,
             ),
             return_properties,
             return_references,
@@ -14,7 +14,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.types import INCLUDE_VECTOR, VECTOR_FORMAT
 
 class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, References]):
     @overload
@@ -33,6 +33,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -53,6 +54,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -73,6 +75,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -93,6 +96,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -113,6 +117,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -133,6 +138,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
@@ -156,6 +162,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -176,6 +183,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -196,6 +204,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -216,6 +225,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -236,6 +246,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -256,6 +267,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
@@ -276,6 +288,7 @@ class _BM25GenerateAsync(Generic[Properties, References], _Base[Properties, Refe
         group_by: Optional[GroupBy] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
@@ -298,6 +311,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -318,6 +332,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -338,6 +353,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -358,6 +374,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -378,6 +395,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -398,6 +416,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
@@ -422,6 +441,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -443,6 +463,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -464,6 +485,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -485,6 +507,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -506,6 +529,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -527,6 +551,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
@@ -547,6 +572,7 @@ class _BM25Generate(Generic[Properties, References], _Base[Properties, Reference
         group_by: Optional[GroupBy] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
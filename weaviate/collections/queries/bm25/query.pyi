@@ -1,4 +1,4 @@
-from typing import Generic, List, Literal, Optional, Type, overload
+from typing import Any, Generic, List, Literal, Optional, Type, overload
 
 from weaviate.collections.classes.filters import (
     _Filters,
@@ -14,9 +14,28 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.types import INCLUDE_VECTOR, VECTOR_FORMAT
 
 class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, References]):
+    @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["arrow"],
+    ) -> Any: ...
     @overload
     async def bm25(
         self,
@@ -30,9 +49,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, References]: ...
     @overload
     async def bm25(
@@ -47,9 +68,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, CrossReferences]: ...
     @overload
     async def bm25(
@@ -64,9 +87,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, TReferences]: ...
     @overload
     async def bm25(
@@ -81,9 +106,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, References]: ...
     @overload
     async def bm25(
@@ -98,9 +125,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, CrossReferences]: ...
     @overload
     async def bm25(
@@ -115,9 +144,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, TReferences]: ...
 
     ###### GROUP BY ######
@@ -135,9 +166,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[Properties, References]: ...
     @overload
     async def bm25(
@@ -152,9 +185,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[Properties, CrossReferences]: ...
     @overload
     async def bm25(
@@ -169,9 +204,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[Properties, TReferences]: ...
     @overload
     async def bm25(
@@ -186,9 +223,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[TProperties, References]: ...
     @overload
     async def bm25(
@@ -203,9 +242,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[TProperties, CrossReferences]: ...
     @overload
     async def bm25(
@@ -220,9 +261,11 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: GroupBy,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[TProperties, TReferences]: ...
     @overload
     async def bm25(
@@ -237,12 +280,33 @@ class _BM25QueryAsync(Generic[Properties, References], _Base[Properties, Referen
         group_by: Optional[GroupBy] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
 
 class _BM25Query(Generic[Properties, References], _Base[Properties, References]):
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["arrow"],
+    ) -> Any: ...
     @overload
     def bm25(
         self,
@@ -256,9 +320,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, References]: ...
     @overload
     def bm25(
@@ -273,9 +339,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, CrossReferences]: ...
     @overload
     def bm25(
@@ -290,9 +358,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, TReferences]: ...
     @overload
     def bm25(
@@ -307,9 +377,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, References]: ...
     @overload
     def bm25(
@@ -324,9 +396,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, CrossReferences]: ...
     @overload
     def bm25(
@@ -341,9 +415,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         group_by: Literal[None] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, TReferences]: ...
 
     ###### GROUP BY ######
@@ -362,9 +438,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[Properties, References]: ...
     @overload
     def bm25(
@@ -380,9 +458,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[Properties, CrossReferences]: ...
     @overload
     def bm25(
@@ -398,9 +478,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[Properties, TReferences]: ...
     @overload
     def bm25(
@@ -416,9 +498,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[TProperties, References]: ...
     @overload
     def bm25(
@@ -434,9 +518,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[TProperties, CrossReferences]: ...
     @overload
     def bm25(
@@ -452,9 +538,11 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> GroupByReturn[TProperties, TReferences]: ...
     @overload
     def bm25(
@@ -469,7 +557,9 @@ class _BM25Query(Generic[Properties, References], _Base[Properties, References])
         group_by: Optional[GroupBy] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
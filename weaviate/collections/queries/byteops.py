@@ -1,5 +1,17 @@
 import struct
-from typing import List
+from typing import Any, List
+
+from weaviate.exceptions import WeaviateInvalidInputError
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise WeaviateInvalidInputError(
+            "numpy must be installed to return vectors as numpy arrays"
+        ) from e
+    return numpy
 
 
 class _ByteOps:
@@ -7,6 +19,11 @@ class _ByteOps:
     def decode_float32s(byte_vector: bytes) -> List[float]:
         return [float(val) for val in struct.unpack(f"{len(byte_vector)//4}f", byte_vector)]
 
+    @staticmethod
+    def decode_float32_array(byte_vector: bytes) -> Any:
+        """Return a read-only float32 `numpy` array that shares the memory of `byte_vector` instead of copying it."""
+        return _import_numpy().frombuffer(byte_vector, dtype="<f4")
+
     @staticmethod
     def decode_float64s(byte_vector: bytes) -> List[float]:
         return [float(val) for val in struct.unpack(f"{len(byte_vector)//8}d", byte_vector)]
@@ -19,7 +19,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import INCLUDE_VECTOR, UUID
+from weaviate.types import INCLUDE_VECTOR, VECTOR_FORMAT, UUID
 
 
 class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properties, References]):
@@ -27,6 +27,7 @@ class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properti
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
@@ -38,6 +39,9 @@ class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properti
                 The UUID of the object to retrieve, REQUIRED.
             `include_vector`
                 Whether to include the vector in the returned object.
+            `vector_format`
+                The format of the returned vectors, `"list"` for lists of floats or `"numpy"` for float32 `numpy` arrays.
+                If not specified, the default of the collection is used, see `client.collections.get`.
             `return_properties`
                 The properties to return for each object.
             `return_references`
@@ -72,6 +76,7 @@ class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properti
                 include_vector,
                 self._references,
                 return_references,
+                vector_format=vector_format,
             ),
             return_properties,
             None,
@@ -16,7 +16,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import INCLUDE_VECTOR, UUID
+from weaviate.types import INCLUDE_VECTOR, VECTOR_FORMAT, UUID
 
 class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properties, References]):
     @overload
@@ -24,6 +24,7 @@ class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properti
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -33,6 +34,7 @@ class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properti
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -42,6 +44,7 @@ class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properti
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -51,6 +54,7 @@ class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properti
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -60,6 +64,7 @@ class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properti
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -69,6 +74,7 @@ class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properti
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
@@ -78,6 +84,7 @@ class _FetchObjectByIDQueryAsync(Generic[Properties, References], _Base[Properti
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
@@ -89,6 +96,7 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _Base[Properties, R
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -98,6 +106,7 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _Base[Properties, R
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -107,6 +116,7 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _Base[Properties, R
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -116,6 +126,7 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _Base[Properties, R
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -125,6 +136,7 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _Base[Properties, R
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -134,6 +146,7 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _Base[Properties, R
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
@@ -143,6 +156,7 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _Base[Properties, R
         self,
         uuid: UUID,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         *,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
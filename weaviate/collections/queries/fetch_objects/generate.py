@@ -12,7 +12,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import UUID, INCLUDE_VECTOR
+from weaviate.types import UUID, INCLUDE_VECTOR, VECTOR_FORMAT
 
 
 class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
@@ -28,6 +28,7 @@ class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properti
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None
@@ -53,6 +54,9 @@ class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properti
                 The sorting to apply to the retrieval.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format of the returned vectors, `"list"` for lists of floats or `"numpy"` for float32 `numpy` arrays.
+                If not specified, the default of the collection is used, see `client.collections.get`.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -95,6 +99,7 @@ class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properti
                 include_vector,
                 self._references,
                 return_references,
+                vector_format=vector_format,
             ),
             return_properties,
             return_references,
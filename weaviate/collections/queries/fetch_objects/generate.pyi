@@ -16,7 +16,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import UUID, INCLUDE_VECTOR
+from weaviate.types import UUID, INCLUDE_VECTOR, VECTOR_FORMAT
 
 class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
     @overload
@@ -32,6 +32,7 @@ class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properti
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None
@@ -49,6 +50,7 @@ class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properti
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES
@@ -66,6 +68,7 @@ class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properti
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences]
@@ -83,6 +86,7 @@ class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properti
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None
@@ -100,6 +104,7 @@ class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properti
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES
@@ -117,6 +122,7 @@ class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properti
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences]
@@ -134,6 +140,7 @@ class _FetchObjectsGenerateAsync(Generic[Properties, References], _Base[Properti
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None
@@ -153,6 +160,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _Base[Properties, R
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None
@@ -170,6 +178,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _Base[Properties, R
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES
@@ -187,6 +196,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _Base[Properties, R
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences]
@@ -204,6 +214,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _Base[Properties, R
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None
@@ -221,6 +232,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _Base[Properties, R
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES
@@ -238,6 +250,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _Base[Properties, R
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences]
@@ -255,6 +268,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _Base[Properties, R
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None
@@ -1,4 +1,4 @@
-from typing import Generic, List, Literal, Optional, Union, Type, overload
+from typing import Any, Generic, List, Literal, Optional, Union, Type, overload
 
 from weaviate.collections.classes.filters import _Filters
 from weaviate.collections.classes.grpc import METADATA, PROPERTIES, REFERENCES, Sorting
@@ -11,7 +11,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import UUID, INCLUDE_VECTOR
+from weaviate.types import UUID, INCLUDE_VECTOR, VECTOR_FORMAT
 
 class _FetchObjectsQueryAsync(Generic[Properties, References], _Base[Properties, References]):
     @overload
@@ -24,9 +24,27 @@ class _FetchObjectsQueryAsync(Generic[Properties, References], _Base[Properties,
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["arrow"],
+    ) -> Any: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Sorting] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: Literal[None] = None
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, References]: ...
     @overload
     async def fetch_objects(
@@ -38,9 +56,11 @@ class _FetchObjectsQueryAsync(Generic[Properties, References], _Base[Properties,
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: REFERENCES
+        return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, CrossReferences]: ...
     @overload
     async def fetch_objects(
@@ -52,9 +72,11 @@ class _FetchObjectsQueryAsync(Generic[Properties, References], _Base[Properties,
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: Type[TReferences]
+        return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, TReferences]: ...
     @overload
     async def fetch_objects(
@@ -66,9 +88,11 @@ class _FetchObjectsQueryAsync(Generic[Properties, References], _Base[Properties,
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: Literal[None] = None
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, References]: ...
     @overload
     async def fetch_objects(
@@ -80,9 +104,11 @@ class _FetchObjectsQueryAsync(Generic[Properties, References], _Base[Properties,
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: REFERENCES
+        return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, CrossReferences]: ...
     @overload
     async def fetch_objects(
@@ -94,9 +120,11 @@ class _FetchObjectsQueryAsync(Generic[Properties, References], _Base[Properties,
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: Type[TReferences]
+        return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, TReferences]: ...
     @overload
     async def fetch_objects(
@@ -108,9 +136,11 @@ class _FetchObjectsQueryAsync(Generic[Properties, References], _Base[Properties,
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturnType[Properties, References, TProperties, TReferences]: ...
 
 class _FetchObjectsQuery(Generic[Properties, References], _Base[Properties, References]):
@@ -124,9 +154,27 @@ class _FetchObjectsQuery(Generic[Properties, References], _Base[Properties, Refe
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["arrow"],
+    ) -> Any: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Sorting] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: Literal[None] = None
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, References]: ...
     @overload
     def fetch_objects(
@@ -138,9 +186,11 @@ class _FetchObjectsQuery(Generic[Properties, References], _Base[Properties, Refe
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: REFERENCES
+        return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, CrossReferences]: ...
     @overload
     def fetch_objects(
@@ -152,9 +202,11 @@ class _FetchObjectsQuery(Generic[Properties, References], _Base[Properties, Refe
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: Type[TReferences]
+        return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, TReferences]: ...
     @overload
     def fetch_objects(
@@ -166,9 +218,11 @@ class _FetchObjectsQuery(Generic[Properties, References], _Base[Properties, Refe
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: Literal[None] = None
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, References]: ...
     @overload
     def fetch_objects(
@@ -180,9 +234,11 @@ class _FetchObjectsQuery(Generic[Properties, References], _Base[Properties, Refe
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: REFERENCES
+        return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, CrossReferences]: ...
     @overload
     def fetch_objects(
@@ -194,9 +250,11 @@ class _FetchObjectsQuery(Generic[Properties, References], _Base[Properties, Refe
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: Type[TReferences]
+        return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, TReferences]: ...
     @overload
     def fetch_objects(
@@ -208,7 +266,9 @@ class _FetchObjectsQuery(Generic[Properties, References], _Base[Properties, Refe
         filters: Optional[_Filters] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturnType[Properties, References, TProperties, TReferences]: ...
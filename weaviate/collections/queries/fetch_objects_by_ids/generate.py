@@ -13,7 +13,7 @@ from weaviate.collections.classes.internal import (
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
 from weaviate.proto.v1 import search_get_pb2
-from weaviate.types import UUID, INCLUDE_VECTOR
+from weaviate.types import UUID, INCLUDE_VECTOR, VECTOR_FORMAT
 
 
 class _FetchObjectsByIDsGenerateAsync(
@@ -31,6 +31,7 @@ class _FetchObjectsByIDsGenerateAsync(
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None
@@ -62,6 +63,7 @@ class _FetchObjectsByIDsGenerateAsync(
                 include_vector,
                 self._references,
                 return_references,
+                vector_format=vector_format,
             ),
             return_properties,
             return_references,
@@ -12,7 +12,7 @@ from weaviate.collections.classes.internal import (
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
 from weaviate.proto.v1 import search_get_pb2
-from weaviate.types import UUID, INCLUDE_VECTOR
+from weaviate.types import UUID, INCLUDE_VECTOR, VECTOR_FORMAT, RETURN_FORMAT
 
 
 class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Properties, References]):
@@ -25,9 +25,11 @@ class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Proper
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: RETURN_FORMAT = "objects",
     ) -> QueryReturnType[Properties, References, TProperties, TReferences]:
         """Special case of fetch_objects based on filters on uuid"""
         if not ids:
@@ -51,6 +53,8 @@ class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Proper
                 include_vector,
                 self._references,
                 return_references,
+                vector_format=vector_format,
+                return_format=return_format,
             ),
             return_properties,
             return_references,
@@ -1,4 +1,4 @@
-from typing import Generic, Iterable, Literal, Optional, Type, overload
+from typing import Any, Generic, Iterable, Literal, Optional, Type, overload
 
 from weaviate.collections.classes.grpc import METADATA, PROPERTIES, REFERENCES, Sorting
 from weaviate.collections.classes.internal import (
@@ -10,7 +10,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import UUID, INCLUDE_VECTOR
+from weaviate.types import UUID, INCLUDE_VECTOR, VECTOR_FORMAT
 
 class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Properties, References]):
     @overload
@@ -23,9 +23,27 @@ class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Proper
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["arrow"],
+    ) -> Any: ...
+    @overload
+    async def fetch_objects_by_ids(
+        self,
+        ids: Iterable[UUID],
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        sort: Optional[Sorting] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: Literal[None] = None
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, References]: ...
     @overload
     async def fetch_objects_by_ids(
@@ -37,9 +55,11 @@ class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Proper
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: REFERENCES
+        return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, CrossReferences]: ...
     @overload
     async def fetch_objects_by_ids(
@@ -51,9 +71,11 @@ class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Proper
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: Type[TReferences]
+        return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, TReferences]: ...
     @overload
     async def fetch_objects_by_ids(
@@ -65,9 +87,11 @@ class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Proper
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: Literal[None] = None
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, References]: ...
     @overload
     async def fetch_objects_by_ids(
@@ -79,9 +103,11 @@ class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Proper
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: REFERENCES
+        return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, CrossReferences]: ...
     @overload
     async def fetch_objects_by_ids(
@@ -93,9 +119,11 @@ class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Proper
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: Type[TReferences]
+        return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, TReferences]: ...
     @overload
     async def fetch_objects_by_ids(
@@ -107,9 +135,11 @@ class _FetchObjectsByIDsQueryAsync(Generic[Properties, References], _Base[Proper
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturnType[Properties, References, TProperties, TReferences]: ...
 
 class _FetchObjectsByIDsQuery(Generic[Properties, References], _Base[Properties, References]):
@@ -123,9 +153,27 @@ class _FetchObjectsByIDsQuery(Generic[Properties, References], _Base[Properties,
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["arrow"],
+    ) -> Any: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        ids: Iterable[UUID],
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        sort: Optional[Sorting] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: Literal[None] = None
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, References]: ...
     @overload
     def fetch_objects_by_ids(
@@ -137,9 +185,11 @@ class _FetchObjectsByIDsQuery(Generic[Properties, References], _Base[Properties,
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: REFERENCES
+        return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, CrossReferences]: ...
     @overload
     def fetch_objects_by_ids(
@@ -151,9 +201,11 @@ class _FetchObjectsByIDsQuery(Generic[Properties, References], _Base[Properties,
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
-        return_references: Type[TReferences]
+        return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, TReferences]: ...
     @overload
     def fetch_objects_by_ids(
@@ -165,9 +217,11 @@ class _FetchObjectsByIDsQuery(Generic[Properties, References], _Base[Properties,
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: Literal[None] = None
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, References]: ...
     @overload
     def fetch_objects_by_ids(
@@ -179,9 +233,11 @@ class _FetchObjectsByIDsQuery(Generic[Properties, References], _Base[Properties,
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: REFERENCES
+        return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, CrossReferences]: ...
     @overload
     def fetch_objects_by_ids(
@@ -193,9 +249,11 @@ class _FetchObjectsByIDsQuery(Generic[Properties, References], _Base[Properties,
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
-        return_references: Type[TReferences]
+        return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, TReferences]: ...
     @overload
     def fetch_objects_by_ids(
@@ -207,7 +265,9 @@ class _FetchObjectsByIDsQuery(Generic[Properties, References], _Base[Properties,
         after: Optional[UUID] = None,
         sort: Optional[Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturnType[Properties, References, TProperties, TReferences]: ...
@@ -23,7 +23,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import NUMBER, INCLUDE_VECTOR, VECTOR_FORMAT
 
 class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
     @overload
@@ -47,6 +47,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -72,6 +73,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -97,6 +99,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -122,6 +125,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -147,6 +151,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -172,6 +177,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
@@ -200,6 +206,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -225,6 +232,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -250,6 +258,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -275,6 +284,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -300,6 +310,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -325,6 +336,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
@@ -350,6 +362,7 @@ class _HybridGenerateAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
@@ -377,6 +390,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -402,6 +416,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -427,6 +442,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -452,6 +468,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -477,6 +494,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -502,6 +520,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
@@ -530,6 +549,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
@@ -555,6 +575,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
@@ -580,6 +601,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
@@ -605,6 +627,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
@@ -630,6 +653,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
@@ -655,6 +679,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
@@ -681,6 +706,7 @@ class _HybridGenerate(Generic[Properties, References], _Base[Properties, Referen
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
@@ -16,7 +16,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import NUMBER, INCLUDE_VECTOR, VECTOR_FORMAT, RETURN_FORMAT
 
 
 class _NearImageQueryAsync(Generic[Properties, References], _Base[Properties, References]):
@@ -34,9 +34,11 @@ class _NearImageQueryAsync(Generic[Properties, References], _Base[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: RETURN_FORMAT = "objects",
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]:
         """Search for objects by image in this collection using an image-capable vectorization module and vector-based similarity search.
 
@@ -68,12 +70,21 @@ class _NearImageQueryAsync(Generic[Properties, References], _Base[Properties, Re
                 The name of the vector space to search in for named vector configurations. Required if multiple spaces are configured.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format of the returned vectors, `"list"` for lists of floats or `"numpy"` for float32 `numpy` arrays.
+                If not specified, the default of the collection is used, see `client.collections.get`.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
                 The properties to return for each object.
             `return_references`
                 The references to return for each object.
+            `return_format`
+                The format of the results, `"objects"` for the objects of a `QueryReturn` or `GroupByReturn`, `"lazy"`
+                for objects of a `QueryReturn` that decode each property, their metadata and vectors only when first
+                accessed, which is faster when reading a few fields of many objects, or `"arrow"` for a `pyarrow.Table`
+                with one row per object, which is built without creating the objects and converts to `pandas` or
+                `polars` without copying. References are not included in it. Requires `pyarrow`.
 
         NOTE:
             - If `return_properties` is not provided then all properties are returned except for blob properties.
@@ -114,6 +125,8 @@ class _NearImageQueryAsync(Generic[Properties, References], _Base[Properties, Re
                 return_references,
                 rerank,
                 group_by,
+                vector_format=vector_format,
+                return_format=return_format,
             ),
             return_properties,
             return_references,
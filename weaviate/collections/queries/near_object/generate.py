@@ -15,7 +15,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _Base
-from weaviate.types import NUMBER, INCLUDE_VECTOR, UUID
+from weaviate.types import NUMBER, INCLUDE_VECTOR, VECTOR_FORMAT, UUID
 
 
 class _NearObjectGenerateAsync(Generic[Properties, References], _Base[Properties, References]):
@@ -36,6 +36,7 @@ class _NearObjectGenerateAsync(Generic[Properties, References], _Base[Properties
         rerank: Optional[Rerank] = None,
         target_vector: Optional[TargetVectorJoinType] = None,
         include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
@@ -67,6 +68,9 @@ class _NearObjectGenerateAsync(Generic[Properties, References], _Base[Properties
                 The name of the vector space to search in for named vector configurations. Required if multiple spaces are configured.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format of the returned vectors, `"list"` for lists of floats or `"numpy"` for float32 `numpy` arrays.
+                If not specified, the default of the collection is used, see `client.collections.get`.
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -117,6 +121,7 @@ class _NearObjectGenerateAsync(Generic[Properties, References], _Base[Properties
                 return_references,
                 rerank,
                 group_by,
+                vector_format=vector_format,
             ),
             return_properties,
             return_references,
@@ -0,0 +1,13 @@
+from .query import (
+    _PrepareQueryAsync,
+    _PrepareQuery,
+    _PreparedNearVectorQueryAsync,
+    _PreparedNearVectorQuery,
+)
+
+__all__ = [
+    "_PrepareQuery",
+    "_PrepareQueryAsync",
+    "_PreparedNearVectorQuery",
+    "_PreparedNearVectorQueryAsync",
+]
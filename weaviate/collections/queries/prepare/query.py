@@ -0,0 +1,216 @@
+from typing import Any, Generic, Optional, Type
+
+from weaviate import syncify
+from weaviate.collections.classes.filters import (
+    _Filters,
+)
+from weaviate.collections.classes.grpc import (
+    METADATA,
+    Rerank,
+    TargetVectorJoinType,
+    NearVectorInputType,
+)
+from weaviate.collections.classes.internal import (
+    ReturnProperties,
+    ReturnReferences,
+    _QueryOptions,
+    QueryReturn,
+)
+from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
+from weaviate.collections.filters import _FilterToGRPC
+from weaviate.collections.queries.base import _Base
+from weaviate.proto.v1 import search_get_pb2
+from weaviate.types import NUMBER, INCLUDE_VECTOR, VECTOR_FORMAT, RETURN_FORMAT
+from weaviate.validator import _ValidateArgument, _validate_input
+
+
+class _PreparedNearVectorQueryAsync(Generic[Properties, References]):
+    """A near vector query whose request is built once by `query.prepare` and then sent with different vectors.
+
+    Every search copies the prepared request and replaces only the vector and the options that are passed, none of the
+    other arguments are validated or converted again.
+    """
+
+    def __init__(
+        self,
+        query: _Base[Any, Any],
+        request: search_get_pb2.SearchRequest,
+        options: _QueryOptions,
+        return_properties: Optional[ReturnProperties[Any]],
+        return_references: Optional[ReturnReferences[Any]],
+    ) -> None:
+        self.__query = query
+        self.__request = request
+        self.__options = options
+        self.__return_properties = return_properties
+        self.__return_references = return_references
+
+    async def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+    ) -> QueryReturn[Properties, References]:
+        """Search for objects with the prepared query by the given vector.
+
+        Arguments:
+            `near_vector`
+                The vector to search on, REQUIRED. It must have the same shape as the vector the query was prepared
+                with, i.e. a single vector or one vector per target vector.
+            `certainty`
+                The minimum similarity score to return, replacing the certainty or distance of the prepared query. If
+                not specified, the one of the prepared query is used.
+            `distance`
+                The maximum distance to search, replacing the certainty or distance of the prepared query. If not
+                specified, the one of the prepared query is used.
+            `limit`
+                The maximum number of results to return. If not specified, the one of the prepared query is used.
+            `offset`
+                The offset to start from. If not specified, the one of the prepared query is used.
+            `filters`
+                The filters to apply to the search, replacing those of the prepared query. If not specified, the
+                filters of the prepared query are used.
+
+        Returns:
+            A `QueryReturn` object that includes the searched objects.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the request to the Weaviate server fails.
+        """
+        if self.__query._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument([int, None], "limit", limit),
+                    _ValidateArgument([int, None], "offset", offset),
+                    _ValidateArgument([_Filters, None], "filters", filters),
+                ]
+            )
+        # the prepared request is never changed, it may still be used by a search that is running concurrently
+        request = search_get_pb2.SearchRequest()
+        request.CopyFrom(self.__request)
+        self.__query._query.patch_near_vector(request, near_vector, certainty, distance)
+        if limit is not None:
+            request.limit = limit
+        if offset is not None:
+            request.offset = offset
+        if filters is not None:
+            request.filters.CopyFrom(_FilterToGRPC.convert(filters))
+
+        res = await self.__query._query.search(request)
+        return self.__query._result_to_query_return(
+            res, self.__options, self.__return_properties, self.__return_references
+        )
+
+
+@syncify.convert
+class _PreparedNearVectorQuery(
+    Generic[Properties, References], _PreparedNearVectorQueryAsync[Properties, References]
+):
+    pass
+
+
+class _PrepareQueryAsync(Generic[Properties, References], _Base[Properties, References]):
+    # the class of the prepared queries, with sync or async searches like the query namespace
+    _prepared_near_vector: Type[_PreparedNearVectorQueryAsync] = _PreparedNearVectorQueryAsync
+
+    def prepare(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        vector_format: Optional[VECTOR_FORMAT] = None,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: RETURN_FORMAT = "objects",
+    ) -> _PreparedNearVectorQueryAsync[Properties, References]:
+        """Prepare a near vector query that is run many times with different vectors.
+
+        All arguments are validated and converted to the gRPC request once, the prepared query then only replaces the
+        vector and the options passed to its `near_vector` method. No request is sent to Weaviate by this method.
+
+        Arguments:
+            `near_vector`
+                A vector with the shape of the vectors that will be searched on, REQUIRED. It is not searched on.
+            `certainty`
+                The minimum similarity score to return. If not specified, the default certainty specified by the server is used.
+            `distance`
+                The maximum distance to search. If not specified, the default distance specified by the server is used.
+            `limit`
+                The maximum number of results to return. If not specified, the default limit specified by the server is returned.
+            `offset`
+                The offset to start from. If not specified, the retrieval begins from the first object in the server.
+            `auto_limit`
+                The maximum number of [autocut](https://weaviate.io/developers/weaviate/api/graphql/additional-operators#autocut) results to return. If not specified, no limit is applied.
+            `filters`
+                The filters to apply to the search.
+            `rerank`
+                How the results should be reranked. NOTE: A `rerank-*` module must be enabled for this functionality to work.
+            `target_vector`
+                The name of the vector space to search in for named vector configurations. Required if multiple spaces are configured.
+            `include_vector`
+                Whether to include the vector in the results. If not specified, this is set to False.
+            `vector_format`
+                The format of the returned vectors, `"list"` for lists of floats or `"numpy"` for float32 `numpy` arrays.
+                If not specified, the default of the collection is used, see `client.collections.get`.
+            `return_metadata`
+                The metadata to return for each object, defaults to `None`.
+            `return_properties`
+                The properties to return for each object.
+            `return_references`
+                The references to return for each object.
+            `return_format`
+                The format of the results, `"objects"` or `"lazy"` for objects that are decoded when first accessed,
+                see `near_vector`.
+
+        Returns:
+            The prepared query, search with it by calling its `near_vector` method.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If an argument is invalid.
+        """
+        request = self._query.near_vector_request(
+            near_vector=near_vector,
+            certainty=certainty,
+            distance=distance,
+            limit=limit,
+            offset=offset,
+            autocut=auto_limit,
+            filters=filters,
+            rerank=rerank,
+            target_vector=target_vector,
+            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_properties=self._parse_return_properties(return_properties),
+            return_references=self._parse_return_references(return_references),
+        )
+        options = _QueryOptions.from_input(
+            return_metadata,
+            return_properties,
+            include_vector,
+            self._references,
+            return_references,
+            rerank,
+            vector_format=vector_format,
+            return_format=return_format,
+        )
+        return self._prepared_near_vector(
+            self, request, options, return_properties, return_references
+        )
+
+
+class _PrepareQuery(Generic[Properties, References], _PrepareQueryAsync[Properties, References]):
+    _prepared_near_vector: Type[_PreparedNearVectorQueryAsync] = _PreparedNearVectorQuery
@@ -18,6 +18,7 @@ from weaviate.collections.queries.near_media import _NearMediaQueryAsync, _NearM
 from weaviate.collections.queries.near_object import _NearObjectQueryAsync, _NearObjectQuery
 from weaviate.collections.queries.near_text import _NearTextQueryAsync, _NearTextQuery
 from weaviate.collections.queries.near_vector import _NearVectorQueryAsync, _NearVectorQuery
+from weaviate.collections.queries.prepare import _PrepareQueryAsync, _PrepareQuery
 
 
 class _QueryCollectionAsync(
@@ -32,6 +33,7 @@ class _QueryCollectionAsync(
     _NearObjectQueryAsync[TProperties, References],
     _NearTextQueryAsync[TProperties, References],
     _NearVectorQueryAsync[TProperties, References],
+    _PrepareQueryAsync[TProperties, References],
 ):
     pass
 
@@ -48,5 +50,6 @@ class _QueryCollection(
     _NearObjectQuery[TProperties, References],
     _NearTextQuery[TProperties, References],
     _NearVectorQuery[TProperties, References],
+    _PrepareQuery[TProperties, References],
 ):
     pass
@@ -716,6 +716,13 @@ class ConnectionV4(_ConnectionBase):
             raise WeaviateClosedClientError()
         return self._grpc_stub
 
+    @property
+    def grpc_channel(self) -> Channel:
+        if not self.is_connected():
+            raise WeaviateClosedClientError()
+        assert self._grpc_channel is not None
+        return self._grpc_channel
+
     def __del__(self) -> None:
         if self._client is not None or self._grpc_channel is not None:
             _Warnings.unclosed_connection()
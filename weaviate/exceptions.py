@@ -261,6 +261,15 @@ class WeaviateBatchValidationError(WeaviateBaseError):
         self.message = message
 
 
+class WeaviateIngestError(WeaviateBaseError):
+    """Is raised if a worker process of a parallel ingestion fails."""
+
+    def __init__(self, message: str):
+        msg = f"""Parallel ingestion failed: {message}"""
+        super().__init__(msg)
+        self.message = message
+
+
 class WeaviateInsertInvalidPropertyError(WeaviateBaseError):
     """Is raised when inserting an invalid property."""
 
@@ -0,0 +1,386 @@
+"""Import data with several processes, each with its own client and batch.
+
+A single process is limited by building the gRPC messages of its batches. `parallel` shards a source across worker
+processes and combines their results, so that the import scales with the number of CPU cores until Weaviate is the
+bottleneck.
+"""
+
+import itertools
+import multiprocessing
+import os
+import queue
+import time
+import traceback
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from weaviate.client import WeaviateClient
+from weaviate.collections.batch.arrow import _ArrowConverter
+from weaviate.collections.batch.controller import MAX_CONCURRENT_REQUESTS
+from weaviate.collections.classes.batch import BatchObjectReturn, BatchResult, ErrorObject
+from weaviate.collections.classes.data import DataObject
+from weaviate.exceptions import WeaviateIngestError, WeaviateInvalidInputError
+
+CHUNK_SIZE = 1000  # objects of an iterable source that are handed to a worker at once
+# how long the results of a worker that exited normally may take to arrive before it is considered failed
+EXIT_GRACE_SECONDS = 10
+
+# kinds of the units of work that are handed to the workers
+_OBJECTS = "objects"
+_TASK = "task"
+_FRAGMENT = "fragment"
+
+# kinds of the messages from the workers to the parent
+_PROGRESS = "progress"
+_DONE = "done"
+_FAILED = "failed"
+
+_Unit = Tuple[int, str, Any]  # position of the unit in the source, its kind and its content
+_Span = Tuple[
+    int, int, int
+]  # unit, index of its first object in the batch of the worker, number of objects
+
+
+@dataclass
+class IngestProgress:
+    """The progress of a parallel ingestion, reported whenever a worker has finished a part of the source."""
+
+    num_objects: int
+    """The number of objects that were added to the batches of the workers."""
+    num_errors: int
+    """The number of objects that Weaviate has rejected so far."""
+    elapsed_seconds: float
+
+
+@dataclass
+class IngestResult:
+    """The combined results of all workers of a parallel ingestion.
+
+    The keys of `results.objs.uuids` and `results.objs.errors` and the index of the failed objects are the positions of
+    the objects in the source. For tasks and Arrow datasets, the objects of all tasks or fragments are counted in the
+    order of the source. Like for batching, every worker only keeps its last `MAX_STORED_RESULTS` UUIDs.
+    """
+
+    results: BatchResult
+    failed_objects: List[ErrorObject]
+    num_objects: int
+    elapsed_seconds: float
+
+
+@dataclass
+class _WorkerConfig:
+    connect: Callable[[], WeaviateClient]
+    collection: str
+    tenant: Optional[str]
+    batch_size: Optional[int]
+    concurrent_requests: int
+    concurrency_share: float
+    reader: Optional[Callable[[Any], Iterable[Any]]]
+    uuid_column: Optional[str]
+    vector_column: Optional[Union[str, Dict[str, str]]]
+
+
+def _add_item(batch: Any, item: Any) -> int:
+    if isinstance(item, DataObject):
+        batch.add_object(
+            properties=item.properties,
+            references=item.references,
+            uuid=item.uuid,
+            vector=item.vector,
+        )
+    else:
+        batch.add_object(properties=item)
+    return 1
+
+
+def _worker(
+    config: _WorkerConfig,
+    worker_id: int,
+    units: "multiprocessing.Queue[Optional[_Unit]]",
+    messages: "multiprocessing.Queue[Tuple[Any, ...]]",
+) -> None:
+    try:
+        client = config.connect()
+        try:
+            collection = client.collections.get(config.collection)
+            if config.tenant is not None:
+                collection = collection.with_tenant(config.tenant)
+            batching = collection.batch
+            if config.batch_size is not None:
+                context = batching.fixed_size(config.batch_size, config.concurrent_requests)
+            else:
+                context = batching.dynamic(concurrency_share=config.concurrency_share)
+            converter: Optional[_ArrowConverter] = (
+                None  # requires pyarrow, created for the first fragment
+            )
+
+            spans: List[_Span] = []
+            num_added = 0
+            with context as batch:
+                while (unit := units.get()) is not None:
+                    unit_id, kind, content = unit
+                    start = num_added
+                    if kind == _OBJECTS:
+                        for item in content:
+                            num_added += _add_item(batch, item)
+                    elif kind == _TASK:
+                        assert config.reader is not None
+                        for item in config.reader(content):
+                            num_added += _add_item(batch, item)
+                    else:
+                        if converter is None:
+                            converter = _ArrowConverter(config.uuid_column, config.vector_column)
+                        for record_batch in content.to_batches():
+                            properties, vectors, uuids = converter.convert(record_batch)
+                            num_added += len(
+                                batch.add_objects(
+                                    properties=properties, vectors=vectors, uuids=uuids
+                                )
+                            )
+                    spans.append((unit_id, start, num_added - start))
+                    messages.put((_PROGRESS, worker_id, num_added - start, batch.number_errors))
+
+            objs = batching.results.objs
+            messages.put(
+                (
+                    _DONE,
+                    worker_id,
+                    spans,
+                    BatchObjectReturn(
+                        uuids=objs.uuids, errors=objs.errors, has_errors=objs.has_errors
+                    ),
+                    batching.failed_objects,
+                )
+            )
+        finally:
+            client.close()
+    except Exception:
+        messages.put((_FAILED, worker_id, traceback.format_exc()))
+
+
+def _check_workers(
+    workers: List[Any], done: Dict[int, Any], exited: Dict[int, float], now: float
+) -> None:
+    """Raise if a worker died, i.e. it exited with an error or exited normally but its results did not arrive.
+
+    A worker puts its results into the queue before it exits, but they can still be in the pipe when its exit code is
+    already set. So a worker that exited normally only counts as failed if its results do not arrive within
+    `EXIT_GRACE_SECONDS` while the queue is drained.
+    """
+    for worker_id, worker in enumerate(workers):
+        if worker_id in done or worker.exitcode is None:
+            continue
+        if worker.exitcode != 0:
+            raise WeaviateIngestError(f"worker {worker_id} exited with code {worker.exitcode}")
+        if now - exited.setdefault(worker_id, now) > EXIT_GRACE_SECONDS:
+            raise WeaviateIngestError(f"worker {worker_id} exited without sending its results")
+
+
+def _units(
+    source: Any, reader: Optional[Callable[[Any], Iterable[Any]]], chunk_size: int
+) -> Iterator[_Unit]:
+    if reader is not None:
+        for unit_id, task in enumerate(source):
+            yield unit_id, _TASK, task
+    elif hasattr(source, "get_fragments"):  # pyarrow.dataset.Dataset
+        for unit_id, fragment in enumerate(source.get_fragments()):
+            yield unit_id, _FRAGMENT, fragment
+    else:
+        items = iter(source)
+        for unit_id in itertools.count():
+            chunk = list(itertools.islice(items, chunk_size))
+            if len(chunk) == 0:
+                return
+            yield unit_id, _OBJECTS, chunk
+
+
+def _combine(
+    done: Dict[int, Tuple[List[_Span], BatchObjectReturn, List[ErrorObject]]], elapsed: float
+) -> IngestResult:
+    """Combine the results of the workers and translate the indices of their batches into positions in the source."""
+    counts = sorted(
+        (unit_id, count) for spans, _, _ in done.values() for unit_id, _, count in spans
+    )
+    offsets = dict(
+        zip((unit_id for unit_id, _ in counts), itertools.accumulate([0] + [c for _, c in counts]))
+    )
+
+    result = IngestResult(
+        results=BatchResult(),
+        failed_objects=[],
+        num_objects=sum(count for _, count in counts),
+        elapsed_seconds=elapsed,
+    )
+    for spans, objs, failed_objects in done.values():
+        starts = [start for _, start, _ in spans]
+
+        def position(index: int) -> int:
+            unit_id, start, _ = spans[bisect_right(starts, index) - 1]
+            return offsets[unit_id] + index - start
+
+        errors = {position(index): error for index, error in objs.errors.items()}
+        remapped = set()
+        for error in itertools.chain(objs.errors.values(), failed_objects):
+            if (
+                id(error) not in remapped
+            ):  # the same errors are part of the results and the failed objects
+                remapped.add(id(error))
+                error.object_.index = position(error.object_.index)
+        result.results.objs += BatchObjectReturn(
+            uuids={position(index): uuid for index, uuid in objs.uuids.items()},
+            errors=errors,
+            has_errors=objs.has_errors,
+        )
+        result.failed_objects.extend(failed_objects)
+    result.results.objs.elapsed_seconds = elapsed
+    return result
+
+
+def parallel(
+    source: Any,
+    collection: str,
+    connect: Callable[[], WeaviateClient],
+    processes: Optional[int] = None,
+    tenant: Optional[str] = None,
+    reader: Optional[Callable[[Any], Iterable[Any]]] = None,
+    batch_size: Optional[int] = None,
+    concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+    chunk_size: int = CHUNK_SIZE,
+    uuid_column: Optional[str] = None,
+    vector_column: Optional[Union[str, Dict[str, str]]] = None,
+    on_progress: Optional[Callable[[IngestProgress], None]] = None,
+) -> IngestResult:
+    """Import a source into a collection with several worker processes, each with its own client and batch.
+
+    The workers are started with the `spawn` method, so a script that calls this function must guard its entry point
+    with `if __name__ == "__main__":`, and `connect`, `reader` and all objects have to be picklable, e.g.
+    `functools.partial(weaviate.connect_to_local, port=8080)` or module-level functions.
+
+    Arguments:
+        `source`
+            What to import, one of:
+            - an iterable of objects, either properties as dictionaries or `weaviate.classes.data.DataObject`. It is
+                read by this process and handed to the workers in chunks of `chunk_size` objects.
+            - an iterable of tasks, e.g. file names, if `reader` is given. Every task is read by a worker.
+            - a `pyarrow.dataset.Dataset`. Every fragment is read by a worker and imported like with
+                `collection.data.insert_arrow`.
+        `collection`
+            The name of the collection to import into.
+        `connect`
+            A function without arguments that returns a connected `WeaviateClient`, called once in every worker.
+        `processes`
+            The number of worker processes, by default the number of CPU cores.
+        `tenant`
+            The tenant to import into, if the collection is multi-tenant.
+        `reader`
+            A function that turns one task of the source into an iterable of objects in a worker.
+        `batch_size`
+            If given, the workers use fixed size batches of this size instead of dynamic batching.
+        `concurrent_requests`
+            The number of requests that the workers send at once in total with fixed size batches. Dynamic batching
+            splits the concurrency that the cluster can take between the workers instead.
+        `chunk_size`
+            The number of objects of an iterable source that are handed to a worker at once.
+        `uuid_column`
+            The UUID column of an Arrow dataset, see `collection.data.insert_arrow`.
+        `vector_column`
+            The vector column or columns of an Arrow dataset, see `collection.data.insert_arrow`.
+        `on_progress`
+            A function that is called in this process whenever a worker has finished a chunk, task or fragment.
+
+    Returns:
+        The combined results of all workers.
+
+    Raises:
+        `weaviate.exceptions.WeaviateInvalidInputError`:
+            If the number of processes or the chunk size is smaller than one.
+        `weaviate.exceptions.WeaviateIngestError`:
+            If a worker fails, the other workers are stopped.
+    """
+    processes = processes if processes is not None else os.cpu_count() or 1
+    if processes < 1:
+        raise WeaviateInvalidInputError(f"processes must be at least 1, but is {processes}")
+    if chunk_size < 1:
+        raise WeaviateInvalidInputError(f"chunk_size must be at least 1, but is {chunk_size}")
+
+    config = _WorkerConfig(
+        connect=connect,
+        collection=collection,
+        tenant=tenant,
+        batch_size=batch_size,
+        concurrent_requests=max(1, concurrent_requests // processes),
+        concurrency_share=1 / processes,
+        reader=reader,
+        uuid_column=uuid_column,
+        vector_column=vector_column,
+    )
+    ctx = multiprocessing.get_context("spawn")
+    units: "multiprocessing.Queue[Optional[_Unit]]" = ctx.Queue(maxsize=2 * processes)
+    messages: "multiprocessing.Queue[Tuple[Any, ...]]" = ctx.Queue()
+    workers = [
+        ctx.Process(
+            target=_worker,
+            args=(config, worker_id, units, messages),
+            daemon=True,
+            name=f"WeaviateIngest{worker_id}",
+        )
+        for worker_id in range(processes)
+    ]
+    start = time.time()
+    for worker in workers:
+        worker.start()
+
+    num_objects = 0
+    num_errors: Dict[int, int] = {}
+    done: Dict[int, Tuple[List[_Span], BatchObjectReturn, List[ErrorObject]]] = {}
+    exited: Dict[int, float] = (
+        {}
+    )  # when workers were first seen to have exited normally without their results
+
+    def receive(timeout: float) -> bool:
+        """Handle the messages of the workers, return whether there were any."""
+        nonlocal num_objects
+        try:
+            message = messages.get(timeout=timeout)
+        except queue.Empty:
+            _check_workers(workers, done, exited, time.time())
+            return False
+        kind, worker_id, *content = message
+        if kind == _FAILED:
+            raise WeaviateIngestError(f"worker {worker_id} failed:\n{content[0]}")
+        if kind == _PROGRESS:
+            num_objects += content[0]
+            num_errors[worker_id] = content[1]
+            if on_progress is not None:
+                on_progress(
+                    IngestProgress(num_objects, sum(num_errors.values()), time.time() - start)
+                )
+        else:
+            done[worker_id] = (content[0], content[1], content[2])
+        return True
+
+    def send(unit: Optional[_Unit]) -> None:
+        while True:
+            try:
+                units.put(unit, timeout=0.1)
+                return
+            except queue.Full:
+                receive(timeout=0)
+
+    try:
+        for unit in _units(source, reader, chunk_size):
+            send(unit)
+            while receive(timeout=0):
+                pass
+        for _ in workers:
+            send(None)
+        while len(done) < len(workers):
+            receive(timeout=0.1)
+    finally:
+        for worker in workers:
+            if worker.is_alive() and len(done) < len(workers):
+                worker.terminate()
+            worker.join()
+
+    return _combine(done, time.time() - start)
@@ -1,15 +1,19 @@
 from weaviate.collections.classes.batch import (
+    BatchJournalState,
     BatchObjectReturn,
     BatchReferenceReturn,
     BatchResult,
     ErrorObject,
     ErrorReference,
+    VectorIndexingProgress,
 )
 
 __all__ = [
+    "BatchJournalState",
     "BatchObjectReturn",
     "BatchReferenceReturn",
     "BatchResult",
     "ErrorObject",
     "ErrorReference",
+    "VectorIndexingProgress",
 ]
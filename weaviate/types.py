@@ -1,6 +1,6 @@
 import datetime
 import uuid as uuid_package
-from typing import Dict, Union, List, Sequence, Tuple
+from typing import Any, Dict, Literal, Union, List, Sequence, Tuple
 
 DATE = datetime.datetime
 UUID = Union[str, uuid_package.UUID]
@@ -8,7 +8,13 @@ UUIDS = Union[Sequence[UUID], UUID]
 NUMBER = Union[int, float]
 GEO_COORDINATES = Tuple[float, float]
 VECTORS = Union[Dict[str, List[float]], List[float]]
+# a 2D array like `numpy.ndarray` with one row per object, or one such matrix per name for named vectors
+VECTOR_MATRICES = Union[Any, Dict[str, Any]]
 INCLUDE_VECTOR = Union[bool, str, List[str]]
+# returned vectors as lists of floats or as float32 `numpy` arrays
+VECTOR_FORMAT = Literal["list", "numpy"]
+# query results as objects, as objects decoded on access or as a `pyarrow.Table`
+RETURN_FORMAT = Literal["objects", "lazy", "arrow"]
 
 BEACON = "weaviate://localhost/"
 
@@ -953,6 +953,14 @@ def _datetime_to_string(value: TIME) -> str:
 
 
 def _datetime_from_weaviate_str(string: str) -> datetime.datetime:
+    # Weaviate returns RFC 3339 dates. Those with whole seconds or microseconds are parsed by the much faster
+    # `fromisoformat`, which before Python 3.11 accepts neither `Z` nor other fractions of seconds.
+    iso = string[:-1] + "+00:00" if string[-1:] == "Z" else string
+    if (len(iso) == 25 or len(iso) == 32) and iso[10] == "T":
+        try:
+            return datetime.datetime.fromisoformat(iso)
+        except ValueError:
+            pass
     try:
         return datetime.datetime.strptime(
             "".join(string.rsplit(":", 1) if string[-1] != "Z" else string),